@@ -94,6 +94,11 @@ popd
 %{_bindir}/ksflatten
 %{_bindir}/ksverdiff
 %{_bindir}/ksshell
+%{_bindir}/ksinfer
+%{_bindir}/ksfingerprint
+%{_bindir}/ksdiff
+%{_bindir}/ksvalidatord
+%{_bindir}/ksstats
 %{_mandir}/man1/*
 
 %files -n python-kickstart
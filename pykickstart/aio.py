@@ -0,0 +1,408 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Loading and parsing kickstart files from asyncio code.
+
+Everything a kickstart file pulls in over the network with %include or
+%ksappend is fetched concurrently, without blocking the event loop, before
+the file is parsed.  Many files can be loaded and parsed at once in one
+event loop.  This module needs Python 3.
+
+This module exports two classes:
+
+    Fetcher - The base class for loading kickstart files asynchronously.
+              Subclasses provide fetchURL.
+
+    HTTPFetcher - A Fetcher with a small HTTP/1.1 client built on asyncio
+                  streams, which limits the number of requests made to each
+                  host at once.  It keeps to the timeouts and size cap that
+                  pykickstart.load uses.
+
+And it exports several functions:
+
+    load_to_str - Load a file or URL into a string.
+
+    preprocessFromStringToStringAsync - The asynchronous version of
+                                        preprocessFromStringToString.
+
+    preprocessKickstartToStringAsync - The asynchronous version of
+                                       preprocessKickstartToString.
+
+    readKickstartAsync - Fetch a kickstart file and everything it includes,
+                         then parse it.
+"""
+import asyncio
+import base64
+import os
+import ssl
+from urllib.parse import urljoin, urlsplit
+
+from pykickstart import load
+from pykickstart.errors import KickstartError, KickstartTimeoutError, formatErrorMsg
+from pykickstart.includes import findIncludes
+from pykickstart.load import _CHUNK_SIZE, _is_url, _load_file, _too_large
+from pykickstart.parser import _preprocessStateMachine
+
+from pykickstart.i18n import _
+
+_redirects = (301, 302, 303, 307, 308)
+
+class Fetcher(object):
+    """The base class for loading kickstart files asynchronously.  Local
+       files are read directly, as that doesn't wait on anything for long.
+       URLs are handed to fetchURL, which subclasses must provide.
+    """
+    async def fetch(self, location):
+        """Return the contents of the file or URL location as a string.
+           Raises KickstartError if it can not be loaded.
+        """
+        if _is_url(location):
+            return await self.fetchURL(location)
+        else:
+            return _load_file(location)
+
+    async def fetchURL(self, url):
+        """Return the contents of url as a string, raising KickstartError if
+           it can not be loaded.  This method must be provided by all
+           subclasses.
+        """
+        raise TypeError("fetchURL() not implemented for Fetcher")
+
+class HTTPFetcher(Fetcher):
+    """A Fetcher for http and https URLs using only asyncio streams.  Each
+       request uses its own connection.  A fetcher must only be used from one
+       event loop.  Instance attributes:
+
+       maxPerHost   -- The most requests made to one host and port at once.
+                       Others wait their turn.
+       maxRedirects -- The most redirects followed for one URL.
+       verify       -- Whether to check the certificates of https servers, or
+                       None to go by pykickstart.load.SSL_VERIFY.
+    """
+    def __init__(self, maxPerHost=4, maxRedirects=5, verify=None):
+        self.maxPerHost = maxPerHost
+        self.maxRedirects = maxRedirects
+        self.verify = verify
+        self._semaphores = {}
+
+    def _sslContext(self):
+        ctx = ssl.create_default_context()
+
+        verify = load.SSL_VERIFY if self.verify is None else self.verify
+        if not verify:
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+
+        return ctx
+
+    def _semaphore(self, key):
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(self.maxPerHost)
+
+        return self._semaphores[key]
+
+    def _request(self, parts, host, port, default):
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        lines = ["GET %s HTTP/1.1" % path,
+                 "Host: %s" % (host if port == default else "%s:%d" % (host, port)),
+                 "Accept-Encoding: identity",
+                 "Connection: close"]
+
+        if parts.username is not None:
+            credentials = "%s:%s" % (parts.username, parts.password or "")
+            lines.append("Authorization: Basic %s" % base64.b64encode(credentials.encode("utf-8")).decode("ascii"))
+
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+    async def _read(self, fn, *args):
+        """Await one read from the server, giving up if it takes longer than
+           pykickstart.load.READ_TIMEOUT seconds.
+        """
+        return await asyncio.wait_for(fn(*args), load.READ_TIMEOUT)
+
+    def _checkSize(self, url, size):
+        if load.MAX_SIZE is not None and size > load.MAX_SIZE:
+            raise _too_large(url)
+
+    async def _readExactly(self, reader, count, pieces):
+        while count > 0:
+            piece = await self._read(reader.readexactly, min(count, _CHUNK_SIZE))
+            pieces.append(piece)
+            count -= len(piece)
+
+    async def _readBody(self, url, reader, headers):
+        pieces = []
+        size = 0
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                count = int((await self._read(reader.readline)).split(b";")[0].strip(), 16)
+                if count == 0:
+                    break
+
+                size += count
+                self._checkSize(url, size)
+                await self._readExactly(reader, count, pieces)
+                await self._read(reader.readline)
+        elif "content-length" in headers:
+            self._checkSize(url, int(headers["content-length"]))
+            await self._readExactly(reader, int(headers["content-length"]), pieces)
+        else:
+            while True:
+                piece = await self._read(reader.read, _CHUNK_SIZE)
+                if not piece:
+                    break
+
+                size += len(piece)
+                self._checkSize(url, size)
+                pieces.append(piece)
+
+        return b"".join(pieces)
+
+    async def _get(self, url):
+        """Make one GET request, returning the status, a dict of headers with
+           lower case names and the body as bytes.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise KickstartError(_('Error accessing URL "%s"') % url + ': {e}'.format(e=_("unsupported URL")))
+
+        default = 443 if parts.scheme == "https" else 80
+        host = parts.hostname
+        port = parts.port or default
+        ctx = self._sslContext() if parts.scheme == "https" else None
+
+        async with self._semaphore((host, port)):
+            try:
+                (reader, writer) = await asyncio.wait_for(asyncio.open_connection(host, port, ssl=ctx),
+                                                          load.CONNECT_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise KickstartError(_('Error accessing URL "%s"') % url + ': ' + _("timed out"))
+            except ssl.SSLError as e:
+                raise KickstartError(_('Error securely accessing URL "%s"') % url + ': {e}'.format(e=str(e)))
+            except OSError as e:
+                raise KickstartError(_('Error accessing URL "%s"') % url + ': {e}'.format(e=str(e)))
+
+            try:
+                writer.write(self._request(parts, host, port, default))
+
+                status = int((await self._read(reader.readline)).split(None, 2)[1])
+
+                headers = {}
+                while True:
+                    line = (await self._read(reader.readline)).decode("latin-1").strip()
+                    if not line:
+                        break
+
+                    (name, _sep, value) = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await self._readBody(url, reader, headers)
+            except asyncio.TimeoutError:
+                raise KickstartError(_('Error accessing URL "%s"') % url + ': ' + _("timed out"))
+            except ssl.SSLError as e:
+                raise KickstartError(_('Error securely accessing URL "%s"') % url + ': {e}'.format(e=str(e)))
+            except (OSError, ValueError, IndexError, asyncio.IncompleteReadError) as e:
+                raise KickstartError(_('Error accessing URL "%s"') % url + ': {e}'.format(e=str(e) or type(e).__name__))
+            finally:
+                writer.close()
+
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+
+        return (status, headers, body)
+
+    async def fetchURL(self, url):
+        for _i in range(self.maxRedirects + 1):
+            (status, headers, body) = await self._get(url)
+
+            if status in _redirects and "location" in headers:
+                url = urljoin(url, headers["location"])
+            else:
+                break
+
+        if status != 200:
+            raise KickstartError(_('Error accessing URL "%s"') % url + ': {c}'.format(c=str(status)))
+
+        charset = "utf-8"
+        for param in headers.get("content-type", "").split(";")[1:]:
+            (name, _sep, value) = param.partition("=")
+            if name.strip().lower() == "charset":
+                charset = value.strip().strip('"')
+
+        try:
+            return body.decode(charset)
+        except (LookupError, UnicodeDecodeError) as e:
+            raise KickstartError(_('Error accessing URL "%s"') % url + ': {e}'.format(e=str(e)))
+
+async def load_to_str(location, fetcher=None):
+    """Load a file or URL into a string, using fetcher, or a new HTTPFetcher
+       if none is given.  Raises KickstartError on error reading.
+    """
+    return await (fetcher or HTTPFetcher()).fetch(location)
+
+async def _fetchAll(fetcher, locations, limits=None):
+    """Fetch every location in the list locations at once.  Returns a dict
+       mapping each to a tuple of its contents and the KickstartError loading
+       it raised, one of which is None.  If limits is given, each URL counts
+       as a fetch and the fetches must finish in the time it has left, or
+       the KickstartLimitError is raised.
+    """
+    async def fetchOne(location):
+        try:
+            return (await fetcher.fetch(location), None)
+        except KickstartError as e:
+            return (None, e)
+
+    locations = list(set(locations))
+
+    if limits is not None:
+        limits.checkDeadline()
+        for location in locations:
+            if _is_url(location):
+                limits.addFetch(location)
+
+    try:
+        results = await asyncio.wait_for(asyncio.gather(*[fetchOne(location) for location in locations]),
+                                         None if limits is None else limits.remainingTime())
+    except asyncio.TimeoutError:
+        raise KickstartTimeoutError(formatErrorMsg(0, msg=_("Reading the kickstart file took longer than %s seconds") % limits.timeout))
+
+    return dict(zip(locations, results))
+
+async def _preprocess(contents, fetcher, limits=None):
+    lines = contents.splitlines(True)
+
+    # The same rules _preprocessStateMachine uses to find the URL, leaving
+    # it to report lines it can't make sense of.
+    urls = []
+    for line in lines:
+        words = line.strip().split(" ")
+        if words[0].startswith("%ksappend") and len(words) > 1:
+            urls.append(words[1])
+
+    fetched = await _fetchAll(fetcher, urls, limits)
+
+    def loadFetched(url):
+        (contents, error) = fetched[url]
+        if error is not None:
+            raise error
+
+        return contents
+
+    return _preprocessStateMachine(iter(lines + [""]), load=loadFetched, limits=limits)
+
+async def preprocessFromStringToStringAsync(s, fetcher=None, limits=None):
+    """Preprocess the kickstart file, provided as the string s, fetching
+       every %ksappend URL at once with fetcher.  Returns the complete
+       kickstart file encoded as preprocessFromStringToString does.  limits
+       is a pykickstart.limits.Limits as for preprocessFromStringToString.
+    """
+    if limits is not None:
+        limits.start()
+        limits.addBytes(0, len(s))
+
+    return await _preprocess(s, fetcher or HTTPFetcher(), limits)
+
+async def preprocessKickstartToStringAsync(f, fetcher=None, limits=None):
+    """Preprocess the kickstart file given by the filename or URL f,
+       fetching it and then every %ksappend URL in it at once with fetcher.
+       Returns the complete kickstart file encoded as
+       preprocessKickstartToString does.  limits is a
+       pykickstart.limits.Limits as for preprocessKickstartToString.
+    """
+    fetcher = fetcher or HTTPFetcher()
+
+    if limits is not None:
+        limits.start()
+
+    (contents, error) = (await _fetchAll(fetcher, [f], limits))[f]
+    if error is not None:
+        raise KickstartError(formatErrorMsg(0, msg=_("Unable to open input kickstart file: %s") % str(error)))
+
+    if limits is not None:
+        limits.addBytes(0, len(contents))
+
+    return await _preprocess(contents, fetcher, limits)
+
+def _includeDir(location):
+    # This matches what KickstartParser._setCurrentDir does, so names are
+    # resolved to the same locations the parser will ask for.
+    cd = os.path.dirname(location)
+    if not cd.startswith("/"):
+        cd = os.path.abspath(cd)
+
+    return cd
+
+async def readKickstartAsync(parser, f, reset=True, fetcher=None):
+    """Fetch the kickstart file given by the filename or URL f and every
+       file it includes with fetcher, a new HTTPFetcher if none is given,
+       then parse it with the KickstartParser parser.  The files at each
+       level of includes are all fetched at once.  Parsing happens after all
+       the fetching, so it never waits on the network.  Usually called as
+       parser.readKickstartAsync(f).
+
+       The parser's limits are kept to while fetching.  Every URL counts as
+       a fetch, and the files fetched together must fit in the bytes left.
+       Nothing is fetched from deeper than the include depth allows, which
+       the parser then reports when it gets there.
+    """
+    # pylint: disable=protected-access
+    fetcher = fetcher or HTTPFetcher()
+
+    if reset:
+        parser._reset()
+
+    resolver = parser._includes
+    pending = [resolver.resolve(f, parser.currentdir.get(parser._includeDepth - 1))]
+    seen = set()
+    limits = parser.limits
+    depth = parser._includeDepth
+    size = 0
+
+    while pending:
+        batch = [location for location in pending if location not in seen]
+        seen.update(batch)
+
+        fetched = await _fetchAll(fetcher, batch, limits)
+
+        # The parser only counts the bytes of each file as it reads it.
+        if limits is not None:
+            for (location, (contents, _error)) in fetched.items():
+                size += len(contents or "")
+                limits.checkSize(location, size)
+
+        # What this batch includes is one level deeper.
+        depth += 1
+        deeper = parser.followIncludes and (limits is None or limits.maxIncludeDepth is None or
+                                            depth <= limits.maxIncludeDepth)
+
+        pending = []
+        for (location, (contents, error)) in fetched.items():
+            resolver.setContents(location, contents, error)
+
+            if contents is not None and deeper:
+                basedir = _includeDir(location)
+                pending.extend(resolver.resolve(name, basedir) for name in findIncludes(contents))
+
+    parser.readKickstart(f, reset=False)
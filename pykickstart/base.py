@@ -42,10 +42,13 @@ from pykickstart.i18n import _
 
 import six
 import warnings
-from pykickstart.errors import KickstartParseError, formatErrorMsg
+from pykickstart.errors import KickstartDeprecationWarning, KickstartParseError, formatErrorMsg
+from pykickstart.fingerprint import combineDigests, commandDigest, packagesDigest, scriptsDigest, \
+    sectionsDigest
 from pykickstart.ko import KickstartObject
 from pykickstart.version import versionToString
 from pykickstart.parser import Packages
+from pykickstart.sourcemap import SourceMap
 
 ###
 ### COMMANDS
@@ -68,6 +71,9 @@ class KickstartCommand(KickstartObject):
                             command is contained withing.  This is needed to
                             allow referencing of Data objects.
            lineno        -- The current line number in the input file.
+           source        -- The index of the handler's sourceMap entry for
+                            the line that last ran this command, which says
+                            which %include file it was in.
            seen          -- If this command was ever used in the kickstart file,
                             this attribute will be set to True.  This allows
                             for differentiating commands that were omitted
@@ -93,6 +99,7 @@ class KickstartCommand(KickstartObject):
         self.handler = None
         self.lineno = 0
         self.seen = False
+        self.source = None
 
         # If a subclass provides a removedKeywords list, warn if the user
         # continues to use some of the removed keywords
@@ -203,11 +210,41 @@ class DeprecatedCommand(KickstartCommand):
     def parse(self, args):
         """Print a warning message if the command is seen in the input file."""
         mapping = {"lineno": self.lineno, "cmd": self.currentCmd}
-        warnings.warn(_("Ignoring deprecated command on line %(lineno)s:  The %(cmd)s command has been deprecated and no longer has any effect.  It may be removed from future releases, which will result in a fatal error from kickstart.  Please modify your kickstart file to remove this command.") % mapping, DeprecationWarning)
+        warnings.warn(_("Ignoring deprecated command on line %(lineno)s:  The %(cmd)s command has been deprecated and no longer has any effect.  It may be removed from future releases, which will result in a fatal error from kickstart.  Please modify your kickstart file to remove this command.") % mapping, KickstartDeprecationWarning)
 
 ###
 ### HANDLERS
 ###
+
+# The sections a handler holds besides its commands.  These are shared
+# between a handler and its clones along with the commands.
+_sharedSections = ["packages", "scripts", "_null_section_strings"]
+
+def _copyObject(obj):
+    """Return a copy of a command, data object, section or list of them that
+       can be changed without changing obj.  Lists, dicts and sets held by obj
+       are copied, along with any pykickstart objects in those lists.  Other
+       values, such as strings and option parsers, are shared.
+    """
+    if isinstance(obj, list):
+        return [_copyObject(v) if isinstance(v, KickstartObject) else v for v in obj]
+
+    state = {}
+    for (key, value) in obj.__dict__.items():
+        if isinstance(value, list):
+            value = _copyObject(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        elif isinstance(value, set):
+            value = set(value)
+
+        state[key] = value
+
+    # Some commands proxy attribute access, so don't go through setattr.
+    new = obj.__class__.__new__(obj.__class__)
+    new.__dict__.update(state)
+    return new
+
 class BaseHandler(KickstartObject):
     """Each version of kickstart syntax is provided by a subclass of this
        class.  These subclasses are what users will interact with for parsing,
@@ -253,6 +290,7 @@ class BaseHandler(KickstartObject):
                        manipulated internally and called through dispatcher.
            currentLine -- The current unprocessed line from the input file
                           that caused this handler to be run.
+           currentSource -- The index of the sourceMap entry for currentLine.
            packages -- An instance of pykickstart.parser.Packages which
                        describes the packages section of the input file.
            platform -- A string describing the hardware platform, which is
@@ -261,6 +299,10 @@ class BaseHandler(KickstartObject):
                        populated by KickstartParser.addScript and describes the
                        %pre/%pre-install/%post/%traceback script section of the
                        input file.
+           sourceMap -- A pykickstart.sourcemap.SourceMap of the file and
+                        line of every command and section read, which the
+                        source attribute of commands, data objects and
+                        scripts index.
         """
 
         # We don't want people using this class by itself.
@@ -278,6 +320,8 @@ class BaseHandler(KickstartObject):
         # These will be set by the dispatcher.
         self.commands = {}
         self.currentLine = ""
+        self.currentSource = None
+        self.sourceMap = SourceMap()
 
         # A dict keyed by an integer priority number, with each value being a
         # list of KickstartCommand subclasses.  This dict is maintained by
@@ -291,42 +335,63 @@ class BaseHandler(KickstartObject):
         # in the future.  Don't rely on this exact implementation.
         self._null_section_strings = []
 
+        # The digests fingerprint has already worked out, so only the parts
+        # that changed since need to be looked at again.  Keyed by the id of
+        # each command object, or by "packages" and "scripts", with values
+        # of (object, digest) tuples so replaced objects are noticed.
+        self._fingerprints = {}
+
         self._registerCommands(mapping, dataMapping, commandUpdates, dataUpdates)
 
     def __str__(self):
         """Return a string formatted for output to a kickstart file."""
-        retval = ""
+        return "".join(self._strParts())
+
+    def write(self, f):
+        """Write the same text __str__ returns to the open file f, a command
+           or section at a time, so the whole of it is never held at once.
+        """
+        for part in self._strParts():
+            f.write(part)
+
+    @staticmethod
+    def _objStr(obj):
+        """Return the text of one command, script or Packages object."""
+        obj_str = obj.__str__()
+        if isinstance(obj_str, six.text_type) and not six.PY3:
+            obj_str = obj_str.encode("utf-8")
+        return obj_str
+
+    def _strParts(self, strFunc=None):
+        """Generate the pieces of the text __str__ returns, in order.  If
+           strFunc is given, it is called to get the text of each command,
+           script and the Packages object instead of _objStr.
+        """
+        if strFunc is None:
+            strFunc = self._objStr
 
         if self.platform:
-            retval += "#platform=%s\n" % self.platform
+            yield "#platform=%s\n" % self.platform
 
-        retval += "#version=%s\n" % versionToString(self.version)
+        yield "#version=%s\n" % versionToString(self.version)
 
         lst = list(self._writeOrder.keys())
         lst.sort()
 
         for prio in lst:
             for obj in self._writeOrder[prio]:
-                obj_str = obj.__str__()
-                if isinstance(obj_str, six.text_type) and not six.PY3:
-                    obj_str = obj_str.encode("utf-8")
-                retval += obj_str
+                yield strFunc(obj)
 
         for script in self.scripts:
-            script_str = script.__str__()
-            if isinstance(script_str, six.text_type) and not six.PY3:
-                script_str = script_str.encode("utf-8")
-            retval += script_str
+            yield strFunc(script)
 
         if self._null_section_strings:
-            retval += "\n"
+            yield "\n"
 
             for s in self._null_section_strings:
-                retval += s
+                yield s
 
-        retval += self.packages.__str__()
-
-        return retval
+        yield strFunc(self.packages)
 
     def _insertSorted(self, lst, obj):
         length = len(lst)
@@ -362,6 +427,12 @@ class BaseHandler(KickstartObject):
             if not six.PY3:
                 name = unicode(name)    # pylint: disable=undefined-variable
 
+        # A command replacing one that is shared with a clone is no longer
+        # shared.
+        if name.lower() in self.__dict__.get("_shared", {}):
+            self._sharedIds.pop(id(self._shared.pop(name.lower())), None)
+            self._touched.append(name.lower())
+
         setattr(self, name.lower(), cmdObj)
 
         # Also, add the object into the _writeOrder dict in the right place.
@@ -424,18 +495,21 @@ class BaseHandler(KickstartObject):
         """Given the name of a command that's already been instantiated, create
            a new instance of it that will take the place of the existing
            instance.  This is equivalent to quickly blanking out all the
-           attributes that were previously set.
+           attributes that were previously set.  Every other name for the
+           command gets the new instance too.
 
            This method raises a KeyError if cmdName is invalid.
         """
         if cmdName not in self.commands:
             raise KeyError
 
-        cmdObj = self.commands[cmdName].__class__()
+        old = self.commands[cmdName]
+        cmdObj = old.__class__()
+        cmdObj.handler = self
 
         self._setCommand(cmdObj)
+        self._replaceCommand(old, cmdObj)
         self.commands[cmdName] = cmdObj
-        self.commands[cmdName].handler = self
 
     def dispatcher(self, args, lineno):
         """Call the appropriate KickstartCommand handler for the current line
@@ -451,10 +525,16 @@ class BaseHandler(KickstartObject):
         if cmd not in self.commands:
             raise KickstartParseError(formatErrorMsg(lineno, msg=_("Unknown command: %s") % cmd))
         elif self.commands[cmd] is not None:
-            self.commands[cmd].currentCmd = cmd
-            self.commands[cmd].currentLine = self.currentLine
-            self.commands[cmd].lineno = lineno
-            self.commands[cmd].seen = True
+            # The command is about to be changed, so it can't be shared with
+            # a clone any longer.
+            cmdObj = self._own(self.commands[cmd])
+
+            cmdObj.currentCmd = cmd
+            cmdObj.currentLine = self.currentLine
+            cmdObj.lineno = lineno
+            cmdObj.source = self.currentSource
+            cmdObj.seen = True
+            self._fingerprints.pop(id(cmdObj), None)
 
             # The parser returns the data object that was modified.  This is either
             # the command handler object itself (a KickstartCommand object), or it's
@@ -462,22 +542,247 @@ class BaseHandler(KickstartObject):
             # dataList.  The latter is done via side effects.
             #
             # Regardless, return the object that was given to us by the parser.
-            obj = self.commands[cmd].parse(args[1:])
+            obj = cmdObj.parse(args[1:])
+            if isinstance(obj, BaseData):
+                obj.source = self.currentSource
 
             # Here's the side effect part - don't worry about lst not being returned.
-            lst = self.commands[cmd].dataList()
+            lst = cmdObj.dataList()
             if isinstance(obj, BaseData) and lst is not None:
                 lst.append(obj)
 
             return obj
 
+    def _invalidateFingerprint(self, names):
+        """Forget the digests of the commands given in the list names, which
+           can also include "packages" and "scripts".
+        """
+        for name in names:
+            if name in ("packages", "scripts"):
+                self._fingerprints.pop(name, None)
+            elif self.commands.get(name) is not None:
+                self._fingerprints.pop(id(self.commands[name]), None)
+
+    def _cachedDigest(self, key, obj, fn):
+        cached = self._fingerprints.get(key)
+        if cached is None or cached[0] is not obj:
+            cached = (obj, fn(obj))
+            self._fingerprints[key] = cached
+
+        return cached[1]
+
+    def fingerprint(self, changed=None):
+        """Return a hex digest of what this handler describes, which is the
+           same for any two kickstart files that differ only in whitespace or
+           the order of their commands, data entries, packages and groups.
+           The digest is built from the state of each command, the package
+           and group sets and the script bodies, without rendering any of
+           them back into text.
+
+           Each part's digest is remembered, and only the commands and
+           sections the parser has seen since the last call are looked at
+           again.  Anything changed by other means must be listed in changed,
+           a list of command names that can also include "packages" and
+           "scripts".
+        """
+        if changed:
+            self._invalidateFingerprint(changed)
+
+        # Aliases share a command object, so use the same name for it
+        # whichever of them the file used.
+        names = {}
+        objs = {}
+        for (name, cmd) in self.commands.items():
+            if cmd is not None:
+                names[id(cmd)] = min(name, names.get(id(cmd), name))
+                objs[id(cmd)] = cmd
+
+        # Forget about commands that have been replaced since the last call.
+        for key in list(self._fingerprints.keys()):
+            if key not in objs and key not in ("packages", "scripts"):
+                del self._fingerprints[key]
+
+        parts = {}
+        for (key, cmd) in objs.items():
+            parts[names[key]] = self._cachedDigest(key, cmd, commandDigest)
+
+        parts["%packages"] = self._cachedDigest("packages", self.packages, packagesDigest)
+        parts["%scripts"] = self._cachedDigest("scripts", self.scripts, scriptsDigest)
+        parts["%unknown"] = sectionsDigest(self._null_section_strings)
+
+        return combineDigests(self.version, parts)
+
+    def edit(self, name):
+        """Return the command or section called name so it can be changed.
+           name is a key of the commands dict or the name of an attribute,
+           such as "packages" or "scripts".  A command or section shared with
+           a clone, or kept for reset to put back, is copied first, so the
+           change is only seen by this handler.
+
+           Once a handler has been cloned or reset, its commands and sections
+           must only be changed through what this method returns, or by
+           parsing into the handler.
+        """
+        if name in self.commands:
+            return self._own(self.commands[name])
+
+        return self._own(getattr(self, name))
+
+    def _own(self, obj):
+        """Return obj, a command or section of this handler, or the copy of
+           it that belongs to this handler alone if it is shared.
+        """
+        if obj is not None and id(obj) in self.__dict__.get("_sharedIds", {}):
+            return self._unshare(self._sharedIds[id(obj)])
+
+        return obj
+
+    def _unshare(self, name):
+        """Replace the command or section called name, which is shared with a
+           clone, with a copy of it that belongs to this handler alone.
+        """
+        obj = self._shared.pop(name)
+        self._sharedIds.pop(id(obj), None)
+        self._touched.append(name)
+
+        new = _copyObject(obj)
+        self.__dict__[name] = new
+
+        if isinstance(obj, KickstartCommand):
+            new.handler = self
+            self._replaceCommand(obj, new)
+
+        return new
+
+    def _replaceCommand(self, old, new):
+        """Put the command object new everywhere this handler refers to the
+           command object old, without copying anything.
+        """
+        for (key, value) in list(self.commands.items()):
+            if value is old:
+                dict.__setitem__(self.commands, key, new)
+
+        lst = self._writeOrder.get(old.writePriority, [])
+        for (i, value) in enumerate(lst):
+            if value is old:
+                lst[i] = new
+
+    def _share(self):
+        """Mark every command and section of this handler as shared, so it is
+           copied the first time it is changed.
+        """
+        shared = self.__dict__.get("_shared", {})
+
+        for (name, value) in self.__dict__.items():
+            if isinstance(value, KickstartCommand) or name in _sharedSections:
+                shared[name] = value
+
+        self._shared = shared
+        self._sharedIds = dict((id(value), name) for (name, value) in shared.items())
+
+        # What reset puts back.  Anything shared now that differs from it has
+        # already been noted in _touched.
+        if "_pristine" not in self.__dict__:
+            self._pristine = dict(shared)
+            self._touched = []
+            self._sourceMark = len(self.sourceMap)
+        self.commands = dict(self.commands)
+        self._writeOrder = dict((prio, list(lst)) for (prio, lst) in self._writeOrder.items())
+
+    def clone(self):
+        """Return a new handler holding the same commands, data objects,
+           %packages and scripts as this one.  Nothing is copied up front:
+           the two handlers share everything, and a command or section is
+           only copied when either of them changes it, by parsing or through
+           edit.  Reading a handler, writing it out or taking its fingerprint
+           copies nothing, so cloning takes the same time however long the
+           kickstart file is.
+
+           Afterwards, neither handler's commands and sections may be changed
+           other than by parsing or through edit, whether they were looked
+           up before or after the clone was made.  Until one of them is
+           copied, both handlers hold the very same object, so a plain
+           assignment such as clone.rootpw.password = "x", or appending to
+           clone.packages.packageList, changes the original as well.  Write
+           clone.edit("rootpw").password = "x" instead.
+        """
+        self._share()
+
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._shared = dict(self._shared)
+        del new.__dict__["_pristine"]
+        new._fingerprints = dict(self._fingerprints)
+        new._share()
+
+        return new
+
+    def reset(self):
+        """Undo everything done to this handler, so it can be used to parse
+           another file.  The first reset replaces every command and section
+           with a new one.  After that, every command and section is shared
+           with a saved copy in the same way clone shares them, so each reset
+           only has to put back the ones that were changed since the last
+           one.
+
+           A clone is put back to how it was when it was cloned, and so is a
+           handler that was cloned before it was ever reset.  As after clone,
+           commands and sections must then only be changed by parsing or
+           through edit.
+        """
+        if "_pristine" not in self.__dict__:
+            cmds = dict((id(v), v) for v in self.commands.values() if v is not None)
+            for cmd in cmds.values():
+                new = cmd.__class__()
+                new.handler = self
+                self._setCommand(new)
+                self._replaceCommand(cmd, new)
+
+            self.packages = Packages()
+            self.scripts = []
+            self._null_section_strings = []
+            self._fingerprints = {}
+            self.sourceMap = SourceMap()
+            self._share()
+        else:
+            # Sections may also have been replaced outright.
+            touched = set(self._touched)
+            touched.update(name for name in _sharedSections
+                           if self.__dict__.get(name) is not self._pristine[name])
+
+            for name in touched:
+                obj = self._pristine[name]
+
+                # What was touched may have been shared with a clone since.
+                current = self.__dict__.get(name)
+                if self._shared.get(name) is current:
+                    self._sharedIds.pop(id(current), None)
+
+                self.__dict__[name] = obj
+                self._shared[name] = obj
+                self._sharedIds[id(obj)] = name
+
+                if isinstance(current, KickstartCommand) and current is not obj:
+                    self._replaceCommand(current, obj)
+                    self._fingerprints.pop(id(current), None)
+
+            self._touched = []
+
+            # A clone may be adding to the same map, so the entries of what
+            # was put back are kept in a new one.
+            if len(self.sourceMap) > self._sourceMark:
+                self.sourceMap = self.sourceMap.copy(self._sourceMark)
+
+        self.currentLine = ""
+        self.currentSource = None
+
     def maskAllExcept(self, lst):
         """Set all entries in the commands dict to None, except the ones in
            the lst.  All other commands will not be processed.
         """
         self._writeOrder = {}
 
-        for (key, _val) in list(self.commands.items()):
+        for key in list(self.commands.keys()):
             if key not in lst:
                 self.commands[key] = None
 
@@ -497,6 +802,8 @@ class BaseData(KickstartObject):
         """Create a new BaseData instance.
 
            lineno -- Line number in the ks-file where this object was defined
+           source -- The index of the handler's sourceMap entry for the line
+                     this object was defined on
         """
 
         # We don't want people using this class by itself.
@@ -505,6 +812,7 @@ class BaseData(KickstartObject):
 
         KickstartObject.__init__(self, *args, **kwargs)
         self.lineno = 0
+        self.source = None
 
         # If a subclass provides a removedKeywords list, warn if the user
         # continues to use some of the removed keywords
@@ -19,6 +19,7 @@
 #
 from pykickstart.version import F12, F13, RHEL7
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.errors import KickstartParseWarning
 from pykickstart.options import KSOptionParser
 
 import warnings
@@ -116,7 +117,7 @@ class F12_Fcoe(KickstartCommand):
 
         # Check for duplicates in the data list.
         if zd in self.dataList():
-            warnings.warn(_("A FCOE device with the name %s has already been defined.") % zd.nic)
+            warnings.warn(_("A FCOE device with the name %s has already been defined.") % zd.nic, KickstartParseWarning)
 
         return zd
 
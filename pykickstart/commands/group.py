@@ -19,6 +19,7 @@
 #
 from pykickstart.version import F12
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.errors import KickstartParseWarning
 from pykickstart.options import KSOptionParser
 
 import warnings
@@ -91,7 +92,7 @@ class F12_Group(KickstartCommand):
 
         # Check for duplicates in the data list.
         if gd in self.dataList():
-            warnings.warn(_("A group with the name %s has already been defined.") % gd.name)
+            warnings.warn(_("A group with the name %s has already been defined.") % gd.name, KickstartParseWarning)
 
         return gd
 
@@ -28,7 +28,7 @@ class FC3_Method(KickstartCommand):
     # These are all set up as part of the base KickstartCommand.  We want to
     # make sure looking them up gets redirected to the right place.
     internals = ["method",
-                 "writePriority", "currentCmd", "currentLine", "handler", "lineno", "seen"]
+                 "writePriority", "currentCmd", "currentLine", "handler", "lineno", "source", "seen"]
 
     _methods = ["cdrom", "harddrive", "nfs", "url"]
 
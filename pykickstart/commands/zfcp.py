@@ -19,6 +19,7 @@
 #
 from pykickstart.version import FC3, F12, F14
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.errors import KickstartParseWarning
 from pykickstart.options import KSOptionParser
 
 import warnings
@@ -116,7 +117,7 @@ class FC3_ZFCP(KickstartCommand):
 
         # Check for duplicates in the data list.
         if zd in self.dataList():
-            warnings.warn(_("A zfcp with this information has already been defined."))
+            warnings.warn(_("A zfcp with this information has already been defined."), KickstartParseWarning)
 
         return zd
 
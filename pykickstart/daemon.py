@@ -0,0 +1,252 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+A resident process that validates and flattens kickstart files on request.
+
+Starting Python, importing every version's commands and making a handler take
+far longer than checking a typical kickstart file.  ksvalidatord pays for that
+once and keeps handlers and parsers for each version in a HandlerPool, so each
+request only costs the parse itself.
+
+Requests and responses are JSON objects, one per line, over a Unix socket.
+Every request has an "op" key:
+
+    validate - Check the file at "location", or the string "contents" if
+               given, against "version".  "followIncludes", "firstError" and
+               "storage" work as the ksvalidator options of the same names.
+               The response has "retval", "messages" and "errors", the
+               messages a non-fatal parse would print to stderr.
+
+    flatten - Parse the file as validate does and return it as one file in
+              "output", with the same "retval" and "messages".
+
+    ping - Do nothing, giving a "retval" of 0.
+
+    shutdown - Stop the server after responding.
+
+Relative locations are looked up in the request's "cwd".  Clients talk to
+the server with pykickstart.daemonclient, which this module takes its
+defaultSocketPath and request functions from.
+
+This module exports a class and a few functions:
+
+    ValidationServer - The server, which handles one connection at a time.
+
+    defaultSocketPath - Return where the server listens by default.
+
+    request - Send one request to a server and return its response.
+"""
+import json
+import os
+import socket
+import sys
+import warnings
+
+import six
+from six.moves import socketserver
+
+from pykickstart.daemonclient import defaultSocketPath, request    # pylint: disable=unused-import
+from pykickstart.errors import KickstartError, KickstartParseError, KickstartVersionError
+from pykickstart.load import load_to_str
+from pykickstart.parser import CollectingParser, preprocessFromStringToString
+from pykickstart.pool import HandlerPool
+from pykickstart.storage import checkStorage
+from pykickstart.version import DEVEL
+
+from pykickstart.i18n import _
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while not self.server.stopping:
+            line = self.rfile.readline()
+            if not line:
+                break
+            elif not line.strip():
+                continue
+
+            try:
+                message = json.loads(line.decode("utf-8"))
+                if not isinstance(message, dict):
+                    raise ValueError(message)
+            except ValueError:
+                response = {"retval": 1, "messages": [_("Malformed request")], "errors": []}
+            else:
+                response = self.server.dispatch(message)
+
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+class ValidationServer(socketserver.UnixStreamServer):
+    """A server that validates and flattens kickstart files sent to it over
+       the Unix socket at path.  Connections are handled one at a time, so a
+       request never waits on another one for the interpreter.  The socket
+       can only be used by the user the server runs as.  Instance attributes:
+
+       pool     -- The HandlerPool the handlers and parsers come from.  Each
+                   is reset after every request, and dropped instead if
+                   parsing failed in some way that may have left it broken.
+       stopping -- Set to True to stop serve after the current request.
+    """
+    def __init__(self, path, versions=None, poolSize=4):
+        self.pool = HandlerPool(size=poolSize, parserClass=CollectingParser)
+        self.stopping = False
+
+        if os.path.exists(path):
+            try:
+                request(path, {"op": "ping"}, timeout=1)
+            except (socket.error, ValueError):
+                os.unlink(path)
+            else:
+                raise KickstartError(_("Another server is already listening on %s") % path)
+
+        socketserver.UnixStreamServer.__init__(self, path, _RequestHandler, bind_and_activate=False)
+
+        try:
+            oldmask = os.umask(0o077)
+            try:
+                self.server_bind()
+            finally:
+                os.umask(oldmask)
+
+            self.server_activate()
+        except (socket.error, OSError) as e:
+            self.server_close()
+            raise KickstartError(_("Unable to listen on %(path)s: %(error)s") % {"path": path, "error": e})
+
+        for version in versions or []:
+            self.pool.warm(version)
+
+    def serve(self):
+        """Handle requests until a shutdown request arrives, then remove the
+           socket.
+        """
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+
+            try:
+                os.unlink(self.server_address)
+            except OSError:
+                pass
+
+    def dispatch(self, message):
+        """Return the response to the request message."""
+        op = message.get("op")
+
+        if op == "validate":
+            return self.validate(message)
+        elif op == "flatten":
+            return self.flatten(message)
+        elif op == "ping":
+            return {"retval": 0, "messages": [], "errors": []}
+        elif op == "shutdown":
+            self.stopping = True
+            return {"retval": 0, "messages": [], "errors": []}
+        else:
+            return {"retval": 1, "messages": [_("Unknown request: %s") % op], "errors": []}
+
+    def _load(self, message):
+        location = message.get("location") or ""
+        cwd = message.get("cwd")
+
+        # Relative %include paths are looked up next to the original file,
+        # which is relative to the client rather than the server.
+        path = location
+        if cwd and location and "://" not in location:
+            path = os.path.join(cwd, location)
+
+        contents = message.get("contents")
+        if contents is None:
+            contents = load_to_str(path)
+
+        if "%ksappend" in contents:
+            contents = preprocessFromStringToString(contents)
+            if six.PY3:
+                contents = contents.decode(sys.getdefaultencoding())
+
+        return (path or None, contents)
+
+    def _parse(self, message, func):
+        """Parse the file a request refers to with a parser from the pool and
+           call func with it afterwards.  Returns the response, with whatever
+           func returns added to it.
+        """
+        version = message.get("version", DEVEL)
+        location = message.get("location")
+
+        try:
+            (path, contents) = self._load(message)
+        except KickstartError as e:
+            return {"retval": 1, "messages": [_("Error reading %(filename)s:\n%(version)s") % {"filename": location, "version": e}], "errors": []}
+
+        try:
+            (handler, parser) = self.pool.acquire(version)
+        except KickstartVersionError:
+            return {"retval": 1, "messages": [_("The version %s is not supported by pykickstart") % version], "errors": []}
+
+        parser.followIncludes = bool(message.get("followIncludes", False))
+        parser.errorsAreFatal = bool(message.get("firstError", False))
+        parser.messages = []
+
+        response = {"retval": 1, "messages": [], "errors": parser.messages}
+        keep = True
+
+        with warnings.catch_warnings():
+            # turn DeprecationWarnings into errors
+            warnings.filterwarnings("error")
+
+            try:
+                parser.readKickstartFromString(contents, path=path)
+                response["retval"] = parser.errorsCount
+                response.update(func(handler, parser))
+            except DeprecationWarning as err:
+                response["messages"] = [_("File uses a deprecated option or command.\n%s") % err]
+            except KickstartParseError as err:
+                response["messages"] = [str(err)]
+            except KickstartError:
+                response["messages"] = [_("General kickstart error in input file")]
+            except Exception as e:      # pylint: disable=broad-except
+                response["messages"] = [_("General error in input file:  %s") % e]
+                keep = False
+
+        if keep:
+            self.pool.release(handler, parser)
+
+        return response
+
+    def validate(self, message):
+        """Return the response to a validate request."""
+        def check(handler, parser):
+            if not message.get("storage") or parser.errorsCount != 0:
+                return {}
+
+            errors = checkStorage(handler)
+            if errors and parser.errorsAreFatal:
+                return {"retval": 1, "messages": [str(errors[0])]}
+            elif errors:
+                return {"retval": len(errors), "messages": [str(err) for err in errors]}
+
+            return {}
+
+        return self._parse(message, check)
+
+    def flatten(self, message):
+        """Return the response to a flatten request."""
+        return self._parse(message, lambda handler, parser: {"output": str(handler)})
@@ -0,0 +1,68 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Talking to a running ksvalidatord.
+
+This module imports nothing that parsing needs, so a client that only asks
+the server to do the work starts quickly.  The protocol is described in
+pykickstart.daemon.
+
+This module exports two functions:
+
+    defaultSocketPath - Return where the server listens by default.
+
+    request - Send one request to a server and return its response.
+"""
+import json
+import os
+import socket
+import tempfile
+
+def defaultSocketPath():
+    """Return the path of the socket ksvalidatord listens on and ksvalidator
+       --daemon connects to when no other is given.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "ksvalidatord.sock")
+
+    return os.path.join(tempfile.gettempdir(), "ksvalidatord-%d.sock" % os.getuid())
+
+def request(path, message, timeout=None):
+    """Send the dict message to the server listening on the socket path and
+       return the dict it responds with.  Raises socket.error if there is no
+       server to talk to, and ValueError if its response can't be read.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+
+    try:
+        sock.connect(path)
+        sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+
+            data += chunk
+    finally:
+        sock.close()
+
+    return json.loads(data.decode("utf-8"))
@@ -0,0 +1,403 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Comparing two parsed kickstart files command by command.
+
+Rather than comparing the text of two files, this compares the state of the
+commands, data objects, %packages and scripts held by two handlers.  Data
+objects are matched up by the same natural keys their commands use to spot
+duplicates - the mount point of a partition, the volume group and name of a
+logical volume, the name of a user and so on - using dicts, so comparing two
+large layouts takes time in proportion to their size.
+
+This module exports a single class:
+
+    Difference - One command, data object, package or script that was added,
+                 removed or changed, along with the options that changed.
+
+And it exports two functions:
+
+    diffHandlers - Return a list of the Differences between two handlers.
+
+    keyFunction - Return functions giving and showing the natural key of a
+                  command's data objects.
+"""
+import json
+import operator
+import six
+
+from pykickstart.constants import KS_SCRIPT_ONERROR, KS_SCRIPT_POST, KS_SCRIPT_PRE, \
+    KS_SCRIPT_PREINSTALL, KS_SCRIPT_TRACEBACK
+from pykickstart.fingerprint import COMMAND_SKIP, DATA_SKIP, canonicalState
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+# The attributes that pick out a data object among the others of its command,
+# the same ones their __eq__ methods compare.  Data objects of commands not
+# listed here are only ever added or removed, never changed.
+_naturalKeys = {"btrfs": ("mountpoint",),
+                "device": ("moduleName",),
+                "dmraid": ("name",),
+                "fcoe": ("nic",),
+                "group": ("name",),
+                "logvol": ("vgname", "name"),
+                "network": ("device",),
+                "part": ("mountpoint",),
+                "raid": ("device",),
+                "repo": ("name",),
+                "sshkey": ("username",),
+                "sshpw": ("username",),
+                "user": ("name",),
+                "volgroup": ("vgname",),
+                "zfcp": ("devnum", "wwpn", "fcplun")}
+
+# Attributes of commands and sections that are not options.  Whether they
+# were given at all is reported as added or removed instead.
+_commandSkip = COMMAND_SKIP | set(["seen"])
+_sectionSkip = DATA_SKIP | set(["seen"])
+
+_scriptSections = {KS_SCRIPT_PRE: "%pre",
+                   KS_SCRIPT_POST: "%post",
+                   KS_SCRIPT_TRACEBACK: "%traceback",
+                   KS_SCRIPT_PREINSTALL: "%pre-install",
+                   KS_SCRIPT_ONERROR: "%onerror"}
+
+_packageLists = [("packageList", ""), ("groupList", ""),
+                 ("excludedList", "-"), ("excludedGroupList", "-")]
+
+# The state of a command or data object nobody has touched, by
+# class, so options can be reported as added or removed and not just changed.
+_defaults = {}
+
+def _formatValue(value):
+    if isinstance(value, six.string_types):
+        return value
+    else:
+        return json.dumps(value, sort_keys=True)
+
+class Difference(object):
+    """One difference between two handlers.  Instance attributes:
+
+       kind    -- ADDED, REMOVED or CHANGED.
+       command -- The name of the command, or %packages, or the name of the
+                  script section.
+       key     -- A string saying which data object, package or script this
+                  is about, or None for a whole command.
+       options -- A list of (kind, option, old, new) tuples for each option
+                  that was added, removed or changed.  Options are given by
+                  their name on the command line where there is one, and by
+                  attribute name otherwise.
+    """
+    def __init__(self, kind, command, key=None, options=None):
+        self.kind = kind
+        self.command = command
+        self.key = key
+        self.options = options or []
+
+    def __str__(self):
+        marks = {ADDED: "+", REMOVED: "-", CHANGED: "~"}
+
+        retval = "%s %s" % (marks[self.kind], self.command)
+        if self.key:
+            retval += " %s" % self.key
+
+        for (kind, option, old, new) in self.options:
+            if kind == CHANGED:
+                retval += "\n    ~ %s: %s -> %s" % (option, _formatValue(old), _formatValue(new))
+            elif kind == ADDED and new is True:
+                retval += "\n    + %s" % option
+            elif kind == ADDED:
+                retval += "\n    + %s=%s" % (option, _formatValue(new))
+            elif old is True:
+                retval += "\n    - %s" % option
+            else:
+                retval += "\n    - %s=%s" % (option, _formatValue(old))
+
+        return retval
+
+    def __repr__(self):
+        return "<Difference %s %s %s>" % (self.kind, self.command, self.key)
+
+def _optionNames(cmd):
+    """Return a dict mapping the attributes set by the options of cmd to the
+       name of the option.
+    """
+    op = getattr(cmd, "op", None)
+    if op is None:
+        return {}
+
+    retval = {}
+    for action in op._actions:
+        if action.option_strings:
+            names = [o for o in action.option_strings if o.startswith("--")] or action.option_strings
+            retval.setdefault(action.dest, names[0])
+
+    return retval
+
+def _state(obj, skip):
+    """Return a dict of the public attributes of obj other than those in
+       skip.  The values are compared as they are, which is much quicker
+       than building their canonical state first.
+    """
+    return dict((k, v) for (k, v) in vars(obj).items()
+                if not k.startswith("_") and k not in skip and not callable(v))
+
+def _default(cls, skip):
+    """Return the state of a new instance of cls, which also says which of
+       its attributes are options.  Anything else was left behind by the
+       option parser.
+    """
+    if cls not in _defaults:
+        _defaults[cls] = _state(cls(), skip)
+
+    return _defaults[cls]
+
+def _isEmpty(value):
+    return value is None or value is False or value == "" or value == 0 or value == [] or value == {}
+
+def _diffOptions(old, new, default, names):
+    """Compare the attribute dicts old and new, and return a list of (kind,
+       option, old, new) tuples for the attributes in default that differ.
+       An option is added if old has the default value for it and that value
+       is empty, and removed if new does.
+    """
+    retval = []
+
+    for attr in default:
+        (o, n) = (old.get(attr), new.get(attr))
+        if o == n:
+            continue
+
+        option = names.get(attr, attr)
+        d = default.get(attr)
+
+        if o == d and _isEmpty(o):
+            kind = ADDED
+        elif n == d and _isEmpty(n):
+            kind = REMOVED
+        else:
+            kind = CHANGED
+
+        retval.append((kind, option, canonicalState(o), canonicalState(n)))
+
+    retval.sort(key=lambda t: t[1])
+    return retval
+
+def _commandNames(handler):
+    """Return a dict mapping a name for every command object of handler to
+       the object.  Aliases share a command object, so the same name is used
+       for it whichever of them the file used.
+    """
+    names = {}
+    for (name, cmd) in handler.commands.items():
+        if cmd is not None:
+            names[id(cmd)] = (min(name, names.get(id(cmd), (name, None))[0]), cmd)
+
+    return dict(names.values())
+
+def _dataListAttr(cmd):
+    """Return the name of the attribute holding cmd's data objects, or None
+       if it does not have any.
+    """
+    try:
+        lst = cmd.dataList()
+    except AttributeError:
+        return None
+
+    if lst is None:
+        return None
+
+    for (attr, value) in vars(cmd).items():
+        if value is lst:
+            return attr
+
+    return None
+
+def keyFunction(name):
+    """Return a function giving the natural key of a data object of the
+       command name, and a function turning a key into a string to show.
+    """
+    attrs = _naturalKeys.get(name)
+    if attrs is None:
+        return (lambda data: json.dumps(canonicalState(data), sort_keys=True), lambda key: None)
+
+    getter = operator.attrgetter(*attrs)
+    if len(attrs) == 1:
+        return (getter, lambda key: six.text_type(key or ""))
+    else:
+        return (getter, lambda key: "/".join(six.text_type(k or "") for k in key))
+
+def _diffData(display, name, oldCmd, newCmd, listAttr, names):
+    retval = []
+
+    oldList = getattr(oldCmd, listAttr, []) if oldCmd is not None else []
+    newList = getattr(newCmd, listAttr, []) if newCmd is not None else []
+
+    cmd = newCmd if newCmd is not None else oldCmd
+    default = _default(cmd.dataClass, DATA_SKIP)
+    (keyOf, show) = keyFunction(name)
+
+    # Comparing the values of every option at once is far quicker than
+    # going through them one at a time, and most objects are unchanged.
+    values = operator.itemgetter(*default.keys()) if default else lambda d: ()
+
+    # Index the old objects by key.  Keys given more than once are matched
+    # up in the order they were given.
+    index = {}
+    for data in oldList:
+        index.setdefault(keyOf(data), []).append(vars(data))
+
+    for data in newList:
+        key = keyOf(data)
+        state = vars(data)
+
+        if index.get(key):
+            oldState = index[key].pop(0)
+
+            try:
+                if values(oldState) == values(state):
+                    continue
+            except KeyError:
+                pass
+
+            options = _diffOptions(oldState, state, default, names)
+            if options:
+                retval.append(Difference(CHANGED, display, show(key), options))
+        else:
+            retval.append(Difference(ADDED, display, show(key), _diffOptions(default, state, default, names)))
+
+    for (key, states) in index.items():
+        for state in states:
+            retval.append(Difference(REMOVED, display, show(key), _diffOptions(state, default, default, names)))
+
+    return retval
+
+def _diffCommand(name, oldCmd, newCmd):
+    retval = []
+
+    cmd = newCmd if newCmd is not None else oldCmd
+    names = _optionNames(cmd)
+    listAttr = _dataListAttr(cmd)
+
+    skip = set(_commandSkip)
+    if listAttr:
+        skip.add(listAttr)
+
+    default = _default(cmd.__class__, skip)
+
+    old = _state(oldCmd, skip) if oldCmd is not None else default
+    new = _state(newCmd, skip) if newCmd is not None else default
+
+    oldSeen = oldCmd is not None and oldCmd.seen
+    newSeen = newCmd is not None and newCmd.seen
+
+    # Report commands with aliases by the name the files used.
+    if newSeen and newCmd.currentCmd:
+        display = newCmd.currentCmd
+    elif oldSeen and oldCmd.currentCmd:
+        display = oldCmd.currentCmd
+    else:
+        display = name
+
+    options = _diffOptions(old, new, default, names)
+
+    # Commands with data objects are only reported for options of their own.
+    if listAttr and not options:
+        pass
+    elif newSeen and not oldSeen:
+        retval.append(Difference(ADDED, display, None, options))
+    elif oldSeen and not newSeen:
+        retval.append(Difference(REMOVED, display, None, options))
+    elif options:
+        retval.append(Difference(CHANGED, display, None, options))
+
+    if listAttr:
+        retval.extend(_diffData(display, name, oldCmd, newCmd, listAttr, names))
+
+    return retval
+
+def _diffPackages(old, new):
+    retval = []
+
+    for (attr, prefix) in _packageLists:
+        oldNames = set(six.text_type(p) for p in getattr(old, attr))
+        newNames = set(six.text_type(p) for p in getattr(new, attr))
+
+        for p in sorted(newNames - oldNames):
+            retval.append(Difference(ADDED, "%packages", prefix + p))
+        for p in sorted(oldNames - newNames):
+            retval.append(Difference(REMOVED, "%packages", prefix + p))
+
+    skip = _sectionSkip | set(attr for (attr, prefix) in _packageLists)
+    options = _diffOptions(_state(old, skip), _state(new, skip), _default(old.__class__, skip), {})
+    if options:
+        retval.insert(0, Difference(CHANGED, "%packages", None, options))
+
+    return retval
+
+def _scriptKey(state):
+    for line in state.get("script", "").splitlines():
+        if line.strip():
+            return line.strip()
+
+    return ""
+
+def _diffScripts(oldScripts, newScripts):
+    retval = []
+
+    index = {}
+    for script in oldScripts:
+        state = canonicalState(script)
+        index.setdefault(json.dumps(state, sort_keys=True), []).append(script)
+
+    for script in newScripts:
+        state = canonicalState(script)
+        key = json.dumps(state, sort_keys=True)
+
+        if index.get(key):
+            index[key].pop(0)
+        else:
+            retval.append(Difference(ADDED, _scriptSections.get(script.type, "%script"), _scriptKey(state)))
+
+    for scripts in index.values():
+        for script in scripts:
+            retval.append(Difference(REMOVED, _scriptSections.get(script.type, "%script"),
+                                     _scriptKey(canonicalState(script))))
+
+    return retval
+
+def diffHandlers(old, new):
+    """Compare the handlers old and new, which have each been used to parse
+       a kickstart file, and return a list of Differences describing what
+       needs to change to get from old to new.  Commands are listed in name
+       order, followed by %packages and the scripts.
+    """
+    retval = []
+
+    oldCommands = _commandNames(old)
+    newCommands = _commandNames(new)
+
+    for name in sorted(set(oldCommands.keys()) | set(newCommands.keys())):
+        retval.extend(_diffCommand(name, oldCommands.get(name), newCommands.get(name)))
+
+    retval.extend(_diffPackages(old.packages, new.packages))
+    retval.extend(_diffScripts(old.scripts, new.scripts))
+
+    return retval
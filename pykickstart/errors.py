@@ -30,11 +30,29 @@ It also exports several exception classes:
 
     KickstartParseError - An exception for errors occurring during parsing.
 
+    KickstartIncludeLoopError - An exception for %include files that end up
+                                including themselves.
+
+    KickstartLimitError - The base class of the exceptions for input that
+                          goes past one of the limits given to the parser:
+                          KickstartIncludeDepthError, KickstartSizeError,
+                          KickstartLineLengthError, KickstartSectionCountError,
+                          KickstartDataCountError, KickstartFetchCountError
+                          and KickstartTimeoutError.
+
     KickstartValueError - No longer raised by pykickstart, but kept around for
                           backwards compatibility.
 
     KickstartVersionError - An exception for errors relating to unsupported
                             syntax versions.
+
+And two warning classes:
+
+    KickstartParseWarning - A warning about the input file that does not
+                            stop it from being read.
+
+    KickstartDeprecationWarning - A warning about a deprecated command or
+                                  option in the input file.
 """
 from pykickstart.i18n import _
 
@@ -47,7 +65,14 @@ def formatErrorMsg(lineno, msg=""):
         return _("There was a problem reading from line %s of the kickstart file") % lineno
 
 class KickstartError(Exception):
-    """A generic exception class for unspecific error conditions."""
+    """A generic exception class for unspecific error conditions.  When the
+       parser knows which line of which file an error is for, it sets the
+       filename and lineno attributes.  The filename is None for a file read
+       from a string.
+    """
+    filename = None
+    lineno = None
+
     def __init__(self, val=""):
         """Create a new KickstartError exception instance with the descriptive
            message val.  val should be the return value of formatErrorMsg.
@@ -72,6 +97,56 @@ class KickstartParseError(KickstartError):
     def __str__(self):
         return self.value
 
+class KickstartIncludeLoopError(KickstartParseError):
+    """An exception class for %include lines that would include a file that
+       is already being read, which would otherwise go on forever.
+    """
+    def __init__(self, msg):
+        """Create a new KickstartIncludeLoopError exception instance with the
+           descriptive message msg.  msg should be the return value of
+           formatErrorMsg.
+        """
+        KickstartParseError.__init__(self, msg)
+
+    def __str__(self):
+        return self.value
+
+class KickstartLimitError(KickstartParseError):
+    """The base exception class for input that goes past one of the limits
+       set by a pykickstart.limits.Limits, which are meant for kickstart files
+       that can not be trusted.  These are always fatal.
+    """
+    def __init__(self, msg):
+        """Create a new KickstartLimitError exception instance with the
+           descriptive message msg.  msg should be the return value of
+           formatErrorMsg.
+        """
+        KickstartParseError.__init__(self, msg)
+
+    def __str__(self):
+        return self.value
+
+class KickstartIncludeDepthError(KickstartLimitError):
+    """An exception class for %include files nested too deeply."""
+
+class KickstartSizeError(KickstartLimitError):
+    """An exception class for input larger than the limit on total bytes."""
+
+class KickstartLineLengthError(KickstartLimitError):
+    """An exception class for lines longer than the limit on line length."""
+
+class KickstartSectionCountError(KickstartLimitError):
+    """An exception class for files with more sections than allowed."""
+
+class KickstartDataCountError(KickstartLimitError):
+    """An exception class for files with more data objects than allowed."""
+
+class KickstartFetchCountError(KickstartLimitError):
+    """An exception class for files fetching more URLs than allowed."""
+
+class KickstartTimeoutError(KickstartLimitError):
+    """An exception class for files taking longer to read than allowed."""
+
 class KickstartValueError(KickstartError):
     """This exception class is no longer raised by pykickstart but is kept
        for backwards compatibility.
@@ -95,3 +170,13 @@ class KickstartVersionError(KickstartError):
 
     def __str__(self):
         return self.value
+
+class KickstartParseWarning(UserWarning):
+    """A warning class for problems in the input file that do not stop it
+       from being read, such as something defined twice.
+    """
+
+class KickstartDeprecationWarning(KickstartParseWarning, DeprecationWarning):
+    """A warning class for deprecated commands and options in the input
+       file.
+    """
@@ -0,0 +1,162 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Canonical forms of parsed kickstart state, for telling whether two kickstart
+files say the same thing.
+
+Two files that differ only in the order of their commands, data entries,
+packages and groups, or in whitespace, have the same canonical form.  The
+canonical form is built from the attributes of the command, data and section
+objects, never from their rendered text.
+
+This module exports several functions:
+
+    canonicalState - Return a structure built only from dicts, lists,
+                     strings, numbers, booleans and None that represents the
+                     state of a command, data object or anything else held by
+                     a handler.
+
+    combineDigests - Combine the digests of the parts of a handler into one.
+
+    commandDigest - Return a digest of the canonical state of one command,
+                    including its data objects.
+
+    packagesDigest - Return a digest of the canonical state of a Packages
+                     object.
+
+    scriptsDigest - Return a digest of the canonical state of a list of
+                    Scripts.
+
+    sectionsDigest - Return a digest of the sections pykickstart does not
+                     understand.
+
+And two sets of attribute names, which other modules comparing handlers
+share:
+
+    COMMAND_SKIP - Attributes of commands that say how or where a command
+                   was given rather than what it does.
+
+    DATA_SKIP - Attributes of data objects and scripts that say where they
+                were given.
+"""
+import hashlib
+import json
+import six
+
+# Attributes of commands that say how or where a command was given rather
+# than what it does.
+COMMAND_SKIP = frozenset(["handler", "op", "lineno", "source", "currentCmd", "currentLine", "writePriority"])
+
+# Attributes of data objects and scripts that say where they were given.
+DATA_SKIP = frozenset(["lineno", "source"])
+
+def canonicalState(obj, skip=None, sortLists=False):
+    """Return a canonical structure for obj.  Objects become dicts of their
+       public attributes other than those named in skip.  Lists of objects
+       are sorted, as the order data objects were given in does not change
+       their meaning; other lists are only sorted if sortLists is True.
+       Callables are left out.
+    """
+    if obj is None or isinstance(obj, (bool, float) + six.integer_types):
+        return obj
+    elif isinstance(obj, six.string_types):
+        return six.text_type(obj)
+    elif isinstance(obj, dict):
+        return dict((six.text_type(k), canonicalState(v, sortLists=sortLists))
+                    for (k, v) in obj.items() if not callable(v))
+    elif isinstance(obj, (set, frozenset)):
+        return sorted(canonicalState(v) for v in obj)
+    elif hasattr(obj, "__dict__"):
+        skip = DATA_SKIP if skip is None else skip
+        return dict((six.text_type(k), canonicalState(v, sortLists=sortLists))
+                    for (k, v) in vars(obj).items()
+                    if not k.startswith("_") and k not in skip and not callable(v))
+
+    try:
+        items = list(obj)
+    except TypeError:
+        return six.text_type(obj)
+
+    retval = [canonicalState(v, sortLists=sortLists) for v in items]
+    if sortLists or any(hasattr(v, "__dict__") for v in items):
+        retval.sort(key=_dumps)
+
+    return retval
+
+def _dumps(state):
+    return json.dumps(state, sort_keys=True)
+
+def _digest(state):
+    return hashlib.sha256(_dumps(state).encode("utf-8")).hexdigest()
+
+def commandDigest(cmd):
+    """Return a hex digest of the state of the KickstartCommand cmd and its
+       data objects.  The name the command was given as and the line numbers
+       it was given on do not count.
+    """
+    return _digest(canonicalState(cmd, skip=COMMAND_SKIP))
+
+def packagesDigest(packages):
+    """Return a hex digest of the state of a Packages object.  Package and
+       group lists are compared as sets.
+    """
+    return _digest(canonicalState(packages, sortLists=True))
+
+def _scriptState(script):
+    state = canonicalState(script)
+
+    # Leading and trailing blank lines and trailing whitespace on each line
+    # do not change what a script does.
+    lines = [line.rstrip() for line in (state.get("script") or "").splitlines()]
+    while lines and not lines[0]:
+        lines.pop(0)
+    while lines and not lines[-1]:
+        lines.pop()
+
+    state["script"] = "\n".join(lines)
+
+    return state
+
+def scriptsDigest(scripts):
+    """Return a hex digest of the state of a list of Scripts.  Scripts of
+       different types run at different times, so only the order of scripts
+       of the same type counts.
+    """
+    byType = {}
+    for script in scripts:
+        byType.setdefault(six.text_type(script.type), []).append(_scriptState(script))
+
+    return _digest(byType)
+
+def sectionsDigest(strings):
+    """Return a hex digest of the list of sections pykickstart does not
+       understand, given as the strings they were read as, in any order.
+    """
+    return _digest(sorted(strings))
+
+def combineDigests(version, digests):
+    """Return a hex digest for a whole handler of the given version, given a
+       dict mapping the name of each part of it to that part's digest.
+    """
+    h = hashlib.sha256()
+    h.update(("version %s\n" % version).encode("utf-8"))
+
+    for name in sorted(digests.keys()):
+        h.update(("%s %s\n" % (name, digests[name])).encode("utf-8"))
+
+    return h.hexdigest()
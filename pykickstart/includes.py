@@ -0,0 +1,347 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Finding, loading and keeping track of %include files.
+
+This module exports two classes:
+
+    IncludeGraph - Which kickstart files include which others.
+
+    IncludeResolver - Resolves %include paths and loads the files they name,
+                      remembering both, and records every include in an
+                      IncludeGraph.
+
+And it exports two functions:
+
+    buildIncludeGraph - Follow the %include lines of one or more kickstart
+                        files without parsing them, and return the resulting
+                        IncludeGraph.
+
+    findIncludes - Return the names given to the %include lines of a
+                   kickstart file.
+"""
+import os
+import shlex
+
+from pykickstart.errors import KickstartError, KickstartIncludeLoopError, KickstartLimitError, formatErrorMsg
+from pykickstart.load import _is_url, load_to_str
+
+from pykickstart.i18n import _
+
+class IncludeGraph(object):
+    """The %include relationships between a set of kickstart files.  Files
+       are identified by the locations an IncludeResolver gives them.
+       Instance attributes:
+
+       roots   -- A list of the top level files, in the order they were added.
+                  A top level kickstart file that was not read from a file is
+                  given as None.
+       missing -- A set of the locations that were included but could not be
+                  loaded.
+    """
+    def __init__(self):
+        self.roots = []
+        self.missing = set()
+        self._includes = {}
+        self._includedBy = {}
+
+    def addFile(self, location):
+        """Add location to the graph as a top level file."""
+        if location not in self.roots:
+            self.roots.append(location)
+
+        self._includes.setdefault(location, [])
+        self._includedBy.setdefault(location, [])
+
+    def addInclude(self, parent, location):
+        """Record that the file at parent includes the file at location."""
+        self._includes.setdefault(location, [])
+        self._includedBy.setdefault(location, [])
+
+        children = self._includes.setdefault(parent, [])
+        if location not in children:
+            children.append(location)
+            self._includedBy[location].append(parent)
+
+        self._includedBy.setdefault(parent, [])
+
+    def setIncludes(self, location, children):
+        """Replace the list of locations directly included by location."""
+        for child in self._includes.get(location, []):
+            self._includedBy[child].remove(location)
+
+        self._includes[location] = []
+        self._includedBy.setdefault(location, [])
+
+        for child in children:
+            self.addInclude(location, child)
+
+    def removeFile(self, location):
+        """Forget everything location includes, and drop it from the graph
+           unless another file still includes it.
+        """
+        self.setIncludes(location, [])
+
+        if location in self.roots:
+            self.roots.remove(location)
+
+        if not self._includedBy.get(location):
+            self._includes.pop(location, None)
+            self._includedBy.pop(location, None)
+
+    @property
+    def files(self):
+        """A list of every location in the graph."""
+        return list(self._includes.keys())
+
+    def includes(self, location):
+        """Return a list of the locations directly included by location."""
+        return list(self._includes.get(location, []))
+
+    def includedBy(self, location):
+        """Return a list of the locations that directly include location."""
+        return list(self._includedBy.get(location, []))
+
+    def descendants(self, location):
+        """Return a list of every location included by location, directly or
+           not, in the order they are first reached.
+        """
+        return self._walk(location, self._includes)
+
+    def ancestors(self, location):
+        """Return a list of every location that includes location, directly
+           or not.  For a shared fragment, the top level files among these
+           are the ones that need to be looked at again when it changes.
+        """
+        return self._walk(location, self._includedBy)
+
+    def _walk(self, location, edges):
+        seen = set([location])
+        retval = []
+        stack = list(reversed(edges.get(location, [])))
+
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+
+            seen.add(node)
+            retval.append(node)
+            stack.extend(reversed(edges.get(node, [])))
+
+        return retval
+
+    def findCycle(self):
+        """Return a list of locations forming an include loop, starting and
+           ending with the same location, or None if there are none.
+        """
+        (white, grey, black) = (0, 1, 2)
+        color = dict((node, white) for node in self._includes)
+
+        for start in self._includes:
+            if color[start] != white:
+                continue
+
+            path = [start]
+            iters = [iter(self._includes[start])]
+            color[start] = grey
+
+            while iters:
+                try:
+                    node = next(iters[-1])
+                except StopIteration:
+                    color[path.pop()] = black
+                    iters.pop()
+                    continue
+
+                if color.get(node, white) == grey:
+                    return path[path.index(node):] + [node]
+                elif color.get(node, white) == white:
+                    color[node] = grey
+                    path.append(node)
+                    iters.append(iter(self._includes.get(node, [])))
+
+        return None
+
+class IncludeResolver(object):
+    """Turns the names given to %include into locations, and loads the files
+       at those locations.  Both are remembered, so a fragment shared by many
+       files is only looked for and read once.  Files are remembered by their
+       key, so every way of naming the same file shares what was loaded for
+       it.  One IncludeResolver is meant to last for a single parse, or a
+       single run over a set of files, as it does not notice files changing.
+       Instance attributes:
+
+       graph -- The IncludeGraph of every include resolved so far.
+    """
+    def __init__(self):
+        self.graph = IncludeGraph()
+        self._paths = {}
+        self._contents = {}
+        self._errors = {}
+        self._followed = set()
+
+    def resolve(self, name, basedir=None):
+        """Return the location of the file name refers to.  A name that does
+           not exist as given but does exist in basedir, the directory of the
+           including file, is joined to basedir.  Otherwise the name is
+           returned as given, so messages about it show what the file said.
+        """
+        try:
+            return self._paths[(name, basedir)]
+        except KeyError:
+            pass
+
+        location = name
+        if not _is_url(name) and not os.path.exists(name) and basedir is not None:
+            if os.path.exists(os.path.join(basedir, name)):
+                location = os.path.join(basedir, name)
+
+        self._paths[(name, basedir)] = location
+        return location
+
+    def key(self, location):
+        """Return what the file at location is remembered by: the absolute
+           path of a local file, or the URL.  None, for a file not read from
+           anywhere, is returned as it is.
+        """
+        if location is None or _is_url(location):
+            return location
+
+        return os.path.abspath(location)
+
+    def load(self, location, remember=True, limits=None):
+        """Return the contents of the file at location, reading it only the
+           first time.  If remember is False, the contents are not kept for
+           next time unless they already were, which is meant for top level
+           files that are read once.  limits is a pykickstart.limits.Limits
+           reading the file must stay within.  Raises KickstartError if it
+           cannot be read.
+        """
+        key = self.key(location)
+
+        try:
+            return self._contents[key]
+        except KeyError:
+            pass
+
+        if key in self._errors:
+            self.graph.missing.add(location)
+            raise self._errors[key]
+
+        try:
+            contents = load_to_str(location, limits=limits)
+        except KickstartLimitError:
+            raise
+        except KickstartError:
+            self.graph.missing.add(location)
+            raise
+
+        if remember:
+            self._contents[key] = contents
+
+        return contents
+
+    def setContents(self, location, contents=None, error=None):
+        """Record what loading location gives without loading it, so a file
+           fetched some other way is not fetched again.  Either contents is
+           the string it holds, or error is the KickstartError loading it
+           raised.
+        """
+        if error is not None:
+            self._errors[self.key(location)] = error
+        else:
+            self._contents[self.key(location)] = contents
+
+    def checkLoop(self, location, stack):
+        """Raise KickstartIncludeLoopError if location is already one of the
+           files in stack, the list of files currently being read with the
+           outermost first.  Files are compared by their keys.
+        """
+        keys = [self.key(l) for l in stack]
+        if self.key(location) in keys:
+            loop = stack[keys.index(self.key(location)):] + [location]
+            raise KickstartIncludeLoopError(formatErrorMsg(0, msg=_("%%include loop found: %s") %
+                                                           " -> ".join(str(l) for l in loop)))
+
+def findIncludes(contents):
+    """Return the names given to every %include line in the kickstart file
+       provided as the string contents, in order.  Like the parser, this
+       includes %include lines in the bodies of sections such as %post.
+    """
+    retval = []
+
+    for line in contents.splitlines():
+        stripped = line.strip()
+        if not stripped.startswith("%include"):
+            continue
+
+        try:
+            args = shlex.split(stripped, comments=True)
+        except ValueError:
+            continue
+
+        if len(args) > 1 and args[0] == "%include" and args[1]:
+            retval.append(args[1])
+
+    return retval
+
+def buildIncludeGraph(locations, resolver=None):
+    """Follow every %include line in the kickstart files given by the list
+       locations, and in the files they include, without parsing them.
+       Files that cannot be loaded are recorded in the graph's missing set
+       instead of being an error, as anaconda allows includes that are
+       written by a %pre script.  Passing the same resolver for several calls
+       shares the lookups and file contents between them.  Raises
+       KickstartIncludeLoopError if there is an include loop.  Returns the
+       resolver's IncludeGraph.
+    """
+    if resolver is None:
+        resolver = IncludeResolver()
+
+    for root in locations:
+        location = resolver.resolve(root)
+        resolver.graph.addFile(location)
+        _follow(resolver, location, [])
+
+    return resolver.graph
+
+def _follow(resolver, location, stack):
+    resolver.checkLoop(location, stack)
+
+    # Files reached before through another path have already been followed,
+    # and any loop through them would have been found then.
+    if resolver.key(location) in resolver._followed:
+        return
+
+    resolver._followed.add(resolver.key(location))
+
+    try:
+        contents = resolver.load(location)
+    except KickstartError:
+        return
+
+    if _is_url(location):
+        basedir = None
+    else:
+        basedir = os.path.dirname(os.path.abspath(location))
+
+    for name in findIncludes(contents):
+        child = resolver.resolve(name, basedir)
+        resolver.graph.addInclude(location, child)
+        _follow(resolver, child, stack + [location])
@@ -0,0 +1,161 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Limits on how much work reading a kickstart file may take, for files that can
+not be trusted.
+
+A Limits is given to a KickstartParser, or to the preprocess functions for
+%ksappend, which check it as they go and raise a different subclass of
+KickstartLimitError for each limit passed.  Limits that are None are not
+checked.  What has been used so far is counted in the Limits itself, starting
+over each time a new file is read, so each parser needs its own.
+
+This module exports one class:
+
+    Limits - The most input, nesting and time reading one kickstart file may
+             take.
+"""
+import time
+
+from pykickstart.errors import KickstartDataCountError, KickstartFetchCountError, \
+    KickstartIncludeDepthError, KickstartLineLengthError, KickstartSectionCountError, \
+    KickstartSizeError, KickstartTimeoutError, formatErrorMsg
+from pykickstart.i18n import _
+
+_now = getattr(time, "monotonic", time.time)
+
+# How many lines are read between looks at the clock.
+_CLOCK_LINES = 256
+
+class Limits(object):
+    """The most input, nesting and time reading one kickstart file may take.
+       Instance attributes:
+
+       maxIncludeDepth -- How deeply %include files may be nested.
+       maxBytes        -- The most bytes read, counting the file, every
+                          %include file and everything fetched by %ksappend.
+                          Files already read into strings count each
+                          character as a byte.
+       maxLineLength   -- The most characters on any one line.
+       maxSections     -- The most %packages, %pre, %post and other sections.
+       maxDataEntries  -- The most data objects, such as partitions and
+                          network devices, made by all commands together.
+       maxFetches      -- The most URLs fetched by %include and %ksappend.
+       timeout         -- The most seconds reading the file may take.
+
+       bytes, sections, dataEntries and fetches count what the current file
+       has used so far.
+    """
+    def __init__(self, maxIncludeDepth=None, maxBytes=None, maxLineLength=None,
+                 maxSections=None, maxDataEntries=None, maxFetches=None,
+                 timeout=None):
+        self.maxIncludeDepth = maxIncludeDepth
+        self.maxBytes = maxBytes
+        self.maxLineLength = maxLineLength
+        self.maxSections = maxSections
+        self.maxDataEntries = maxDataEntries
+        self.maxFetches = maxFetches
+        self.timeout = timeout
+
+        self.start()
+
+    def start(self):
+        """Start counting for a new file.  The parser calls this each time
+           it is reset.
+        """
+        self.bytes = 0
+        self.sections = 0
+        self.dataEntries = 0
+        self.fetches = 0
+        self._lines = 0
+        self._deadline = None if self.timeout is None else _now() + self.timeout
+
+    def remainingBytes(self):
+        """Return how many more bytes may be read, or None if there is no
+           limit.
+        """
+        if self.maxBytes is None:
+            return None
+
+        return max(0, self.maxBytes - self.bytes)
+
+    def remainingTime(self):
+        """Return how many more seconds reading may take, or None if there is
+           no limit.
+        """
+        if self._deadline is None:
+            return None
+
+        return max(0.0, self._deadline - _now())
+
+    def checkDeadline(self, lineno=0):
+        """Raise KickstartTimeoutError if there is no time left."""
+        if self._deadline is not None and _now() > self._deadline:
+            raise KickstartTimeoutError(formatErrorMsg(lineno, msg=_("Reading the kickstart file took longer than %s seconds") % self.timeout))
+
+    def checkLine(self, lineno, line):
+        """Check the length of a line about to be handled, and every so
+           often, that there is still time left.
+        """
+        if self.maxLineLength is not None and len(line) > self.maxLineLength:
+            raise KickstartLineLengthError(formatErrorMsg(lineno, msg=_("Line is longer than %d characters") % self.maxLineLength))
+
+        if self._deadline is not None:
+            self._lines += 1
+            if self._lines % _CLOCK_LINES == 0:
+                self.checkDeadline(lineno)
+
+    def checkIncludeDepth(self, lineno, depth):
+        """Check an %include that would be read at depth, where the file
+           given to the parser is at depth 0.
+        """
+        if self.maxIncludeDepth is not None and depth > self.maxIncludeDepth:
+            raise KickstartIncludeDepthError(formatErrorMsg(lineno, msg=_("%%include files are nested more than %d deep") % self.maxIncludeDepth))
+
+    def addBytes(self, lineno, count):
+        """Count count more bytes read."""
+        self.bytes += count
+        if self.maxBytes is not None and self.bytes > self.maxBytes:
+            raise KickstartSizeError(formatErrorMsg(lineno, msg=_("Input is larger than %d bytes") % self.maxBytes))
+
+    def addSection(self, lineno):
+        """Count a section starting on line lineno."""
+        self.sections += 1
+        if self.maxSections is not None and self.sections > self.maxSections:
+            raise KickstartSectionCountError(formatErrorMsg(lineno, msg=_("More than %d sections") % self.maxSections))
+
+    def addDataEntry(self, lineno):
+        """Count a data object made by the command on line lineno."""
+        self.dataEntries += 1
+        if self.maxDataEntries is not None and self.dataEntries > self.maxDataEntries:
+            raise KickstartDataCountError(formatErrorMsg(lineno, msg=_("More than %d data entries") % self.maxDataEntries))
+
+    def addFetch(self, location):
+        """Count a fetch of the URL location, which is about to be made."""
+        self.fetches += 1
+        if self.maxFetches is not None and self.fetches > self.maxFetches:
+            raise KickstartFetchCountError(_('Error accessing URL "%s"') % location + ': ' + _("more than %d URLs fetched") % self.maxFetches)
+
+    def checkSize(self, location, size):
+        """Check that size more bytes from the file at location may still
+           be read, before reading them.  The parser counts them once they
+           are.
+        """
+        remaining = self.remainingBytes()
+        if remaining is not None and size > remaining:
+            raise KickstartSizeError(_('Error reading "%(location)s": larger than the %(remaining)d bytes left') % {"location": location, "remaining": remaining})
@@ -17,32 +17,115 @@
 # subject to the GNU General Public License and may only be used or replicated
 # with the express permission of Red Hat, Inc.
 #
+import codecs
+import io
+import os
 import requests
 import shutil
 import six
+import threading
+import time
 
 from pykickstart.errors import KickstartError
 from pykickstart.i18n import _
-from requests.exceptions import SSLError, RequestException
+from requests.exceptions import ConnectionError, InvalidHeader, InvalidSchema, InvalidURL, \
+    MissingSchema, RequestException, SSLError, Timeout    # pylint: disable=redefined-builtin
 
 _is_url = lambda location: '://' in location  # RFC 3986
 
 SSL_VERIFY = True
 
-def load_to_str(location):
+# Seconds to wait for a connection to be made, and between bytes of the
+# response once it has been.  None waits forever.
+CONNECT_TIMEOUT = 30
+READ_TIMEOUT = 60
+
+# How many more times to try a URL after a connection problem, a timeout or a
+# 5xx response, and the seconds to wait before the first retry.  The wait
+# doubles after each one.  Other errors are not retried.
+RETRIES = 3
+RETRY_BACKOFF = 1.0
+
+# The most bytes read from one URL.  None reads any amount.
+MAX_SIZE = 64 * 1024 * 1024
+
+_CHUNK_SIZE = 64 * 1024
+
+class URLStats(object):
+    """Counters for the loads of one URL.  Attributes:
+
+       requests -- The number of requests made, including retries.
+       retries  -- The number of those that were retries.
+       failures -- The number of loads that failed after any retries.
+       bytes    -- The number of bytes of response bodies read.
+       latency  -- The total seconds spent waiting for response headers.
+       elapsed  -- The total seconds spent on requests.
+    """
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.bytes = 0
+        self.latency = 0.0
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return "URLStats(requests=%d, retries=%d, failures=%d, bytes=%d, latency=%.3f, elapsed=%.3f)" % \
+               (self.requests, self.retries, self.failures, self.bytes, self.latency, self.elapsed)
+
+_url_stats = {}
+_url_stats_lock = threading.Lock()
+
+def get_url_stats():
+    '''Return a dict mapping each URL loaded since the last call to
+    reset_url_stats to a copy of its URLStats.'''
+
+    with _url_stats_lock:
+        retval = {}
+        for (location, stats) in _url_stats.items():
+            retval[location] = URLStats()
+            retval[location].__dict__.update(stats.__dict__)
+
+        return retval
+
+def reset_url_stats():
+    '''Forget the counters of every URL loaded so far.'''
+
+    with _url_stats_lock:
+        _url_stats.clear()
+
+def _count(location, **kwargs):
+    with _url_stats_lock:
+        stats = _url_stats.setdefault(location, URLStats())
+        for (name, value) in kwargs.items():
+            setattr(stats, name, getattr(stats, name) + value)
+
+def load_to_str(location, limits=None):
     '''Load a destination URL or file into a string.
     Type of input is inferred automatically.
 
     Arguments:
     location -- URL or file name to load
+    limits -- a pykickstart.limits.Limits whose fetches, bytes and time
+              left this load must stay within, or None
 
     Returns: string with contents
-    Raises: KickstartError on error reading'''
+    Raises: KickstartError on error reading, or a KickstartLimitError if
+            loading would go past one of the limits
+
+    URLs are read with the timeouts, retries and size limit set by
+    CONNECT_TIMEOUT, READ_TIMEOUT, RETRIES, RETRY_BACKOFF and MAX_SIZE.'''
+
+    if limits is not None:
+        limits.checkDeadline()
 
     if _is_url(location):
-        return _load_url(location)
+        if limits is not None:
+            limits.addFetch(location)
+
+        return _load_url(location, limits=limits)
     else:
-        return _load_file(location)
+        return _load_file(location, limits=limits)
 
 def load_to_file(location, destination):
     '''Load a destination URL or file into a file name.
@@ -56,44 +139,158 @@ def load_to_file(location, destination):
     Raises: KickstartError on error reading or writing'''
 
     if _is_url(location):
-        contents = _load_url(location)
-
-        # Write to file
-        try:
-            with open(destination, 'w') as fh:
-                fh.write(contents)
-        except IOError as e:
-            raise KickstartError(_('Error writing file "%s":') % location + ': {e}'.format(e=str(e)))
-
+        _load_url(location, destination)
         return destination
     else:
         _copy_file(location, destination)
         return destination
 
-def _load_url(location):
-    '''Load a location (URL or filename) and return contents as string'''
+class _RetryableError(Exception):
+    def __init__(self, error):
+        Exception.__init__(self)
+        self.error = error
+
+def _request_error(location, e):
+    '''Return the error to raise for the RequestException e, which is only
+    retried if it was a connection problem or a timeout.  A URL or header
+    that is no good will be just as bad the next time.'''
+
+    error = KickstartError(_('Error accessing URL "%s"') % location + ': {e}'.format(e=str(e)))
+
+    if isinstance(e, (InvalidURL, MissingSchema, InvalidSchema, InvalidHeader)):
+        return error
+    elif isinstance(e, (ConnectionError, Timeout)):
+        return _RetryableError(error)
+    else:
+        return error
+
+def _load_url(location, destination=None, limits=None):
+    '''Load a URL and return its contents as a string or, if destination is
+    given, write them to that file instead.  Failures that may not happen
+    again are retried.'''
+
+    for attempt in range(RETRIES + 1):
+        if attempt:
+            time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            _count(location, retries=1)
+
+            if limits is not None:
+                limits.checkDeadline()
+
+        start = time.time()
+        try:
+            return _get_url(location, destination, start, limits)
+        except _RetryableError as e:
+            error = e.error
+        except KickstartError:
+            _count(location, failures=1)
+            raise
+        finally:
+            _count(location, requests=1, elapsed=time.time() - start)
+
+    _count(location, failures=1)
+    raise error
+
+def _too_large(location):
+    return KickstartError(_('Error accessing URL "%s"') % location + ': ' + _('larger than %d bytes') % MAX_SIZE)
+
+def _timeouts(limits):
+    '''Return the connect and read timeouts, cut short to the time limits
+    has left.'''
+
+    remaining = limits.remainingTime() if limits is not None else None
+    if remaining is None:
+        return (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+    return tuple(remaining if t is None else min(t, remaining) for t in (CONNECT_TIMEOUT, READ_TIMEOUT))
+
+def _get_url(location, destination, start, limits=None):
+    '''Make one request for a URL, reading the body in pieces so no more
+    than MAX_SIZE bytes of it, or the bytes limits has left, are ever
+    read.'''
 
     try:
-        request = requests.get(location, verify=SSL_VERIFY)
+        request = requests.get(location, verify=SSL_VERIFY, stream=True, timeout=_timeouts(limits))
     except SSLError as e:
         raise KickstartError(_('Error securely accessing URL "%s"') % location + ': {e}'.format(e=str(e)))
     except RequestException as e:
-        raise KickstartError(_('Error accessing URL "%s"') % location + ': {e}'.format(e=str(e)))
+        raise _request_error(location, e)
+
+    _count(location, latency=time.time() - start)
+
+    try:
+        if request.status_code != requests.codes.ok:        # pylint: disable=no-member
+            error = KickstartError(_('Error accessing URL "%s"') % location + ': {c}'.format(c=str(request.status_code)))
+            if request.status_code >= 500:
+                raise _RetryableError(error)
+
+            raise error
+
+        try:
+            length = int(request.headers.get("content-length", 0))
+        except ValueError:
+            length = 0
+
+        if MAX_SIZE is not None and length > MAX_SIZE:
+            raise _too_large(location)
+
+        if limits is not None:
+            limits.checkSize(location, length)
 
-    if request.status_code != requests.codes.ok:        # pylint: disable=no-member
-        raise KickstartError(_('Error accessing URL "%s"') % location + ': {c}'.format(c=str(request.status_code)))
+        try:
+            decoder = codecs.getincrementaldecoder(request.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        try:
+            fh = io.open(destination, 'w', encoding='utf-8') if destination else None
+        except IOError as e:
+            raise KickstartError(_('Error writing file "%s":') % location + ': {e}'.format(e=str(e)))
+
+        pieces = []
+        write = fh.write if fh else pieces.append
+        size = 0
+
+        try:
+            for chunk in request.iter_content(_CHUNK_SIZE):
+                size += len(chunk)
+                _count(location, bytes=len(chunk))
+
+                if MAX_SIZE is not None and size > MAX_SIZE:
+                    raise _too_large(location)
+
+                if limits is not None:
+                    limits.checkSize(location, size)
+                    limits.checkDeadline()
+
+                write(decoder.decode(chunk))
+
+            write(decoder.decode(b"", True))
+        except RequestException as e:
+            raise _request_error(location, e)
+        except IOError as e:
+            raise KickstartError(_('Error writing file "%s":') % location + ': {e}'.format(e=str(e)))
+        finally:
+            if fh:
+                fh.close()
 
-    return request.text
+        return "".join(pieces) if not fh else None
+    finally:
+        request.close()
 
-def _load_file(filename):
+def _load_file(filename, limits=None):
     '''Load a file's contents and return them as a string'''
 
     try:
         if six.PY3:
             with open(filename, 'rb') as fh:
+                if limits is not None:
+                    limits.checkSize(filename, os.fstat(fh.fileno()).st_size)
                 contents = fh.read().decode("utf-8")
         else:
             with open(filename, 'r') as fh:
+                if limits is not None:
+                    limits.checkSize(filename, os.fstat(fh.fileno()).st_size)
                 contents = fh.read()
     except IOError as e:
         raise KickstartError(_('Error opening file: %s') % str(e))
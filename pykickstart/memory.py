@@ -0,0 +1,362 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Memory profiling for kickstart parsing and rendering.
+
+This module exports a single class:
+
+    MemoryReport - The result of profiling one kickstart file.  It holds the
+                   number of bytes attributed to each phase of processing.
+
+And it exports several functions:
+
+    memoryReport - Parse and render a kickstart file under tracemalloc and
+                   return a MemoryReport.
+
+    peakRSS - Return the peak resident set size of the current process.
+
+    rssBenchmark - Measure the peak resident set size of parsing generated
+                   kickstart files of several sizes, each in a fresh process.
+"""
+import gc
+import json
+import os
+import subprocess
+import sys
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from pykickstart.errors import KickstartError
+from pykickstart.parser import KickstartParser
+from pykickstart.version import DEVEL, makeVersion, stringToVersion
+
+from pykickstart.i18n import _
+
+# The phases of processing memory is attributed to, in the order they are
+# reported.
+PHASE_HANDLER = "handler"
+PHASE_SOURCE = "source"
+PHASE_LINES = "lines"
+PHASE_TOKENS = "tokens"
+PHASE_COMMANDS = "commands"
+PHASE_DATA = "data"
+PHASE_PACKAGES = "packages"
+PHASE_SCRIPTS = "scripts"
+PHASE_RENDERED = "rendered"
+
+PHASES = [PHASE_HANDLER, PHASE_SOURCE, PHASE_LINES, PHASE_TOKENS, PHASE_COMMANDS,
+          PHASE_DATA, PHASE_PACKAGES, PHASE_SCRIPTS, PHASE_RENDERED]
+
+_descriptions = {PHASE_HANDLER: "handler and parser setup",
+                 PHASE_SOURCE: "loaded source text",
+                 PHASE_LINES: "line list",
+                 PHASE_TOKENS: "tokens",
+                 PHASE_COMMANDS: "command objects",
+                 PHASE_DATA: "data lists",
+                 PHASE_PACKAGES: "%packages lists",
+                 PHASE_SCRIPTS: "script bodies",
+                 PHASE_RENDERED: "rendered output"}
+
+class MemoryReport(object):
+    """The memory used while processing a single kickstart file.  Instance
+       attributes:
+
+       location -- The file or URL that was profiled.
+       lines    -- The number of lines in the input.
+       size     -- The size of the input, in characters.
+       phases   -- A dict mapping each PHASE_* constant to the number of bytes
+                   attributed to that phase.
+       peak     -- The highest number of bytes traced by tracemalloc at any
+                   point during processing.
+       peakRSS  -- The peak resident set size of the process after processing,
+                   in bytes, or None if it cannot be determined.
+    """
+    def __init__(self, location, lines=0, size=0):
+        self.location = location
+        self.lines = lines
+        self.size = size
+        self.phases = dict((phase, 0) for phase in PHASES)
+        self.peak = 0
+        self.peakRSS = None
+
+    def __str__(self):
+        retval = _("Memory usage for %s:") % self.location
+
+        for phase in PHASES:
+            retval += "\n  %-26s %12d" % (_descriptions[phase], self.phases[phase])
+
+        retval += "\n  %-26s %12d" % (_("peak traced"), self.peak)
+        if self.peakRSS is not None:
+            retval += "\n  %-26s %12d" % (_("peak RSS"), self.peakRSS)
+
+        return retval
+
+    def asDict(self):
+        """Return the report as a dict suitable for serializing as JSON."""
+        return {"location": self.location, "lines": self.lines, "size": self.size,
+                "phases": dict(self.phases), "peak": self.peak, "peakRSS": self.peakRSS}
+
+def peakRSS():
+    """Return the peak resident set size of the current process in bytes, or
+       None if the platform does not provide it.
+    """
+    if resource is None:
+        return None
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, while OS X reports bytes.
+    if sys.platform == "darwin":
+        return maxrss
+    else:
+        return maxrss * 1024
+
+def _traced():
+    return tracemalloc.get_traced_memory()[0]
+
+class _MemoryParser(KickstartParser):
+    """A parser that attributes what it allocates for the source text, the
+       line lists and the tokens of each line to those phases of a
+       MemoryReport as it reads the file and everything it includes.
+    """
+    def __init__(self, *args, **kwargs):
+        KickstartParser.__init__(self, *args, **kwargs)
+        self.report = None
+        self._sourceMark = None
+        self._linesMark = None
+
+    def readKickstart(self, f, reset=True):
+        if reset:
+            self._reset()
+
+        self._sourceMark = _traced()
+        KickstartParser.readKickstart(self, f, reset=False)
+
+    def readKickstartFromString(self, s, reset=True, path=None):
+        if self._sourceMark is not None:
+            self.report.phases[PHASE_SOURCE] += max(0, _traced() - self._sourceMark)
+            self._sourceMark = None
+
+        if self._includeDepth == 0:
+            self.report.lines = s.count("\n") + (1 if s and not s.endswith("\n") else 0)
+            self.report.size = len(s)
+
+        self._linesMark = _traced()
+        KickstartParser.readKickstartFromString(self, s, reset=reset, path=path)
+
+    def _stateMachine(self, lineIter, lineno=0):
+        if self._linesMark is not None:
+            self.report.phases[PHASE_LINES] += max(0, _traced() - self._linesMark)
+            self._linesMark = None
+
+        return KickstartParser._stateMachine(self, lineIter, lineno=lineno)
+
+    def _split(self, line, comments=False):
+        # Each line's tokens are thrown away once it has been handled, so
+        # this is everything allocated for tokens rather than what is held
+        # at any one time.
+        before = _traced()
+        args = KickstartParser._split(self, line, comments=comments)
+        self.report.phases[PHASE_TOKENS] += max(0, _traced() - before)
+        return args
+
+def memoryReport(location, version=DEVEL, followIncludes=True, contents=None, check=None):
+    """Parse and render the kickstart file or URL given by location with
+       tracemalloc running, and return a MemoryReport describing where the
+       memory went.  The file is parsed once, by a KickstartParser.  If
+       contents is given, it is the string to parse instead of loading
+       location, such as the file with its %ksappend lines filled in, and
+       location is only used to find what it includes.  If check is given,
+       it is called with the handler once parsing is done, before anything
+       is thrown away, so the one parse can be checked further.
+
+       Memory for the source text and line lists of the file and everything
+       it includes is measured as the parser allocates it, as is everything
+       allocated splitting lines into tokens.  Memory for the command
+       objects, data lists, %packages lists, script bodies and rendered
+       output is measured by how much is released when each of them is
+       thrown away after parsing, so the handler used for profiling is not
+       usable afterwards.
+
+       Raises KickstartError if tracemalloc is not available, and any error
+       raised by the parser.
+    """
+    if tracemalloc is None:
+        raise KickstartError(_("Memory profiling requires the tracemalloc module."))
+
+    wasTracing = tracemalloc.is_tracing()
+    if not wasTracing:
+        tracemalloc.start()
+
+    try:
+        # Make sure all the command modules have been imported before anything
+        # is measured, so the import machinery isn't counted against setup.
+        # Throwing the handler away again also tells us how much an unused
+        # handler gives back, which is the baseline for the command objects.
+        unused = [_MemoryParser(makeVersion(version))]
+        releasedUnused = _released(unused.pop)
+
+        gc.collect()
+        if wasTracing and hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        base = _traced()
+
+        handler = makeVersion(version)
+        parser = _MemoryParser(handler, followIncludes=followIncludes)
+        report = MemoryReport(location)
+        report.phases[PHASE_HANDLER] = _traced() - base
+
+        parser.report = report
+        if contents is None:
+            parser.readKickstart(location)
+        else:
+            parser.readKickstartFromString(contents, path=location)
+
+        if check is not None:
+            check(handler)
+
+        beforeRender = _traced()
+        rendered = str(handler)
+        report.phases[PHASE_RENDERED] = max(0, _traced() - beforeRender)
+        del rendered
+
+        report.phases[PHASE_SCRIPTS] = _released(lambda: _dropScripts(handler))
+        report.phases[PHASE_PACKAGES] = _released(lambda: _dropPackages(handler))
+        report.phases[PHASE_DATA] = _released(lambda: _dropDataLists(handler))
+
+        # Whatever else the handler gives back beyond what an unused handler
+        # does belongs to the command objects themselves.
+        holder = [parser]
+        parser.report = None
+        del parser
+        del handler
+        released = _released(holder.pop)
+        report.phases[PHASE_COMMANDS] = max(0, released - releasedUnused)
+
+        report.peak = tracemalloc.get_traced_memory()[1] - base
+        report.peakRSS = peakRSS()
+        return report
+    finally:
+        if not wasTracing:
+            tracemalloc.stop()
+
+def _released(drop):
+    """Return the number of bytes released by calling drop."""
+    gc.collect()
+    before = _traced()
+    drop()
+    gc.collect()
+    return max(0, before - _traced())
+
+def _dropScripts(handler):
+    handler.scripts = []
+
+def _dropPackages(handler):
+    packages = handler.packages
+    packages.packageList = []
+    packages.excludedList = []
+    packages.groupList = []
+    packages.excludedGroupList = []
+
+def _dropDataLists(handler):
+    cmds = dict((id(c), c) for c in handler.commands.values() if c is not None)
+    for cmd in cmds.values():
+        try:
+            lst = cmd.dataList()
+        except AttributeError:
+            # Deprecated commands may not have the list their parent class
+            # refers to.
+            continue
+
+        if lst:
+            del lst[:]
+
+def generateKickstart(lines):
+    """Return a synthetic kickstart file of roughly the given number of lines,
+       mixing commands, partitioning, %packages entries and %post scripts in
+       the proportions typically seen in the wild.
+    """
+    retval = ["#version=DEVEL\n", "rootpw --plaintext secret\n", "bootloader --location=mbr\n",
+              "network --bootproto=dhcp --hostname=host.example.com\n"]
+    body = max(0, lines - len(retval))
+
+    for i in range(body // 4):
+        retval.append("part /mnt/p%d --size=%d --fstype=ext4\n" % (i, 100 + i))
+
+    retval.append("%packages\n")
+    for i in range(body // 4):
+        retval.append("package-%d\n" % i)
+        if i % 10 == 0:
+            retval.append("@group-%d\n" % i)
+    retval.append("%end\n")
+
+    for i in range(body // 40):
+        retval.append("%post\n")
+        retval.extend("echo line %d >> /root/post-%d.log\n" % (j, i) for j in range(8))
+        retval.append("%end\n")
+
+    return "".join(retval)
+
+_benchmarkScript = """
+import json, sys, tempfile, os
+from pykickstart.memory import generateKickstart, peakRSS
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+(lines, version) = (int(sys.argv[1]), int(sys.argv[2]))
+(fd, path) = tempfile.mkstemp(prefix="ks-memory-", text=True)
+os.write(fd, generateKickstart(lines).encode("utf-8"))
+os.close(fd)
+try:
+    before = peakRSS()
+    handler = makeVersion(version)
+    KickstartParser(handler).readKickstart(path)
+    rendered = str(handler)
+    print(json.dumps({"lines": lines, "size": os.path.getsize(path),
+                      "baseRSS": before, "peakRSS": peakRSS()}))
+finally:
+    os.unlink(path)
+"""
+
+def rssBenchmark(sizes, version=DEVEL):
+    """Parse and render a generated kickstart file of each of the given sizes
+       (in lines) in a fresh interpreter and record its peak resident set
+       size.  Returns a list of dicts, one per size, with the keys lines,
+       size, baseRSS (peak RSS before parsing) and peakRSS.
+    """
+    results = []
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([os.path.dirname(os.path.dirname(os.path.abspath(__file__)))] +
+                                        [p for p in [env.get("PYTHONPATH")] if p])
+
+    version = stringToVersion(version) if isinstance(version, str) else version
+
+    for lines in sizes:
+        out = subprocess.check_output([sys.executable, "-c", _benchmarkScript, str(lines), str(version)],
+                                      env=env)
+        results.append(json.loads(out.decode("utf-8")))
+
+    return results
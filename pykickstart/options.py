@@ -20,7 +20,7 @@
 """
 Specialized option handling.
 
-This module exports three classes:
+This module exports four classes:
 
     ExtendAction - A subclass of Action that appends a list of values to an
                    already existing list.  In this way, it's like the existing
@@ -31,10 +31,14 @@ This module exports three classes:
                         existing "append_const" action except for lists instead
                         of single values.
 
+    KSOptionMatcher - A table-driven argument matcher compiled from the
+                      actions of a KSOptionParser.  It is used by the parser
+                      itself to skip most of the argparse machinery.
+
     KSOptionParser - A specialized subclass of ArgumentParser to be used
                      in BaseHandler subclasses.
 
-And it exports two functions:
+And it exports three functions:
 
     commaSplit - A function to be used as the type= argument to any arguments
                  that take a single string that may be split on commas, resulting
@@ -42,17 +46,36 @@ And it exports two functions:
 
     ksboolean - A function to be used as the type= argument to any arguments
                 that can take a boolean.
+
+    setOptionHook - Have a function called for every option any KSOptionParser
+                    parses, such as to count how often each one is used.
 """
+import re
+import six
 import warnings
 import textwrap
-from argparse import RawTextHelpFormatter, SUPPRESS
-from argparse import Action, ArgumentParser, ArgumentTypeError
+from argparse import RawTextHelpFormatter, SUPPRESS, OPTIONAL, ZERO_OR_MORE, ONE_OR_MORE
+from argparse import Action, ArgumentError, ArgumentParser, ArgumentTypeError, Namespace
 
-from pykickstart.errors import KickstartParseError, formatErrorMsg
+from pykickstart.errors import KickstartDeprecationWarning, KickstartParseError, formatErrorMsg
 from pykickstart.version import versionToString, versionToLongString
 
 from pykickstart.i18n import _
 
+# Called with the parser and action of every option parsed.  See setOptionHook.
+_optionHook = None
+
+def setOptionHook(fn):
+    """Have fn(parser, action) called for every option any KSOptionParser
+       parses, with the parser and the argparse action handling the option,
+       before the option is checked against the parser's version.  The hook
+       is removed if fn is None.  Returns the hook that was set before.
+    """
+    global _optionHook
+    previous = _optionHook
+    _optionHook = fn
+    return previous
+
 def commaSplit(value):
     return list(filter(None, [v.strip() for v in value.split(',')]))
 
@@ -109,6 +132,244 @@ class ExtendConstAction(Action):
         else:
             setattr(namespace, self.dest, self.const)
 
+class _MatcherFallback(Exception):
+    """Raised by KSOptionMatcher for anything it leaves to argparse.  It is
+       only ever raised before the namespace has been touched.
+    """
+    pass
+
+_negativeNumber = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+class KSOptionMatcher(object):
+    """Match a list of argument strings against the actions of a
+       KSOptionParser using tables built once from the parser, instead of
+       going through ArgumentParser.parse_known_args every time.
+
+       The matcher follows argparse's rules for splitting arguments between
+       optional and positional actions, and leaves the actions themselves,
+       type conversion and choices checking to the same code argparse uses,
+       so it produces the same namespace, warnings and errors.  Anything
+       argparse would treat specially (abbreviated options, "--", mutually
+       exclusive groups, variable length positionals, and every error that is
+       found before the namespace is touched) is handed back to argparse so the
+       result is always the same.
+    """
+    def __init__(self, parser):
+        self.parser = parser
+
+        # Exact option strings and every prefix of them, for spotting
+        # arguments argparse would treat as abbreviations.
+        self.optionals = dict(parser._option_string_actions)
+        self.prefixes = set()
+        for option in self.optionals:
+            for i in range(2, len(option)):
+                self.prefixes.add(option[:i])
+
+        self.hasNegativeNumbers = bool(parser._has_negative_number_optionals)
+
+        self.positionals = []
+        self.supported = not parser._mutually_exclusive_groups and \
+                         parser.prefix_chars == "-" and not parser.fromfile_prefix_chars
+
+        for action in parser._actions:
+            if action.option_strings:
+                if not self._supportedNargs(action.nargs):
+                    self.supported = False
+            elif action.nargs is None or isinstance(action.nargs, int):
+                self.positionals.append(action)
+            else:
+                self.supported = False
+
+        self.required = [a for a in parser._actions if a.required]
+        self.stringDefaults = [a for a in parser._actions
+                               if isinstance(a.default, six.string_types)]
+
+    def _supportedNargs(self, nargs):
+        return nargs is None or isinstance(nargs, int) or \
+               nargs in (OPTIONAL, ZERO_OR_MORE, ONE_OR_MORE)
+
+    def _classify(self, arg):
+        """Return None if argparse would consider arg a positional argument,
+           or a tuple of (action, option string, explicit argument) if it is
+           an option.  The action is None for an unknown option.
+        """
+        if not arg or arg[0] != "-":
+            return None
+
+        if arg in self.optionals:
+            return (self.optionals[arg], arg, None)
+
+        if len(arg) == 1:
+            return None
+
+        if arg == "--":
+            raise _MatcherFallback()
+
+        if "=" in arg:
+            (option, explicit) = arg.split("=", 1)
+            if option in self.optionals:
+                return (self.optionals[option], option, explicit)
+        else:
+            option = arg
+
+        # Leave anything that could be an abbreviation to argparse.
+        if option in self.prefixes or (arg[1] != "-" and arg[:2] in self.optionals):
+            raise _MatcherFallback()
+
+        if _negativeNumber.match(arg) and not self.hasNegativeNumbers:
+            return None
+
+        if " " in arg:
+            return None
+
+        return (None, arg, None)
+
+    def _plan(self, args):
+        """Work out which argument strings go to which action, without doing
+           anything to a namespace.  Returns the option tuples in the order
+           they were found, the list of (action, strings, option string)
+           tuples in the order argparse would take those actions, and the
+           leftover argument strings.
+        """
+        kinds = [self._classify(arg) for arg in args]
+        options = [k for k in kinds if k is not None]
+        optionIndices = [i for (i, k) in enumerate(kinds) if k is not None]
+
+        positionals = list(self.positionals)
+        plan = []
+        extras = []
+        count = len(args)
+
+        def runLength(start):
+            end = start
+            while end < count and kinds[end] is None:
+                end += 1
+            return end - start
+
+        def consumePositionals(start):
+            available = runLength(start)
+            used = 0
+
+            for action in list(positionals):
+                nargs = 1 if action.nargs is None else action.nargs
+                if used + nargs > available:
+                    break
+
+                plan.append((action, args[start + used:start + used + nargs], None))
+                positionals.remove(action)
+                used += nargs
+
+            return start + used
+
+        def consumeOptional(start):
+            (action, option, explicit) = kinds[start]
+
+            if action is None:
+                extras.append(args[start])
+                return start + 1
+
+            nargs = action.nargs
+
+            if explicit is not None:
+                if nargs == 0 or (isinstance(nargs, int) and nargs > 1):
+                    raise _MatcherFallback()
+
+                plan.append((action, [explicit], option))
+                return start + 1
+
+            available = runLength(start + 1)
+
+            if nargs is None:
+                wanted = 1
+            elif nargs == OPTIONAL:
+                wanted = min(available, 1)
+            elif nargs in (ZERO_OR_MORE, ONE_OR_MORE):
+                wanted = available
+                if nargs == ONE_OR_MORE and not wanted:
+                    raise _MatcherFallback()
+            else:
+                wanted = nargs
+
+            if wanted > available:
+                raise _MatcherFallback()
+
+            plan.append((action, args[start + 1:start + 1 + wanted], option))
+            return start + 1 + wanted
+
+        # This mirrors the main loop of ArgumentParser._parse_known_args.
+        start = 0
+        maxOptionIndex = optionIndices[-1] if optionIndices else -1
+
+        while start <= maxOptionIndex:
+            nextOptionIndex = min(i for i in optionIndices if i >= start)
+
+            if start != nextOptionIndex:
+                end = consumePositionals(start)
+                if end > start:
+                    start = end
+                    continue
+                else:
+                    start = end
+
+            if kinds[start] is None:
+                extras.extend(args[start:nextOptionIndex])
+                start = nextOptionIndex
+
+            start = consumeOptional(start)
+
+        stop = consumePositionals(start)
+        extras.extend(args[stop:])
+
+        seen = set(action for (action, _strings, _option) in plan)
+        if [a for a in self.required if a not in seen]:
+            raise _MatcherFallback()
+
+        return (options, plan, extras, seen)
+
+    def parse_known_args(self, args, namespace=None):
+        """Parse args the way ArgumentParser.parse_known_args would, and
+           return a (namespace, extras) tuple.
+        """
+        if not self.supported:
+            raise _MatcherFallback()
+
+        (options, plan, extras, seen) = self._plan(args)
+        parser = self.parser
+
+        # Everything from here on has side effects, so there is no going back
+        # to argparse.  Version checking comes first, just like it happens while
+        # argparse is classifying the arguments.
+        for (action, _option, _explicit) in options:
+            if action is not None:
+                parser._checkActionVersion(action)
+
+        if namespace is None:
+            namespace = Namespace()
+
+        for action in parser._actions:
+            if action.dest is not SUPPRESS and not hasattr(namespace, action.dest) \
+               and action.default is not SUPPRESS:
+                setattr(namespace, action.dest, action.default)
+
+        for (dest, value) in parser._defaults.items():
+            if not hasattr(namespace, dest):
+                setattr(namespace, dest, value)
+
+        try:
+            for (action, strings, option) in plan:
+                values = parser._get_values(action, strings)
+                if values is not SUPPRESS:
+                    action(parser, namespace, values, option)
+
+            for action in self.stringDefaults:
+                if action not in seen and hasattr(namespace, action.dest) and \
+                   action.default is getattr(namespace, action.dest):
+                    setattr(namespace, action.dest, parser._get_value(action, action.default))
+        except ArgumentError as e:
+            parser.error(str(e))
+
+        return (namespace, extras)
+
 class KSOptionParser(ArgumentParser):
     """A specialized subclass of argparse.ArgumentParser to handle extra option
        attribute checking, work error reporting into the KickstartParseError
@@ -160,18 +421,24 @@ class KSOptionParser(ArgumentParser):
         self.version = int_version
         self.lineno = None
 
-    def _parse_optional(self, arg_string):
+        # The compiled matcher used by parse_known_args.  It is built the first
+        # time something is parsed and thrown away whenever the arguments
+        # change.
+        self._matcher = None
+
+    def _checkActionVersion(self, action):
+        """Raise an error if the option handled by action is too new or has
+           been removed for the version being parsed, and warn if it has been
+           deprecated.
+        """
         def usedTooNew(action):
             return action.introduced and action.introduced > self.version
 
         def usedRemoved(action):
             return action.removed and action.removed <= self.version
 
-        option_tuple = ArgumentParser._parse_optional(self, arg_string)
-        if option_tuple is None or option_tuple[0] is None:
-            return option_tuple
-
-        action = option_tuple[0]
+        if _optionHook is not None:
+            _optionHook(self, action)
 
         if usedTooNew(action):
             mapping = {"option": action.option_strings[0], "intro": versionToString(action.introduced),
@@ -187,8 +454,14 @@ class KSOptionParser(ArgumentParser):
                 self.error(_("The %(option)s option was removed in version %(removed)s, but you are using kickstart syntax version %(version)s.") % mapping)
         elif action.deprecated is True or (self.version and type(action.deprecated) == int and self.version >= action.deprecated):
             mapping = {"lineno": self.lineno, "option": action.option_strings[0]}
-            warnings.warn(_("Ignoring deprecated option on line %(lineno)s:  The %(option)s option has been deprecated and no longer has any effect.  It may be removed from future releases, which will result in a fatal error from kickstart.  Please modify your kickstart file to remove this option.") % mapping, DeprecationWarning)
+            warnings.warn(_("Ignoring deprecated option on line %(lineno)s:  The %(option)s option has been deprecated and no longer has any effect.  It may be removed from future releases, which will result in a fatal error from kickstart.  Please modify your kickstart file to remove this option.") % mapping, KickstartDeprecationWarning)
 
+    def _parse_optional(self, arg_string):
+        option_tuple = ArgumentParser._parse_optional(self, arg_string)
+        if option_tuple is None or option_tuple[0] is None:
+            return option_tuple
+
+        self._checkActionVersion(option_tuple[0])
         return option_tuple
 
     def add_argument(self, *args, **kwargs):
@@ -230,6 +503,7 @@ class KSOptionParser(ArgumentParser):
         removed = kwargs.pop("removed", None)
 
         action = ArgumentParser.add_argument(self, *args, **kwargs)
+        self._matcher = None
         action.deprecated = deprecated
         action.introduced = introduced
         action.notest = notest
@@ -250,6 +524,7 @@ class KSOptionParser(ArgumentParser):
             candidate.help += "\n\n    .. versionremoved:: %s" % versionToLongString(kwargs.pop("version"))
             self._remove_action(candidate)
             self._option_string_actions.pop(arg)
+            self._matcher = None
 
     def error(self, message):
         # Overridden to turn errors into KickstartParseErrors.
@@ -269,8 +544,17 @@ class KSOptionParser(ArgumentParser):
 
         return ArgumentParser.parse_args(self, *args, **kwargs)
 
-    def parse_known_args(self, *args, **kwargs):
+    def parse_known_args(self, args=None, namespace=None, **kwargs):
         if "lineno" in kwargs:
             self.lineno = kwargs.pop("lineno")
 
-        return ArgumentParser.parse_known_args(self, *args, **kwargs)
+        if args is not None:
+            if self._matcher is None:
+                self._matcher = KSOptionMatcher(self)
+
+            try:
+                return self._matcher.parse_known_args(list(args), namespace)
+            except _MatcherFallback:
+                pass
+
+        return ArgumentParser.parse_known_args(self, args, namespace, **kwargs)
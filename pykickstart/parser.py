@@ -28,7 +28,13 @@ This module exports several important classes:
 
     Packages - Representation of the %packages section.
 
+    TokenCache - The split up lines of a kickstart file, shared between
+                 parsers for different versions.
+
     KickstartParser - The kickstart file parser state machine.
+
+    CollectingParser - A KickstartParser that keeps the errors it would print
+                       instead.
 """
 
 from __future__ import print_function
@@ -42,7 +48,9 @@ import warnings
 from ordered_set import OrderedSet
 
 from pykickstart import constants, version
-from pykickstart.errors import KickstartError, KickstartParseError, formatErrorMsg
+from pykickstart.errors import KickstartError, KickstartIncludeLoopError, KickstartLimitError, \
+    KickstartParseError, KickstartParseWarning, formatErrorMsg
+from pykickstart.includes import IncludeGraph, IncludeResolver
 from pykickstart.ko import KickstartObject
 from pykickstart.load import load_to_str
 from pykickstart.options import KSOptionParser
@@ -55,7 +63,9 @@ from pykickstart.i18n import _
 STATE_END = "end"
 STATE_COMMANDS = "commands"
 
-def _preprocessStateMachine(lineIter):
+def _preprocessStateMachine(lineIter, load=None, limits=None):
+    if load is None:
+        load = lambda url: load_to_str(url, limits=limits)
     l = None
     lineno = 0
     retval = ""
@@ -90,7 +100,9 @@ def _preprocessStateMachine(lineIter):
             raise KickstartParseError(formatErrorMsg(lineno, msg=_("Illegal url for %%ksappend: %s") % ll))
 
         try:
-            contents = load_to_str(ksurl)
+            contents = load(ksurl)
+        except KickstartLimitError:
+            raise
         except KickstartError as e:
             raise KickstartError(formatErrorMsg(lineno, msg=_("Unable to open %%ksappend file: %s") % str(e)))
 
@@ -98,39 +110,58 @@ def _preprocessStateMachine(lineIter):
         # file in one burst.  This allows multiple %ksappend lines to
         # exist.
         if contents is not None:
+            if limits is not None:
+                limits.addBytes(lineno, len(contents))
+
             retval += contents.encode(sys.getdefaultencoding())
 
     return retval
 
-def preprocessFromStringToString(s):
+def preprocessFromStringToString(s, limits=None):
     """Preprocess the kickstart file, provided as the string s.  This
        method is currently only useful for handling %ksappend lines, which
        need to be fetched before the real kickstart parser can be run.
-       Returns the complete kickstart file as a string.
+       Returns the complete kickstart file as a string.  If limits is given,
+       it is a pykickstart.limits.Limits that s and the files fetched must
+       stay within, counting afresh from this call.
     """
+    if limits is not None:
+        limits.start()
+        limits.addBytes(0, len(s))
+
     i = iter(s.splitlines(True) + [""])
-    return _preprocessStateMachine(i)
+    return _preprocessStateMachine(i, limits=limits)
 
-def preprocessKickstartToString(f):
+def preprocessKickstartToString(f, limits=None):
     """Preprocess the kickstart file, given by the filename f.  This
        method is currently only useful for handling %ksappend lines,
        which need to be fetched before the real kickstart parser can be
-       run.  Returns the complete kickstart file as a string.
+       run.  Returns the complete kickstart file as a string.  limits is
+       as for preprocessFromStringToString.
     """
+    if limits is not None:
+        limits.start()
+
     try:
-        contents = load_to_str(f)
+        contents = load_to_str(f, limits=limits)
+    except KickstartLimitError:
+        raise
     except KickstartError as e:
         raise KickstartError(formatErrorMsg(0, msg=_("Unable to open input kickstart file: %s") % str(e)))
 
-    return _preprocessStateMachine(iter(contents.splitlines(True)))
+    if limits is not None:
+        limits.addBytes(0, len(contents))
+
+    return _preprocessStateMachine(iter(contents.splitlines(True)), limits=limits)
 
-def preprocessFromString(s):
+def preprocessFromString(s, limits=None):
     """Preprocess the kickstart file, provided as the string s.  This
        method is currently only useful for handling %ksappend lines,
        which need to be fetched before the real kickstart parser can be
-       run.  Returns the location of the complete kickstart file.
+       run.  Returns the location of the complete kickstart file.  limits
+       is as for preprocessFromStringToString.
     """
-    s = preprocessFromStringToString(s)
+    s = preprocessFromStringToString(s, limits=limits)
     if s:
         import tempfile
         (outF, outName) = tempfile.mkstemp("-ks.cfg", "", "/tmp")
@@ -141,13 +172,14 @@ def preprocessFromString(s):
 
     return None
 
-def preprocessKickstart(f):
+def preprocessKickstart(f, limits=None):
     """Preprocess the kickstart file, given by the filename f.  This
        method is currently only useful for handling %ksappend lines,
        which need to be fetched before the real kickstart parser can be
-       run.  Returns the location of the complete kickstart file.
+       run.  Returns the location of the complete kickstart file.  limits
+       is as for preprocessFromStringToString.
     """
-    s = preprocessKickstartToString(f)
+    s = preprocessKickstartToString(f, limits=limits)
     if s:
         import tempfile
         (outF, outName) = tempfile.mkstemp("-ks.cfg", "", "/tmp")
@@ -211,6 +243,9 @@ class Script(KickstartObject):
 
            :keyword script: A string containing all the lines of the script.
 
+           :keyword source: The index of the handler's sourceMap entry for the
+                            line this script starts on.
+
            :keyword type: The type of the script, which can be KS_SCRIPT_* from
                           :mod:`pykickstart.constants`.
         """
@@ -220,6 +255,7 @@ class Script(KickstartObject):
         self.interp = kwargs.get("interp", "/bin/sh")
         self.inChroot = kwargs.get("inChroot", False)
         self.lineno = kwargs.get("lineno", None)
+        self.source = kwargs.get("source", None)
         self.logfile = kwargs.get("logfile", None)
         self.errorOnFail = kwargs.get("errorOnFail", False)
         self.type = kwargs.get("type", constants.KS_SCRIPT_PRE)
@@ -304,6 +340,24 @@ class Group(KickstartObject):
 
     __hash__ = KickstartObject.__hash__
 
+_groupParser = None
+
+def _getGroupParser():
+    """Return the option parser for @group lines in %packages, which is the
+       same for every version and so is only built once.
+    """
+    global _groupParser
+
+    if _groupParser is None:
+        op = KSOptionParser(prog="", description="", version=version.DEVEL)
+        op.add_argument("--nodefaults", action="store_true", default=False,
+                        help="", version=version.DEVEL)
+        op.add_argument("--optional", action="store_true", default=False,
+                        help="", version=version.DEVEL)
+        _groupParser = op
+
+    return _groupParser
+
 class Packages(KickstartObject):
     _ver = version.DEVEL
 
@@ -352,6 +406,9 @@ class Packages(KickstartObject):
         self.excludedGroupList = []
         self.excludeDocs = False
         self.groupList = []
+        self._groupIndex = {}
+        self._groupIndexList = None
+        self._groupIndexLen = 0
         self.handleMissing = constants.KS_MISSING_PROMPT
         self.packageList = []
         self.instLangs = None
@@ -414,14 +471,20 @@ class Packages(KickstartObject):
         else:
             return retval + "\n" + pkgs + "\n"
 
-    def _processGroup(self, line):
-        op = KSOptionParser(prog="", description="", version=version.DEVEL)
-        op.add_argument("--nodefaults", action="store_true", default=False,
-                        help="", version=version.DEVEL)
-        op.add_argument("--optional", action="store_true", default=False,
-                        help="", version=version.DEVEL)
+    def _groupNames(self):
+        """Return a dict indexing groupList by group name.  The index is
+           rebuilt whenever groupList has been replaced or changed size behind
+           our back.
+        """
+        if self._groupIndexList is not self.groupList or self._groupIndexLen != len(self.groupList):
+            self._groupIndex = dict((g.name, g) for g in self.groupList)
+            self._groupIndexList = self.groupList
+            self._groupIndexLen = len(self.groupList)
 
-        (ns, extra) = op.parse_known_args(args=line.split())
+        return self._groupIndex
+
+    def _processGroup(self, line):
+        (ns, extra) = _getGroupParser().parse_known_args(args=line.split())
 
         if ns.nodefaults and ns.optional:
             raise KickstartParseError(_("Group cannot specify both --nodefaults and --optional"))
@@ -430,15 +493,20 @@ class Packages(KickstartObject):
         # now.
         grp = " ".join(extra)
 
-        if grp in [g.name for g in self.groupList]:
+        groups = self._groupNames()
+        if grp in groups:
             return
 
         if ns.nodefaults:
-            self.groupList.append(Group(name=grp, include=constants.GROUP_REQUIRED))
+            group = Group(name=grp, include=constants.GROUP_REQUIRED)
         elif ns.optional:
-            self.groupList.append(Group(name=grp, include=constants.GROUP_ALL))
+            group = Group(name=grp, include=constants.GROUP_ALL)
         else:
-            self.groupList.append(Group(name=grp, include=constants.GROUP_DEFAULT))
+            group = Group(name=grp, include=constants.GROUP_DEFAULT)
+
+        self.groupList.append(group)
+        groups[grp] = group
+        self._groupIndexLen += 1
 
     def add(self, pkgList):
         """Given a list of lines from the input file, strip off any leading
@@ -490,6 +558,57 @@ class Packages(KickstartObject):
         self.packageList = list(existingPackageSet)
         self.excludedList = list(existingExcludedSet)
 
+class TokenCache(object):
+    """The result of splitting lines of a kickstart file into tokens the way
+       the parser does.  Splitting a line does not depend on the syntax
+       version, so a TokenCache filled in from a kickstart file once can be
+       given to the parsers for every version that file is checked against.
+       Lines not already in the cache are split and added when they are
+       first seen.  A TokenCache can be pickled and sent to other processes.
+    """
+    def __init__(self, s=None):
+        """Create a new TokenCache instance.  If s is given, every line of it
+           is split right away.
+        """
+        self._split = {}
+
+        if s is not None:
+            self.addString(s)
+
+    def addString(self, s):
+        """Split every line of the kickstart file provided as the string s
+           and remember the result.
+        """
+        for line in s.splitlines(True):
+            stripped = line.lstrip()
+            if not stripped or stripped[0] == "#":
+                continue
+
+            self.split(line, comments=True)
+            if stripped[0] == "%":
+                self.split(line)
+
+    def split(self, line, comments=False):
+        """Return the result of shlex.split(line, comments=comments), raising
+           the same ValueError if the line cannot be split.
+        """
+        key = (line, comments)
+
+        try:
+            (args, err) = self._split[key]
+        except KeyError:
+            try:
+                (args, err) = (shlex.split(line, comments=comments), None)
+            except ValueError as e:
+                (args, err) = (None, str(e))
+
+            self._split[key] = (args, err)
+
+        if err is not None:
+            raise ValueError(err)
+
+        return list(args)
+
 ###
 ### PARSER
 ###
@@ -501,7 +620,8 @@ class KickstartParser(object):
        overridden.
     """
     def __init__(self, handler, followIncludes=True, errorsAreFatal=True,
-                 missingIncludeIsFatal=True, unknownSectionIsFatal=True):
+                 missingIncludeIsFatal=True, unknownSectionIsFatal=True,
+                 tokenCache=None, includeResolver=None, limits=None):
         """Create a new KickstartParser instance.  Instance attributes:
 
            errorsAreFatal        -- Should errors cause processing to halt, or
@@ -515,12 +635,27 @@ class KickstartParser(object):
                                     None, the input file will still be parsed
                                     but no data will be saved and no commands
                                     will be executed.
+           includeResolver       -- An IncludeResolver to look up and load
+                                    %include files with, kept for every file
+                                    parsed, so files included by many
+                                    kickstart files are only read once.  By
+                                    default, each parse gets a new one.
+           limits                -- A pykickstart.limits.Limits on how much
+                                    input, nesting and time each file may
+                                    take, for files that can not be trusted.
+                                    Going past a limit raises a subclass of
+                                    KickstartLimitError, even if errorsAreFatal
+                                    is False.
            missingIncludeIsFatal -- Should missing include files be fatal, even
                                     if errorsAreFatal is False?
            unknownSectionIsFatal -- Should an unknown %section be fatal?  Not all
                                     sections are handled by pykickstart.  Some are
                                     user-defined, so there should be a way to have
                                     pykickstart ignore them.
+           tokenCache            -- A TokenCache to take already split lines
+                                    from, so the same file can be checked
+                                    against several versions without splitting
+                                    it every time.
         """
         self.errorsAreFatal = errorsAreFatal
         self.errorsCount = 0
@@ -529,15 +664,27 @@ class KickstartParser(object):
         self.currentdir = {}
         self.missingIncludeIsFatal = missingIncludeIsFatal
         self.unknownSectionIsFatal = unknownSectionIsFatal
+        self.tokenCache = tokenCache
+        self.includeResolver = includeResolver
+        self.limits = limits
 
         self._state = STATE_COMMANDS
         self._includeDepth = 0
         self._line = ""
+        self._lineno = None
+
+        # The file being read at each include depth, and what is known about
+        # included files for the current parse.
+        self._files = {}
+        self._includes = includeResolver or IncludeResolver()
 
         self.version = self.handler.version
         Script._ver = self.version
         Packages._ver = self.version
 
+        # The sections to handle, or None for all of them.  See maskAllExcept.
+        self._wantedSections = None
+
         self._sections = {}
         self.setupSections()
 
@@ -545,6 +692,26 @@ class KickstartParser(object):
         """Reset the internal variables of the state machine for a new kickstart file."""
         self._state = STATE_COMMANDS
         self._includeDepth = 0
+        self._lineno = None
+        self._files = {}
+
+        if self.limits is not None:
+            self.limits.start()
+
+        # A shared resolver keeps what it has loaded, but the graph only
+        # describes the one parse.
+        if self.includeResolver is not None:
+            self._includes = self.includeResolver
+            self._includes.graph = IncludeGraph()
+        else:
+            self._includes = IncludeResolver()
+
+    @property
+    def includeGraph(self):
+        """The IncludeGraph of the files read by the last parse.  The top
+           level file is None if it was not read from a file.
+        """
+        return self._includes.graph
 
     def getSection(self, s):
         """Return a reference to the requested section (s must start with '%'s),
@@ -561,8 +728,42 @@ class KickstartParser(object):
         if self.handler:
             self.handler.currentLine = self._line
             retval = self.handler.dispatcher(args, lineno)
+
+            # Anything other than the command itself is a new data object.
+            if self.limits is not None and retval is not None and retval is not self.handler.commands[args[0]]:
+                self._checkLimit(self.limits.addDataEntry, lineno)
+
             return retval
 
+    def maskAllExcept(self, lst):
+        """Only handle the commands and sections given in the list lst, such
+           as ["network", "url", "%pre"].  The other commands are masked in
+           the handler with its maskAllExcept method.  Lines starting with a
+           masked command and the bodies of other sections are skipped
+           without being split into arguments or kept in memory, so a masked
+           line that could not be split, such as one with unbalanced quotes,
+           is not an error either.  %include lines are always followed.
+
+           Commands masked through the handler alone are still split and
+           checked as usual.
+        """
+        if self.handler:
+            self.handler.maskAllExcept([name for name in lst if not name.startswith("%")])
+
+        self._wantedSections = set(name for name in lst if name.startswith("%"))
+
+    def _skipSection(self, name):
+        return self._wantedSections is not None and name not in self._wantedSections
+
+    def _isMasked(self, line):
+        """Does line start with a command masked by maskAllExcept?"""
+        if not self.handler or self._wantedSections is None:
+            return False
+
+        # A first word shlex would change (quoted, or with a comment
+        # straight after it) won't be found, so the line is split as usual.
+        return dict.get(self.handler.commands, line.split(None, 1)[0], False) is None
+
     def registerSection(self, obj):
         """Given an instance of a Section subclass, register the new section
            with the parser.  Calling this method means the parser will
@@ -580,9 +781,12 @@ class KickstartParser(object):
     def _finalize(self, obj):
         """Called at the close of a kickstart section to take any required
            actions.  Internally, this is used to add scripts once we have the
-           whole body read.
+           whole body read.  obj is None for a section masked by
+           maskAllExcept.
         """
-        obj.finalize()
+        if obj is not None:
+            obj.finalize()
+
         self._state = STATE_COMMANDS
 
     def _handleSpecialComments(self, line):
@@ -595,7 +799,11 @@ class KickstartParser(object):
             self.handler.platform = self._line[10:].strip()
 
     def _readSection(self, lineIter, lineno):
-        obj = self._sections[self._state]
+        # A section masked by maskAllExcept is read up to its end, but none
+        # of its lines are handled or kept.
+        skip = self._skipSection(self._state)
+        obj = None if skip else self._sections[self._state]
+        limits = self.limits
 
         while True:
             try:
@@ -603,7 +811,7 @@ class KickstartParser(object):
                 if line == "" and self._includeDepth == 0:
                     # This section ends at the end of the file.
                     if self.version >= version.F8:
-                        raise KickstartParseError(formatErrorMsg(lineno, msg=_("Section %s does not end with %%end.") % obj.sectionOpen))
+                        raise self._parseError(lineno, _("Section %s does not end with %%end.") % self._state)
 
                     self._finalize(obj)
             except StopIteration:
@@ -611,9 +819,15 @@ class KickstartParser(object):
 
             lineno += 1
 
+            if limits is not None:
+                self._checkLimit(limits.checkLine, lineno, line)
+
+            if skip:
+                if not line.lstrip().startswith("%"):
+                    continue
             # Throw away blank lines and comments, unless the section wants all
             # lines.
-            if self._isBlankOrComment(line) and not obj.allLines:
+            elif self._isBlankOrComment(line) and not obj.allLines:
                 continue
 
             if line.lstrip().startswith("%"):
@@ -624,10 +838,11 @@ class KickstartParser(object):
                 possibleSectionStart = line.split()[0]
                 if not self._validState(possibleSectionStart) \
                    and possibleSectionStart not in ("%end", "%include"):
-                    obj.handleLine(line)
+                    if not skip:
+                        obj.handleLine(line)
                     continue
 
-                args = shlex.split(line)
+                args = self._split(line)
 
                 if args and args[0] == "%end":
                     # This is a properly terminated section.
@@ -635,16 +850,16 @@ class KickstartParser(object):
                     break
                 elif args and args[0] == "%include":
                     if len(args) == 1 or not args[1]:
-                        raise KickstartParseError(formatErrorMsg(lineno))
+                        raise self._parseError(lineno)
 
-                    self._handleInclude(args[1])
+                    self._handleInclude(args[1], lineno)
                     continue
                 elif args and args[0] == "%ksappend":
                     continue
                 elif args and self._validState(args[0]):
                     # This is an unterminated section.
                     if self.version >= version.F8:
-                        raise KickstartParseError(formatErrorMsg(lineno, msg=_("Section %s does not end with %%end.") % obj.sectionOpen))
+                        raise self._parseError(lineno, _("Section %s does not end with %%end.") % self._state)
 
                     # Finish up.  We do not process the header here because
                     # kicking back out to STATE_COMMANDS will ensure that happens.
@@ -661,34 +876,97 @@ class KickstartParser(object):
 
     def _validState(self, st):
         """Is the given section tag one that has been registered with the parser?"""
-        return st in list(self._sections.keys())
+        return st in self._sections
 
     def _tryFunc(self, fn):
         """Call the provided function (which doesn't take any arguments) and
            do the appropriate error handling.  If errorsAreFatal is False, this
-           function will just print the exception and keep going.
+           function will just report the exception and keep going.
         """
         try:
             fn()
         except Exception as msg:    # pylint: disable=broad-except
             self.errorsCount += 1
-            if self.errorsAreFatal:
+            if isinstance(msg, KickstartError):
+                self._locateError(msg, self._lineno)
+
+            if self.errorsAreFatal or isinstance(msg, KickstartLimitError):
                 raise
             else:
-                print(msg, file=sys.stderr)
+                self._reportError(msg)
+
+    def _reportError(self, msg):
+        """Report an error that isn't fatal, by printing it.  Subclasses that
+           want to keep the errors somewhere else can override this method.
+        """
+        print(msg, file=sys.stderr)
+
+    def _checkLimit(self, check, lineno, *args):
+        """Call check, a method of self.limits, with lineno and args, noting
+           the file and line of any KickstartLimitError it raises.
+        """
+        try:
+            check(lineno, *args)
+        except KickstartLimitError as e:
+            self._locateError(e, lineno)
+            raise
+
+    def _markSource(self, lineno):
+        """Record that what is handled next comes from line lineno of the
+           file being read, in the handler's source map.
+        """
+        self._lineno = lineno
+
+        if self.handler:
+            sourceMap = self.handler.sourceMap
+            fileId = sourceMap.intern(self._files.get(self._includeDepth))
+            self.handler.currentSource = sourceMap.add(fileId, lineno)
+
+    def _locateError(self, e, lineno):
+        """Set the file and line the KickstartError e is for to line lineno
+           of the file being read, unless the %include file it was raised in
+           already has.  Errors in %include files say which file they are in.
+        """
+        if e.lineno is not None:
+            return
+
+        e.filename = self._files.get(self._includeDepth)
+        e.lineno = lineno
+
+        if self._includeDepth > 0 and e.filename is not None:
+            e.value = _("In %%include file %(filename)s:\n%(msg)s") % {"filename": e.filename, "msg": e.value}
+
+    def _parseError(self, lineno, msg=""):
+        """Return a KickstartParseError for msg at line lineno of the file
+           being read.
+        """
+        e = KickstartParseError(formatErrorMsg(lineno, msg=msg))
+        self._locateError(e, lineno)
+        return e
+
+    def _split(self, line, comments=False):
+        if self.tokenCache is not None:
+            return self.tokenCache.split(line, comments=comments)
+        else:
+            return shlex.split(line, comments=comments)
 
     def _isBlankOrComment(self, line):
         return line.isspace() or line == "" or line.lstrip()[0] == '#'
 
-    def _handleInclude(self, f):
+    def _handleInclude(self, f, lineno=0):
         # This case comes up primarily in ksvalidator.
         if not self.followIncludes:
             return
 
+        if self.limits is not None:
+            self._checkLimit(self.limits.checkIncludeDepth, lineno, self._includeDepth + 1)
+
         self._includeDepth += 1
 
         try:
             self.readKickstart(f, reset=False)
+        except (KickstartIncludeLoopError, KickstartLimitError):
+            raise
         except KickstartError:
             # Handle the include file being provided over the
             # network in a %pre script.  This case comes up in the
@@ -698,9 +976,10 @@ class KickstartParser(object):
 
         self._includeDepth -= 1
 
-    def _stateMachine(self, lineIter):
-        # For error reporting.
-        lineno = 0
+    def _stateMachine(self, lineIter, lineno=0):
+        # For error reporting.  lineno is the number of lines before the
+        # first one lineIter returns, when reading part of a file.
+        limits = self.limits
 
         while True:
             # Get the next line out of the file, quitting if this is the last line.
@@ -713,19 +992,25 @@ class KickstartParser(object):
 
             lineno += 1
 
+            if limits is not None:
+                self._checkLimit(limits.checkLine, lineno, self._line)
+
             # Eliminate blank lines, whitespace-only lines, and comments.
             if self._isBlankOrComment(self._line):
                 self._handleSpecialComments(self._line)
                 continue
 
+            if self._state == STATE_COMMANDS and self._isMasked(self._line):
+                continue
+
             # Split the line, discarding comments.
-            args = shlex.split(self._line, comments=True)
+            args = self._split(self._line, comments=True)
 
             if args[0] == "%include":
                 if len(args) == 1 or not args[1]:
-                    raise KickstartParseError(formatErrorMsg(lineno))
+                    raise self._parseError(lineno)
 
-                self._handleInclude(args[1])
+                self._handleInclude(args[1], lineno)
                 continue
 
             # Now on to the main event.
@@ -737,19 +1022,32 @@ class KickstartParser(object):
                     # This is the beginning of a new section.  Handle its header
                     # here.
                     newSection = args[0]
-                    if not self._validState(newSection):
+                    if limits is not None:
+                        self._checkLimit(limits.addSection, lineno)
+
+                    if self._skipSection(newSection):
+                        self._state = newSection
+                        lineno = self._readSection(lineIter, lineno)
+                        continue
+                    elif not self._validState(newSection):
                         if self.unknownSectionIsFatal:
-                            raise KickstartParseError(formatErrorMsg(lineno, msg=_("Unknown kickstart section: %s") % newSection))
+                            raise self._parseError(lineno, _("Unknown kickstart section: %s") % newSection)
                         else:
                             # If we are ignoring unknown section errors, just create a new
                             # NullSection for the header we just saw.  Then nothing else
                             # needs to change.  You can turn this warning into an error via
                             # ksvalidator, or the warnings module.
-                            warnings.warn(_("Potentially unknown section seen at line %(lineno)s: %(sectionName)s") % {"lineno": lineno, "sectionName": newSection})
+                            warnings.warn(_("Potentially unknown section seen at line %(lineno)s: %(sectionName)s") % {"lineno": lineno, "sectionName": newSection}, KickstartParseWarning)
                             self.registerSection(NullSection(self.handler, sectionOpen=newSection))
 
                     self._state = newSection
                     obj = self._sections[self._state]
+
+                    # Sections add to the packages and scripts directly, not
+                    # through the dispatcher, so the handler can not tell.
+                    self.handler._invalidateFingerprint(["packages", "scripts"])
+
+                    self._markSource(lineno)
                     self._tryFunc(lambda: obj.handleHeader(lineno, args))
 
                     # This will handle all section processing, kicking us back
@@ -758,6 +1056,7 @@ class KickstartParser(object):
                     lineno = self._readSection(lineIter, lineno)
                 else:
                     # This is a command in the command section.  Dispatch to it.
+                    self._markSource(lineno)
                     self._tryFunc(lambda: self.handleCommand(lineno, args))
             elif self._state == STATE_END:
                 break
@@ -766,17 +1065,63 @@ class KickstartParser(object):
                 lineno -= 1
                 lineno = self._readSection(lineIter, lineno)
 
-    def readKickstartFromString(self, s, reset=True):
-        """Process a kickstart file, provided as the string str."""
+    def readKickstartFromString(self, s, reset=True, path=None):
+        """Process a kickstart file, provided as the string str.  If the
+           string was read from a file, path may be given as the name of that
+           file so %include lines with relative paths are looked up next to
+           it.
+        """
         if reset:
             self._reset()
 
+        if path is not None:
+            self._setCurrentDir(path)
+            self._enterFile(self._includes.resolve(path))
+        elif reset:
+            self._enterFile(None)
+
+        if self.limits is not None:
+            self._checkLimit(self.limits.addBytes, 0, len(s))
+
         # Add a "" to the end of the list so the string reader acts like the
         # file reader and we only get StopIteration when we're after the final
         # line of input.
         i = PutBackIterator(s.splitlines(True) + [""])
         self._stateMachine(i)
 
+    def _enterFile(self, location):
+        """Record that location is being read at the current include depth,
+           raising KickstartIncludeLoopError if that would mean reading it
+           from inside itself.
+        """
+        stack = [self._files.get(depth) for depth in range(self._includeDepth)]
+        if location is not None:
+            self._includes.checkLoop(location, stack)
+
+        if self._includeDepth == 0:
+            self._includes.graph.addFile(location)
+        else:
+            self._includes.graph.addInclude(stack[-1], location)
+
+        self._files[self._includeDepth] = location
+
+    def _setCurrentDir(self, f):
+        cd = os.path.dirname(f)
+        if not cd.startswith("/"):
+            cd = os.path.abspath(cd)
+        self.currentdir[self._includeDepth] = cd
+
+    def readKickstartAsync(self, f, reset=True, fetcher=None):
+        """Return a coroutine that processes the kickstart file given by the
+           filename or URL f from an asyncio event loop.  Every file it
+           %includes is fetched through fetcher, an instance of
+           pykickstart.aio.Fetcher defaulting to an HTTPFetcher, before
+           parsing starts, so nothing blocks the loop waiting on the network.
+           This is only available on Python 3.
+        """
+        from pykickstart.aio import readKickstartAsync
+        return readKickstartAsync(self, f, reset=reset, fetcher=fetcher)
+
     def readKickstart(self, f, reset=True):
         """Process a kickstart file, given by the filename f."""
         if reset:
@@ -786,19 +1131,19 @@ class KickstartParser(object):
         # out what the path should have been, then we're unable to find it
         # requiring full path specification, though, sucks.  so let's make
         # the reading "smart" by keeping track of what the path is at each
-        # include depth.
-        if not os.path.exists(f):
-            if self._includeDepth - 1 in self.currentdir:
-                if os.path.exists(os.path.join(self.currentdir[self._includeDepth - 1], f)):
-                    f = os.path.join(self.currentdir[self._includeDepth - 1], f)
+        # include depth.  The resolver remembers where each name led, so the
+        # same file included many times is only looked for once.
+        f = self._includes.resolve(f, self.currentdir.get(self._includeDepth - 1))
+        self._enterFile(f)
 
-        cd = os.path.dirname(f)
-        if not cd.startswith("/"):
-            cd = os.path.abspath(cd)
-        self.currentdir[self._includeDepth] = cd
+        self._setCurrentDir(f)
 
         try:
-            s = load_to_str(f)
+            # Only included files are kept, as they are the ones a shared
+            # resolver will be asked for again.
+            s = self._includes.load(f, remember=self._includeDepth > 0, limits=self.limits)
+        except KickstartLimitError:
+            raise
         except KickstartError as e:
             raise KickstartError(formatErrorMsg(0, msg=_("Unable to open input kickstart file: %s") % str(e)))
 
@@ -823,3 +1168,14 @@ class KickstartParser(object):
         # but shouldn't error on.
         self.registerSection(NullSection(self.handler, sectionOpen="%addon"))
         self.registerSection(NullSection(self.handler, sectionOpen="%anaconda"))
+
+class CollectingParser(KickstartParser):
+    """A parser that keeps the errors it would print when errorsAreFatal is
+       False in its messages list, so they can be handed on instead.
+    """
+    def __init__(self, *args, **kwargs):
+        super(CollectingParser, self).__init__(*args, **kwargs)
+        self.messages = []
+
+    def _reportError(self, msg):
+        self.messages.append(str(msg))
@@ -0,0 +1,151 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Reusing handlers and parsers across many parses.
+
+Making a handler builds every command of its version, which takes much longer
+than parsing a typical kickstart file.  A service that parses one file per
+request can instead keep handlers around and reset them between requests.
+
+This module exports a single class:
+
+    HandlerPool - A thread-safe pool of handler and parser pairs for each
+                  version, reset each time they are handed back.
+"""
+import contextlib
+import threading
+
+import six
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import DEVEL, makeVersion, stringToVersion
+
+class HandlerPool(object):
+    """A pool of handlers and the parsers that use them, kept separately for
+       each version.  A pair is only ever handed to one caller at a time, so
+       any number of threads can share a pool.  Instance attributes:
+
+       parserArgs  -- A dict of the keyword arguments given to parserClass
+                      when a new parser is made.
+       parserClass -- The class of the parsers made, which should be
+                      KickstartParser or a subclass of it.
+       size        -- The most pairs kept for each version.  Pairs handed
+                      back when this many are already waiting are dropped.
+
+       A handler from the pool must only be changed by parsing into it or
+       through its edit method, so that reset knows what to put back.  When
+       a pair is handed back, the handler's fingerprint is checked against
+       that of a newly made one, and a pair whose handler was changed some
+       other way, such as by setting handler.rootpw.password directly, is
+       dropped instead of being handed out again.
+    """
+    def __init__(self, size=8, parserClass=KickstartParser, parserArgs=None):
+        self.size = size
+        self.parserClass = parserClass
+        self.parserArgs = parserArgs or {}
+
+        self._free = {}
+        self._clean = {}
+        self._lock = threading.Lock()
+
+    def _version(self, version):
+        if isinstance(version, six.string_types):
+            return stringToVersion(version)
+
+        return version
+
+    def _make(self, version):
+        handler = makeVersion(version)
+
+        # The first reset of a handler replaces everything.  Doing it now
+        # means every later reset only puts back what a parse touched.
+        handler.reset()
+
+        with self._lock:
+            self._clean.setdefault(version, handler.fingerprint())
+
+        return (handler, self.parserClass(handler, **self.parserArgs))
+
+    def warm(self, version=DEVEL, count=None):
+        """Make count new pairs for version, or enough to fill the pool if
+           count is not given, so the first requests don't have to.
+        """
+        version = self._version(version)
+
+        with self._lock:
+            count = self.size - len(self._free.get(version, [])) if count is None else count
+
+        pairs = [self._make(version) for _i in range(count)]
+
+        with self._lock:
+            free = self._free.setdefault(version, [])
+            free.extend(pairs[:max(0, self.size - len(free))])
+
+    def free(self, version=DEVEL):
+        """Return how many pairs for version are waiting to be handed out."""
+        with self._lock:
+            return len(self._free.get(self._version(version), []))
+
+    def acquire(self, version=DEVEL):
+        """Return a tuple of a handler for version and a parser using it,
+           either from the pool or newly made.  The pair must be handed back
+           with release when it is no longer needed.
+        """
+        version = self._version(version)
+
+        with self._lock:
+            free = self._free.get(version)
+            if free:
+                return free.pop()
+
+        return self._make(version)
+
+    def release(self, handler, parser):
+        """Reset a pair returned by acquire and put it back in the pool.
+           Nothing else may use the handler or parser after this.
+        """
+        handler.reset()
+
+        # pylint: disable=protected-access
+        parser._reset()
+        parser.errorsCount = 0
+        parser.currentdir = {}
+
+        # Anything changed without going through edit is still there after
+        # reset, so look at every command and section again.
+        changed = list(handler.commands.keys()) + ["packages", "scripts"]
+        if handler.fingerprint(changed=changed) != self._clean.get(handler.version):
+            return
+
+        with self._lock:
+            free = self._free.setdefault(handler.version, [])
+            if len(free) < self.size:
+                free.append((handler, parser))
+
+    @contextlib.contextmanager
+    def parser(self, version=DEVEL):
+        """A context manager giving a parser for version, whose handler is
+           its handler attribute, and putting it back in the pool afterwards
+           whether or not parsing succeeded.
+        """
+        (handler, parser) = self.acquire(version)
+
+        try:
+            yield parser
+        finally:
+            self.release(handler, parser)
@@ -0,0 +1,308 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+A description of the commands and options of every version of kickstart
+syntax, for looking things up without making handlers or command objects.
+
+The description is generated from the KSOptionParser of every command class
+into pykickstart/schemadata.py by running "make schema", and is checked
+against the parsers by the test suite.  Each option is described by a dict
+with these keys:
+
+    names      - The option strings, which is empty for arguments that
+                 aren't options.
+    dest       - The attribute the value is stored in.
+    action     - The name of the argparse action class.
+    type       - The name of the function that converts the value, or None.
+    choices    - A sorted list of the values allowed, or None.
+    nargs      - How many values the option takes, as argparse has it.
+    required   - Whether the option must be given.
+    introduced - The version the option was introduced in, or None.
+    deprecated - The version the option was deprecated in, True if it
+                 always has been, or None.
+    removed    - The version the option was removed in, or None.
+
+Versions are given as strings, such as "F27".
+
+This module exports a class and several functions:
+
+    Schema - The description of every version, with methods for looking up
+             the commands and options of one of them.
+
+    buildSchema - Build a new Schema from the command classes.
+
+    checkSchema - Compare the generated description to the command classes
+                  and return a list of the differences.
+
+    getSchema - Return the Schema in pykickstart/schemadata.py.
+
+    writeSchema - Write a Schema as the source of pykickstart/schemadata.py.
+"""
+import six
+
+from pykickstart.base import DeprecatedCommand
+from pykickstart.version import stringToVersion, versionMap, versionToString
+
+_FORMAT = 2
+
+# The order the fields of an option are stored in.
+_FIELDS = ("names", "dest", "action", "type", "choices", "nargs", "required",
+           "introduced", "deprecated", "removed")
+
+def _versionString(version):
+    if isinstance(version, six.string_types):
+        version = stringToVersion(version)
+
+    return versionToString(version, skipDevel=True)
+
+class Schema(object):
+    """The commands and options of every version of kickstart syntax.
+       Versions can be given to methods as numbers or strings.  Many command
+       classes share options, so each different option is only stored once.
+       Instance attributes:
+
+       commands -- A dict mapping each version string to a dict mapping
+                   each command name in that version to its class name.
+       classes  -- A dict mapping each command class name to a tuple of
+                   whether it is a DeprecatedCommand, the version string its
+                   options are checked against, and the positions of its
+                   options in the options list.  As in the parser, that
+                   version is the class's own, whichever version of the
+                   syntax is using it.
+       options  -- A list of tuples, each describing one option with the
+                   fields in _FIELDS.
+    """
+    def __init__(self, commands, classes, options):
+        self.commands = commands
+        self.classes = classes
+        self.options = options
+
+    def commandNames(self, version):
+        """Return a sorted list of the commands in version."""
+        return sorted(self.commands.get(_versionString(version), {}).keys())
+
+    def commandClass(self, version, name):
+        """Return the name of the class handling the command name in version,
+           or None if version has no such command.
+        """
+        return self.commands.get(_versionString(version), {}).get(name)
+
+    def aliases(self, version, name):
+        """Return a sorted list of every name that the command name goes by
+           in version, including name itself.
+        """
+        commands = self.commands.get(_versionString(version), {})
+        if name not in commands:
+            return []
+
+        return sorted(n for (n, cls) in commands.items() if cls == commands[name])
+
+    def isDeprecated(self, version, name):
+        """Is the command name deprecated in version?"""
+        cls = self.commandClass(version, name)
+        return cls is not None and self.classes[cls][0]
+
+    def classOptions(self, cls):
+        """Return a list of the descriptions of every option the command
+           class named cls has, whatever version they can be used in.
+        """
+        return [dict(zip(_FIELDS, self.options[i])) for i in self.classes[cls][2]]
+
+    def commandOptions(self, version, name):
+        """Return a list of the descriptions of the options the command name
+           takes in version, leaving out any that can't be used in it.
+        """
+        cls = self.commandClass(version, name)
+        if cls is None or self.classes[cls][0]:
+            return []
+
+        number = stringToVersion(self.classes[cls][1])
+
+        retval = []
+        for option in self.classOptions(cls):
+            if option["introduced"] and stringToVersion(option["introduced"]) > number:
+                continue
+            elif option["removed"] and stringToVersion(option["removed"]) <= number:
+                continue
+
+            retval.append(option)
+
+        return retval
+
+    def optionStrings(self, version, name):
+        """Return a sorted list of the option strings of the command name
+           that can be used in version.
+        """
+        return sorted(s for option in self.commandOptions(version, name) for s in option["names"])
+
+def _typeName(t):
+    if t is None:
+        return None
+
+    return getattr(t, "__name__", None) or t.__class__.__name__
+
+def _describeAction(action):
+    def version(v):
+        return _versionString(v) if v and v is not True else v
+
+    choices = action.choices
+    if choices is not None:
+        choices = tuple(sorted(six.text_type(c) for c in choices))
+
+    nargs = action.nargs
+    if nargs is not None and not isinstance(nargs, six.integer_types):
+        nargs = six.text_type(nargs)
+
+    return (tuple(action.option_strings), action.dest, action.__class__.__name__,
+            _typeName(action.type), choices, nargs, bool(action.required),
+            version(getattr(action, "introduced", None)),
+            version(getattr(action, "deprecated", None)),
+            version(getattr(action, "removed", None)))
+
+def buildSchema():
+    """Build a Schema from the command classes of every version in
+       pykickstart.handlers.control.commandMap.  Each class is only made once,
+       however many versions use it.
+    """
+    # Importing every command module takes longer than loading the
+    # generated schema, so only do it when building a new one.
+    from pykickstart.handlers.control import commandMap
+
+    commands = {}
+    described = {}
+
+    for version in sorted(set(versionMap.values())):
+        names = commands.setdefault(_versionString(version), {})
+
+        for (name, cmdClass) in commandMap[version].items():
+            names[name] = cmdClass.__name__
+
+            if cmdClass.__name__ in described:
+                continue
+
+            if issubclass(cmdClass, DeprecatedCommand):
+                described[cmdClass.__name__] = (True, None, [])
+                continue
+
+            cmd = cmdClass()
+            op = getattr(cmd, "op", None) or cmd._getParser()
+            described[cmdClass.__name__] = (False, _versionString(op.version),
+                                            [_describeAction(action) for action in op._actions])
+
+    # Sorted, so adding an option to one command moves as few others as
+    # possible in the generated file.
+    options = sorted(set(o for (_deprecated, _version, lst) in described.values() for o in lst), key=repr)
+    positions = dict((o, i) for (i, o) in enumerate(options))
+
+    classes = dict((cls, (deprecated, version, tuple(sorted(positions[o] for o in lst))))
+                   for (cls, (deprecated, version, lst)) in described.items())
+
+    return Schema(commands, classes, options)
+
+def _writeDict(f, name, d):
+    f.write("%s = {\n" % name)
+    for key in sorted(d.keys()):
+        f.write("    %r: %r,\n" % (key, d[key]))
+    f.write("}\n\n")
+
+def writeSchema(schema, f):
+    """Write the Python source of a module holding schema to the open file
+       f.  This is what "make schema" writes to pykickstart/schemadata.py.
+    """
+    f.write("#\n")
+    f.write("# This file is generated by \"make schema\" from the command classes.\n")
+    f.write("# Do not edit it by hand.  See pykickstart/schema.py.\n")
+    f.write("#\n")
+    f.write("# pylint: skip-file\n\n")
+    f.write("FORMAT = %d\n\n" % _FORMAT)
+
+    f.write("COMMANDS = {\n")
+    for version in sorted(schema.commands.keys(), key=stringToVersion):
+        f.write("    %r: {\n" % version)
+        for (name, cls) in sorted(schema.commands[version].items()):
+            f.write("        %r: %r,\n" % (name, cls))
+        f.write("    },\n")
+    f.write("}\n\n")
+
+    _writeDict(f, "CLASSES", schema.classes)
+
+    f.write("OPTIONS = [\n")
+    for option in schema.options:
+        f.write("    %r,\n" % (option,))
+    f.write("]\n")
+
+_schema = None
+
+def getSchema():
+    """Return the Schema in pykickstart/schemadata.py.  Nothing but that
+       module is loaded, so this is quick.
+    """
+    global _schema
+
+    if _schema is None:
+        from pykickstart import schemadata
+        _schema = Schema(schemadata.COMMANDS, schemadata.CLASSES, schemadata.OPTIONS)
+
+    return _schema
+
+def checkSchema(schema=None):
+    """Compare schema, or the one getSchema returns, with a Schema built from
+       the command classes.  Returns a sorted list of strings describing what
+       differs, which is empty if they are the same.
+    """
+    if schema is None:
+        schema = getSchema()
+
+    built = buildSchema()
+    problems = []
+
+    for version in sorted(set(schema.commands) | set(built.commands)):
+        old = schema.commands.get(version, {})
+        new = built.commands.get(version, {})
+
+        for name in sorted(set(old) | set(new)):
+            if old.get(name) != new.get(name):
+                problems.append("%s %s: %s in the schema, %s in the commands" % (version, name, old.get(name), new.get(name)))
+
+    for cls in sorted(set(schema.classes) | set(built.classes)):
+        if cls not in schema.classes:
+            problems.append("%s: missing from the schema" % cls)
+            continue
+        elif cls not in built.classes:
+            problems.append("%s: no longer used by any version" % cls)
+            continue
+
+        if schema.classes[cls][0] != built.classes[cls][0]:
+            problems.append("%s: deprecated in one and not the other" % cls)
+
+        if schema.classes[cls][1] != built.classes[cls][1]:
+            problems.append("%s: checks options against %s in the schema, %s in the commands" %
+                            (cls, schema.classes[cls][1], built.classes[cls][1]))
+
+        old = schema.classOptions(cls)
+        new = built.classOptions(cls)
+
+        for option in old:
+            if option not in new:
+                problems.append("%s %s: only in the schema" % (cls, "/".join(option["names"]) or option["dest"]))
+
+        for option in new:
+            if option not in old:
+                problems.append("%s %s: only in the commands" % (cls, "/".join(option["names"]) or option["dest"]))
+
+    return problems
@@ -0,0 +1,2276 @@
+#
+# This file is generated by "make schema" from the command classes.
+# Do not edit it by hand.  See pykickstart/schema.py.
+#
+# pylint: skip-file
+
+FORMAT = 2
+
+COMMANDS = {
+    'RHEL3': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'FC3_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'FC3_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'FC3_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'driverdisk': 'FC3_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC3_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'FC3_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'langsupport': 'FC3_LangSupport',
+        'lilo': 'FC3_Lilo',
+        'lilocheck': 'FC3_LiloCheck',
+        'logvol': 'FC3_LogVol',
+        'method': 'FC3_Method',
+        'monitor': 'FC3_Monitor',
+        'mouse': 'RHEL3_Mouse',
+        'network': 'FC3_Network',
+        'nfs': 'FC3_NFS',
+        'part': 'FC3_Partition',
+        'partition': 'FC3_Partition',
+        'poweroff': 'FC3_Reboot',
+        'raid': 'FC3_Raid',
+        'reboot': 'FC3_Reboot',
+        'rootpw': 'FC3_RootPw',
+        'shutdown': 'FC3_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC3_Timezone',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'vnc': 'FC3_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC3_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+    },
+    'FC3': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'FC3_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'FC3_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'FC3_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'driverdisk': 'FC3_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC3_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'FC3_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'langsupport': 'FC3_LangSupport',
+        'lilo': 'FC3_Lilo',
+        'lilocheck': 'FC3_LiloCheck',
+        'logvol': 'FC3_LogVol',
+        'method': 'FC3_Method',
+        'monitor': 'FC3_Monitor',
+        'mouse': 'FC3_Mouse',
+        'network': 'FC3_Network',
+        'nfs': 'FC3_NFS',
+        'part': 'FC3_Partition',
+        'partition': 'FC3_Partition',
+        'poweroff': 'FC3_Reboot',
+        'raid': 'FC3_Raid',
+        'reboot': 'FC3_Reboot',
+        'rootpw': 'FC3_RootPw',
+        'selinux': 'FC3_SELinux',
+        'shutdown': 'FC3_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC3_Timezone',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'vnc': 'FC3_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC3_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'RHEL4': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'FC3_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'FC3_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'FC3_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC3_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F8_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'langsupport': 'FC3_LangSupport',
+        'lilo': 'FC3_Lilo',
+        'lilocheck': 'FC3_LiloCheck',
+        'logvol': 'FC3_LogVol',
+        'method': 'FC3_Method',
+        'monitor': 'FC3_Monitor',
+        'mouse': 'FC3_Mouse',
+        'network': 'RHEL4_Network',
+        'nfs': 'FC3_NFS',
+        'part': 'FC3_Partition',
+        'partition': 'FC3_Partition',
+        'poweroff': 'FC3_Reboot',
+        'raid': 'FC3_Raid',
+        'reboot': 'FC3_Reboot',
+        'rootpw': 'FC3_RootPw',
+        'selinux': 'FC3_SELinux',
+        'shutdown': 'FC3_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC3_Timezone',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'vnc': 'FC3_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC3_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'FC4': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'FC3_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'FC4_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'FC3_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC3_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'FC3_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'langsupport': 'FC3_LangSupport',
+        'logvol': 'FC4_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC3_Method',
+        'monitor': 'FC3_Monitor',
+        'mouse': 'FC3_Mouse',
+        'network': 'FC4_Network',
+        'nfs': 'FC3_NFS',
+        'part': 'FC4_Partition',
+        'partition': 'FC4_Partition',
+        'poweroff': 'FC3_Reboot',
+        'raid': 'FC4_Raid',
+        'reboot': 'FC3_Reboot',
+        'rootpw': 'FC3_RootPw',
+        'selinux': 'FC3_SELinux',
+        'shutdown': 'FC3_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC3_Timezone',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'vnc': 'FC3_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC3_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'FC5': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'FC3_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'FC4_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'FC3_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC3_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'FC3_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'langsupport': 'FC5_LangSupport',
+        'logvol': 'FC4_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC3_Method',
+        'monitor': 'FC3_Monitor',
+        'mouse': 'FC3_Mouse',
+        'network': 'FC4_Network',
+        'nfs': 'FC3_NFS',
+        'part': 'FC4_Partition',
+        'partition': 'FC4_Partition',
+        'poweroff': 'FC3_Reboot',
+        'raid': 'FC5_Raid',
+        'reboot': 'FC3_Reboot',
+        'rootpw': 'FC3_RootPw',
+        'selinux': 'FC3_SELinux',
+        'shutdown': 'FC3_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC3_Timezone',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'vnc': 'FC3_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC3_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'FC6': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'FC3_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'FC4_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'FC3_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'FC3_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'FC6_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'langsupport': 'FC5_LangSupport',
+        'logging': 'FC6_Logging',
+        'logvol': 'FC4_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC6_Method',
+        'monitor': 'FC6_Monitor',
+        'mouse': 'FC3_Mouse',
+        'multipath': 'FC6_MultiPath',
+        'network': 'FC6_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'FC4_Partition',
+        'partition': 'FC4_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'FC5_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'FC6_Repo',
+        'rootpw': 'FC3_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'user': 'FC6_User',
+        'vnc': 'FC6_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC6_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'RHEL5': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F9_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'RHEL5_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'FC3_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F12_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F8_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'FC6_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'key': 'RHEL5_Key',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'langsupport': 'FC5_LangSupport',
+        'logging': 'FC6_Logging',
+        'logvol': 'RHEL5_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC6_Method',
+        'monitor': 'FC6_Monitor',
+        'mouse': 'FC3_Mouse',
+        'multipath': 'FC6_MultiPath',
+        'network': 'RHEL5_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'RHEL5_Partition',
+        'partition': 'RHEL5_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'RHEL5_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'FC6_Repo',
+        'rootpw': 'FC3_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'user': 'FC6_User',
+        'vnc': 'FC6_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC6_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'F7': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'FC3_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'FC4_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'FC3_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'FC3_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'FC6_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'FC4_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC6_Method',
+        'monitor': 'FC6_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'FC6_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'FC4_Partition',
+        'partition': 'FC4_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F7_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'FC6_Repo',
+        'rootpw': 'FC3_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'user': 'FC6_User',
+        'vnc': 'FC6_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC6_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'F8': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'FC3_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F8_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'FC3_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F8_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'FC6_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'FC4_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC6_Method',
+        'monitor': 'FC6_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F8_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'FC4_Partition',
+        'partition': 'FC4_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F7_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F8_Repo',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'user': 'F8_User',
+        'vnc': 'FC6_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'FC6_XConfig',
+        'zerombr': 'FC3_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'F9': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F9_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F8_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'F9_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F8_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'FC6_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F9_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC6_Method',
+        'monitor': 'FC6_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F9_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F9_Partition',
+        'partition': 'F9_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F9_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F8_Repo',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'user': 'F8_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'F9_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'F10': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F9_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F8_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'F10_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F8_IgnoreDisk',
+        'install': 'FC3_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'F10_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F9_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC6_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F9_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F9_Partition',
+        'partition': 'F9_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F9_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F8_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'FC3_Upgrade',
+        'url': 'FC3_Url',
+        'user': 'F8_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'F10_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'F11': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F9_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F8_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'FC4_DriverDisk',
+        'firewall': 'F10_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F8_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'F10_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F9_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC6_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F9_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F11_Partition',
+        'partition': 'F11_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F9_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F11_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'FC3_Url',
+        'user': 'F8_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'F10_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'FC3_ZFCP',
+    },
+    'F12': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F12_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F12_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F12_DriverDisk',
+        'fcoe': 'F12_Fcoe',
+        'firewall': 'F10_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F8_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'F10_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F12_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'FC6_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F9_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F12_Partition',
+        'partition': 'F12_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F12_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F11_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'FC3_Url',
+        'user': 'F12_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'F10_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F12_ZFCP',
+    },
+    'F13': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F12_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F12_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F12_DriverDisk',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F10_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F8_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'F10_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F12_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F13_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F9_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F12_Partition',
+        'partition': 'F12_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F13_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F13_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'F13_Url',
+        'user': 'F12_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'F10_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F12_ZFCP',
+    },
+    'RHEL6': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'RHEL6_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'RHEL6_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F12_DriverDisk',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F10_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'RHEL6_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'interactive': 'FC3_Interactive',
+        'iscsi': 'RHEL6_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'key': 'RHEL5_Key',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'RHEL6_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'RHEL6_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'RHEL6_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'RHEL6_Partition',
+        'partition': 'RHEL6_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'RHEL6_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'RHEL6_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'unsupported_hardware': 'RHEL6_UnsupportedHardware',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'RHEL6_Url',
+        'user': 'F12_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F16_VolGroup',
+        'xconfig': 'F10_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F12_ZFCP',
+    },
+    'F14': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F12_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F14_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F14_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'interactive': 'F14_Interactive',
+        'iscsi': 'F10_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F14_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F14_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F9_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F14_Partition',
+        'partition': 'F14_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F14_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F14_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'F14_Url',
+        'user': 'F12_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F15': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F12_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F15_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F14_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'iscsi': 'F10_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F15_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F14_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F9_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F14_Partition',
+        'partition': 'F14_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F15_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F15_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'F14_Url',
+        'user': 'F12_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'FC3_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F16': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F16_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F15_Bootloader',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'FC3_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F14_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'iscsi': 'F10_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F15_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F14_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F16_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F14_Partition',
+        'partition': 'F14_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F15_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F15_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'F14_Url',
+        'user': 'F12_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F16_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F17': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F17_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F17_Bootloader',
+        'btrfs': 'F17_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F17_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F14_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'FC6_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'FC3_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F17_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F14_Method',
+        'monitor': 'F10_Monitor',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F16_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F17_Partition',
+        'partition': 'F17_Partition',
+        'poweroff': 'FC6_Reboot',
+        'raid': 'F15_Raid',
+        'reboot': 'FC6_Reboot',
+        'repo': 'F15_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F8_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'FC6_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'FC6_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'F14_Url',
+        'user': 'F12_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F16_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F18': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F18_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F18_Bootloader',
+        'btrfs': 'F17_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F17_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F14_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F18_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'FC3_Lang',
+        'logging': 'FC6_Logging',
+        'logvol': 'F18_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F18_Method',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F18_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F18_Partition',
+        'partition': 'F18_Partition',
+        'poweroff': 'F18_Reboot',
+        'raid': 'F18_Raid',
+        'reboot': 'F18_Reboot',
+        'repo': 'F15_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F18_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'F18_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F12_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F16_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F19': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F18_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F19_Bootloader',
+        'btrfs': 'F17_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F17_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F14_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F18_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F18_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F19_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F18_Partition',
+        'partition': 'F18_Partition',
+        'poweroff': 'F18_Reboot',
+        'raid': 'F19_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F18_Reboot',
+        'repo': 'F15_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F18_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'F18_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F11_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F19_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F16_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F20': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F20_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F19_Bootloader',
+        'btrfs': 'F17_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F17_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F18_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F20_Install',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F20_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F20_Network',
+        'nfs': 'FC6_NFS',
+        'part': 'F20_Partition',
+        'partition': 'F20_Partition',
+        'poweroff': 'F18_Reboot',
+        'raid': 'F20_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F18_Reboot',
+        'repo': 'F15_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F18_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'F18_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F19_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F16_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F21': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F21_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F21_Bootloader',
+        'btrfs': 'F17_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F21_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F18_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F20_Install',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F21_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F21_Network',
+        'nfs': 'FC6_NFS',
+        'ostreesetup': 'F21_OSTreeSetup',
+        'part': 'F20_Partition',
+        'partition': 'F20_Partition',
+        'poweroff': 'F18_Reboot',
+        'raid': 'F20_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F18_Reboot',
+        'repo': 'F21_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F18_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'F18_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F19_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F21_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'RHEL7': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'RHEL7_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'RHEL7_Bootloader',
+        'btrfs': 'RHEL7_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F21_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'RHEL7_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F18_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F11_Upgrade',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'RHEL7_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'FC6_MultiPath',
+        'network': 'RHEL7_Network',
+        'nfs': 'FC6_NFS',
+        'ostreesetup': 'RHEL7_OSTreeSetup',
+        'part': 'RHEL7_Partition',
+        'partition': 'RHEL7_Partition',
+        'poweroff': 'F18_Reboot',
+        'raid': 'RHEL7_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F18_Reboot',
+        'repo': 'RHEL7_Repo',
+        'reqpart': 'RHEL7_ReqPart',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F18_Reboot',
+        'skipx': 'FC3_SkipX',
+        'snapshot': 'F26_Snapshot',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'RHEL7_Timezone',
+        'unsupported_hardware': 'RHEL6_UnsupportedHardware',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F19_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'RHEL7_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F22': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F21_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F21_Bootloader',
+        'btrfs': 'F17_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F21_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F18_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F20_Install',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F21_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F22_Network',
+        'nfs': 'FC6_NFS',
+        'ostreesetup': 'F21_OSTreeSetup',
+        'part': 'F20_Partition',
+        'partition': 'F20_Partition',
+        'poweroff': 'F18_Reboot',
+        'raid': 'F20_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F18_Reboot',
+        'repo': 'F21_Repo',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F18_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshkey': 'F22_SshKey',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'F18_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F19_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F21_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F23': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F23_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F21_Bootloader',
+        'btrfs': 'F23_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F21_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F8_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'FC6_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F23_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F20_Install',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F23_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'FC6_MultiPath',
+        'network': 'F22_Network',
+        'nfs': 'FC6_NFS',
+        'ostreesetup': 'F21_OSTreeSetup',
+        'part': 'F23_Partition',
+        'partition': 'F23_Partition',
+        'poweroff': 'F23_Reboot',
+        'raid': 'F23_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F23_Reboot',
+        'repo': 'F21_Repo',
+        'reqpart': 'F23_ReqPart',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F23_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshkey': 'F22_SshKey',
+        'sshpw': 'F13_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'F23_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F19_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F21_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F24': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F23_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F21_Bootloader',
+        'btrfs': 'F23_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F21_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F24_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'F24_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F23_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F20_Install',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F23_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'F24_MultiPath',
+        'network': 'F24_Network',
+        'nfs': 'FC6_NFS',
+        'ostreesetup': 'F21_OSTreeSetup',
+        'part': 'F23_Partition',
+        'partition': 'F23_Partition',
+        'poweroff': 'F23_Reboot',
+        'raid': 'F23_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F23_Reboot',
+        'repo': 'F21_Repo',
+        'reqpart': 'F23_ReqPart',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F23_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshkey': 'F22_SshKey',
+        'sshpw': 'F24_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'F23_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F24_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F21_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F25': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F23_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F21_Bootloader',
+        'btrfs': 'F23_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F21_ClearPart',
+        'cmdline': 'FC3_DisplayMode',
+        'device': 'F24_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'F24_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'FC3_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F23_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F20_Install',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F23_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'F24_MultiPath',
+        'network': 'F25_Network',
+        'nfs': 'FC6_NFS',
+        'ostreesetup': 'F21_OSTreeSetup',
+        'part': 'F23_Partition',
+        'partition': 'F23_Partition',
+        'poweroff': 'F23_Reboot',
+        'raid': 'F25_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F23_Reboot',
+        'repo': 'F21_Repo',
+        'reqpart': 'F23_ReqPart',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F23_Reboot',
+        'skipx': 'FC3_SkipX',
+        'sshkey': 'F22_SshKey',
+        'sshpw': 'F24_SshPw',
+        'text': 'FC3_DisplayMode',
+        'timezone': 'F25_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F24_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F21_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F26': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F26_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F21_Bootloader',
+        'btrfs': 'F23_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F21_ClearPart',
+        'cmdline': 'F26_DisplayMode',
+        'device': 'F24_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'F24_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'F26_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F23_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F20_Install',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F23_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'F24_MultiPath',
+        'network': 'F25_Network',
+        'nfs': 'FC6_NFS',
+        'ostreesetup': 'F21_OSTreeSetup',
+        'part': 'F23_Partition',
+        'partition': 'F23_Partition',
+        'poweroff': 'F23_Reboot',
+        'raid': 'F25_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F23_Reboot',
+        'repo': 'F21_Repo',
+        'reqpart': 'F23_ReqPart',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F23_Reboot',
+        'skipx': 'FC3_SkipX',
+        'snapshot': 'F26_Snapshot',
+        'sshkey': 'F22_SshKey',
+        'sshpw': 'F24_SshPw',
+        'text': 'F26_DisplayMode',
+        'timezone': 'F25_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F18_Url',
+        'user': 'F24_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F21_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+    'F27': {
+        'auth': 'FC3_Authconfig',
+        'authconfig': 'FC3_Authconfig',
+        'autopart': 'F26_AutoPart',
+        'autostep': 'FC3_AutoStep',
+        'bootloader': 'F21_Bootloader',
+        'btrfs': 'F23_BTRFS',
+        'cdrom': 'FC3_Cdrom',
+        'clearpart': 'F21_ClearPart',
+        'cmdline': 'F26_DisplayMode',
+        'device': 'F24_Device',
+        'deviceprobe': 'FC3_DeviceProbe',
+        'dmraid': 'F24_DmRaid',
+        'driverdisk': 'F14_DriverDisk',
+        'eula': 'F20_Eula',
+        'fcoe': 'F13_Fcoe',
+        'firewall': 'F20_Firewall',
+        'firstboot': 'FC3_Firstboot',
+        'graphical': 'F26_DisplayMode',
+        'group': 'F12_Group',
+        'halt': 'F23_Reboot',
+        'harddrive': 'FC3_HardDrive',
+        'ignoredisk': 'F14_IgnoreDisk',
+        'install': 'F20_Install',
+        'iscsi': 'F17_Iscsi',
+        'iscsiname': 'FC6_IscsiName',
+        'keyboard': 'F18_Keyboard',
+        'lang': 'F19_Lang',
+        'liveimg': 'F19_Liveimg',
+        'logging': 'FC6_Logging',
+        'logvol': 'F23_LogVol',
+        'mediacheck': 'FC4_MediaCheck',
+        'method': 'F19_Method',
+        'multipath': 'F24_MultiPath',
+        'network': 'F25_Network',
+        'nfs': 'FC6_NFS',
+        'ostreesetup': 'F21_OSTreeSetup',
+        'part': 'F23_Partition',
+        'partition': 'F23_Partition',
+        'poweroff': 'F23_Reboot',
+        'raid': 'F25_Raid',
+        'realm': 'F19_Realm',
+        'reboot': 'F23_Reboot',
+        'repo': 'F27_Repo',
+        'reqpart': 'F23_ReqPart',
+        'rescue': 'F10_Rescue',
+        'rootpw': 'F18_RootPw',
+        'selinux': 'FC3_SELinux',
+        'services': 'FC6_Services',
+        'shutdown': 'F23_Reboot',
+        'skipx': 'FC3_SkipX',
+        'snapshot': 'F26_Snapshot',
+        'sshkey': 'F22_SshKey',
+        'sshpw': 'F24_SshPw',
+        'text': 'F26_DisplayMode',
+        'timezone': 'F25_Timezone',
+        'updates': 'F7_Updates',
+        'upgrade': 'F20_Upgrade',
+        'url': 'F27_Url',
+        'user': 'F24_User',
+        'vnc': 'F9_Vnc',
+        'volgroup': 'F21_VolGroup',
+        'xconfig': 'F14_XConfig',
+        'zerombr': 'F9_ZeroMbr',
+        'zfcp': 'F14_ZFCP',
+    },
+}
+
+CLASSES = {
+    'F10_Firewall': (False, 'FC3', (48, 62, 80, 94, 180, 204, 209, 213, 224, 228)),
+    'F10_Iscsi': (False, 'FC6', (104, 172, 178, 193, 194, 220, 238)),
+    'F10_Monitor': (True, None, ()),
+    'F10_Rescue': (False, 'F10', (150, 195)),
+    'F10_XConfig': (False, 'FC3', (38, 40, 55, 191, 217, 245)),
+    'F11_Partition': (False, 'FC3', (1, 7, 22, 65, 67, 75, 76, 77, 85, 109, 120, 141, 161, 163, 165, 171, 183, 206, 216, 257)),
+    'F11_Repo': (False, 'FC6', (11, 33, 72, 97, 98, 127, 133)),
+    'F11_Upgrade': (False, 'FC3', (196,)),
+    'F12_AutoPart': (False, 'FC3', (10, 65, 69, 171)),
+    'F12_Bootloader': (False, 'FC3', (6, 36, 54, 110, 118, 122, 172, 227, 233)),
+    'F12_DriverDisk': (False, 'FC3', (12, 210, 230, 260)),
+    'F12_Fcoe': (False, 'F12', (136,)),
+    'F12_Group': (False, 'F12', (83, 133)),
+    'F12_LogVol': (False, 'FC3', (10, 22, 65, 69, 75, 76, 78, 85, 120, 133, 141, 171, 173, 183, 206, 237, 243, 257)),
+    'F12_Partition': (False, 'FC3', (1, 7, 10, 22, 65, 67, 69, 75, 76, 77, 85, 109, 120, 141, 161, 163, 165, 171, 183, 206, 216, 257)),
+    'F12_Raid': (False, 'FC3', (10, 22, 42, 65, 69, 75, 76, 78, 113, 141, 171, 211, 237, 257, 261)),
+    'F12_User': (False, 'FC6', (82, 84, 88, 107, 119, 133, 172, 176, 205, 232)),
+    'F12_ZFCP': (False, 'FC3', (45, 74, 198, 200, 252)),
+    'F13_Fcoe': (False, 'F12', (35, 136)),
+    'F13_Method': (False, 'FC3', ()),
+    'F13_Raid': (False, 'FC3', (10, 22, 42, 65, 69, 75, 76, 78, 113, 141, 171, 211, 237, 257, 261)),
+    'F13_Repo': (False, 'FC6', (11, 33, 72, 97, 98, 127, 133, 182)),
+    'F13_SshPw': (False, 'F13', (107, 119, 176, 239, 262)),
+    'F13_Url': (False, 'FC3', (182, 235)),
+    'F14_Bootloader': (False, 'FC3', (6, 36, 54, 118, 122, 172, 227, 233)),
+    'F14_DriverDisk': (False, 'FC3', (12, 210, 260)),
+    'F14_Firewall': (False, 'FC3', (48, 62, 80, 94, 180, 204, 209, 213, 228)),
+    'F14_IgnoreDisk': (False, 'FC3', (58, 101, 164)),
+    'F14_Interactive': (True, None, ()),
+    'F14_LogVol': (False, 'FC3', (10, 65, 69, 75, 76, 78, 85, 120, 133, 141, 171, 173, 183, 206, 237, 243, 257)),
+    'F14_Method': (False, 'FC3', ()),
+    'F14_Partition': (False, 'FC3', (1, 7, 10, 65, 69, 75, 76, 77, 85, 109, 120, 141, 161, 163, 165, 171, 183, 206, 257)),
+    'F14_Raid': (False, 'FC3', (10, 42, 65, 69, 75, 76, 78, 113, 141, 171, 211, 237, 257, 261)),
+    'F14_Repo': (False, 'FC6', (11, 33, 72, 97, 98, 127, 133, 159, 182)),
+    'F14_Url': (False, 'FC3', (159, 182, 235)),
+    'F14_XConfig': (False, 'FC3', (38, 217)),
+    'F14_ZFCP': (False, 'FC3', (45, 74, 252)),
+    'F15_Bootloader': (False, 'FC3', (6, 36, 54, 107, 118, 121, 172, 227, 233)),
+    'F15_LogVol': (False, 'FC3', (10, 65, 69, 75, 76, 78, 85, 109, 120, 133, 141, 171, 173, 183, 206, 237, 243, 257)),
+    'F15_Raid': (False, 'FC3', (10, 42, 65, 69, 75, 76, 78, 109, 113, 141, 171, 211, 237, 257, 261)),
+    'F15_Repo': (False, 'FC6', (11, 33, 72, 97, 98, 127, 133, 159, 182)),
+    'F16_AutoPart': (False, 'FC3', (10, 65, 69, 147, 171)),
+    'F16_Network': (False, 'FC3', (0, 16, 43, 46, 70, 71, 81, 90, 103, 105, 131, 134, 135, 139, 140, 144, 145, 158, 162, 249, 251)),
+    'F16_VolGroup': (False, 'FC3', (141, 175, 188, 189, 237, 258, 261)),
+    'F17_AutoPart': (False, 'FC3', (10, 65, 69, 148, 171, 229)),
+    'F17_BTRFS': (False, 'F17', (34, 109, 124, 132, 141, 169, 218, 237)),
+    'F17_Bootloader': (False, 'FC3', (6, 15, 36, 54, 107, 118, 121, 172, 227, 233)),
+    'F17_ClearPart': (False, 'FC3', (5, 57, 99, 116, 117, 152)),
+    'F17_Iscsi': (False, 'FC6', (96, 104, 172, 178, 193, 194, 220, 238)),
+    'F17_LogVol': (False, 'FC3', (10, 65, 69, 75, 76, 78, 85, 109, 120, 133, 141, 171, 173, 183, 190, 206, 237, 243, 257)),
+    'F17_Partition': (False, 'FC3', (1, 7, 10, 65, 69, 75, 76, 77, 85, 109, 120, 141, 161, 163, 165, 171, 183, 190, 206, 257)),
+    'F18_AutoPart': (False, 'FC3', (10, 30, 65, 69, 148, 171, 229)),
+    'F18_Bootloader': (False, 'FC3', (6, 15, 36, 54, 107, 112, 118, 121, 172, 227, 233)),
+    'F18_Keyboard': (False, 'FC3', (219, 242, 253, 255)),
+    'F18_LogVol': (False, 'FC3', (10, 30, 65, 69, 75, 76, 78, 85, 86, 109, 120, 133, 141, 171, 173, 183, 190, 206, 237, 243, 257)),
+    'F18_Method': (False, 'FC3', ()),
+    'F18_Network': (False, 'FC3', (0, 16, 43, 46, 70, 71, 81, 90, 103, 105, 131, 134, 135, 139, 140, 144, 145, 158, 162, 249, 251)),
+    'F18_Partition': (False, 'FC3', (1, 7, 10, 30, 65, 69, 75, 76, 77, 85, 86, 109, 120, 141, 161, 163, 165, 171, 183, 190, 206, 257)),
+    'F18_Raid': (False, 'FC3', (10, 30, 42, 65, 69, 75, 76, 78, 109, 113, 141, 171, 211, 237, 257, 261)),
+    'F18_Reboot': (False, 'FC3', (60,)),
+    'F18_RootPw': (False, 'FC3', (107, 119, 176, 263)),
+    'F18_Timezone': (False, 'FC3', (153, 160, 240, 266)),
+    'F18_Url': (False, 'FC3', (127, 159, 182, 234)),
+    'F19_Bootloader': (False, 'FC3', (6, 15, 36, 54, 73, 107, 112, 118, 121, 172, 227, 233)),
+    'F19_Lang': (False, 'FC3', (3, 256)),
+    'F19_Liveimg': (False, 'F19', (28, 159, 182, 235)),
+    'F19_Method': (False, 'FC3', ()),
+    'F19_Network': (False, 'FC3', (0, 13, 14, 16, 43, 46, 70, 71, 81, 90, 103, 105, 106, 131, 134, 135, 139, 140, 144, 145, 158, 162, 246, 249, 251)),
+    'F19_Raid': (False, 'FC3', (10, 30, 42, 65, 69, 75, 76, 78, 109, 113, 141, 171, 211, 237, 257, 261)),
+    'F19_Realm': (False, 'F19', ()),
+    'F19_User': (False, 'FC6', (82, 83, 84, 88, 107, 119, 133, 172, 176, 205, 232)),
+    'F20_AutoPart': (False, 'FC3', (10, 30, 65, 69, 148, 171, 229)),
+    'F20_Eula': (False, 'F20', (4,)),
+    'F20_Firewall': (False, 'FC3', (48, 62, 80, 94, 180, 187, 204, 209, 213, 228)),
+    'F20_Install': (False, 'F20', (196,)),
+    'F20_LogVol': (False, 'FC3', (10, 29, 30, 65, 69, 75, 76, 78, 85, 86, 109, 120, 125, 133, 141, 171, 173, 177, 183, 190, 206, 225, 226, 237, 243, 257)),
+    'F20_Network': (False, 'FC3', (0, 13, 14, 16, 43, 46, 70, 71, 81, 90, 103, 105, 106, 131, 134, 135, 139, 140, 144, 145, 158, 162, 221, 222, 246, 249, 251)),
+    'F20_Partition': (False, 'FC3', (1, 7, 10, 30, 65, 69, 75, 76, 77, 85, 86, 109, 120, 141, 161, 163, 165, 171, 183, 190, 206, 257)),
+    'F20_Raid': (False, 'FC3', (10, 30, 42, 65, 69, 75, 76, 78, 109, 113, 141, 171, 211, 237, 257, 261)),
+    'F20_Upgrade': (True, None, ()),
+    'F21_AutoPart': (False, 'FC3', (10, 30, 65, 69, 78, 148, 171, 229)),
+    'F21_Bootloader': (False, 'FC3', (6, 15, 36, 51, 54, 73, 107, 112, 118, 121, 149, 172, 227, 233)),
+    'F21_ClearPart': (False, 'FC3', (5, 53, 57, 99, 116, 117, 152)),
+    'F21_LogVol': (False, 'FC3', (10, 29, 30, 65, 69, 75, 76, 78, 85, 86, 109, 120, 125, 133, 141, 171, 173, 177, 181, 183, 190, 206, 225, 226, 237, 243, 257)),
+    'F21_Network': (False, 'FC3', (0, 13, 14, 16, 43, 46, 70, 71, 81, 90, 102, 103, 105, 106, 131, 134, 135, 139, 140, 144, 145, 158, 162, 221, 222, 246, 249, 251)),
+    'F21_OSTreeSetup': (False, 'F21', (142, 168, 185, 186, 235)),
+    'F21_Repo': (False, 'FC6', (11, 33, 72, 97, 98, 100, 127, 133, 159, 182)),
+    'F21_VolGroup': (False, 'FC3', (141, 175, 188, 189, 237, 258, 261)),
+    'F22_Network': (False, 'FC3', (0, 13, 14, 16, 19, 20, 43, 46, 70, 71, 81, 90, 102, 103, 105, 106, 131, 134, 135, 139, 140, 144, 145, 158, 162, 221, 222, 246, 249, 251)),
+    'F22_SshKey': (False, 'F22', (239, 264)),
+    'F23_AutoPart': (False, 'FC3', (10, 30, 65, 69, 78, 148, 171, 229)),
+    'F23_BTRFS': (False, 'F17', (34, 109, 124, 128, 132, 141, 169, 218, 237)),
+    'F23_LogVol': (False, 'FC3', (10, 23, 24, 25, 29, 30, 65, 69, 75, 76, 78, 85, 86, 109, 120, 125, 128, 133, 141, 171, 173, 177, 181, 183, 190, 206, 225, 226, 237, 243, 257)),
+    'F23_Partition': (False, 'FC3', (1, 7, 10, 30, 65, 69, 75, 76, 77, 85, 86, 109, 120, 128, 141, 161, 163, 165, 171, 183, 190, 206, 257)),
+    'F23_Raid': (False, 'FC3', (10, 30, 42, 65, 69, 75, 76, 78, 109, 113, 128, 141, 171, 211, 237, 257, 261)),
+    'F23_Reboot': (False, 'FC3', (60, 108)),
+    'F23_ReqPart': (False, 'F23', (2,)),
+    'F23_Timezone': (False, 'FC3', (153, 160, 240, 266)),
+    'F24_Device': (True, None, ()),
+    'F24_DmRaid': (True, None, ()),
+    'F24_MultiPath': (True, None, ()),
+    'F24_Network': (False, 'FC3', (0, 13, 14, 16, 19, 20, 43, 46, 70, 71, 81, 90, 102, 103, 105, 106, 131, 134, 135, 139, 140, 144, 145, 158, 162, 221, 222, 246, 249, 251)),
+    'F24_SshPw': (False, 'F13', (107, 119, 176, 214, 239, 262)),
+    'F24_User': (False, 'FC6', (82, 83, 84, 88, 107, 119, 133, 172, 176, 205, 232)),
+    'F25_Network': (False, 'FC3', (0, 13, 14, 16, 19, 20, 43, 46, 70, 71, 81, 90, 102, 103, 105, 106, 131, 134, 135, 137, 139, 140, 144, 145, 158, 162, 221, 222, 246, 249, 251)),
+    'F25_Raid': (False, 'FC3', (10, 29, 30, 42, 65, 69, 75, 76, 78, 109, 113, 128, 141, 171, 211, 237, 257, 261)),
+    'F25_Timezone': (False, 'FC3', (153, 160, 240, 265)),
+    'F26_AutoPart': (False, 'FC3', (10, 30, 65, 69, 78, 138, 143, 148, 157, 171, 229)),
+    'F26_DisplayMode': (False, 'FC3', (151,)),
+    'F26_Snapshot': (False, 'F26', (133, 250)),
+    'F27_Repo': (False, 'FC6', (11, 33, 72, 97, 98, 100, 126, 127, 133, 159, 182)),
+    'F27_Url': (False, 'FC3', (126, 127, 159, 182, 234)),
+    'F7_Raid': (False, 'FC3', (21, 42, 75, 78, 113, 141, 211, 237, 257, 261)),
+    'F7_Updates': (False, 'F7', (267,)),
+    'F8_Bootloader': (False, 'FC3', (6, 36, 54, 111, 118, 122, 172, 227, 233)),
+    'F8_Device': (False, 'FC3', (166,)),
+    'F8_IgnoreDisk': (False, 'FC3', (58, 164)),
+    'F8_Network': (False, 'FC3', (18, 43, 46, 70, 71, 81, 90, 103, 105, 131, 134, 135, 140, 144, 145, 158, 162, 249)),
+    'F8_Repo': (False, 'FC6', (11, 33, 72, 98, 127, 133)),
+    'F8_RootPw': (False, 'FC3', (107, 119, 176, 263)),
+    'F8_User': (False, 'FC6', (84, 88, 107, 119, 133, 172, 176, 205, 232)),
+    'F9_AutoPart': (False, 'FC3', (65, 171)),
+    'F9_Firewall': (False, 'FC3', (48, 62, 79, 93, 180, 208, 212, 223, 228)),
+    'F9_LogVol': (False, 'FC3', (22, 65, 75, 76, 78, 85, 120, 133, 141, 171, 173, 183, 206, 237, 243, 257)),
+    'F9_Network': (False, 'FC3', (17, 43, 46, 70, 71, 81, 90, 103, 105, 131, 134, 135, 140, 144, 145, 158, 162, 249)),
+    'F9_Partition': (False, 'FC3', (1, 7, 22, 65, 66, 75, 76, 77, 85, 109, 120, 141, 161, 163, 165, 171, 183, 206, 215, 257)),
+    'F9_Raid': (False, 'FC3', (22, 42, 65, 75, 76, 78, 113, 141, 171, 211, 237, 257, 261)),
+    'F9_Vnc': (False, 'FC3', (89, 172, 179)),
+    'F9_XConfig': (False, 'FC3', (38, 39, 56, 192, 217, 244)),
+    'F9_ZeroMbr': (False, 'FC3', ()),
+    'FC3_Authconfig': (False, 'FC3', (259,)),
+    'FC3_AutoPart': (False, 'FC3', ()),
+    'FC3_AutoStep': (False, 'FC3', (8,)),
+    'FC3_Bootloader': (False, 'FC3', (6, 54, 111, 115, 118, 122, 146, 172, 233, 236)),
+    'FC3_Cdrom': (False, 'FC3', ()),
+    'FC3_ClearPart': (False, 'FC3', (5, 57, 99, 116, 152)),
+    'FC3_Device': (False, 'FC3', (166,)),
+    'FC3_DeviceProbe': (False, 'FC3', ()),
+    'FC3_DisplayMode': (False, 'FC3', ()),
+    'FC3_DriverDisk': (False, 'FC3', (210, 231, 260)),
+    'FC3_Firewall': (False, 'FC3', (48, 62, 79, 87, 93, 123, 180, 208, 212, 223, 228)),
+    'FC3_Firstboot': (False, 'FC3', (49, 63, 184)),
+    'FC3_HardDrive': (False, 'FC3', (12, 47, 170)),
+    'FC3_IgnoreDisk': (False, 'FC3', (59,)),
+    'FC3_Interactive': (False, 'FC3', ()),
+    'FC3_Keyboard': (False, 'FC3', (255,)),
+    'FC3_Lang': (False, 'FC3', (256,)),
+    'FC3_LangSupport': (False, 'FC3', (37,)),
+    'FC3_Lilo': (False, 'FC3', (6, 54, 111, 115, 118, 122, 146, 172, 233, 236)),
+    'FC3_LiloCheck': (False, 'FC3', ()),
+    'FC3_LogVol': (False, 'FC3', (78, 85, 120, 133, 141, 173, 183, 206, 237, 243, 257)),
+    'FC3_Method': (False, 'FC3', ()),
+    'FC3_Monitor': (False, 'FC3', (92, 130, 248)),
+    'FC3_Mouse': (True, None, ()),
+    'FC3_NFS': (False, 'FC3', (47, 203)),
+    'FC3_Network': (False, 'FC3', (18, 43, 46, 70, 71, 81, 90, 103, 131, 134, 135, 140, 162, 249)),
+    'FC3_Partition': (False, 'FC3', (1, 7, 66, 77, 85, 120, 141, 161, 163, 165, 183, 206, 215, 257)),
+    'FC3_Raid': (False, 'FC3', (42, 78, 113, 141, 211, 237, 257, 261)),
+    'FC3_Reboot': (False, 'FC3', ()),
+    'FC3_RootPw': (False, 'FC3', (107, 263)),
+    'FC3_SELinux': (False, 'FC3', (52, 68, 174)),
+    'FC3_SkipX': (False, 'FC3', ()),
+    'FC3_Timezone': (False, 'FC3', (241, 266)),
+    'FC3_Upgrade': (False, 'FC3', ()),
+    'FC3_Url': (False, 'FC3', (235,)),
+    'FC3_Vnc': (False, 'FC3', (32, 172)),
+    'FC3_VolGroup': (False, 'FC3', (141, 175, 237, 258, 261)),
+    'FC3_XConfig': (False, 'FC3', (27, 38, 39, 92, 130, 154, 192, 202, 217, 244, 248)),
+    'FC3_ZFCP': (False, 'FC3', (45, 74, 199, 201, 252)),
+    'FC3_ZeroMbr': (False, 'FC3', ()),
+    'FC4_Bootloader': (False, 'FC3', (6, 54, 111, 118, 122, 172, 233)),
+    'FC4_DriverDisk': (False, 'FC3', (12, 210, 231, 260)),
+    'FC4_LogVol': (False, 'FC3', (21, 75, 78, 85, 120, 133, 141, 173, 183, 206, 237, 243, 257)),
+    'FC4_MediaCheck': (False, 'FC4', ()),
+    'FC4_Network': (False, 'FC3', (18, 43, 46, 70, 71, 81, 90, 103, 131, 134, 135, 140, 158, 162, 249)),
+    'FC4_Partition': (False, 'FC3', (1, 7, 21, 66, 75, 77, 85, 109, 120, 141, 161, 163, 165, 183, 206, 215, 257)),
+    'FC4_Raid': (False, 'FC3', (42, 75, 78, 113, 141, 211, 237, 257, 261)),
+    'FC5_LangSupport': (True, None, ()),
+    'FC5_Raid': (False, 'FC3', (21, 42, 75, 78, 113, 141, 211, 237, 257, 261)),
+    'FC6_DmRaid': (False, 'FC6', (41, 133)),
+    'FC6_Iscsi': (False, 'FC6', (104, 172, 178, 220, 238)),
+    'FC6_IscsiName': (False, 'FC6', (254,)),
+    'FC6_Logging': (False, 'FC6', (89, 114, 179)),
+    'FC6_Method': (False, 'FC3', ()),
+    'FC6_Monitor': (False, 'FC3', (92, 130, 156, 248)),
+    'FC6_MultiPath': (False, 'FC6', (44, 133, 197)),
+    'FC6_NFS': (False, 'FC3', (47, 167, 203)),
+    'FC6_Network': (False, 'FC3', (18, 43, 46, 70, 71, 81, 90, 103, 131, 134, 135, 140, 144, 145, 158, 162, 249)),
+    'FC6_Reboot': (False, 'FC3', (60,)),
+    'FC6_Repo': (False, 'FC6', (11, 127, 133)),
+    'FC6_Services': (False, 'FC6', (50, 64)),
+    'FC6_Timezone': (False, 'FC3', (240, 266)),
+    'FC6_User': (False, 'FC6', (84, 88, 107, 133, 172, 205, 232)),
+    'FC6_Vnc': (False, 'FC3', (31, 89, 172, 179)),
+    'FC6_XConfig': (False, 'FC3', (26, 38, 39, 56, 91, 129, 155, 192, 217, 244, 247)),
+    'RHEL3_Mouse': (False, 'RHEL3', (43, 61)),
+    'RHEL4_Network': (False, 'FC3', (18, 43, 46, 70, 71, 81, 90, 103, 131, 134, 135, 140, 158, 162, 249)),
+    'RHEL5_Bootloader': (False, 'FC3', (6, 54, 95, 111, 118, 122, 172, 233)),
+    'RHEL5_Key': (False, 'RHEL5', (207,)),
+    'RHEL5_LogVol': (False, 'FC3', (21, 65, 75, 78, 85, 120, 133, 141, 171, 173, 183, 206, 237, 243, 257)),
+    'RHEL5_Network': (False, 'FC3', (17, 43, 46, 70, 71, 81, 90, 103, 131, 134, 135, 140, 144, 145, 158, 162, 249)),
+    'RHEL5_Partition': (False, 'FC3', (1, 7, 21, 65, 66, 75, 77, 85, 109, 120, 141, 161, 163, 165, 171, 183, 206, 215, 257)),
+    'RHEL5_Raid': (False, 'FC3', (21, 42, 65, 75, 78, 113, 141, 171, 211, 237, 257, 261)),
+    'RHEL6_AutoPart': (False, 'FC3', (10, 30, 65, 69, 171)),
+    'RHEL6_Bootloader': (False, 'FC3', (6, 36, 54, 107, 110, 118, 121, 172, 227, 233)),
+    'RHEL6_IgnoreDisk': (False, 'FC3', (58, 101, 164)),
+    'RHEL6_Iscsi': (False, 'FC6', (96, 104, 172, 178, 193, 194, 220, 238)),
+    'RHEL6_LogVol': (False, 'FC3', (10, 22, 29, 30, 65, 69, 75, 76, 78, 85, 86, 120, 125, 133, 141, 171, 173, 177, 181, 183, 206, 225, 226, 237, 243, 257)),
+    'RHEL6_Method': (False, 'FC3', ()),
+    'RHEL6_Network': (False, 'FC3', (0, 13, 14, 16, 43, 46, 70, 71, 81, 90, 103, 105, 131, 134, 135, 139, 140, 144, 145, 158, 162, 246, 249)),
+    'RHEL6_Partition': (False, 'FC3', (1, 7, 10, 22, 30, 65, 67, 69, 75, 76, 77, 85, 86, 109, 120, 141, 161, 163, 165, 171, 183, 206, 216, 257)),
+    'RHEL6_Raid': (False, 'FC3', (10, 22, 30, 42, 65, 69, 75, 76, 78, 113, 141, 171, 211, 237, 257, 261)),
+    'RHEL6_Repo': (False, 'FC6', (11, 33, 72, 97, 98, 127, 133, 159, 182)),
+    'RHEL6_UnsupportedHardware': (False, 'RHEL6', ()),
+    'RHEL6_Url': (False, 'FC3', (159, 182, 235)),
+    'RHEL7_AutoPart': (False, 'FC3', (10, 30, 65, 69, 78, 143, 148, 171, 229)),
+    'RHEL7_BTRFS': (False, 'F17', (34, 109, 124, 128, 132, 141, 169, 218, 237)),
+    'RHEL7_Bootloader': (False, 'FC3', (6, 15, 36, 51, 54, 73, 107, 112, 118, 121, 149, 172, 227, 233)),
+    'RHEL7_Fcoe': (False, 'F12', (9, 35, 136)),
+    'RHEL7_LogVol': (False, 'FC3', (10, 29, 30, 65, 69, 75, 76, 78, 85, 86, 109, 120, 125, 128, 133, 141, 171, 173, 177, 181, 183, 190, 206, 225, 226, 237, 243, 257)),
+    'RHEL7_Network': (False, 'FC3', (0, 13, 14, 16, 19, 20, 43, 46, 70, 71, 81, 90, 102, 103, 105, 106, 131, 134, 135, 137, 139, 140, 144, 145, 158, 162, 221, 222, 246, 249, 251)),
+    'RHEL7_OSTreeSetup': (False, 'F21', (142, 168, 185, 186, 235)),
+    'RHEL7_Partition': (False, 'FC3', (1, 7, 10, 30, 65, 69, 75, 76, 77, 85, 86, 109, 120, 128, 141, 161, 163, 165, 171, 183, 190, 206, 257)),
+    'RHEL7_Raid': (False, 'FC3', (10, 29, 30, 42, 65, 69, 75, 76, 78, 109, 113, 128, 141, 171, 211, 237, 257, 261)),
+    'RHEL7_Repo': (False, 'FC6', (11, 33, 72, 97, 98, 100, 127, 133, 159, 182)),
+    'RHEL7_ReqPart': (False, 'F23', (2,)),
+    'RHEL7_Timezone': (False, 'FC3', (153, 160, 240, 265)),
+    'RHEL7_VolGroup': (False, 'FC3', (141, 175, 188, 189, 237, 258, 261)),
+}
+
+OPTIONS = [
+    (('--activate',), 'activate', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--active',), 'active', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--add-boot',), 'addBoot', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--addsupport',), 'addsupport', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--agreed', '--agree', '--accepted', '--accept'), 'agreed', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--all',), 'type', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--append',), 'appendLine', '_StoreAction', None, None, None, False, None, False, None),
+    (('--asprimary',), 'primOnly', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--autoscreenshot',), 'autoscreenshot', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--autovlan',), 'autovlan', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--backuppassphrase',), 'backuppassphrase', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--baseurl',), 'baseurl', '_StoreAction', None, None, None, False, None, False, None),
+    (('--biospart',), 'biospart', '_StoreAction', None, None, None, False, None, False, None),
+    (('--bondopts',), 'bondopts', '_StoreAction', None, None, None, False, None, False, None),
+    (('--bondslaves',), 'bondslaves', '_StoreAction', None, None, None, False, None, False, None),
+    (('--boot-drive',), 'bootDrive', '_StoreAction', None, None, None, False, None, False, None),
+    (('--bootproto',), 'bootProto', '_StoreAction', None, ('bootp', 'dhcp', 'ibft', 'query', 'static'), None, False, None, False, None),
+    (('--bootproto',), 'bootProto', '_StoreAction', None, ('bootp', 'dhcp', 'query', 'static'), None, False, None, False, None),
+    (('--bootproto',), 'bootProto', '_StoreAction', None, ('bootp', 'dhcp', 'static'), None, False, None, False, None),
+    (('--bridgeopts',), 'bridgeopts', '_StoreAction', None, None, None, False, None, False, None),
+    (('--bridgeslaves',), 'bridgeslaves', '_StoreAction', None, None, None, False, None, False, None),
+    (('--bytes-per-inode',), 'bytesPerInode', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--bytes-per-inode',), 'bytes_per_inode', '_StoreAction', None, None, None, False, None, 'F9', None),
+    (('--cachemode',), 'cache_mode', '_StoreAction', None, None, None, False, None, False, None),
+    (('--cachepvs',), 'cache_pvs', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--cachesize',), 'cache_size', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--card',), 'card', '_StoreAction', None, None, None, False, None, 'FC6', None),
+    (('--card',), 'card', '_StoreAction', None, None, None, False, None, False, None),
+    (('--checksum',), 'checksum', '_StoreAction', None, None, None, False, None, False, None),
+    (('--chunksize',), 'chunk_size', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--cipher',), 'cipher', '_StoreAction', None, None, None, False, None, False, None),
+    (('--connect',), '_connect', '_StoreAction', None, None, None, False, None, False, None),
+    (('--connect',), 'connect', '_StoreAction', None, None, None, False, None, False, None),
+    (('--cost',), 'cost', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--data',), 'dataLevel', '_StoreAction', 'level_cb', None, None, False, None, False, None),
+    (('--dcb',), 'dcb', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--default',), 'default', '_StoreAction', None, None, None, False, None, False, None),
+    (('--default',), 'deflang', '_StoreAction', None, None, None, False, None, False, None),
+    (('--defaultdesktop',), 'defaultdesktop', '_StoreAction', None, None, None, False, None, False, None),
+    (('--depth',), 'depth', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--depth',), 'depth', '_StoreAction', None, None, None, False, None, 'F10', None),
+    (('--dev',), 'devices', '_AppendAction', None, None, None, True, None, False, None),
+    (('--device',), 'device', '_StoreAction', 'device_cb', None, None, True, None, False, None),
+    (('--device',), 'device', '_StoreAction', None, None, None, False, None, False, None),
+    (('--device',), 'device', '_StoreAction', None, None, None, True, None, False, None),
+    (('--devnum',), 'devnum', '_StoreAction', None, None, None, True, None, False, None),
+    (('--dhcpclass',), 'dhcpclass', '_StoreAction', None, None, None, False, None, False, None),
+    (('--dir',), 'dir', '_StoreAction', None, None, None, True, None, False, None),
+    (('--disable', '--disabled'), 'enabled', '_StoreFalseAction', None, None, 0, False, None, False, None),
+    (('--disable', '--disabled'), 'firstboot', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--disabled',), 'disabled', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--disabled',), 'disabled', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--disabled',), 'selinux', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--disklabel',), 'disklabel', '_StoreAction', None, None, None, False, None, False, None),
+    (('--driveorder',), 'driveorder', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--driver',), 'driver', '_StoreAction', None, None, None, False, None, 'F10', None),
+    (('--driver',), 'driver', '_StoreAction', None, None, None, False, None, False, None),
+    (('--drives',), 'drives', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--drives',), 'ignoredisk', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--drives',), 'ignoredisk', '_StoreAction', 'commaSplit', None, None, True, None, False, None),
+    (('--eject',), 'eject', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--emulthree',), 'emulthree', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--enable', '--enabled'), 'enabled', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--enable', '--enabled'), 'firstboot', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--enabled',), 'enabled', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--encrypted',), 'encrypted', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--end',), 'end', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--end',), 'end', '_StoreAction', None, None, None, False, None, 'F11', None),
+    (('--enforcing',), 'selinux', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--escrowcert',), 'escrowcert', '_StoreAction', None, None, None, False, None, False, None),
+    (('--essid',), 'essid', '_StoreAction', None, None, None, False, None, False, None),
+    (('--ethtool',), 'ethtool', '_StoreAction', None, None, None, False, None, False, None),
+    (('--excludepkgs',), 'excludepkgs', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--extlinux',), 'extlinux', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--fcplun',), 'fcplun', '_StoreAction', None, None, None, True, None, False, None),
+    (('--fsoptions',), 'fsopts', '_StoreAction', None, None, None, False, None, False, None),
+    (('--fsprofile',), 'fsprofile', '_StoreAction', None, None, None, False, None, False, None),
+    (('--fstype', '--type'), 'fstype', '_StoreAction', None, None, None, False, None, False, None),
+    (('--fstype',), 'fstype', '_StoreAction', None, None, None, False, None, False, None),
+    (('--ftp',), 'ports', '_AppendConstAction', None, None, 0, False, None, False, None),
+    (('--ftp',), 'services', '_AppendConstAction', None, None, 0, False, None, False, None),
+    (('--gateway',), 'gateway', '_StoreAction', None, None, None, False, None, False, None),
+    (('--gecos',), 'gecos', '_StoreAction', None, None, None, False, None, False, None),
+    (('--gid',), 'gid', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--groups',), 'groups', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--grow',), 'grow', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--hibernation',), 'hibernation', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--high',), 'high', '_StoreAction', None, None, None, False, None, 'FC3', None),
+    (('--homedir',), 'homedir', '_StoreAction', None, None, None, False, None, False, None),
+    (('--host',), 'host', '_StoreAction', None, None, None, False, None, False, None),
+    (('--hostname',), 'hostname', '_StoreAction', None, None, None, False, None, False, None),
+    (('--hsync',), 'hsync', '_StoreAction', None, None, None, False, None, 'FC6', None),
+    (('--hsync',), 'hsync', '_StoreAction', None, None, None, False, None, False, None),
+    (('--http',), 'ports', 'ExtendConstAction', None, None, 0, False, None, False, None),
+    (('--http',), 'services', '_AppendConstAction', None, None, 0, False, None, False, None),
+    (('--hvargs',), 'hvArgs', '_StoreAction', None, None, None, False, None, False, None),
+    (('--iface',), 'iface', '_StoreAction', None, None, None, False, None, False, None),
+    (('--ignoregroups',), 'ignoregroups', '_StoreAction', 'ksboolean', None, None, False, None, False, None),
+    (('--includepkgs',), 'includepkgs', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--initlabel',), 'initAll', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--install',), 'install', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--interactive',), 'interactive', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--interfacename',), 'interfacename', '_StoreAction', None, None, None, False, None, False, None),
+    (('--ip',), 'ip', '_StoreAction', None, None, None, False, None, False, None),
+    (('--ipaddr',), 'ipaddr', '_StoreAction', None, None, None, True, None, False, None),
+    (('--ipv6',), 'ipv6', '_StoreAction', None, None, None, False, None, False, None),
+    (('--ipv6gateway',), 'ipv6gateway', '_StoreAction', None, None, None, False, None, False, None),
+    (('--iscrypted',), 'isCrypted', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--kexec',), 'kexec', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--label',), 'label', '_StoreAction', None, None, None, False, None, False, None),
+    (('--lba32',), 'forceLBA', '_StoreTrueAction', None, None, 0, False, None, 'F12', None),
+    (('--lba32',), 'forceLBA', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--leavebootorder',), 'leavebootorder', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--level',), 'level', '_StoreAction', 'level_cb', None, None, False, None, False, None),
+    (('--level',), 'level', '_StoreAction', None, ('critical', 'debug', 'error', 'info', 'warning'), None, False, None, False, None),
+    (('--linear',), 'linear', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--linux',), 'type', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--list',), 'devices', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--location',), 'location', '_StoreAction', None, ('boot', 'mbr', 'none', 'partition'), None, False, None, False, None),
+    (('--lock',), 'lock', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--maxsize',), 'maxSizeMB', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--md5pass',), '_md5pass', '_StoreAction', None, None, None, False, None, False, None),
+    (('--md5pass',), 'md5pass', '_StoreAction', None, None, None, False, None, False, None),
+    (('--medium',), 'medium', '_StoreAction', None, None, None, False, None, 'FC3', None),
+    (('--metadata',), 'metaDataLevel', '_StoreAction', 'level_cb', None, None, False, None, False, None),
+    (('--metadatasize',), 'metadata_size', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--metalink',), 'metalink', '_StoreAction', None, None, None, False, None, False, None),
+    (('--mirrorlist',), 'mirrorlist', '_StoreAction', None, None, None, False, None, False, None),
+    (('--mkfsoptions',), 'mkfsopts', '_StoreAction', None, None, None, False, None, False, None),
+    (('--monitor',), 'monitor', '_StoreAction', None, None, None, False, None, 'FC6', None),
+    (('--monitor',), 'monitor', '_StoreAction', None, None, None, False, None, False, None),
+    (('--mtu',), 'mtu', '_StoreAction', None, None, None, False, None, False, None),
+    (('--name',), 'name', '_StoreAction', None, None, None, False, None, False, None),
+    (('--name',), 'name', '_StoreAction', None, None, None, True, None, False, None),
+    (('--nameserver',), 'nameserver', '_StoreAction', None, None, None, False, None, False, None),
+    (('--netmask',), 'netmask', '_StoreAction', None, None, None, False, None, False, None),
+    (('--nic',), 'nic', '_StoreAction', None, None, None, True, None, False, None),
+    (('--no-activate',), 'activate', '_StoreFalseAction', None, None, 0, False, None, False, None),
+    (('--noboot',), 'noboot', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--nodefroute',), 'nodefroute', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--nodns',), 'nodns', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--noformat',), 'format', '_StoreFalseAction', None, None, 0, False, None, False, None),
+    (('--nogpg',), 'nogpg', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--nohome',), 'nohome', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--noipv4',), 'noipv4', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--noipv6',), 'noipv6', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--nolinear',), 'linear', '_StoreFalseAction', None, None, 0, False, None, False, None),
+    (('--nolvm',), 'lvm', '_StoreFalseAction', None, None, 0, False, None, False, None),
+    (('--nolvm',), 'type', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--nombr',), 'nombr', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--nomount',), 'nomount', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--non-interactive',), 'nonInteractive', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--none',), 'type', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--nontp',), 'nontp', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--noprobe',), 'noProbe', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--noprobe',), 'noprobe', '_StoreAction', None, None, None, False, None, 'FC6', None),
+    (('--noprobe',), 'probe', '_StoreFalseAction', None, None, 0, False, None, False, None),
+    (('--noswap',), 'noswap', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--notksdevice',), 'notksdevice', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--noverifyssl',), 'noverifyssl', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--ntpservers',), 'ntpservers', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--onbiosdisk',), 'onbiosdisk', '_StoreAction', None, None, None, False, None, False, None),
+    (('--onboot',), 'onboot', '_StoreAction', 'ksboolean', None, None, False, None, False, None),
+    (('--ondisk', '--ondrive'), 'disk', '_StoreAction', None, None, None, False, None, False, None),
+    (('--only-use',), 'onlyuse', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--onpart', '--usepart'), 'onPart', '_StoreAction', 'part_cb', None, None, False, None, False, None),
+    (('--opts',), 'moduleOpts', '_StoreAction', None, None, None, False, None, False, None),
+    (('--opts',), 'opts', '_StoreAction', None, None, None, False, None, False, None),
+    (('--osname',), 'osname', '_StoreAction', None, None, None, True, None, False, None),
+    (('--parent',), 'parent', '_StoreAction', None, None, None, False, None, False, None),
+    (('--partition',), 'partition', '_StoreAction', None, None, None, False, None, False, None),
+    (('--passphrase',), 'passphrase', '_StoreAction', None, None, None, False, None, False, None),
+    (('--password',), 'password', '_StoreAction', None, None, None, False, None, False, None),
+    (('--percent',), 'percent', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--permissive',), 'selinux', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--pesize',), 'pesize', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--plaintext',), 'isCrypted', '_StoreFalseAction', None, None, 0, False, None, False, None),
+    (('--poolname',), 'pool_name', '_StoreAction', None, None, None, False, None, False, None),
+    (('--port',), 'port', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--port',), 'port', '_StoreAction', None, None, None, False, None, False, None),
+    (('--port',), 'ports', 'ExtendAction', 'firewall_port_cb', None, None, False, None, False, None),
+    (('--profile',), 'profile', '_StoreAction', None, None, None, False, None, False, None),
+    (('--proxy',), 'proxy', '_StoreAction', None, None, None, False, None, False, None),
+    (('--recommended',), 'recommended', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--reconfig',), 'firstboot', '_StoreConstAction', None, None, 0, False, None, False, None),
+    (('--ref',), 'ref', '_StoreAction', None, None, None, True, None, False, None),
+    (('--remote',), 'remote', '_StoreAction', None, None, None, False, None, False, None),
+    (('--remove-service',), 'remove_services', 'ExtendAction', 'commaSplit', None, None, False, None, False, None),
+    (('--reserved-percent',), 'reserved_percent', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--reserved-space',), 'reserved_space', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--resize',), 'resize', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--resolution',), 'resolution', '_StoreAction', None, None, None, False, None, 'F10', None),
+    (('--resolution',), 'resolution', '_StoreAction', None, None, None, False, None, False, None),
+    (('--reverse-password',), 'password_in', '_StoreAction', None, None, None, False, None, False, None),
+    (('--reverse-user',), 'user_in', '_StoreAction', None, None, None, False, None, False, None),
+    (('--romount',), 'romount', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--root-device',), 'root_device', '_StoreAction', None, None, None, False, None, False, None),
+    (('--rule',), 'rule', '_StoreAction', None, None, None, True, None, False, None),
+    (('--scsiid',), 'scsiid', '_StoreAction', None, None, None, False, None, 'F12', None),
+    (('--scsiid',), 'scsiid', '_StoreAction', None, None, None, True, None, False, None),
+    (('--scsilun',), 'scsilun', '_StoreAction', None, None, None, False, None, 'F12', None),
+    (('--scsilun',), 'scsilun', '_StoreAction', None, None, None, True, None, False, None),
+    (('--server',), 'server', '_StoreAction', None, None, None, False, None, False, None),
+    (('--server',), 'server', '_StoreAction', None, None, None, True, None, False, None),
+    (('--service',), 'services', 'ExtendAction', 'commaSplit', None, None, False, None, False, None),
+    (('--shell',), 'shell', '_StoreAction', None, None, None, False, None, False, None),
+    (('--size',), 'size', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--skip',), 'skip', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--smtp',), 'ports', '_AppendConstAction', None, None, 0, False, None, False, None),
+    (('--smtp',), 'services', '_AppendConstAction', None, None, 0, False, None, False, None),
+    (('--source',), 'source', '_StoreAction', None, None, None, False, None, False, None),
+    (('--spares',), 'spares', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--ssh',), 'ports', '_AppendConstAction', None, None, 0, False, None, False, None),
+    (('--ssh',), 'services', '_AppendConstAction', None, None, 0, False, None, False, None),
+    (('--sshkey',), 'sshkey', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--start',), 'start', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--start',), 'start', '_StoreAction', None, None, None, False, None, 'F11', None),
+    (('--startxonboot',), 'startX', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--subvol',), 'subvol', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--switch',), 'switch_options', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    (('--target',), 'target', '_StoreAction', None, None, None, False, None, False, None),
+    (('--teamconfig',), 'teamconfig', '_StoreAction', None, None, None, False, None, False, None),
+    (('--teamslaves',), 'teamslaves', '_StoreAction', 'teamslaves_cb', None, None, False, None, False, None),
+    (('--telnet',), 'ports', '_AppendConstAction', None, None, 0, False, None, False, None),
+    (('--telnet',), 'telnet', '_StoreAction', None, None, None, False, None, 'F10', None),
+    (('--thin',), 'thin_volume', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--thinpool',), 'thin_pool', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--timeout',), 'timeout', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--trust',), 'trusts', '_AppendAction', None, None, None, False, None, False, None),
+    (('--type',), 'type', '_StoreAction', '_type_cb', None, None, False, None, False, None),
+    (('--type',), 'type', '_StoreAction', None, None, None, False, None, 'F12', None),
+    (('--type',), 'type', '_StoreAction', None, None, None, False, None, False, None),
+    (('--uid',), 'uid', '_StoreAction', 'int', None, None, False, None, False, None),
+    (('--upgrade',), 'upgrade', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--url',), 'url', '_StoreAction', None, None, None, False, None, False, None),
+    (('--url',), 'url', '_StoreAction', None, None, None, True, None, False, None),
+    (('--useLilo',), 'useLilo', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--useexisting',), 'preexist', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--user',), 'user', '_StoreAction', None, None, None, False, None, False, None),
+    (('--username',), 'username', '_StoreAction', None, None, None, True, None, False, None),
+    (('--utc', '--isUtc'), 'isUtc', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--utc',), 'isUtc', '_StoreTrueAction', None, None, 0, False, None, False, None),
+    (('--vckeymap',), 'vc_keymap', '_StoreAction', None, None, None, False, None, False, None),
+    (('--vgname',), 'vgname', '_StoreAction', None, None, None, True, None, False, None),
+    (('--videoram',), 'videoRam', '_StoreAction', None, None, None, False, None, False, None),
+    (('--videoram',), 'videoram', '_StoreAction', None, None, None, False, None, 'F10', None),
+    (('--vlanid',), 'vlanid', '_StoreAction', None, None, None, False, None, False, None),
+    (('--vsync',), 'vsync', '_StoreAction', None, None, None, False, None, 'FC6', None),
+    (('--vsync',), 'vsync', '_StoreAction', None, None, None, False, None, False, None),
+    (('--wepkey',), 'wepkey', '_StoreAction', None, None, None, False, None, False, None),
+    (('--when',), 'when', '_StoreAction', '_when_cb', None, None, True, None, False, None),
+    (('--wpakey',), 'wpakey', '_StoreAction', None, None, None, False, None, False, None),
+    (('--wwpn',), 'wwpn', '_StoreAction', None, None, None, True, None, False, None),
+    (('--xlayouts',), 'x_layouts', '_StoreAction', 'commaSplit', None, None, False, None, False, None),
+    ((), 'iqn', '_StoreAction', None, None, 1, True, None, False, None),
+    ((), 'kbd', '_StoreAction', None, None, '*', True, None, False, None),
+    ((), 'lang', '_StoreAction', None, None, 1, True, None, False, None),
+    ((), 'mntpoint', '_StoreAction', None, None, 1, True, None, False, None),
+    ((), 'name', '_StoreAction', None, None, '*', True, None, False, None),
+    ((), 'options', '_StoreAction', None, None, None, True, None, False, None),
+    ((), 'partition', '_StoreAction', None, None, '*', True, None, False, None),
+    ((), 'partitions', '_StoreAction', None, None, '*', True, None, False, None),
+    ((), 'password', '_StoreAction', None, None, '*', True, None, False, None),
+    ((), 'password', '_StoreAction', None, None, '?', False, None, False, None),
+    ((), 'sshkey', '_StoreAction', None, None, 1, True, None, False, None),
+    ((), 'timezone', '_StoreAction', None, None, '*', True, None, False, None),
+    ((), 'timezone', '_StoreAction', None, None, 1, True, None, False, None),
+    ((), 'updates', '_StoreAction', None, None, '*', True, None, False, None),
+]
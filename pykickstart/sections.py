@@ -57,6 +57,9 @@ class Section(object):
     sectionOpen = ""
     timesSeen = 0
 
+    # Header parsers, shared by every instance of the same class and version.
+    _parsers = {}
+
     def __init__(self, handler, **kwargs):
         """Create a new Script instance.  At the least, you must pass in an
            instance of a baseHandler subclass.
@@ -102,6 +105,20 @@ class Section(object):
         self.timesSeen += 1
     # pylint: enable=unused-argument
 
+    def _getCachedParser(self):
+        """Return the option parser for this section's header, building it
+           with _getParser the first time it is needed for this class and
+           version.
+        """
+        key = (self.__class__, self.version)
+        op = Section._parsers.get(key)
+
+        if op is None:
+            op = self._getParser()
+            Section._parsers[key] = op
+
+        return op
+
     @property
     def seen(self):
         """This property is given for consistency with KickstartCommand objects
@@ -140,7 +157,7 @@ class NullSection(Section):
         else:
             s = "%s\n%%end" % " ".join(self._args)
 
-        self.handler._null_section_strings.append(s)
+        self.handler.edit("_null_section_strings").append(s)
 
         self._args = []
         self._body = []
@@ -182,7 +199,7 @@ class ScriptSection(Section):
 
     def _resetScript(self):
         self._script = {"interp": "/bin/sh", "log": None, "errorOnFail": False,
-                        "lineno": None, "chroot": False, "body": []}
+                        "lineno": None, "source": None, "chroot": False, "body": []}
 
     def handleLine(self, line):
         self._script["body"].append(line)
@@ -194,6 +211,7 @@ class ScriptSection(Section):
         kwargs = {"interp": self._script["interp"],
                   "inChroot": self._script["chroot"],
                   "lineno": self._script["lineno"],
+                  "source": self._script["source"],
                   "logfile": self._script["log"],
                   "errorOnFail": self._script["errorOnFail"],
                   "type": self._script["type"]}
@@ -201,7 +219,7 @@ class ScriptSection(Section):
         if self.dataObj is not None:
             s = self.dataObj(self._script["body"], **kwargs)
             self._resetScript()
-            self.handler.scripts.append(s)
+            self.handler.edit("scripts").append(s)
 
     def handleHeader(self, lineno, args):
         """Process the arguments to a %pre/%post/%traceback header for later
@@ -209,12 +227,13 @@ class ScriptSection(Section):
            This method may be overridden in a subclass if necessary.
         """
         Section.handleHeader(self, lineno, args)
-        op = self._getParser()
+        op = self._getCachedParser()
 
         ns = op.parse_args(args=args[1:], lineno=lineno)
 
         self._script["interp"] = ns.interpreter
         self._script["lineno"] = lineno
+        self._script["source"] = self.handler.currentSource
         self._script["log"] = ns.log
         self._script["errorOnFail"] = ns.errorOnFail
         if hasattr(ns, "nochroot"):
@@ -444,7 +463,7 @@ class PackageSection(Section):
     def handleLine(self, line):
         h = line.partition('#')[0]
         line = h.rstrip()
-        self.handler.packages.add([line])
+        self.handler.edit("packages").add([line])
 
     def _getParser(self):
         op = KSOptionParser(prog=self.sectionOpen, description="""
@@ -611,7 +630,7 @@ class PackageSection(Section):
            overridden in a subclass if necessary.
         """
         Section.handleHeader(self, lineno, args)
-        op = self._getParser()
+        op = self._getCachedParser()
         ns = op.parse_args(args=args[1:], lineno=lineno)
 
         if ns.defaultPackages and ns.nobase:
@@ -619,20 +638,21 @@ class PackageSection(Section):
         elif ns.defaultPackages and ns.nocore:
             raise KickstartParseError(formatErrorMsg(lineno, msg=_("--default and --nocore cannot be used together")))
 
-        self.handler.packages.excludeDocs = ns.excludedocs
-        self.handler.packages.addBase = not ns.nobase
+        packages = self.handler.edit("packages")
+        packages.excludeDocs = ns.excludedocs
+        packages.addBase = not ns.nobase
         if ns.ignoremissing:
-            self.handler.packages.handleMissing = KS_MISSING_IGNORE
+            packages.handleMissing = KS_MISSING_IGNORE
         else:
-            self.handler.packages.handleMissing = KS_MISSING_PROMPT
+            packages.handleMissing = KS_MISSING_PROMPT
 
         if ns.defaultPackages:
-            self.handler.packages.default = True
+            packages.default = True
 
         if ns.instLangs is not None:
-            self.handler.packages.instLangs = ns.instLangs
+            packages.instLangs = ns.instLangs
 
-        self.handler.packages.nocore = ns.nocore
-        self.handler.packages.multiLib = ns.multiLib
-        self.handler.packages.excludeWeakdeps = ns.excludeWeakdeps
-        self.handler.packages.seen = True
+        packages.nocore = ns.nocore
+        packages.multiLib = ns.multiLib
+        packages.excludeWeakdeps = ns.excludeWeakdeps
+        packages.seen = True
@@ -0,0 +1,477 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Editing a kickstart file one command at a time, as ksshell does.
+
+A session holds the file as a list of entries, each being one command line,
+one whole section from its header to its %end, or a blank or comment line.
+Changing an entry only parses again what it could have changed:
+
+    - For a command, the command object is replaced with a new one and every
+      line of that command is dispatched again, so repeated commands and
+      data commands such as part come out just as a full parse would leave
+      them.
+
+    - For a script section, only that section is parsed, and the scripts of
+      the other sections are reused.
+
+    - For %packages, every %packages section is parsed again, as they all
+      add to the same Packages object.
+
+    - For %include and any section pykickstart does not know, the whole file
+      is parsed again, as what they did can not be taken back.
+
+The handler's output is built from the text of each command and section,
+which is only made again for the ones that have been parsed again since.
+Checks one command makes against another when it is parsed are only as
+current as the last time it was parsed.
+
+This module exports one class:
+
+    KickstartSession - A kickstart file being edited.
+"""
+import bisect
+import warnings
+
+from pykickstart.errors import KickstartError, KickstartParseWarning
+from pykickstart.parser import CollectingParser, Packages, PutBackIterator, STATE_COMMANDS
+from pykickstart.schema import getSchema
+from pykickstart.sections import PackageSection, ScriptSection
+
+# Keys of entries that have nothing to parse, and of those that mean parsing
+# the whole file again.
+_NOTHING = None
+_EVERYTHING = "%%"
+
+def _recordWarnings():
+    # Only warnings about the input belong in an entry's messages, not ones
+    # from Python or other libraries along the way.
+    warnings.simplefilter("ignore")
+    warnings.simplefilter("always", KickstartParseWarning)
+
+class SessionEntry(object):
+    """One command, section, or blank or comment line of a KickstartSession.
+       Instance attributes:
+
+       key      -- What parsing it affects: the name of the command class, or
+                   the name of the command if there is no such command,
+                   "%scripts", "%packages", or one of the module's _NOTHING
+                   and _EVERYTHING values.
+       lines    -- A list of the lines of text, without their newlines.
+       messages -- A list of the errors and warnings from the last time it was
+                   parsed.
+       name     -- The first word of its first line, or None for a blank or
+                   comment line.
+       scripts  -- For a script section, the Script objects it made.
+    """
+    def __init__(self, lines, name, key):
+        self.lines = lines
+        self.name = name
+        self.key = key
+        self.messages = []
+        self.scripts = []
+
+    def __str__(self):
+        return "".join(line + "\n" for line in self.lines)
+
+class KickstartSession(object):
+    """A kickstart file being edited, which is kept parsed into a handler.
+       Entries are given by their position in the list of entries.
+       Instance attributes:
+
+       entries -- The list of SessionEntry objects making up the file.
+       handler -- The BaseHandler subclass instance the file is parsed into.
+       parser  -- The KickstartParser used for sections and %include.
+    """
+    def __init__(self, handler, followIncludes=True, extraWords=None):
+        """Create a new KickstartSession with no entries.
+
+           handler        -- The handler to parse the file into.  Anything
+                             already in it is thrown away.
+           followIncludes -- Should %include lines be followed?
+           extraWords     -- A list of further words to complete at the start
+                             of a line, such as a program's own commands.
+        """
+        self.handler = handler
+        self.parser = CollectingParser(handler, followIncludes=followIncludes,
+                                       errorsAreFatal=False)
+        self.entries = []
+
+        # Lines of a section that feed has not seen the %end of yet.
+        self._pending = []
+
+        # Each key's entries, in no particular order.
+        self._index = {}
+
+        # Where each entry is and the line it starts on, worked out again
+        # when needed after entries are added or removed.
+        self._positions = None
+        self._starts = None
+
+        # The text of each command, script and Packages object, keyed by id
+        # and holding the object too so a new one with the same id is not
+        # mistaken for it.
+        self._rendered = {}
+
+        # Every word that can be completed, sorted so the ones starting with
+        # any prefix are found by bisecting.
+        schema = getSchema()
+        commands = [name for name in dict.keys(handler.commands) if dict.get(handler.commands, name) is not None]
+        self._commandWords = sorted(set(commands + list(self.parser._sections.keys()) + (extraWords or [])))
+        self._optionWords = dict((name, schema.optionStrings(handler.version, name)) for name in commands)
+
+        self.rebuild()
+
+    ##
+    ## SPLITTING INTO ENTRIES
+    ##
+
+    def _key(self, name):
+        # pylint: disable=protected-access
+        if name is None:
+            return _NOTHING
+        elif name.startswith("%"):
+            section = self.parser._sections.get(name)
+            if isinstance(section, ScriptSection):
+                return "%scripts"
+            elif isinstance(section, PackageSection):
+                return "%packages"
+            else:
+                return _EVERYTHING
+
+        cmd = dict.get(self.handler.commands, name)
+        if cmd is None:
+            return name
+
+        return cmd.__class__.__name__
+
+    def _isSectionStart(self, word):
+        return word.startswith("%") and word not in ("%end", "%include", "%ksappend")
+
+    def _makeEntries(self, lines):
+        """Split the list of lines into a list of SessionEntry objects.  A
+           section that does not end is made into an entry anyway, and parsing
+           it will say so.
+        """
+        retval = []
+        section = None
+
+        for line in lines:
+            words = line.split()
+            first = words[0] if words and not line.lstrip().startswith("#") else None
+
+            if section is not None:
+                # A script may have lines starting with % that don't start a
+                # section, so only ones the parser knows end this one early.
+                if first is not None and self._isSectionStart(first) and self.parser._validState(first):
+                    retval.append(SessionEntry(section, section[0].split()[0], self._key(section[0].split()[0])))
+                    section = None
+                else:
+                    section.append(line)
+                    if first == "%end":
+                        retval.append(SessionEntry(section, section[0].split()[0], self._key(section[0].split()[0])))
+                        section = None
+                    continue
+
+            if first is not None and self._isSectionStart(first):
+                section = [line]
+            else:
+                retval.append(SessionEntry([line], first, self._key(first)))
+
+        if section is not None:
+            retval.append(SessionEntry(section, section[0].split()[0], self._key(section[0].split()[0])))
+
+        return retval
+
+    def _layout(self):
+        if self._positions is None:
+            self._positions = {}
+            self._starts = []
+            lineno = 1
+
+            for (i, entry) in enumerate(self.entries):
+                self._positions[id(entry)] = i
+                self._starts.append(lineno)
+                lineno += len(entry.lines)
+
+    def _moved(self):
+        self._positions = None
+        self._starts = None
+
+    def lineno(self, index):
+        """Return the line of the file the entry at index starts on."""
+        self._layout()
+        return self._starts[index]
+
+    def _entryLineno(self, entry):
+        self._layout()
+        return self._starts[self._positions[id(entry)]]
+
+    ##
+    ## PARSING
+    ##
+
+    def _parseCommand(self, entry):
+        # pylint: disable=protected-access
+        line = entry.lines[0]
+        lineno = self._entryLineno(entry)
+
+        self.parser._line = line + "\n"
+
+        with warnings.catch_warnings(record=True) as caught:
+            _recordWarnings()
+
+            try:
+                args = self.parser._split(line, comments=True)
+                self.parser._markSource(lineno)
+                self.parser.handleCommand(lineno, args)
+            except (KickstartError, ValueError) as e:
+                entry.messages.append(str(e))
+
+        entry.messages.extend(str(w.message) for w in caught)
+
+    def _parseSection(self, entry):
+        # pylint: disable=protected-access
+        lineno = self._entryLineno(entry)
+        self.parser.messages = []
+
+        with warnings.catch_warnings(record=True) as caught:
+            _recordWarnings()
+
+            try:
+                lines = PutBackIterator([line + "\n" for line in entry.lines] + [""])
+                self.parser._stateMachine(lines, lineno=lineno - 1)
+            except KickstartError as e:
+                self.parser.messages.append(str(e))
+
+        # A section that did not end leaves the parser inside it.
+        self.parser._state = STATE_COMMANDS
+        self.parser._includeDepth = 0
+
+        entry.messages.extend(self.parser.messages)
+        entry.messages.extend(str(w.message) for w in caught)
+
+    def _parse(self, entry):
+        entry.messages = []
+
+        if entry.key is _NOTHING:
+            return
+        elif entry.key == "%scripts":
+            scripts = self.handler.edit("scripts")
+            count = len(scripts)
+            self._parseSection(entry)
+            entry.scripts = scripts[count:]
+            del scripts[count:]
+        elif entry.name.startswith("%"):
+            self._parseSection(entry)
+        else:
+            self._parseCommand(entry)
+
+    def _setScripts(self):
+        # pylint: disable=protected-access
+        self.handler.scripts = [script for entry in self.entries for script in entry.scripts]
+        self.handler._invalidateFingerprint(["scripts"])
+
+    def rebuild(self):
+        """Parse every entry again into an emptied handler."""
+        # pylint: disable=protected-access
+        self.handler.reset()
+        self.parser._reset()
+        self.parser._enterFile(None)
+        self._layout()
+
+        for entry in self.entries:
+            self._parse(entry)
+
+        self._setScripts()
+
+    def _reparse(self, key, name, added):
+        """Parse what entries with key affect again, after the entries in the
+           list added were put in and any others taken out.  name is the name
+           of one of the entries that had the key.
+        """
+        # pylint: disable=protected-access
+        if key is _NOTHING:
+            return
+        elif key == "%scripts":
+            for entry in added:
+                if entry.key == key:
+                    self._parse(entry)
+
+            self._setScripts()
+            return
+
+        self._layout()
+        entries = sorted(self._index.get(key, []), key=lambda e: self._positions[id(e)])
+
+        if key == "%packages":
+            self.handler.packages = Packages()
+            self.handler._invalidateFingerprint(["packages"])
+        elif dict.get(self.handler.commands, name) is not None:
+            # The command is emptied even if no lines of it are left.
+            self.handler.resetCommand(name)
+
+        for entry in entries:
+            self._parse(entry)
+
+    def _change(self, index, count, text):
+        """Replace count entries starting at index with the entries in text,
+           parse what that affects, and return the new entries.
+        """
+        lines = text.splitlines() if text else []
+        added = self._makeEntries(lines)
+        removed = self.entries[index:index + count]
+
+        self.entries[index:index + count] = added
+        self._moved()
+
+        for entry in removed:
+            self._index[entry.key].remove(entry)
+
+        for entry in added:
+            self._index.setdefault(entry.key, []).append(entry)
+
+        keys = dict((entry.key, entry.name) for entry in removed + added)
+        if _EVERYTHING in keys:
+            self.rebuild()
+        else:
+            for (key, name) in keys.items():
+                self._reparse(key, name, added)
+
+        return added
+
+    ##
+    ## EDITING
+    ##
+
+    def load(self, s):
+        """Replace the whole file with the string s."""
+        self._pending = []
+        self.entries = self._makeEntries(s.splitlines())
+        self._index = {}
+        for entry in self.entries:
+            self._index.setdefault(entry.key, []).append(entry)
+
+        self._moved()
+        self.rebuild()
+
+    def insert(self, index, text):
+        """Put the lines of text in before the entry at index, and return
+           the list of errors and warnings from parsing them.
+        """
+        return [msg for entry in self._change(index, 0, text) for msg in entry.messages]
+
+    def append(self, text):
+        """Put the lines of text at the end of the file, and return the list
+           of errors and warnings from parsing them.
+        """
+        return self.insert(len(self.entries), text)
+
+    def replace(self, index, text):
+        """Put the lines of text in place of the entry at index, and return
+           the list of errors and warnings from parsing them.
+        """
+        return [msg for entry in self._change(index, 1, text) for msg in entry.messages]
+
+    def delete(self, index):
+        """Take the entry at index out of the file."""
+        self._change(index, 1, "")
+
+    @property
+    def pending(self):
+        """Is feed in the middle of a section?"""
+        return len(self._pending) > 0
+
+    def feed(self, line):
+        """Add one line to the end of the file, as it is typed.  The lines
+           of a section are kept back until its %end, so None is returned
+           for them.  Otherwise, the list of errors and warnings from parsing
+           the line, or the section it ended, is returned.
+        """
+        words = line.split()
+        first = words[0] if words and not line.lstrip().startswith("#") else None
+
+        if not self._pending and first is not None and self._isSectionStart(first):
+            self._pending = [line]
+            return None
+        elif self._pending:
+            self._pending.append(line)
+            if first != "%end":
+                return None
+
+        lines = self._pending or [line]
+        self._pending = []
+        return self.append("\n".join(lines))
+
+    def __str__(self):
+        """Return the file as it was entered."""
+        return "".join(str(entry) for entry in self.entries)
+
+    ##
+    ## OUTPUT
+    ##
+
+    def render(self):
+        """Return the handler formatted for output to a kickstart file, the
+           same as str(self.handler) but only formatting the commands and
+           sections that have changed since the last call.
+        """
+        # pylint: disable=protected-access
+        rendered = {}
+
+        def _strFunc(obj):
+            cached = self._rendered.get(id(obj))
+            if cached is None or cached[0] is not obj:
+                cached = (obj, self.handler._objStr(obj))
+
+            rendered[id(obj)] = cached
+            return cached[1]
+
+        retval = "".join(self.handler._strParts(_strFunc))
+
+        # Forget what is no longer part of the handler.
+        self._rendered = rendered
+        return retval
+
+    ##
+    ## COMPLETION
+    ##
+
+    def _startingWith(self, words, prefix):
+        i = bisect.bisect_left(words, prefix)
+        j = i
+        while j < len(words) and words[j].startswith(prefix):
+            j += 1
+
+        return words[i:j]
+
+    def complete(self, line, begin, end):
+        """Return a sorted list of the words that could take the place of
+           line[begin:end], the word being completed.  The first word of a
+           line can be any command or section, and the others any option of
+           that command.  Nothing is completed inside a section.
+        """
+        if self._pending:
+            return []
+
+        prefix = line[begin:end]
+
+        if line[:begin].strip() == "":
+            return self._startingWith(self._commandWords, prefix)
+
+        return self._startingWith(self._optionWords.get(line.split()[0], []), prefix)
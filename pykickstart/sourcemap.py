@@ -0,0 +1,108 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Where in which file each command, data object and script came from.
+
+The lineno attribute of a command or data object is the line in the file it
+was read from, which may be any of the files pulled in with %include.  A
+handler's SourceMap records the file and line of every command and section
+header the parser handles, and each command, data object and script keeps the
+index of its entry in the source attribute.
+
+File names are interned, so each entry is just a file number and a line
+number kept in two arrays, taking eight bytes whatever the file is called.
+
+This module exports one class:
+
+    SourceMap - The file and line of every command and section header read
+                into a handler.
+"""
+from array import array
+
+from pykickstart.i18n import _
+
+class SourceMap(object):
+    """The file and line of every command and section header read into a
+       handler, in the order they were read.  Entries are never removed, so
+       an index given out by add always refers to the same place.  A file
+       name of None stands for a kickstart file read from a string.
+    """
+    def __init__(self):
+        self._names = []
+        self._ids = {}
+
+        # Entry i is line _lines[i] of the file numbered _fileIds[i].
+        self._fileIds = array("I")
+        self._lines = array("I")
+
+    def __len__(self):
+        return len(self._lines)
+
+    def intern(self, name):
+        """Return the number standing for the file name in this map."""
+        fileId = self._ids.get(name)
+        if fileId is None:
+            fileId = len(self._names)
+            self._ids[name] = fileId
+            self._names.append(name)
+
+        return fileId
+
+    def fileName(self, fileId):
+        """Return the name of the file numbered fileId."""
+        return self._names[fileId]
+
+    def add(self, fileId, lineno):
+        """Record line lineno of the file numbered fileId, and return the
+           index of the new entry.
+        """
+        self._fileIds.append(fileId)
+        self._lines.append(lineno)
+        return len(self._lines) - 1
+
+    def lookup(self, index):
+        """Return a tuple of the file name and line number of the entry
+           index, or (None, None) if index is None.
+        """
+        if index is None:
+            return (None, None)
+
+        return (self._names[self._fileIds[index]], self._lines[index])
+
+    def describe(self, index):
+        """Return where the entry index is, for use in messages."""
+        (name, lineno) = self.lookup(index)
+
+        if name is None:
+            return _("line %s") % lineno
+        else:
+            return _("line %(lineno)s of %(filename)s") % {"lineno": lineno, "filename": name}
+
+    def copy(self, count=None):
+        """Return a new SourceMap holding the first count entries of this
+           one, or all of them if count is None.  Only the names of files
+           those entries are in are kept, so a handler that is reset over
+           and over doesn't collect the name of every file it ever read.
+        """
+        new = SourceMap()
+        new._lines = self._lines[:count]
+
+        for fileId in self._fileIds[:count]:
+            new._fileIds.append(new.intern(self._names[fileId]))
+
+        return new
@@ -0,0 +1,317 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Counting which commands, options, %packages groups and script interpreters a
+collection of kickstart files uses, however many files there are.
+
+Each file is parsed with the version given by its "#version=" line, or a
+default version if it has none, and everything is counted separately for each
+version.  Options are counted as KSOptionParser parses them, and each one is
+checked against the version of the file to find the deprecated ones, as the
+version index does.  The parsers themselves only know the version of the
+command class that made them, which is often much older.
+
+Files are handed out to a pool of processes in batches, each of which sends
+back counts for its whole batch.  Only a few batches are waiting at once, and
+the counts only grow with the number of different things used, so the memory
+needed doesn't depend on how many files there are.
+
+This module exports a class and several functions:
+
+    UsageStats - Counts of what a set of files uses, which can be merged.
+
+    countFile - Parse one file and add what it uses to a UsageStats.
+
+    countFiles - Count what every file in a list uses on a pool of processes.
+
+    findFiles - Generate the kickstart files in a list of files and
+                directories.
+"""
+import collections
+import fnmatch
+import multiprocessing
+import os
+import warnings
+
+import six
+
+from pykickstart.base import DeprecatedCommand
+from pykickstart.errors import KickstartError, KickstartVersionError
+from pykickstart.load import load_to_str
+from pykickstart.options import setOptionHook
+from pykickstart.parser import KickstartParser
+from pykickstart.version import DEVEL, makeVersion, stringToVersion, versionToString
+from pykickstart.versionindex import DEPRECATED, actionStatus
+from pykickstart.watch import DEFAULT_PATTERNS
+
+class UsageStats(object):
+    """How many files use each command, option, %packages group and script
+       interpreter.  Every count is kept for each version separately, so
+       each attribute is a collections.Counter keyed by tuples starting with
+       the version string, such as "F27":
+
+       files        -- Files parsed, keyed by (version,).
+       failed       -- Files that had errors, keyed by (version,).
+       commands     -- Files using each command, keyed by (version, command).
+       options      -- Files using each option, keyed by (version, command,
+                       option).  Section options are under the section name,
+                       such as "%packages".
+       deprecated   -- Files using each deprecated command or option, keyed
+                       like options with an option of None for commands.
+       unsupported  -- Files using each option that was removed or not yet
+                       added in their version, keyed like options.
+       groups       -- Files installing each %packages group, keyed by
+                       (version, group).
+       interpreters -- Files with scripts run by each interpreter, keyed by
+                       (version, interpreter).
+    """
+    fields = ["files", "failed", "commands", "options", "deprecated",
+              "unsupported", "groups", "interpreters"]
+
+    def __init__(self):
+        for field in self.fields:
+            setattr(self, field, collections.Counter())
+
+    def merge(self, other):
+        """Add the counts of the UsageStats other to these, and return self."""
+        for field in self.fields:
+            getattr(self, field).update(getattr(other, field))
+
+        return self
+
+    def versions(self):
+        """Return a sorted list of the versions any files were parsed with."""
+        return sorted((key[0] for key in self.files), key=stringToVersion)
+
+    def total(self, field, version=None):
+        """Return a collections.Counter of the counts in field for version,
+           or for all versions added together if version is None.  It is
+           keyed by what follows the version in the keys of field.
+        """
+        retval = collections.Counter()
+
+        for (key, count) in getattr(self, field).items():
+            if version is None or key[0] == version:
+                retval[key[1:]] += count
+
+        return retval
+
+class _StatsParser(KickstartParser):
+    """A parser that notes what each file uses instead of printing errors."""
+    def __init__(self, *args, **kwargs):
+        KickstartParser.__init__(self, *args, **kwargs)
+        self._command = None
+        self.clearUsed()
+
+    def clearUsed(self):
+        self.errorsCount = 0
+        self.commands = set()
+        self.options = set()
+        self.deprecated = set()
+        self.unsupported = set()
+
+    def handleCommand(self, lineno, args):
+        self.commands.add(args[0])
+
+        if isinstance(dict.get(self.handler.commands, args[0]), DeprecatedCommand):
+            self.deprecated.add((args[0], None))
+
+        self._command = args[0]
+        try:
+            return KickstartParser.handleCommand(self, lineno, args)
+        finally:
+            self._command = None
+
+    def optionUsed(self, op, action):
+        # Outside of a command, this is the header of a section.
+        key = (self._command or op.prog, action.option_strings[0] if action.option_strings else action.dest)
+        self.options.add(key)
+
+        status = actionStatus(action, self.version)
+        if status is None:
+            self.unsupported.add(key)
+        elif status == DEPRECATED:
+            self.deprecated.add(key)
+
+    def _tryFunc(self, fn):
+        try:
+            fn()
+        except Exception:   # pylint: disable=broad-except
+            self.errorsCount += 1
+
+def _fileVersion(contents, default):
+    """Return the version given by the "#version=" line at the top of the
+       string contents, or default if there isn't one.
+    """
+    for line in contents.splitlines():
+        line = line.strip()
+
+        if line.startswith("#version="):
+            try:
+                return stringToVersion(line[9:].strip())
+            except KickstartVersionError:
+                return default
+        elif line and not line.startswith("#"):
+            break
+
+    return default
+
+# The parser for each version, kept by each process so handlers are only made
+# once.
+_parsers = {}
+
+def countFile(stats, path, version=DEVEL, followIncludes=False):
+    """Parse the kickstart file at path, and add what it uses to the
+       UsageStats stats.  The file is parsed with the version its "#version="
+       line gives, or version if it has none.  A file that can not be read or
+       parsed is counted in failed, along with what it used before the error.
+    """
+    if isinstance(version, six.string_types):
+        version = stringToVersion(version)
+
+    try:
+        contents = load_to_str(path)
+    except KickstartError:
+        name = versionToString(version, skipDevel=True)
+        stats.files[(name,)] += 1
+        stats.failed[(name,)] += 1
+        return
+
+    version = _fileVersion(contents, version)
+    name = versionToString(version, skipDevel=True)
+
+    if version not in _parsers:
+        _parsers[version] = _StatsParser(makeVersion(version), followIncludes=followIncludes,
+                                         errorsAreFatal=False, missingIncludeIsFatal=False)
+
+    parser = _parsers[version]
+    parser.followIncludes = followIncludes
+    parser.handler.reset()
+    parser.clearUsed()
+
+    previous = setOptionHook(parser.optionUsed)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parser.readKickstartFromString(contents, path=path)
+    except Exception:    # pylint: disable=broad-except
+        parser.errorsCount += 1
+    finally:
+        setOptionHook(previous)
+
+    stats.files[(name,)] += 1
+    if parser.errorsCount:
+        stats.failed[(name,)] += 1
+
+    for command in parser.commands:
+        stats.commands[(name, command)] += 1
+
+    for field in ["options", "deprecated", "unsupported"]:
+        counter = getattr(stats, field)
+        for key in getattr(parser, field):
+            counter[(name,) + key] += 1
+
+    for group in set(g.name for g in parser.handler.packages.groupList):
+        stats.groups[(name, group)] += 1
+
+    for interp in set(s.interp for s in parser.handler.scripts):
+        stats.interpreters[(name, interp)] += 1
+
+def _countBatch(args):
+    """Count a batch of files, given by a tuple of (paths, version,
+       followIncludes) so this can be handed to a process pool.
+    """
+    (paths, version, followIncludes) = args
+    stats = UsageStats()
+
+    for path in paths:
+        countFile(stats, path, version=version, followIncludes=followIncludes)
+
+    return stats
+
+def _batches(paths, size):
+    batch = []
+    for path in paths:
+        batch.append(path)
+        if len(batch) == size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+def countFiles(paths, version=DEVEL, followIncludes=False, processes=None, batchSize=64, callback=None):
+    """Count what every kickstart file in paths uses on a pool of processes,
+       and return a UsageStats holding the counts.  paths can be any
+       iterable, such as the generator findFiles returns, and is only read
+       as more files are needed.  If callback is given, it is called with
+       the UsageStats after each batch of batchSize files is added to it.
+    """
+    stats = UsageStats()
+    batches = ((batch, version, followIncludes) for batch in _batches(paths, batchSize))
+
+    def add(batchStats):
+        stats.merge(batchStats)
+        if callback:
+            callback(stats)
+
+    if processes == 1:
+        for batch in batches:
+            add(_countBatch(batch))
+
+        return stats
+
+    pool = multiprocessing.Pool(processes)
+    pending = collections.deque()
+    limit = 2 * (processes or multiprocessing.cpu_count())
+
+    try:
+        for batch in batches:
+            pending.append(pool.apply_async(_countBatch, (batch,)))
+
+            # Don't read further ahead than the pool can use.
+            while len(pending) >= limit or (pending and pending[0].ready()):
+                add(pending.popleft().get())
+
+        while pending:
+            add(pending.popleft().get())
+    finally:
+        pool.close()
+        pool.join()
+
+    return stats
+
+def findFiles(paths, patterns=None):
+    """Generate the kickstart files in the list paths, which may be files
+       or directories.  Directories are searched recursively for files
+       matching any of the fnmatch patterns in the list patterns, which
+       defaults to *.ks and *.cfg.  Files are generated as they are found.
+    """
+    patterns = patterns or DEFAULT_PATTERNS
+
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        for (dirpath, dirnames, filenames) in os.walk(path):
+            dirnames.sort()
+
+            for filename in sorted(filenames):
+                if any(fnmatch.fnmatch(filename, pattern) for pattern in patterns):
+                    yield os.path.join(dirpath, filename)
@@ -0,0 +1,261 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Checking that the storage commands of a parsed kickstart file refer to each
+other correctly.
+
+Each storage command is checked on its own as it is parsed, but nothing there
+notices a logvol naming a volume group that is never defined, or a raid
+device using a member partition that does not exist.  These checks need the
+whole file, so they are run on a handler after parsing, and only when asked.
+
+This module exports a single class:
+
+    StorageGraph - Indexes of the partitions, RAID devices, volume groups,
+                   logical volumes and BTRFS volumes defined by a handler,
+                   and the checks run against them.
+
+And it exports a single function:
+
+    checkStorage - Return a list of the problems found with the storage
+                   layout of a handler.
+"""
+from pykickstart.errors import KickstartParseError, formatErrorMsg
+
+from pykickstart.i18n import _
+
+# The prefixes of the names given to part and raid to make them members of
+# another device instead of mounting them.  Only kickstart gives things these
+# names, so a reference to one that is never defined can not be to something
+# already on disk.
+RAID_MEMBER = "raid."
+PHYSICAL_VOLUME = "pv."
+BTRFS_MEMBER = "btrfs."
+
+MEMBER_PREFIXES = (RAID_MEMBER, PHYSICAL_VOLUME, BTRFS_MEMBER)
+
+# Ways of naming a BTRFS parent volume that refer to something on disk rather
+# than to a volume in the kickstart file.
+_deviceSpecs = ("/dev/", "UUID=", "PARTUUID=")
+
+def _memberKind(name):
+    for prefix in MEMBER_PREFIXES:
+        if name.startswith(prefix):
+            return prefix
+
+    return None
+
+def _dataList(handler, name):
+    cmd = getattr(handler, name, None)
+    if cmd is None or not hasattr(cmd, "dataList"):
+        return []
+
+    return cmd.dataList()
+
+class StorageGraph(object):
+    """The storage layout defined by a handler, with every name a storage
+       command can refer to indexed so each reference is checked with a
+       single lookup.  Building the graph and checking it both take time in
+       proportion to the number of storage commands.  Instance attributes:
+
+       members     -- A dict mapping the raid.*, pv.* and btrfs.* names
+                      defined by part and raid to the data object defining
+                      each.
+       mountpoints -- A dict mapping every mount point to the first data
+                      object using it.
+       volgroups   -- A dict mapping volume group names to their data object.
+       thinpools   -- A dict mapping (volume group, name) tuples to the data
+                      object of each thin pool logical volume.
+       btrfs       -- A dict mapping the names a BTRFS subvolume can use for
+                      its parent (the label, LABEL=label and the mount point)
+                      to the data object of each BTRFS volume.
+    """
+    def __init__(self, handler):
+        self.handler = handler
+
+        self.members = {}
+        self.mountpoints = {}
+        self.volgroups = {}
+        self.thinpools = {}
+        self.btrfs = {}
+
+        self._errors = []
+        self._usedBy = {}
+
+        self._build()
+        self._buildErrors = self._errors
+
+    def _error(self, data, msg):
+        self._errors.append((data.lineno, KickstartParseError(formatErrorMsg(data.lineno, msg=msg))))
+
+    def _define(self, name, data):
+        """Record that data defines name, which is either a mount point or
+           a member name.
+        """
+        if not name:
+            return
+
+        if _memberKind(name):
+            table = self.members
+        elif name.startswith("/"):
+            table = self.mountpoints
+        else:
+            # swap, none, biosboot and the like can be used any number of
+            # times.
+            return
+
+        if name in table:
+            self._error(data, _("%(name)s is already defined on line %(lineno)s") %
+                        {"name": name, "lineno": table[name].lineno})
+        else:
+            table[name] = data
+
+    def _build(self):
+        for part in _dataList(self.handler, "partition"):
+            self._define(part.mountpoint, part)
+
+        for raid in _dataList(self.handler, "raid"):
+            self._define(raid.mountpoint, raid)
+
+        for vg in _dataList(self.handler, "volgroup"):
+            if vg.vgname in self.volgroups:
+                self._error(vg, _("Volume group %(name)s is already defined on line %(lineno)s") %
+                            {"name": vg.vgname, "lineno": self.volgroups[vg.vgname].lineno})
+            else:
+                self.volgroups[vg.vgname] = vg
+
+        for lv in _dataList(self.handler, "logvol"):
+            self._define(lv.mountpoint, lv)
+
+            if getattr(lv, "thin_pool", False):
+                self.thinpools[(lv.vgname, lv.name)] = lv
+
+        for btr in _dataList(self.handler, "btrfs"):
+            self._define(btr.mountpoint, btr)
+
+            if btr.subvol:
+                continue
+
+            for name in (btr.label, btr.label and "LABEL=%s" % btr.label, btr.mountpoint):
+                if name and name != "none":
+                    self.btrfs.setdefault(name, btr)
+
+    def _use(self, name, kind, data, description):
+        """Check that the member name used by data, described for error
+           messages by description, is defined with the right kind and not
+           used by anything else.
+        """
+        defined = self.members.get(name)
+
+        if defined is None:
+            if _memberKind(name):
+                self._error(data, _("%(device)s uses %(name)s, which is not defined") %
+                            {"device": description, "name": name})
+            return
+
+        if _memberKind(name) != kind:
+            kinds = {RAID_MEMBER: _("a RAID member"),
+                     PHYSICAL_VOLUME: _("a physical volume"),
+                     BTRFS_MEMBER: _("a BTRFS member")}
+            self._error(data, _("%(device)s uses %(name)s, which is not %(kind)s") %
+                        {"device": description, "name": name, "kind": kinds[kind]})
+            return
+
+        if name in self._usedBy:
+            self._error(data, _("%(device)s uses %(name)s, which is already used on line %(lineno)s") %
+                        {"device": description, "name": name, "lineno": self._usedBy[name].lineno})
+        else:
+            self._usedBy[name] = data
+
+    def _checkRaid(self):
+        for raid in _dataList(self.handler, "raid"):
+            description = _("RAID device %s") % (raid.device or raid.mountpoint)
+
+            for member in raid.members:
+                self._use(member, RAID_MEMBER, raid, description)
+
+    def _checkVolGroups(self):
+        for vg in _dataList(self.handler, "volgroup"):
+            description = _("Volume group %s") % vg.vgname
+
+            for pv in vg.physvols:
+                self._use(pv, PHYSICAL_VOLUME, vg, description)
+
+    def _checkLogVols(self):
+        for lv in _dataList(self.handler, "logvol"):
+            # An existing logical volume can be in a volume group the file
+            # does not mention.
+            if lv.preexist:
+                continue
+
+            if lv.vgname not in self.volgroups:
+                self._error(lv, _("Logical volume %(name)s uses volume group %(vgname)s, which is not defined") %
+                            {"name": lv.name, "vgname": lv.vgname})
+            elif getattr(lv, "thin_volume", False) and (lv.vgname, lv.pool_name) not in self.thinpools:
+                self._error(lv, _("Logical volume %(name)s uses thin pool %(pool)s, which is not defined in volume group %(vgname)s") %
+                            {"name": lv.name, "pool": lv.pool_name, "vgname": lv.vgname})
+
+    def _checkBTRFS(self):
+        for btr in _dataList(self.handler, "btrfs"):
+            if not btr.subvol:
+                description = _("BTRFS volume %s") % (btr.label or btr.mountpoint)
+
+                for device in btr.devices:
+                    self._use(device, BTRFS_MEMBER, btr, description)
+
+                continue
+
+            parent = btr.devices[0] if btr.devices else btr.parent
+            if btr.preexist or not parent or parent.startswith(_deviceSpecs):
+                continue
+
+            if parent not in self.btrfs:
+                self._error(btr, _("BTRFS subvolume %(name)s uses volume %(parent)s, which is not defined") %
+                            {"name": btr.name, "parent": parent})
+
+    def _checkReqPart(self):
+        reqpart = getattr(self.handler, "reqpart", None)
+        if reqpart is None or not reqpart.reqpart or not getattr(reqpart, "addBoot", False):
+            return
+
+        if "/boot" in self.mountpoints:
+            self._error(self.mountpoints["/boot"],
+                        _("/boot is already created by reqpart --add-boot on line %s") % reqpart.lineno)
+
+    def check(self):
+        """Run every check, and return a list of KickstartParseErrors for the
+           problems found, in line number order.
+        """
+        self._errors = list(self._buildErrors)
+        self._usedBy = {}
+
+        self._checkRaid()
+        self._checkVolGroups()
+        self._checkLogVols()
+        self._checkBTRFS()
+        self._checkReqPart()
+
+        return [err for (lineno, err) in sorted(self._errors, key=lambda e: e[0])]
+
+def checkStorage(handler):
+    """Check that the part, raid, volgroup, logvol, btrfs and reqpart
+       commands of a handler that has already been used to parse a file
+       refer to each other correctly.  Returns a list of KickstartParseErrors,
+       which is empty if nothing is wrong.
+    """
+    return StorageGraph(handler).check()
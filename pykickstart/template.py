@@ -0,0 +1,281 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Rendering many variants of one kickstart file quickly.
+
+A template is made from a handler that has already been used to parse a file,
+with a few attributes of its commands and data objects marked as slots.  All
+the output that does not depend on a slot is rendered once, so rendering a
+variant is mostly a matter of joining strings.
+
+This module exports a single class:
+
+    KickstartTemplate - A handler compiled into fixed pieces of output and
+                        slots to be filled in for each variant.
+"""
+import re
+import six
+
+from pykickstart.diff import keyFunction
+from pykickstart.errors import KickstartError
+
+from pykickstart.i18n import _
+
+# Values that can be put straight into the compiled output.  Anything else
+# (empty values, booleans, lists, values with spaces, quotes or comments in
+# them) may change more of a command's output than the value itself, so the
+# command is rendered again instead.
+_plainValue = re.compile(r"^[^\s\"'\\#]+$")
+_plainTypes = six.string_types + six.integer_types + (float,)
+
+class _Unit(object):
+    """One command whose output depends on slots.  Instance attributes:
+
+       cmd      -- The KickstartCommand.
+       name     -- The name cmd is given by in the handler's commands dict.
+       slots    -- A list of the (name, obj, attr, index) of each slot in cmd,
+                   where index is the position of obj in cmd's list of data
+                   objects, or None if obj is cmd itself.
+       format   -- The output of cmd as a format string with a %s for each
+                   slot, or None if the output of cmd can not be compiled and
+                   must always be rendered.
+       order    -- A list of the names of the slots in the order their %s
+                   appear in format.
+       defaults -- A list of (name, default) tuples giving the value each
+                   slot has in a fresh instance of its object.
+    """
+    def __init__(self, cmd, name):
+        self.cmd = cmd
+        self.name = name
+        self.slots = []
+        self.format = None
+        self.order = []
+        self.defaults = []
+
+class KickstartTemplate(object):
+    """A handler compiled into the output of str(handler) with holes in it
+       for a set of slots.  Rendering a variant gives exactly what
+       str(handler) would give after setting each slot attribute to the value
+       given for it.  The handler itself is never changed: a variant that can
+       not be joined from compiled pieces is rendered in a clone of it, so
+       like any cloned handler, it must only be changed through edit
+       afterwards.
+
+       A slot is given as a tuple of (command, attribute) for a command that
+       is given once, such as ("rootpw", "password"), or as (command, key,
+       attribute) for one data object of a command that can be given more
+       than once, such as ("part", "/", "size") or ("network", "eth0", "ip").
+       key is either the position of the data object in the command's list
+       or the name ksdiff would show for it: the mount point, the device, the
+       volume group and name joined by a slash and so on.
+
+       Instance attributes:
+
+       handler -- The handler the template was made from.
+       slots   -- A dict mapping each slot name to a tuple of the object and
+                  attribute it fills in.
+       values  -- A dict mapping each slot name to the value it had in the
+                  handler, which is used when a variant gives no value.
+    """
+    def __init__(self, handler, slots):
+        self.handler = handler
+        self.slots = {}
+        self.values = {}
+
+        self._pieces = []
+
+        units = {}
+        for (name, spec) in slots.items():
+            (cmd, obj, attr) = self._findSlot(spec)
+            self.slots[name] = (obj, attr)
+            self.values[name] = getattr(obj, attr)
+
+            if id(cmd) not in units:
+                units[id(cmd)] = _Unit(cmd, spec[0])
+
+            if obj is cmd:
+                index = None
+            else:
+                index = [i for (i, data) in enumerate(cmd.dataList()) if data is obj][0]
+
+            units[id(cmd)].slots.append((name, obj, attr, index))
+
+        for unit in units.values():
+            self._compileUnit(unit)
+
+        self._compile(units)
+
+    def _findSlot(self, spec):
+        if len(spec) == 2:
+            (name, attr) = spec
+            key = None
+        elif len(spec) == 3:
+            (name, key, attr) = spec
+        else:
+            raise KickstartError(_("A slot must be given as (command, attribute) or (command, key, attribute), not %s") % (spec,))
+
+        cmd = self.handler.commands.get(name)
+        if cmd is None:
+            raise KickstartError(_("Unknown command %s") % name)
+
+        if len(spec) == 2:
+            obj = cmd
+        else:
+            obj = self._findData(name, cmd, key)
+
+        if not hasattr(obj, attr):
+            raise KickstartError(_("%(command)s has no attribute %(attr)s") % {"command": name, "attr": attr})
+
+        return (cmd, obj, attr)
+
+    def _findData(self, name, cmd, key):
+        lst = cmd.dataList()
+        if lst is None:
+            raise KickstartError(_("The %s command can only be given once, so a slot in it can not have a key") % name)
+
+        if isinstance(key, six.integer_types) and not isinstance(key, bool):
+            if 0 <= key < len(lst):
+                return lst[key]
+        else:
+            # Aliases such as partition share the command object of part,
+            # so look keys up by the name ksdiff uses.
+            names = [n for (n, c) in self.handler.commands.items() if c is cmd]
+            (getKey, show) = keyFunction(min(names))
+
+            matches = [data for data in lst if show(getKey(data)) == (key or "")]
+            if len(matches) == 1:
+                return matches[0]
+            elif len(matches) > 1:
+                raise KickstartError(_("More than one %(command)s is named %(key)s") % {"command": name, "key": key})
+
+        raise KickstartError(_("No %(command)s is named %(key)s") % {"command": name, "key": key})
+
+    def _render(self, unit, values):
+        """Render the command of unit with its slots set to values, in a
+           clone of the handler so the handler itself is left as it is.
+        """
+        handler = self.handler.clone()
+        cmd = handler.edit(unit.name)
+
+        for (name, _obj, attr, index) in unit.slots:
+            obj = cmd if index is None else cmd.dataList()[index]
+            setattr(obj, attr, values[name])
+
+        return handler._objStr(cmd)
+
+    def _compileUnit(self, unit):
+        """Work out the fixed pieces of the output of one command by
+           rendering it with a marker in each slot.  A command whose output
+           does not show every marker exactly once as given, or that can not
+           be rendered with markers at all, is left to be rendered every time.
+        """
+        for (name, obj, attr, _index) in unit.slots:
+            try:
+                unit.defaults.append((name, getattr(obj.__class__(), attr, None)))
+            except Exception:       # pylint: disable=broad-except
+                unit.defaults.append((name, None))
+
+        markers = dict((name, u"\x00%d\x00" % i) for (i, (name, _obj, _attr, _index)) in enumerate(unit.slots))
+
+        try:
+            text = self._render(unit, markers)
+        except Exception:           # pylint: disable=broad-except
+            return
+
+        if any(text.count(marker) != 1 for marker in markers.values()):
+            return
+
+        names = dict((marker, name) for (name, marker) in markers.items())
+        split = re.split("(%s)" % "|".join(re.escape(m) for m in names.keys()), text)
+
+        unit.format = "".join("%s" if p in names else p.replace("%", "%%") for p in split)
+        unit.order = [names[p] for p in split if p in names]
+
+        # Check that the format gives what the command gives for the values
+        # it really has.
+        if self._isPlain(unit, self.values) and self._format(unit, self.values) != self.handler._objStr(unit.cmd):
+            unit.format = None
+
+    def _isPlain(self, unit, values):
+        """Can the values of the slots in unit go straight into its format?"""
+        if unit.format is None:
+            return False
+
+        for (name, default) in unit.defaults:
+            value = values[name]
+
+            if not value or value == default or isinstance(value, bool) or \
+               not isinstance(value, _plainTypes) or not _plainValue.match(six.text_type(value)):
+                return False
+
+        return True
+
+    def _format(self, unit, values):
+        return unit.format % tuple(values[name] for name in unit.order)
+
+    def _compile(self, units):
+        """Split the output of the handler into fixed strings and the units
+           that depend on slots, in the order BaseHandler.__str__ writes them.
+        """
+        handler = self.handler
+        fixed = []
+
+        def _strFunc(obj):
+            return units.get(id(obj)) or handler._objStr(obj)
+
+        for part in handler._strParts(_strFunc):
+            if isinstance(part, _Unit):
+                if fixed:
+                    self._pieces.append("".join(fixed))
+                    fixed = []
+
+                self._pieces.append(part)
+            else:
+                fixed.append(part)
+
+        if fixed:
+            self._pieces.append("".join(fixed))
+
+        if self.render() != str(handler):
+            raise KickstartError(_("The output of this handler can not be compiled into a template"))
+
+    def render(self, values=None):
+        """Return the output str(handler) would give with each slot named in
+           the dict values set to the value given for it.  Slots not given
+           keep the value they had in the handler.
+        """
+        if values:
+            unknown = [name for name in values if name not in self.slots]
+            if unknown:
+                raise KickstartError(_("Unknown slots: %s") % ", ".join(sorted(unknown)))
+
+            merged = dict(self.values)
+            merged.update(values)
+        else:
+            merged = self.values
+
+        retval = []
+        for piece in self._pieces:
+            if not isinstance(piece, _Unit):
+                retval.append(piece)
+            elif self._isPlain(piece, merged):
+                retval.append(self._format(piece, merged))
+            else:
+                retval.append(self._render(piece, merged))
+
+        return "".join(retval)
@@ -41,6 +41,9 @@ This module also exports several functions:
 
     versionToLongString - Perform the reverse mapping but use long names.
 
+    versionRanges - Describe a set of versions as runs of consecutive
+                    releases.
+
     versionFromFile - Read a kickstart file and determine the version of
                       syntax it uses.  This requires the kickstart file to
                       have a version= comment in it.
@@ -177,6 +180,33 @@ def versionFromFile(f):
 
     return v
 
+def versionRanges(versions):
+    """Given a list of version numbers, return a list of strings describing
+       them as runs of consecutive releases, with Fedora and RHEL releases
+       kept apart, like ["F24-F27", "RHEL7"].
+    """
+    allVersions = sorted(set(versionMap.values()))
+    retval = []
+
+    for family in (False, True):
+        releases = [v for v in allVersions
+                    if versionToString(v, skipDevel=True).startswith("RHEL") == family]
+        run = []
+
+        for v in releases + [None]:
+            if v in versions:
+                run.append(v)
+                continue
+
+            if len(run) == 1:
+                retval.append(versionToString(run[0], skipDevel=True))
+            elif run:
+                retval.append("%s-%s" % (versionToString(run[0], skipDevel=True),
+                                         versionToString(run[-1], skipDevel=True)))
+            run = []
+
+    return retval
+
 def returnClassForVersion(version=DEVEL):
     """Return the class of the syntax handler for version.  version can be
        either a string or the matching constant.  Raises KickstartVersionError
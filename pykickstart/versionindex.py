@@ -0,0 +1,523 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+An index of which versions of kickstart syntax each command, section and
+option is valid in.
+
+This module exports three classes:
+
+    VersionIndex - For every command and section, and every option of them,
+                   the versions it can be used in without an error and the
+                   versions it is deprecated in.
+
+    VersionInference - The versions a kickstart file can declare, as worked
+                       out by inferVersions.
+
+    VersionDiff - What changed in the syntax between two versions, as worked
+                  out by diffVersions.
+
+And it exports several functions:
+
+    actionStatus - Return whether an option is valid or deprecated in a
+                   version, or None if using it is an error.
+
+    buildIndex - Build a new VersionIndex from the handlers, commands and
+                 sections of every version.
+
+    cachedIndex - Return a VersionIndex read from a file, building and
+                  saving a new one if the file is missing or out of date.
+
+    diffVersions - Work out what changed between two versions from an index.
+
+    dumpIndex - Write a VersionIndex to a file.
+
+    getIndex - Return a VersionIndex, building it the first time it is
+               needed.
+
+    loadIndex - Read a VersionIndex written by dumpIndex.
+
+    inferVersions - Work out which versions a kickstart file can declare
+                    by looking at the commands, sections and options it uses.
+
+    inferFileVersions - The same, for a file or URL.
+"""
+import hashlib
+import json
+import os
+import re
+import shlex
+import tempfile
+
+from pykickstart.base import DeprecatedCommand
+from pykickstart.errors import KickstartError
+from pykickstart.handlers.control import commandMap
+from pykickstart.load import load_to_str
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion, versionMap, versionToString
+
+from pykickstart.i18n import _
+
+# The status of a command, section or option in a single version.  Anything
+# not in the index for a version is not valid in that version at all.
+VALID = "valid"
+DEPRECATED = "deprecated"
+
+_negativeNumber = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+def actionStatus(action, version):
+    """Return the status of an option handled by action for a parser using
+       the given version, using the same rules as KSOptionParser, or None if
+       using the option is an error.
+    """
+    if action.introduced and action.introduced > version:
+        return None
+    elif action.removed and action.removed <= version:
+        return None
+    elif action.deprecated is True or (version and type(action.deprecated) == int and version >= action.deprecated):
+        return DEPRECATED
+    else:
+        return VALID
+
+class VersionIndex(object):
+    """For every command and section name, the versions it can be used in,
+       and for every option of them, the versions that option can be used in.
+       Instance attributes:
+
+       versions -- A sorted list of all the version numbers in the index.
+       names    -- A dict mapping command and section names to a dict of
+                   version number to VALID or DEPRECATED.
+       options  -- A dict mapping (name, option string) tuples to a dict of
+                   version number to VALID or DEPRECATED.
+    """
+    def __init__(self):
+        self.versions = []
+        self.names = {}
+        self.options = {}
+
+    def _add(self, table, key, version, status):
+        if status is not None:
+            table.setdefault(key, {})[version] = status
+
+    def isSection(self, name):
+        """Is name a section tag rather than a command?"""
+        return name.startswith("%")
+
+    def nameVersions(self, name, allowDeprecated=False):
+        """Return the set of versions the command or section name can be used
+           in.  Versions it is deprecated in are only included if
+           allowDeprecated is True.
+        """
+        return self._versions(self.names.get(name, {}), allowDeprecated)
+
+    def optionVersions(self, name, option, allowDeprecated=False):
+        """Return the set of versions the option of the command or section
+           name can be used in.
+        """
+        return self._versions(self.options.get((name, option), {}), allowDeprecated)
+
+    def versionRange(self, name, option=None, allowDeprecated=False):
+        """Return a (minimum, maximum) tuple of the versions the command or
+           section name, or the given option of it, can be used in.  Both are
+           None if it cannot be used in any version.
+        """
+        if option is None:
+            versions = self.nameVersions(name, allowDeprecated)
+        else:
+            versions = self.optionVersions(name, option, allowDeprecated)
+
+        if not versions:
+            return (None, None)
+
+        return (min(versions), max(versions))
+
+    def findOption(self, name, arg):
+        """Return the option string of the command or section name that arg
+           would be matched to, allowing for "--opt=value" and abbreviations,
+           or None if arg does not look like one of its options.
+        """
+        option = arg.split("=", 1)[0]
+        if (name, option) in self.options:
+            return option
+
+        candidates = [o for (n, o) in self.options if n == name and o.startswith(option)]
+        if len(candidates) == 1:
+            return candidates[0]
+
+        return None
+
+    def _versions(self, statuses, allowDeprecated):
+        return set(v for (v, status) in statuses.items()
+                   if status == VALID or allowDeprecated)
+
+def buildIndex():
+    """Build a VersionIndex from the command classes of every version in
+       pykickstart.handlers.control.commandMap and the sections registered
+       by a KickstartParser for every version.
+    """
+    index = VersionIndex()
+    index.versions = sorted(set(versionMap.values()))
+
+    # Many versions share the same command class, so only look at each one
+    # once.
+    classOptions = {}
+
+    for version in index.versions:
+        for (name, cmdClass) in commandMap[version].items():
+            if issubclass(cmdClass, DeprecatedCommand):
+                index._add(index.names, name, version, DEPRECATED)
+                continue
+
+            index._add(index.names, name, version, VALID)
+
+            if cmdClass not in classOptions:
+                cmd = cmdClass()
+                op = getattr(cmd, "op", None) or cmd._getParser()
+                classOptions[cmdClass] = [(option, actionStatus(action, op.version))
+                                          for (option, action) in op._option_string_actions.items()]
+
+            for (option, status) in classOptions[cmdClass]:
+                index._add(index.options, (name, option), version, status)
+
+        # Section headers are checked against the version of the handler.
+        ksparser = KickstartParser(makeVersion(version))
+        for (name, section) in ksparser._sections.items():
+            index._add(index.names, name, version, VALID)
+
+            if not hasattr(section, "_getParser"):
+                continue
+
+            op = section._getParser()
+            for (option, action) in op._option_string_actions.items():
+                index._add(index.options, (name, option), version,
+                           actionStatus(action, version))
+
+    return index
+
+# How dumpIndex writes the status of something in each version, one character
+# per version.
+_statusChars = {None: "-", VALID: "v", DEPRECATED: "d"}
+_charStatuses = {"v": VALID, "d": DEPRECATED}
+
+_FORMAT = 1
+
+def _sourceDigest():
+    """Return a digest of the names, sizes and modification times of the
+       files pykickstart is made of, which changes whenever a command or
+       section could have.
+    """
+    top = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha256()
+
+    for (dirpath, dirnames, filenames) in os.walk(top):
+        dirnames.sort()
+
+        for name in sorted(filenames):
+            if not name.endswith(".py"):
+                continue
+
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            h.update(("%s %d %d\n" % (os.path.relpath(path, top), st.st_size, int(st.st_mtime))).encode("utf-8"))
+
+    return h.hexdigest()
+
+def _encodeStatuses(statuses, versions):
+    return "".join(_statusChars[statuses.get(v)] for v in versions)
+
+def _decodeStatuses(s, versions):
+    return dict((v, _charStatuses[c]) for (v, c) in zip(versions, s) if c in _charStatuses)
+
+def dumpIndex(index, f, source=None):
+    """Write the VersionIndex index to the open file f as JSON.  Each
+       command, section and option is stored as a string with one character
+       for each version, so the whole index takes a few tens of kilobytes.
+       source is a digest of the code the index was built from, which
+       cachedIndex uses to tell if it is out of date.
+    """
+    options = {}
+    for ((name, option), statuses) in index.options.items():
+        options.setdefault(name, {})[option] = _encodeStatuses(statuses, index.versions)
+
+    data = {"format": _FORMAT,
+            "source": source,
+            "versions": index.versions,
+            "names": dict((name, _encodeStatuses(statuses, index.versions))
+                          for (name, statuses) in index.names.items()),
+            "options": options}
+
+    json.dump(data, f, sort_keys=True, separators=(",", ":"))
+
+def _load(f):
+    try:
+        data = json.load(f)
+    except ValueError as e:
+        raise KickstartError(_("Invalid version index: %s") % e)
+
+    if not isinstance(data, dict) or data.get("format") != _FORMAT:
+        raise KickstartError(_("Invalid version index: unknown format"))
+
+    index = VersionIndex()
+    index.versions = data["versions"]
+
+    for (name, s) in data["names"].items():
+        index.names[name] = _decodeStatuses(s, index.versions)
+
+    for (name, options) in data["options"].items():
+        for (option, s) in options.items():
+            index.options[(name, option)] = _decodeStatuses(s, index.versions)
+
+    return (index, data.get("source"))
+
+def loadIndex(f):
+    """Read a VersionIndex written by dumpIndex from the open file f.
+       Raises KickstartError if f does not hold one.
+    """
+    return _load(f)[0]
+
+def _defaultCachePath():
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "pykickstart", "versionindex.json")
+
+def cachedIndex(path=None):
+    """Return the VersionIndex saved in the file path, which defaults to
+       pykickstart/versionindex.json in the user's cache directory.  If the
+       file is missing, can't be read or was written by different code, a
+       new index is built and saved there, if possible, for next time.
+    """
+    path = path or _defaultCachePath()
+    source = _sourceDigest()
+
+    try:
+        with open(path) as f:
+            (index, saved) = _load(f)
+
+        if saved == source:
+            return index
+    except (IOError, OSError, KickstartError, KeyError, TypeError):
+        pass
+
+    index = buildIndex()
+
+    # Write a new file and move it into place, so a reader never sees half
+    # of one.
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        (handle, tmp) = tempfile.mkstemp(dir=directory, prefix=".versionindex-")
+        try:
+            with os.fdopen(handle, "w") as f:
+                dumpIndex(index, f, source=source)
+
+            os.rename(tmp, path)
+        except (IOError, OSError):
+            os.unlink(tmp)
+            raise
+    except (IOError, OSError):
+        pass
+
+    return index
+
+class VersionDiff(object):
+    """What changed in the syntax between two versions.  Instance attributes:
+
+       fromVersion -- The version the changes are from.
+       toVersion   -- The version the changes are to.
+       added       -- A sorted list of the commands and sections in
+                      toVersion and not fromVersion.
+       removed     -- A sorted list of the commands and sections in
+                      fromVersion and not toVersion.
+       deprecated  -- A sorted list of the commands in both that are
+                      deprecated in toVersion and were not in fromVersion.
+       options     -- A dict mapping the commands and sections in both whose
+                      options changed to a tuple of the sorted lists of
+                      options added, deprecated and removed.
+    """
+    def __init__(self, fromVersion, toVersion):
+        self.fromVersion = fromVersion
+        self.toVersion = toVersion
+        self.added = []
+        self.removed = []
+        self.deprecated = []
+        self.options = {}
+
+def diffVersions(fromVersion, toVersion, index=None):
+    """Return a VersionDiff of the changes between the versions fromVersion
+       and toVersion, as found in index or the index given by getIndex.
+       Nothing is parsed and no handlers are made, so this is quick.
+    """
+    if index is None:
+        index = getIndex()
+
+    diff = VersionDiff(fromVersion, toVersion)
+
+    fromNames = set(n for (n, statuses) in index.names.items() if fromVersion in statuses)
+    toNames = set(n for (n, statuses) in index.names.items() if toVersion in statuses)
+
+    diff.added = sorted(toNames - fromNames)
+    diff.removed = sorted(fromNames - toNames)
+    diff.deprecated = sorted(n for n in fromNames & toNames
+                             if index.names[n][toVersion] == DEPRECATED and index.names[n][fromVersion] != DEPRECATED)
+
+    fromOptions = {}
+    toOptions = {}
+    for ((name, option), statuses) in index.options.items():
+        if fromVersion in statuses:
+            fromOptions.setdefault(name, {})[option] = statuses[fromVersion]
+        if toVersion in statuses:
+            toOptions.setdefault(name, {})[option] = statuses[toVersion]
+
+    for name in fromNames & toNames:
+        old = fromOptions.get(name, {})
+        new = toOptions.get(name, {})
+
+        added = sorted(set(new) - set(old))
+        removed = sorted(set(old) - set(new))
+        deprecated = sorted(o for o in set(old) & set(new)
+                            if new[o] == DEPRECATED and old[o] != DEPRECATED)
+
+        if added or deprecated or removed:
+            diff.options[name] = (added, deprecated, removed)
+
+    return diff
+
+_index = None
+
+def getIndex():
+    """Return the VersionIndex for this copy of pykickstart, building it the
+       first time it is needed.
+    """
+    global _index
+
+    if _index is None:
+        _index = buildIndex()
+
+    return _index
+
+class VersionInference(object):
+    """The versions a kickstart file can declare.  Instance attributes:
+
+       versions -- A sorted list of the version numbers the file can declare.
+       minimum  -- The lowest of those versions, or None.
+       maximum  -- The highest of those versions, or None.
+       limits   -- A list of (lineno, description, versions) tuples, one for
+                   each command, section and option the file uses that can
+                   not be used in every version.
+    """
+    def __init__(self, versions, limits):
+        self.versions = sorted(versions)
+        self.minimum = self.versions[0] if self.versions else None
+        self.maximum = self.versions[-1] if self.versions else None
+        self.limits = limits
+
+    def __str__(self):
+        if not self.versions:
+            return _("No version of kickstart syntax supports this file.")
+
+        return _("Minimum version: %(minimum)s\nMaximum version: %(maximum)s") % \
+               {"minimum": versionToString(self.minimum, skipDevel=True),
+                "maximum": versionToString(self.maximum, skipDevel=True)}
+
+def _uses(lines, index):
+    """Yield a (lineno, name, option) tuple for every command and section
+       name used in the given lines and every option given to them.  option
+       is None for the name itself.
+    """
+    inSection = None
+    lineno = 0
+
+    for line in lines:
+        lineno += 1
+
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+
+        if inSection is not None:
+            first = stripped.split()[0]
+            if first == "%end":
+                inSection = None
+                continue
+            elif first not in index.names or not index.isSection(first):
+                continue
+
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError:
+            continue
+
+        if not args or args[0] in ("%include", "%ksappend", "%end"):
+            continue
+
+        name = args[0]
+        if index.isSection(name):
+            inSection = name
+
+        yield (lineno, name, None)
+
+        for arg in args[1:]:
+            if not arg.startswith("-") or arg == "-" or _negativeNumber.match(arg):
+                continue
+
+            # Some commands take their arguments as they are, without an
+            # option parser, so something that is not an option of this
+            # command in any version says nothing about the version.
+            option = index.findOption(name, arg)
+            if option is not None:
+                yield (lineno, name, option)
+
+def inferVersions(s, allowDeprecated=False, index=None):
+    """Work out which versions of kickstart syntax the kickstart file given
+       as the string s can declare, going by which commands, sections and
+       options it uses.  The file is read once, and option values are not
+       checked, nor are options no version knows about.  Commands, sections
+       and options that are deprecated in a version only count as valid
+       there if allowDeprecated is True.  Returns a VersionInference.
+    """
+    if index is None:
+        index = getIndex()
+
+    versions = set(index.versions)
+    limits = []
+    seen = set()
+
+    for (lineno, name, option) in _uses(s.splitlines(), index):
+        key = (name, option)
+        if key in seen:
+            continue
+
+        seen.add(key)
+
+        if option is None:
+            valid = index.nameVersions(name, allowDeprecated)
+            description = name
+        else:
+            valid = index.optionVersions(name, option, allowDeprecated)
+            description = "%s %s" % (name, option)
+
+        if len(valid) < len(index.versions):
+            limits.append((lineno, description, valid))
+
+        versions &= valid
+
+    return VersionInference(versions, limits)
+
+def inferFileVersions(f, allowDeprecated=False, index=None):
+    """Like inferVersions, but for the kickstart file or URL given by f."""
+    return inferVersions(load_to_str(f), allowDeprecated=allowDeprecated, index=index)
@@ -0,0 +1,192 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Watching a directory of kickstart files for changes.
+
+This module exports a single class:
+
+    KickstartWatcher - Keeps track of the kickstart files in a directory and
+                       the files they include, and works out which top level
+                       files need to be looked at again when any of them
+                       change.
+"""
+import fnmatch
+import os
+import time
+
+from pykickstart.errors import KickstartError
+from pykickstart.includes import IncludeGraph, IncludeResolver, findIncludes
+from pykickstart.load import _is_url, load_to_str
+
+# The names of the files in a directory that are taken to be kickstart files.
+DEFAULT_PATTERNS = ["*.ks", "*.cfg"]
+
+class KickstartWatcher(object):
+    """Watch the kickstart files in a directory by polling them with stat.
+
+       Every file in the directory matching one of the patterns is watched,
+       along with every file they include, wherever it lives.  A file that is
+       not included by any other watched file is a top level file.  The
+       reverse include index kept in graph means a change to a shared
+       fragment only leads to the top level files that end up including it
+       being looked at again.  Instance attributes:
+
+       directory -- The absolute path of the directory being watched.
+       graph     -- The IncludeGraph of every watched file.
+       patterns  -- A list of fnmatch patterns for the files to watch.
+       results   -- A dict mapping every top level file to the last value
+                    returned for it by validate.
+       validate  -- A function taking the location of a top level file and
+                    returning whatever result should be kept for it.
+    """
+    def __init__(self, directory, validate, patterns=None):
+        self.directory = os.path.abspath(directory)
+        self.validate = validate
+        self.patterns = patterns or DEFAULT_PATTERNS
+        self.graph = IncludeGraph()
+        self.results = {}
+        self._scanned = set()
+        self._stats = {}
+
+    def _scanDirectory(self):
+        retval = set()
+
+        for (dirpath, dirnames, filenames) in os.walk(self.directory):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+
+            for filename in filenames:
+                if any(fnmatch.fnmatch(filename, pattern) for pattern in self.patterns):
+                    retval.add(os.path.join(dirpath, filename))
+
+        return retval
+
+    def _stat(self, location):
+        if _is_url(location):
+            return None
+
+        try:
+            st = os.stat(location)
+        except OSError:
+            return None
+
+        return (getattr(st, "st_mtime_ns", st.st_mtime), st.st_size, st.st_ino)
+
+    def _readIncludes(self, location, resolver):
+        try:
+            contents = load_to_str(location)
+        except KickstartError:
+            return []
+
+        basedir = None if _is_url(location) else os.path.dirname(location)
+        retval = []
+
+        # The parser follows %include lines in script sections too, so they
+        # are part of the graph.
+        for name in findIncludes(contents):
+            child = resolver.resolve(name, basedir)
+
+            # Watch for a missing file to turn up next to the file including
+            # it, and name every file by its absolute path like the files
+            # found in the directory.
+            if not _is_url(child) and not os.path.exists(child):
+                child = os.path.join(basedir, name)
+
+            retval.append(resolver.key(child))
+
+        return retval
+
+    def topLevel(self):
+        """Return a sorted list of the top level files being watched."""
+        return sorted(f for f in self._scanned if not self.graph.includedBy(f))
+
+    def poll(self):
+        """Look for files that have been added, changed or removed since the
+           last poll, and run validate on the top level files affected by
+           them.  The first poll validates every top level file.  Returns a
+           dict mapping the top level files that were validated to their new
+           results.
+        """
+        # Names are resolved again on every poll, as the file a name refers
+        # to can change when files come and go.
+        resolver = IncludeResolver()
+
+        self._scanned = self._scanDirectory()
+        oldTopLevel = set(self.results.keys())
+
+        queue = list(self._scanned | set(self.graph.files) | set(self._stats.keys()))
+        changed = set()
+
+        while queue:
+            location = queue.pop()
+            if location in changed:
+                continue
+
+            st = self._stat(location)
+            if location in self._stats and self._stats[location] == st:
+                continue
+
+            self._stats[location] = st
+            changed.add(location)
+
+            # A file that has gone away includes nothing, and is forgotten
+            # unless something still includes it.
+            if st is None:
+                self.graph.setIncludes(location, [])
+                if location not in self._scanned:
+                    self.graph.removeFile(location)
+                    if location not in self.graph.files:
+                        del self._stats[location]
+                continue
+
+            children = self._readIncludes(location, resolver)
+            self.graph.setIncludes(location, children)
+            queue.extend(c for c in children if c not in self._stats)
+
+        affected = set(changed)
+        for location in changed:
+            affected.update(self.graph.ancestors(location))
+
+        topLevel = set(self.topLevel())
+
+        for location in oldTopLevel - topLevel:
+            del self.results[location]
+
+        retval = {}
+        for location in sorted(topLevel):
+            if location in affected or location not in oldTopLevel:
+                retval[location] = self.validate(location)
+                self.results[location] = retval[location]
+
+        return retval
+
+    def watch(self, callback, interval=1.0, iterations=None):
+        """Poll every interval seconds, calling callback with the dict of new
+           results whenever a poll validated anything.  Runs forever unless
+           iterations is given.
+        """
+        count = 0
+
+        while iterations is None or count < iterations:
+            if count:
+                time.sleep(interval)
+
+            results = self.poll()
+            if results:
+                callback(results)
+
+            count += 1
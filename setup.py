@@ -23,8 +23,11 @@ setup(cmdclass={"install_scripts": install_scripts},
       description='Python module for manipulating kickstart files',
       author='Chris Lumens', author_email='clumens@redhat.com',
       url='http://fedoraproject.org/wiki/pykickstart',
-      scripts=['tools/ksvalidator.py', 'tools/ksflatten.py', 'tools/ksverdiff.py', 'tools/ksshell.py'],
+      scripts=['tools/ksvalidator.py', 'tools/ksflatten.py', 'tools/ksverdiff.py', 'tools/ksshell.py',
+               'tools/ksinfer.py', 'tools/ksfingerprint.py', 'tools/ksdiff.py',
+               'tools/ksvalidatord.py', 'tools/ksstats.py'],
       packages=['pykickstart', 'pykickstart.commands', 'pykickstart.handlers'],
       data_files=[('share/man/man1', ['docs/ksvalidator.1', 'docs/ksflatten.1', 'docs/ksverdiff.1',
-                                      'docs/ksshell.1'])],
+                                      'docs/ksshell.1', 'docs/ksinfer.1', 'docs/ksfingerprint.1',
+                                      'docs/ksdiff.1', 'docs/ksvalidatord.1', 'docs/ksstats.1'])],
       classifiers=["Programming Language :: Python :: 3"])
@@ -0,0 +1,278 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+from pykickstart import aio
+from pykickstart.errors import KickstartError, KickstartFetchCountError, KickstartIncludeDepthError, \
+    KickstartSizeError, KickstartTimeoutError
+from pykickstart.limits import Limits
+from pykickstart.parser import KickstartParser
+from pykickstart.version import F27, makeVersion
+
+class Server(object):
+    """A tiny HTTP server on the event loop, serving the dict files.  A path
+       starting with /chunked/ is sent chunked, one starting with /nolength/
+       is sent without a length, one starting with /redirect/ is redirected
+       to the rest of the path and anything not in files is a 404.  The most
+       connections open at once is kept in peak.
+    """
+    def __init__(self, loop, files, delay=0):
+        self.loop = loop
+        self.files = files
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.requests = []
+        self.server = loop.run_until_complete(asyncio.start_server(self.handle, "127.0.0.1", 0))
+        self.url = "http://127.0.0.1:%d" % self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader, writer):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+        try:
+            path = (await reader.readline()).split()[1].decode("ascii")
+            while (await reader.readline()).strip():
+                pass
+
+            self.requests.append(path)
+
+            if self.delay:
+                await asyncio.sleep(self.delay)
+
+            if path.startswith("/redirect/"):
+                writer.write(("HTTP/1.1 302 Found\r\nLocation: /%s\r\nContent-Length: 0\r\n\r\n" % path[10:]).encode("ascii"))
+            elif path.startswith("/chunked/") and path[8:] in self.files:
+                body = self.files[path[8:]].encode("utf-8")
+                writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n")
+                for i in range(0, len(body), 7):
+                    chunk = body[i:i+7]
+                    writer.write(("%x\r\n" % len(chunk)).encode("ascii") + chunk + b"\r\n")
+                writer.write(b"0\r\n\r\n")
+            elif path.startswith("/nolength/") and path[9:] in self.files:
+                writer.write(b"HTTP/1.1 200 OK\r\n\r\n" + self.files[path[9:]].encode("utf-8"))
+            elif path in self.files:
+                body = self.files[path].encode("utf-8")
+                writer.write(("HTTP/1.1 200 OK\r\nContent-Type: text/plain; charset=utf-8\r\nContent-Length: %d\r\n\r\n" % len(body)).encode("ascii") + body)
+            else:
+                writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+
+            await writer.drain()
+        finally:
+            writer.close()
+            self.active -= 1
+
+    def close(self):
+        self.server.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+
+class Base_Aio(unittest.TestCase):
+    files = {}
+    delay = 0
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.server = Server(self.loop, self.files, self.delay)
+
+    def tearDown(self):
+        self.server.close()
+        self.loop.close()
+
+    def run_(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def parser(self, **kwargs):
+        return KickstartParser(makeVersion(F27), **kwargs)
+
+class Load_TestCase(Base_Aio):
+    files = {"/ks.cfg": "text\nrootpw --plaintext über\n"}
+
+    def runTest(self):
+        fetcher = aio.HTTPFetcher()
+        url = self.server.url + "/ks.cfg"
+
+        self.assertEqual(self.run_(aio.load_to_str(url, fetcher)), self.files["/ks.cfg"])
+        self.assertEqual(self.run_(aio.load_to_str(self.server.url + "/chunked/ks.cfg", fetcher)), self.files["/ks.cfg"])
+        self.assertEqual(self.run_(aio.load_to_str(self.server.url + "/redirect/ks.cfg", fetcher)), self.files["/ks.cfg"])
+
+        with self.assertRaises(KickstartError) as cm:
+            self.run_(aio.load_to_str(self.server.url + "/missing.cfg", fetcher))
+        self.assertIn("404", str(cm.exception))
+
+        self.assertRaises(KickstartError, self.run_, aio.load_to_str("http://127.0.0.1:1/ks.cfg", fetcher))
+        self.assertRaises(TypeError, self.run_, aio.Fetcher().fetch(url))
+
+        # Local files don't need the network.
+        (handle, path) = tempfile.mkstemp(prefix="ks-aio-", text=True)
+        os.write(handle, b"text\n")
+        os.close(handle)
+        try:
+            self.assertEqual(self.run_(aio.load_to_str(path)), "text\n")
+        finally:
+            os.unlink(path)
+
+class Read_TestCase(Base_Aio):
+    files = {"/ks.cfg": "%include {url}/part.cfg\nrootpw --plaintext secret\n",
+             "/part.cfg": "part / --size=1000\n%include {url}/chunked/swap.cfg\n",
+             "/swap.cfg": "part swap --size=500\n"}
+
+    def runTest(self):
+        for (path, contents) in self.files.items():
+            self.files[path] = contents.replace("{url}", self.server.url)
+
+        parser = self.parser()
+        self.run_(parser.readKickstartAsync(self.server.url + "/ks.cfg"))
+
+        self.assertEqual([p.mountpoint for p in parser.handler.partition.partitions], ["/", "swap"])
+        self.assertEqual(parser.handler.rootpw.password, "secret")
+
+        # Parsing never went back to the network for the includes.
+        self.assertEqual(sorted(self.server.requests), ["/chunked/swap.cfg", "/ks.cfg", "/part.cfg"])
+
+class Missing_Include_TestCase(Base_Aio):
+    files = {"/ks.cfg": "%include /nothere.cfg\nrootpw --plaintext secret\n"}
+
+    def runTest(self):
+        parser = self.parser(missingIncludeIsFatal=False)
+        self.run_(parser.readKickstartAsync(self.server.url + "/ks.cfg"))
+        self.assertEqual(parser.handler.rootpw.password, "secret")
+
+        parser = self.parser()
+        self.assertRaises(KickstartError, self.run_, parser.readKickstartAsync(self.server.url + "/ks.cfg"))
+        self.assertRaises(KickstartError, self.run_, parser.readKickstartAsync(self.server.url + "/missing.cfg"))
+
+class Concurrent_TestCase(Base_Aio):
+    files = dict(("/ks%d.cfg" % i, "rootpw --plaintext pw%d\n" % i) for i in range(12))
+    delay = 0.02
+
+    def runTest(self):
+        fetcher = aio.HTTPFetcher(maxPerHost=3)
+        parsers = [self.parser() for _i in range(12)]
+
+        async def readAll():
+            await asyncio.gather(*[p.readKickstartAsync(self.server.url + "/ks%d.cfg" % i, fetcher=fetcher)
+                                   for (i, p) in enumerate(parsers)])
+
+        self.run_(readAll())
+
+        self.assertEqual([p.handler.rootpw.password for p in parsers], ["pw%d" % i for i in range(12)])
+        self.assertGreater(self.server.peak, 1)
+        self.assertLessEqual(self.server.peak, 3)
+
+class Max_Size_TestCase(Base_Aio):
+    files = {"/ks.cfg": "text\nrootpw --plaintext secret\n"}
+
+    def runTest(self):
+        fetcher = aio.HTTPFetcher()
+        saved = aio.load.MAX_SIZE
+
+        try:
+            aio.load.MAX_SIZE = len(self.files["/ks.cfg"])
+            for prefix in ["", "/chunked", "/nolength"]:
+                self.assertEqual(self.run_(fetcher.fetch(self.server.url + prefix + "/ks.cfg")), self.files["/ks.cfg"])
+
+            aio.load.MAX_SIZE -= 1
+            for prefix in ["", "/chunked", "/nolength"]:
+                with self.assertRaises(KickstartError) as cm:
+                    self.run_(fetcher.fetch(self.server.url + prefix + "/ks.cfg"))
+                self.assertIn("larger than", str(cm.exception))
+        finally:
+            aio.load.MAX_SIZE = saved
+
+class Timeout_TestCase(Base_Aio):
+    files = {"/ks.cfg": "text\n"}
+    delay = 0.5
+
+    def runTest(self):
+        saved = aio.load.READ_TIMEOUT
+
+        try:
+            aio.load.READ_TIMEOUT = 0.1
+            with self.assertRaises(KickstartError) as cm:
+                self.run_(aio.load_to_str(self.server.url + "/ks.cfg"))
+            self.assertIn("timed out", str(cm.exception))
+        finally:
+            aio.load.READ_TIMEOUT = saved
+
+        # Let the server finish with the request it was given up on.
+        self.run_(asyncio.sleep(self.delay))
+
+class Preprocess_TestCase(Base_Aio):
+    files = {"/one.cfg": "part / --size=1000\n",
+             "/two.cfg": "part swap --size=500\n"}
+
+    def runTest(self):
+        s = "%%ksappend %(url)s/one.cfg\ntext\n%%ksappend %(url)s/two.cfg\n" % {"url": self.server.url}
+        retval = self.run_(aio.preprocessFromStringToStringAsync(s))
+        self.assertEqual(retval, b"part / --size=1000\ntext\npart swap --size=500\n")
+
+        d = tempfile.mkdtemp(prefix="ks-aio-")
+        try:
+            path = os.path.join(d, "ks.cfg")
+            with open(path, "w") as f:
+                f.write(s)
+
+            self.assertEqual(self.run_(aio.preprocessKickstartToStringAsync(path)), retval)
+            self.assertRaises(KickstartError, self.run_, aio.preprocessKickstartToStringAsync(os.path.join(d, "nothere")))
+        finally:
+            shutil.rmtree(d)
+
+        s = "%%ksappend %s/missing.cfg\n" % self.server.url
+        self.assertRaises(KickstartError, self.run_, aio.preprocessFromStringToStringAsync(s))
+
+class Limits_TestCase(Base_Aio):
+    files = {"/ks.cfg": "%include {url}/part.cfg\nrootpw --plaintext secret\n",
+             "/part.cfg": "part / --size=1000\n%include {url}/swap.cfg\n",
+             "/swap.cfg": "part swap --size=500\n",
+             "/one.cfg": "part / --size=1000\n",
+             "/two.cfg": "part swap --size=500\n"}
+
+    def runTest(self):
+        for (path, contents) in self.files.items():
+            self.files[path] = contents.replace("{url}", self.server.url)
+
+        url = self.server.url + "/ks.cfg"
+
+        # Fetching stops as soon as a limit is passed.
+        parser = self.parser(limits=Limits(maxFetches=1))
+        self.assertRaises(KickstartFetchCountError, self.run_, parser.readKickstartAsync(url))
+        self.assertEqual(self.server.requests, ["/ks.cfg"])
+
+        del self.server.requests[:]
+        parser = self.parser(limits=Limits(maxIncludeDepth=1))
+        self.assertRaises(KickstartIncludeDepthError, self.run_, parser.readKickstartAsync(url))
+        self.assertEqual(sorted(self.server.requests), ["/ks.cfg", "/part.cfg"])
+
+        parser = self.parser(limits=Limits(maxBytes=len(self.files["/ks.cfg"]) + 10))
+        self.assertRaises(KickstartSizeError, self.run_, parser.readKickstartAsync(url))
+
+        # Within the limits, the parser doesn't count the prefetched files
+        # again.
+        parser = self.parser(limits=Limits(maxFetches=3, maxIncludeDepth=2))
+        self.run_(parser.readKickstartAsync(url))
+        self.assertEqual([p.mountpoint for p in parser.handler.partition.partitions], ["/", "swap"])
+        self.assertEqual(parser.limits.fetches, 3)
+
+        s = "%%ksappend %(url)s/one.cfg\ntext\n%%ksappend %(url)s/two.cfg\n" % {"url": self.server.url}
+        self.assertRaises(KickstartFetchCountError, self.run_,
+                          aio.preprocessFromStringToStringAsync(s, limits=Limits(maxFetches=1)))
+        self.assertRaises(KickstartSizeError, self.run_,
+                          aio.preprocessFromStringToStringAsync(s, limits=Limits(maxBytes=len(s) + 10)))
+        self.assertEqual(self.run_(aio.preprocessFromStringToStringAsync(s, limits=Limits(maxFetches=2))),
+                         b"part / --size=1000\ntext\npart swap --size=500\n")
+
+class Limits_Timeout_TestCase(Base_Aio):
+    files = {"/ks.cfg": "text\n"}
+    delay = 0.5
+
+    def runTest(self):
+        parser = self.parser(limits=Limits(timeout=0.1))
+        self.assertRaises(KickstartTimeoutError, self.run_, parser.readKickstartAsync(self.server.url + "/ks.cfg"))
+
+        # Let the server finish with the request it was given up on.
+        self.run_(asyncio.sleep(self.delay))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 import unittest
@@ -181,6 +182,11 @@ class HandlerString_TestCase(ParserTest):
         self.handler.scripts.append(Script("echo Hello", type=KS_SCRIPT_POST))
         self.assertIn("echo Hello", str(self.handler))
 
+        # Writing the handler out gives the same text as str.
+        f = io.StringIO()
+        self.handler.write(f)
+        self.assertEqual(f.getvalue(), str(self.handler))
+
 class HandlerResetCommand_TestCase(ParserTest):
     def runTest(self):
         # fail - tried to reset a command that doesn't exist
@@ -208,6 +214,11 @@ class HandlerResetCommand_TestCase(ParserTest):
         self.assertEqual(self.handler.autopart.passphrase, "")
         self.assertNotIn("bogus", self.handler.autopart.__dict__)
 
+        # Every name for a command gets the new instance.
+        self.handler.resetCommand("partition")
+        self.assertIs(self.handler.commands["part"], self.handler.commands["partition"])
+        self.assertIs(self.handler.commands["part"], self.handler.partition)
+
 class HandlerDispatch_TestCase(ParserTest):
     def runTest(self):
         # fail - no such command
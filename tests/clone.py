@@ -0,0 +1,125 @@
+import time
+import unittest
+from tests.baseclass import ParserTest
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import F27, makeVersion
+
+ks = """text
+rootpw --plaintext secret
+network --device=eth0 --bootproto=dhcp --hostname=base
+part / --size=1000
+part /home --size=100
+%packages
+vim
+@core
+%end
+%post
+echo post
+%end
+"""
+
+class Base_Clone(ParserTest):
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.version = F27
+
+    def handlerFor(self, s):
+        handler = makeVersion(self.version)
+        KickstartParser(handler).readKickstartFromString(s)
+        return handler
+
+class Clone_TestCase(Base_Clone):
+    def runTest(self):
+        base = self.handlerFor(ks)
+        expected = str(base)
+
+        clone = base.clone()
+        self.assertEqual(str(clone), expected)
+        self.assertEqual(clone.fingerprint(), base.fingerprint())
+
+        # Nothing is copied until it is changed, and reading doesn't change
+        # anything.
+        self.assertTrue(clone.partition is base.partition)
+        self.assertTrue(clone.commands["part"] is base.commands["part"])
+        self.assertTrue(clone.packages is base.packages)
+        str(clone)
+        clone.fingerprint()
+        self.assertTrue(clone.partition is base.partition)
+
+        clone.edit("rootpw").password = "other"
+        clone.edit("network").network[0].hostname = "host1"
+        clone.edit("part").partitions[0].size = 2000
+        clone.edit("packages").packageList.append("emacs")
+        clone.edit("scripts")[0].script = "echo other\n"
+
+        self.assertEqual(str(base), expected)
+        self.assertFalse(clone.partition is base.partition)
+        self.assertTrue(clone.partition is clone.commands["partition"])
+        self.assertTrue(clone.partition is clone.edit("partition"))
+        self.assertTrue(clone.partition.handler is clone)
+        self.assertTrue("rootpw --plaintext other" in str(clone))
+        self.assertTrue("--hostname=host1" in str(clone))
+        self.assertTrue("part / --size=2000" in str(clone))
+        self.assertTrue("emacs" in str(clone))
+        self.assertTrue("echo other" in str(clone))
+        self.assertNotEqual(clone.fingerprint(), base.fingerprint())
+
+        # Changing the original doesn't change the clone either, even through
+        # a command looked up before the clone was made.
+        before = base.partition
+        base.edit("partition").partitions[1].size = 5
+        self.assertFalse(base.partition is before)
+        self.assertTrue("part /home --size=100" in str(clone))
+        self.assertTrue("part /home --size=5" in str(base))
+
+class Clone_Direct_Change_TestCase(Base_Clone):
+    def runTest(self):
+        base = self.handlerFor(ks)
+        expected = str(base)
+
+        # Through edit, a change is only seen by the handler it was made to.
+        clone = base.clone()
+        clone.edit("rootpw").password = "other"
+        clone.edit("packages").packageList.append("emacs")
+        self.assertEqual(str(base), expected)
+
+        # Without it, the change is made to the object both handlers share.
+        clone = base.clone()
+        clone.rootpw.password = "shared"
+        clone.packages.packageList.append("nano")
+        self.assertTrue(clone.rootpw is base.rootpw)
+        self.assertTrue("rootpw --plaintext shared" in str(base))
+        self.assertTrue("nano" in str(base))
+
+class Clone_Parse_TestCase(Base_Clone):
+    def runTest(self):
+        base = self.handlerFor(ks)
+        expected = str(base)
+
+        clone = base.clone()
+        again = clone.clone()
+        KickstartParser(again).readKickstartFromString("part /var --size=10\n%post\necho more\n%end\n", reset=False)
+
+        self.assertEqual(str(base), expected)
+        self.assertEqual(str(clone), expected)
+        self.assertTrue("part /var --size=10" in str(again))
+        self.assertEqual(len(again.scripts), 2)
+
+class Clone_Size_TestCase(Base_Clone):
+    def runTest(self):
+        small = self.handlerFor(ks)
+        large = self.handlerFor(ks + "".join("part /data%d --size=1\n" % i for i in range(5000)))
+
+        def timeClones(handler):
+            start = time.time()
+            for _i in range(200):
+                handler.clone()
+            return time.time() - start
+
+        # Cloning doesn't look at the data objects, so a handler with
+        # thousands of them takes no longer than one with two.
+        self.assertLess(timeClones(large), timeClones(small) * 5 + 0.1)
+
+if __name__ == "__main__":
+    unittest.main()
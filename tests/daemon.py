@@ -0,0 +1,132 @@
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+from pykickstart.daemon import ValidationServer, request
+from pykickstart.errors import KickstartError
+from pykickstart.parser import KickstartParser
+from pykickstart.version import F27, makeVersion
+
+ks = """text
+rootpw --plaintext secret
+part / --size=1000
+%packages
+vim
+%end
+"""
+
+class Base_Daemon(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp(prefix="ksvalidatord-")
+        self.path = os.path.join(self._tmpdir, "sock")
+        self.server = ValidationServer(self.path, versions=["F27"], poolSize=2)
+        self.thread = threading.Thread(target=self.server.serve)
+        self.thread.start()
+
+    def tearDown(self):
+        if self.thread.is_alive():
+            request(self.path, {"op": "shutdown"})
+            self.thread.join()
+
+        shutil.rmtree(self._tmpdir)
+
+    def send(self, **kwargs):
+        return request(self.path, kwargs, timeout=30)
+
+class Validate_TestCase(Base_Daemon):
+    def runTest(self):
+        self.assertEqual(self.send(op="ping")["retval"], 0)
+        self.assertEqual(self.server.pool.free("F27"), 2)
+
+        response = self.send(op="validate", version="F27", location="ks.cfg", contents=ks)
+        self.assertEqual(response, {"retval": 0, "messages": [], "errors": []})
+
+        # Errors a parser would print are sent back instead.
+        response = self.send(op="validate", version="F27", location="ks.cfg", contents="bogus\nalsobogus\n")
+        self.assertEqual(response["retval"], 2)
+        self.assertEqual(len(response["errors"]), 2)
+        self.assertIn("bogus", response["errors"][0])
+
+        response = self.send(op="validate", version="F27", location="ks.cfg", contents="bogus\nalsobogus\n", firstError=True)
+        self.assertEqual(response["retval"], 1)
+        self.assertEqual(response["errors"], [])
+        self.assertIn("bogus", response["messages"][0])
+
+        # Deprecated commands are errors, as they are to ksvalidator.
+        response = self.send(op="validate", version="F27", location="ks.cfg", contents="upgrade\n")
+        self.assertEqual(response["retval"], 1)
+        self.assertIn("deprecated", response["errors"][0])
+
+        response = self.send(op="validate", version="F27", location="ks.cfg", contents="part / --size=1000\nlogvol / --vgname=vg --name=root --size=10\n", storage=True)
+        self.assertNotEqual(response["retval"], 0)
+
+        # Nothing from one request shows up in the next.
+        response = self.send(op="flatten", version="F27", location="ks.cfg", contents=ks)
+        handler = makeVersion(F27)
+        KickstartParser(handler).readKickstartFromString(ks)
+        self.assertEqual(response["output"], str(handler))
+        self.assertEqual(self.server.pool.free("F27"), 2)
+
+        response = self.send(op="validate", version="RHEL99", location="ks.cfg", contents=ks)
+        self.assertEqual(response["retval"], 1)
+        self.assertIn("RHEL99", response["messages"][0])
+
+        self.assertEqual(self.send(op="bogus")["retval"], 1)
+
+class Location_TestCase(Base_Daemon):
+    def runTest(self):
+        with open(os.path.join(self._tmpdir, "ks.cfg"), "w") as f:
+            f.write("%include part.cfg\nrootpw --plaintext secret\n")
+        with open(os.path.join(self._tmpdir, "part.cfg"), "w") as f:
+            f.write("part / --size=1000\n")
+
+        response = self.send(op="flatten", version="F27", location="ks.cfg", cwd=self._tmpdir, followIncludes=True)
+        self.assertEqual(response["retval"], 0)
+        self.assertIn("part / --size=1000", response["output"])
+
+        response = self.send(op="validate", version="F27", location="nothere.cfg", cwd=self._tmpdir)
+        self.assertEqual(response["retval"], 1)
+        self.assertIn("nothere.cfg", response["messages"][0])
+
+class Protocol_TestCase(Base_Daemon):
+    def runTest(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.path)
+        f = sock.makefile("rwb")
+
+        # Many requests can share a connection.
+        for line in [b"not json\n", b"\n", b"[1]\n", b'{"op": "ping"}\n']:
+            f.write(line)
+        f.flush()
+
+        responses = [json.loads(f.readline().decode("utf-8")) for _i in range(3)]
+        self.assertEqual([r["retval"] for r in responses], [1, 1, 0])
+
+        f.close()
+        sock.close()
+
+class Shutdown_TestCase(Base_Daemon):
+    def runTest(self):
+        self.assertRaises(KickstartError, ValidationServer, self.path)
+
+        self.send(op="shutdown")
+        self.thread.join(30)
+        self.assertFalse(self.thread.is_alive())
+        self.assertFalse(os.path.exists(self.path))
+        self.assertRaises(socket.error, request, self.path, {"op": "ping"})
+
+        # A socket left behind by a server that died is replaced.
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.bind(self.path)
+        s.close()
+
+        server = ValidationServer(self.path)
+        server.server_close()
+        self.assertEqual(os.stat(self.path).st_mode & 0o077, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import time
+import unittest
+from tests.baseclass import ParserTest
+
+from pykickstart.diff import ADDED, CHANGED, REMOVED, diffHandlers
+from pykickstart.parser import KickstartParser
+from pykickstart.version import F27, makeVersion
+
+ks = """text
+rootpw --plaintext secret
+part / --size=1000
+part /home --size=100
+network --device=eth0 --bootproto=dhcp
+user --name=alice
+%packages
+vim
+@core
+%end
+%post
+echo one
+%end
+"""
+
+class Base_Diff(ParserTest):
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.version = F27
+
+    def handlerFor(self, s):
+        handler = makeVersion(self.version)
+        KickstartParser(handler).readKickstartFromString(s)
+        return handler
+
+    def diff(self, old, new):
+        return diffHandlers(self.handlerFor(old), self.handlerFor(new))
+
+class Diff_Same_TestCase(Base_Diff):
+    def runTest(self):
+        self.assertEqual(self.diff(ks, ks), [])
+
+        # Order and whitespace do not matter, and neither does which alias
+        # of a command was used.
+        reordered = ks.replace("part /home", "partition   /home").split("\n")
+        self.assertEqual(self.diff(ks, "\n".join(reversed(reordered[:6])) + "\n" + "\n".join(reordered[6:])), [])
+
+class Diff_Commands_TestCase(Base_Diff):
+    def runTest(self):
+        differences = self.diff(ks, ks.replace("text\n", "cmdline\n").replace("rootpw --plaintext secret\n", "") +
+                                "selinux --permissive\n")
+        self.assertEqual([(d.kind, d.command, d.key) for d in differences],
+                         [(CHANGED, "cmdline", None),
+                          (REMOVED, "rootpw", None),
+                          (ADDED, "selinux", None)])
+
+class Diff_Data_TestCase(Base_Diff):
+    def runTest(self):
+        new = ks.replace("part / --size=1000", "part / --size=2000 --grow")
+        new = new.replace("part /home --size=100\n", "part /var --size=100\n")
+        new = new.replace("--bootproto=dhcp", "--bootproto=static --ip=10.0.0.2")
+        differences = self.diff(ks, new)
+
+        self.assertEqual([(d.kind, d.command, d.key) for d in differences],
+                         [(CHANGED, "network", "eth0"),
+                          (CHANGED, "part", "/"),
+                          (ADDED, "part", "/var"),
+                          (REMOVED, "part", "/home")])
+
+        self.assertEqual(differences[0].options,
+                         [(CHANGED, "--bootproto", "dhcp", "static"),
+                          (ADDED, "--ip", "", "10.0.0.2")])
+        self.assertEqual(str(differences[1]), "~ part /\n    + --grow\n    ~ --size: 1000 -> 2000")
+
+        # Matching is by mount point, not position, so swapping two lines is
+        # not a difference.
+        swapped = ks.replace("part / --size=1000\npart /home --size=100", "part /home --size=100\npart / --size=1000")
+        self.assertEqual(self.diff(ks, swapped), [])
+
+class Diff_Sections_TestCase(Base_Diff):
+    def runTest(self):
+        new = ks.replace("vim\n", "emacs\n").replace("echo one", "echo two")
+        differences = self.diff(ks, new + "%pre\necho pre\n%end\n")
+        self.assertEqual([(d.kind, d.command, d.key) for d in differences],
+                         [(ADDED, "%packages", "emacs"),
+                          (REMOVED, "%packages", "vim"),
+                          (ADDED, "%post", "echo two"),
+                          (ADDED, "%pre", "echo pre"),
+                          (REMOVED, "%post", "echo one")])
+
+        differences = self.diff(ks, ks.replace("%packages", "%packages --nocore"))
+        self.assertEqual(len(differences), 1)
+        self.assertEqual(differences[0].kind, CHANGED)
+        self.assertEqual(differences[0].command, "%packages")
+
+class Diff_Large_TestCase(Base_Diff):
+    def runTest(self):
+        count = 5000
+        old = "".join("part /data%d --size=%d\n" % (i, i + 1) for i in range(count))
+        new = "".join("part /data%d --size=%d\n" % (i, i + 1 if i % 1000 else i + 2)
+                      for i in reversed(range(count)))
+
+        oldHandler = self.handlerFor(old)
+        newHandler = self.handlerFor(new)
+
+        # Entries are matched through a dict, so this takes time in
+        # proportion to the number of entries rather than its square.
+        start = time.time()
+        differences = diffHandlers(oldHandler, newHandler)
+        self.assertLess(time.time() - start, 5)
+
+        self.assertEqual(sorted(d.key for d in differences), sorted("/data%d" % i for i in range(0, count, 1000)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 from tests.baseclass import ParserTest
 
-from pykickstart.errors import formatErrorMsg, KickstartError, KickstartParseError, KickstartVersionError
+from pykickstart.errors import formatErrorMsg, KickstartError, KickstartParseError, KickstartVersionError, \
+    KickstartDeprecationWarning, KickstartParseWarning
 
 class NoErrorMessage_TestCase(ParserTest):
     def runTest(self):
@@ -17,5 +18,12 @@ class ExceptionStr_TestCase(ParserTest):
         self.assertEqual(str(KickstartParseError("OH NO!")), "OH NO!")
         self.assertEqual(str(KickstartVersionError("OH NO!")), "OH NO!")
 
+class Warnings_TestCase(ParserTest):
+    def runTest(self):
+        # Filters on the builtin categories still catch these.
+        self.assertTrue(issubclass(KickstartParseWarning, UserWarning))
+        self.assertTrue(issubclass(KickstartDeprecationWarning, KickstartParseWarning))
+        self.assertTrue(issubclass(KickstartDeprecationWarning, DeprecationWarning))
+
 if __name__ == "__main__":
     unittest.main()
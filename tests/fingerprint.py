@@ -0,0 +1,128 @@
+import unittest
+import unittest.mock as mock
+from tests.baseclass import ParserTest
+
+from pykickstart import fingerprint
+from pykickstart.parser import KickstartParser
+from pykickstart.version import F20, F27, makeVersion
+
+ks = """text
+rootpw --plaintext secret
+part / --size=1000
+part /home --size=100
+%packages
+vim
+@core
+-emacs
+%end
+%pre
+echo pre
+%end
+%post
+echo one
+%end
+%post
+echo two
+%end
+"""
+
+# The same thing, in a different order and with different whitespace.
+reordered = """%post
+
+echo one   
+%end
+
+part   /home --size=100
+%packages
+-emacs
+@core
+vim
+%end
+rootpw   --plaintext   secret
+%pre
+echo pre
+%end
+partition / --size=1000
+text
+%post
+echo two
+%end
+"""
+
+class Base_Fingerprint(ParserTest):
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.version = F27
+
+    def handlerFor(self, s, version=None):
+        handler = makeVersion(version or self.version)
+        KickstartParser(handler).readKickstartFromString(s)
+        return handler
+
+class Fingerprint_Equivalent_TestCase(Base_Fingerprint):
+    def runTest(self):
+        self.assertEqual(self.handlerFor(ks).fingerprint(), self.handlerFor(reordered).fingerprint())
+
+        # Each version has its own fingerprints.
+        self.assertEqual(self.handlerFor(ks, F20).fingerprint(), self.handlerFor(reordered, F20).fingerprint())
+        self.assertNotEqual(self.handlerFor(ks, F20).fingerprint(), self.handlerFor(ks).fingerprint())
+
+class Fingerprint_Different_TestCase(Base_Fingerprint):
+    def runTest(self):
+        base = self.handlerFor(ks).fingerprint()
+
+        for s in [ks.replace("vim", "nano"),
+                  ks.replace("-emacs", "emacs"),
+                  ks.replace("--size=1000", "--size=1001"),
+                  ks.replace("text\n", "graphical\n"),
+                  ks.replace("echo one", "echo  one"),
+                  ks + "%pre\necho pre\n%end\n",
+                  # the order of scripts of the same type counts
+                  ks.replace("echo one", "echo X").replace("echo two", "echo one").replace("echo X", "echo two")]:
+            self.assertNotEqual(self.handlerFor(s).fingerprint(), base, s)
+
+class Fingerprint_Incremental_TestCase(Base_Fingerprint):
+    def runTest(self):
+        handler = self.handlerFor(ks)
+        first = handler.fingerprint()
+        self.assertEqual(handler.fingerprint(), first)
+
+        # Changes made directly have to be named.
+        handler.rootpw.password = "other"
+        self.assertEqual(handler.fingerprint(), first)
+        second = handler.fingerprint(changed=["rootpw"])
+        self.assertNotEqual(second, first)
+        self.assertEqual(second, self.handlerFor(ks.replace("secret", "other")).fingerprint())
+
+        # Only the named command is looked at again.
+        with mock.patch("pykickstart.base.commandDigest", wraps=fingerprint.commandDigest) as digest:
+            handler.rootpw.password = "secret"
+            self.assertEqual(handler.fingerprint(changed=["rootpw"]), first)
+            digest.assert_called_once_with(handler.rootpw)
+
+        # Changes made through the parser are noticed on their own.
+        KickstartParser(handler).readKickstartFromString("part /var --size=10\n%packages\nnano\n%end\n")
+        self.assertEqual(handler.fingerprint(),
+                         self.handlerFor(ks + "part /var --size=10\n%packages\nnano\n%end\n").fingerprint())
+
+        # So are replaced commands.
+        handler.resetCommand("part")
+        self.assertNotEqual(handler.fingerprint(), first)
+
+        handler.packages.packageList.append("other")
+        self.assertNotEqual(handler.fingerprint(changed=["packages"]), first)
+
+class Fingerprint_Scripts_TestCase(unittest.TestCase):
+    def runTest(self):
+        handler = makeVersion(F27)
+        KickstartParser(handler).readKickstartFromString("%post\n\n  echo a  \n\n%end\n")
+        other = makeVersion(F27)
+        KickstartParser(other).readKickstartFromString("%post\n  echo a\n%end\n")
+        self.assertEqual(fingerprint.scriptsDigest(handler.scripts), fingerprint.scriptsDigest(other.scripts))
+
+        # Leading whitespace counts.
+        KickstartParser(other).readKickstartFromString("%post\necho a\n%end\n")
+        self.assertNotEqual(fingerprint.scriptsDigest(handler.scripts[:1]), fingerprint.scriptsDigest(other.scripts[1:]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock as mock
+from tests.baseclass import ParserTest
+
+from pykickstart import includes
+from pykickstart.errors import KickstartError, KickstartIncludeLoopError
+from pykickstart.includes import IncludeGraph, IncludeResolver, buildIncludeGraph, findIncludes
+
+class Base_Includes(ParserTest):
+    files = {}
+
+    def setUp(self):
+        ParserTest.setUp(self)
+        self._dir = tempfile.mkdtemp(prefix="includes-")
+
+        for (name, contents) in self.files.items():
+            with open(self.path(name), "w") as f:
+                f.write(contents)
+
+    def tearDown(self):
+        ParserTest.tearDown(self)
+        shutil.rmtree(self._dir)
+
+    def path(self, name):
+        return os.path.join(self._dir, name)
+
+class Include_Loop_TestCase(Base_Includes):
+    files = {"self.ks": "text\n%include self.ks\n",
+             "a.ks": "text\n%include b.ks\n",
+             "b.ks": "%packages\n%include a.ks\n%end\n"}
+
+    def runTest(self):
+        with self.assertRaises(KickstartIncludeLoopError) as cm:
+            self.parser.readKickstart(self.path("self.ks"))
+        self.assertTrue("%s -> %s" % (self.path("self.ks"), self.path("self.ks")) in str(cm.exception))
+
+        # Loops are fatal even when missing includes are not.
+        self.parser.missingIncludeIsFatal = False
+        with self.assertRaises(KickstartIncludeLoopError) as cm:
+            self.parser.readKickstart(self.path("a.ks"))
+        self.assertTrue("%s -> %s -> %s" % (self.path("a.ks"), self.path("b.ks"), self.path("a.ks")) in str(cm.exception))
+
+        # The same goes for a file given as a string along with its path.
+        with open(self.path("a.ks")) as f:
+            self.assertRaises(KickstartIncludeLoopError, self.parser.readKickstartFromString,
+                              f.read(), path=self.path("a.ks"))
+
+class Include_Graph_TestCase(Base_Includes):
+    files = {"top.ks": "%include left.ks\n%include right.ks\n%include shared.ks\n",
+             "left.ks": "%include shared.ks\n",
+             "right.ks": "%include shared.ks\n",
+             "shared.ks": "text\n"}
+
+    def runTest(self):
+        with mock.patch.object(includes, "load_to_str", wraps=includes.load_to_str) as load:
+            self.parser.readKickstart(self.path("top.ks"))
+
+        # The fragment shared by every file is only read once.
+        self.assertEqual(load.call_count, 4)
+        self.assertTrue(self.handler.displaymode.seen)
+
+        graph = self.parser.includeGraph
+        self.assertEqual(graph.roots, [self.path("top.ks")])
+        self.assertEqual(graph.includes(self.path("top.ks")),
+                         [self.path("left.ks"), self.path("right.ks"), self.path("shared.ks")])
+        self.assertEqual(sorted(graph.includedBy(self.path("shared.ks"))),
+                         sorted([self.path("top.ks"), self.path("left.ks"), self.path("right.ks")]))
+        self.assertEqual(graph.findCycle(), None)
+
+        # Every parse starts over.
+        self.parser.readKickstartFromString("text\n")
+        self.assertEqual(self.parser.includeGraph.roots, [None])
+        self.assertEqual(self.parser.includeGraph.includes(None), [])
+
+class Shared_Resolver_TestCase(Base_Includes):
+    files = {"one.ks": "%include shared.ks\nrootpw --plaintext one\n",
+             "two.ks": "%include shared.ks\nrootpw --plaintext two\n",
+             "shared.ks": "text\n"}
+
+    def runTest(self):
+        self.parser.includeResolver = IncludeResolver()
+
+        with mock.patch.object(includes, "load_to_str", wraps=includes.load_to_str) as load:
+            self.parser.readKickstart(self.path("one.ks"))
+            self.handler.reset()
+            self.parser.readKickstart(self.path("two.ks"))
+
+        # The fragment is read once for both files, and the files themselves
+        # aren't kept.
+        self.assertEqual(load.call_count, 3)
+        self.assertEqual(sorted(self.parser.includeResolver._contents.keys()), [self.path("shared.ks")])
+        self.assertEqual(self.handler.rootpw.password, "two")
+        self.assertTrue(self.handler.displaymode.seen)
+
+        # The graph is still only of the last parse.
+        self.assertEqual(self.parser.includeGraph.roots, [self.path("two.ks")])
+
+class Build_Include_Graph_TestCase(Base_Includes):
+    files = {"one.ks": "%include frag.ks\n%packages\n%include missing.ks\n%end\n",
+             "two.ks": "# %include not-really.ks\n%include frag.ks\n",
+             "frag.ks": "%include sub/leaf.ks\n",
+             "loop1.ks": "%include loop2.ks\n",
+             "loop2.ks": "%include loop1.ks\n"}
+
+    def setUp(self):
+        Base_Includes.setUp(self)
+        os.mkdir(self.path("sub"))
+        with open(self.path("sub/leaf.ks"), "w") as f:
+            f.write("text\n")
+
+    def runTest(self):
+        resolver = IncludeResolver()
+        graph = buildIncludeGraph([self.path("one.ks"), self.path("two.ks")], resolver=resolver)
+
+        self.assertEqual(graph.roots, [self.path("one.ks"), self.path("two.ks")])
+        self.assertEqual(graph.descendants(self.path("one.ks")),
+                         [self.path("frag.ks"), self.path("sub/leaf.ks"), "missing.ks"])
+        self.assertEqual(graph.descendants(self.path("two.ks")),
+                         [self.path("frag.ks"), self.path("sub/leaf.ks")])
+        self.assertEqual(sorted(graph.ancestors(self.path("sub/leaf.ks"))),
+                         sorted([self.path("frag.ks"), self.path("one.ks"), self.path("two.ks")]))
+        self.assertEqual(graph.missing, set(["missing.ks"]))
+        self.assertEqual(resolver.resolve("frag.ks", self._dir), self.path("frag.ks"))
+
+        self.assertRaises(KickstartIncludeLoopError, buildIncludeGraph, [self.path("loop1.ks")])
+
+class Include_Names_TestCase(Base_Includes):
+    files = {"top.ks": "%include frag.ks\n%include missing.ks\n",
+             "frag.ks": "text\n"}
+
+    def runTest(self):
+        resolver = IncludeResolver()
+        self.parser.includeResolver = resolver
+        self.parser.missingIncludeIsFatal = False
+
+        # Relative names are kept as given, and looked up from where the
+        # parser is run.
+        cwd = os.getcwd()
+        os.chdir(self._dir)
+        try:
+            self.parser.readKickstart("top.ks")
+        finally:
+            os.chdir(cwd)
+
+        graph = self.parser.includeGraph
+        self.assertEqual(graph.roots, ["top.ks"])
+        self.assertEqual(graph.includes("top.ks"), ["frag.ks", "missing.ks"])
+        self.assertEqual(graph.missing, set(["missing.ks"]))
+
+        # Messages give the name the file used, not where it was looked for.
+        self.parser.includeResolver = IncludeResolver()
+        self.parser.missingIncludeIsFatal = True
+        with self.assertRaises(KickstartError) as cm:
+            self.parser.readKickstart(self.path("top.ks"))
+        self.assertIn("missing.ks", str(cm.exception))
+        self.assertNotIn(self.path("missing.ks"), str(cm.exception))
+
+        # Every name for the same file shares what was loaded for it.
+        self.assertEqual(resolver.key("frag.ks"), os.path.abspath("frag.ks"))
+        resolver.setContents(self.path("frag.ks"), "skipx\n")
+        with mock.patch.object(includes, "load_to_str") as load:
+            self.assertEqual(resolver.load(os.path.join(self._dir, ".", "frag.ks")), "skipx\n")
+        self.assertFalse(load.called)
+
+class Find_Includes_TestCase(unittest.TestCase):
+    def runTest(self):
+        ks = "%include a.ks\n%pre\n%include b.ks\n%end\n%packages\n%include c.ks\n%end\n" \
+             "%post --nochroot\n  %include 'd.ks'\n%end\n%include e.ks # comment\n"
+        self.assertEqual(findIncludes(ks), ["a.ks", "b.ks", "c.ks", "d.ks", "e.ks"])
+
+class Include_Graph_Cycle_TestCase(unittest.TestCase):
+    def runTest(self):
+        graph = IncludeGraph()
+        graph.addFile("a")
+        graph.addInclude("a", "b")
+        graph.addInclude("b", "c")
+        graph.addInclude("a", "c")
+        self.assertEqual(graph.findCycle(), None)
+
+        graph.addInclude("c", "b")
+        self.assertEqual(graph.findCycle(), ["b", "c", "b"])
+
+if __name__ == "__main__":
+    unittest.main()
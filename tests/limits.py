@@ -0,0 +1,151 @@
+import itertools
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock as mock
+from tests.baseclass import ParserTest
+
+from pykickstart import limits as limits_module
+from pykickstart.errors import KickstartDataCountError, KickstartFetchCountError, \
+    KickstartIncludeDepthError, KickstartLimitError, KickstartLineLengthError, \
+    KickstartParseError, KickstartSectionCountError, KickstartSizeError, KickstartTimeoutError
+from pykickstart.limits import Limits
+from pykickstart.load import load_to_str
+from pykickstart.parser import KickstartParser, preprocessFromStringToString
+from pykickstart.version import makeVersion
+
+class Base_Limits(ParserTest):
+    files = {"a.ks": "text\n%include b.ks\n",
+             "b.ks": "%include c.ks\n",
+             "c.ks": "network --device=eth0\n",
+             "big.ks": "# " + "x" * 1000 + "\n",
+             "top.ks": "text\n%include big.ks\n"}
+
+    def setUp(self):
+        ParserTest.setUp(self)
+        self._dir = tempfile.mkdtemp(prefix="limits-")
+
+        for (name, contents) in self.files.items():
+            with open(self.path(name), "w") as f:
+                f.write(contents)
+
+    def tearDown(self):
+        ParserTest.tearDown(self)
+        shutil.rmtree(self._dir)
+
+    def path(self, name):
+        return os.path.join(self._dir, name)
+
+    def parse(self, limits, s=None, path=None, errorsAreFatal=True):
+        parser = KickstartParser(makeVersion(), limits=limits, errorsAreFatal=errorsAreFatal)
+        if path is not None:
+            parser.readKickstart(path)
+        else:
+            parser.readKickstartFromString(s)
+
+        return parser
+
+class Error_Types_TestCase(unittest.TestCase):
+    def runTest(self):
+        # Every limit has its own error, and they are all parse errors.
+        types = [KickstartIncludeDepthError, KickstartSizeError, KickstartLineLengthError,
+                 KickstartSectionCountError, KickstartDataCountError, KickstartFetchCountError,
+                 KickstartTimeoutError]
+        self.assertEqual(len(set(types)), 7)
+        for t in types:
+            self.assertTrue(issubclass(t, KickstartLimitError))
+            self.assertTrue(issubclass(t, KickstartParseError))
+
+class Include_Depth_TestCase(Base_Limits):
+    def runTest(self):
+        self.parse(Limits(maxIncludeDepth=2), path=self.path("a.ks"))
+
+        with self.assertRaises(KickstartIncludeDepthError) as cm:
+            self.parse(Limits(maxIncludeDepth=1), path=self.path("a.ks"))
+        self.assertEqual(cm.exception.filename, self.path("b.ks"))
+        self.assertEqual(cm.exception.lineno, 1)
+
+        # Not even a missing include that isn't fatal gets past it.
+        parser = KickstartParser(makeVersion(), limits=Limits(maxIncludeDepth=0),
+                                 missingIncludeIsFatal=False)
+        self.assertRaises(KickstartIncludeDepthError, parser.readKickstart, self.path("a.ks"))
+
+class Size_TestCase(Base_Limits):
+    def runTest(self):
+        self.parse(Limits(maxBytes=10), "text\n")
+        self.assertRaises(KickstartSizeError, self.parse, Limits(maxBytes=4), "text\n")
+
+        # A file too large for what is left is not read at all.
+        limits = Limits(maxBytes=100)
+        with mock.patch("pykickstart.load.open", create=True, wraps=open) as _open:
+            with self.assertRaises(KickstartSizeError):
+                self.parse(limits, path=self.path("top.ks"))
+        self.assertEqual(limits.bytes, len(self.files["top.ks"]))
+        self.assertEqual(_open.call_count, 2)
+
+        # What is used is counted again for each file.
+        parser = self.parse(Limits(maxBytes=100), path=self.path("a.ks"))
+        parser.readKickstart(self.path("a.ks"))
+        self.assertEqual(parser.limits.bytes, sum(len(self.files[n]) for n in ["a.ks", "b.ks", "c.ks"]))
+
+class Line_Length_TestCase(Base_Limits):
+    def runTest(self):
+        self.parse(Limits(maxLineLength=30), "rootpw --plaintext secret\n")
+        self.assertRaises(KickstartLineLengthError, self.parse, Limits(maxLineLength=30),
+                          "rootpw --plaintext '%s'\n" % ("x" * 100))
+
+        # Section bodies are checked as well.
+        with self.assertRaises(KickstartLineLengthError) as cm:
+            self.parse(Limits(maxLineLength=30), "%%post\necho\necho %s\n%%end\n" % ("x" * 100))
+        self.assertEqual(cm.exception.lineno, 3)
+
+class Sections_TestCase(Base_Limits):
+    def runTest(self):
+        ks = "%pre\necho\n%end\n%post\necho\n%end\n%packages\n%end\n"
+        self.parse(Limits(maxSections=3), ks)
+        self.assertRaises(KickstartSectionCountError, self.parse, Limits(maxSections=2), ks)
+
+class Data_Entries_TestCase(Base_Limits):
+    def runTest(self):
+        ks = "text\nnetwork --device=eth0\nnetwork --device=eth1\nnetwork --device=eth2\n"
+        parser = self.parse(Limits(maxDataEntries=3), ks)
+        self.assertEqual(parser.limits.dataEntries, 3)
+
+        # Limits are fatal even when other errors are not.
+        self.assertRaises(KickstartDataCountError, self.parse, Limits(maxDataEntries=2), ks,
+                          errorsAreFatal=False)
+
+class Fetches_TestCase(unittest.TestCase):
+    @mock.patch("pykickstart.load._load_url", return_value="text\n")
+    def runTest(self, _load_url):
+        limits = Limits(maxFetches=2)
+        load_to_str("http://example.com/a.ks", limits=limits)
+        load_to_str("http://example.com/b.ks", limits=limits)
+        self.assertRaises(KickstartFetchCountError, load_to_str, "http://example.com/c.ks", limits=limits)
+        self.assertEqual(_load_url.call_count, 2)
+
+        # %ksappend counts too, along with what it fetched.
+        ks = "%ksappend http://example.com/a.ks\n%ksappend http://example.com/b.ks\n"
+        self.assertRaises(KickstartFetchCountError, preprocessFromStringToString, ks, limits=Limits(maxFetches=1))
+
+        limits = Limits(maxBytes=len(ks) + 10)
+        preprocessFromStringToString(ks, limits=limits)
+        self.assertEqual(limits.bytes, len(ks) + 10)
+        self.assertRaises(KickstartSizeError, preprocessFromStringToString, ks, limits=Limits(maxBytes=len(ks) + 9))
+
+class Timeout_TestCase(Base_Limits):
+    def runTest(self):
+        # Each look at the clock finds another 10 seconds gone.
+        with mock.patch.object(limits_module, "_now", side_effect=itertools.count(0, 10)):
+            self.parse(Limits(timeout=10), "text\n" * 300)
+
+        with mock.patch.object(limits_module, "_now", side_effect=itertools.count(0, 10)):
+            self.assertRaises(KickstartTimeoutError, self.parse, Limits(timeout=10), "text\n" * 600)
+
+        with mock.patch.object(limits_module, "_now", side_effect=itertools.count(0, 10)):
+            limits = Limits(timeout=5)
+            self.assertRaises(KickstartTimeoutError, load_to_str, self.path("a.ks"), limits=limits)
+
+if __name__ == "__main__":
+    unittest.main()
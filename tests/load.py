@@ -1,6 +1,8 @@
 import unittest
 import os
 import tempfile
+import threading
+import time
 import six
 
 from pykickstart import load
@@ -120,5 +122,123 @@ class Load_From_URL_To_File_TestCase(Load_From_URL_Test):
         super(Load_From_URL_To_File_TestCase, self).tearDown()
         os.unlink(self._target_path)
 
+class Load_Limits_Test(unittest.TestCase):
+    """Load from a server in a thread that can be slow, flaky or send more
+       than it should."""
+    settings = ["CONNECT_TIMEOUT", "READ_TIMEOUT", "RETRIES", "RETRY_BACKOFF", "MAX_SIZE", "_CHUNK_SIZE"]
+
+    def setUp(self):
+        self._saved = dict((name, getattr(load, name)) for name in self.settings)
+        load.RETRY_BACKOFF = 0
+        load.reset_url_stats()
+
+        self.body = u"text\nrootpw --plaintext \u00fcber\u00df\n".encode("utf-8")
+        self.hits = {}
+        test = self
+
+        class Handler(six.moves.BaseHTTPServer.BaseHTTPRequestHandler):
+            def log_message(self, *args, **kwargs):
+                pass
+
+            def do_GET(self):
+                test.hits[self.path] = test.hits.get(self.path, 0) + 1
+
+                if self.path == "/flaky" and test.hits[self.path] < 3:
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                elif self.path == "/slow":
+                    time.sleep(1)
+                elif self.path not in ("/flaky", "/ks.cfg", "/nolength"):
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                if self.path != "/nolength":
+                    self.send_header("Content-Length", str(len(test.body)))
+                self.end_headers()
+                self.wfile.write(test.body)
+
+        self._server = six.moves.BaseHTTPServer.HTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        self._url = "http://127.0.0.1:%d" % self._server.server_port
+
+    def tearDown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+        for (name, value) in self._saved.items():
+            setattr(load, name, value)
+
+class Load_Retry_TestCase(Load_Limits_Test):
+    def runTest(self):
+        self.assertEqual(load.load_to_str(self._url + "/flaky"), self.body.decode("utf-8"))
+
+        stats = load.get_url_stats()[self._url + "/flaky"]
+        self.assertEqual((stats.requests, stats.retries, stats.failures), (3, 2, 0))
+        self.assertEqual(stats.bytes, len(self.body))
+        self.assertGreaterEqual(stats.elapsed, stats.latency)
+
+        # Not found won't change by asking again.
+        self.assertRaises(KickstartError, load.load_to_str, self._url + "/missing")
+        stats = load.get_url_stats()[self._url + "/missing"]
+        self.assertEqual((stats.requests, stats.retries, stats.failures), (1, 0, 1))
+
+        # Nor will a URL that is no good.
+        for url in ["http://", "http://exa mple.com:port/ks.cfg"]:
+            self.assertRaises(KickstartError, load.load_to_str, url)
+            stats = load.get_url_stats()[url]
+            self.assertEqual((stats.requests, stats.retries, stats.failures), (1, 0, 1))
+
+        # Nor will running out of retries.
+        self.hits.clear()
+        load.RETRIES = 1
+        self.assertRaises(KickstartError, load.load_to_str, self._url + "/flaky")
+        self.assertEqual(self.hits["/flaky"], 2)
+
+        load.reset_url_stats()
+        self.assertEqual(load.get_url_stats(), {})
+
+class Load_Timeout_TestCase(Load_Limits_Test):
+    def runTest(self):
+        load.READ_TIMEOUT = 0.1
+        load.RETRIES = 1
+
+        start = time.time()
+        self.assertRaises(KickstartError, load.load_to_str, self._url + "/slow")
+        self.assertLess(time.time() - start, 1.5)
+        self.assertEqual(load.get_url_stats()[self._url + "/slow"].retries, 1)
+
+class Load_Max_Size_TestCase(Load_Limits_Test):
+    def runTest(self):
+        load.MAX_SIZE = len(self.body) - 1
+
+        for path in ["/ks.cfg", "/nolength"]:
+            with self.assertRaises(KickstartError) as cm:
+                load.load_to_str(self._url + path)
+            self.assertIn("larger than", str(cm.exception))
+
+        load.MAX_SIZE = len(self.body)
+        self.assertEqual(load.load_to_str(self._url + "/nolength"), self.body.decode("utf-8"))
+
+class Load_Decode_TestCase(Load_Limits_Test):
+    def runTest(self):
+        # Small enough pieces that multibyte characters are split up.
+        load._CHUNK_SIZE = 3
+
+        self.assertEqual(load.load_to_str(self._url + "/ks.cfg"), self.body.decode("utf-8"))
+
+        (handle, target) = tempfile.mkstemp(prefix="testfile", text=True)
+        os.close(handle)
+        try:
+            self.assertEqual(load.load_to_file(self._url + "/ks.cfg", target), target)
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), self.body)
+        finally:
+            os.unlink(target)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+import os
+import unittest
+import tempfile
+import unittest.mock as mock
+
+from pykickstart.load import load_to_str
+from pykickstart.memory import PHASES, generateKickstart, memoryReport, rssBenchmark
+from pykickstart.version import F20
+
+class MemoryTest(unittest.TestCase):
+    lines = 400
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        (handle, self._path) = tempfile.mkstemp(prefix="ks-memory-", text=True)
+        os.write(handle, generateKickstart(self.lines).encode("utf-8"))
+        os.close(handle)
+
+    def tearDown(self):
+        os.unlink(self._path)
+        unittest.TestCase.tearDown(self)
+
+class Memory_Report_TestCase(MemoryTest):
+    def runTest(self):
+        report = memoryReport(self._path)
+
+        self.assertEqual(sorted(report.phases.keys()), sorted(PHASES))
+        self.assertEqual(report.location, self._path)
+        self.assertTrue(report.lines > self.lines // 2)
+
+        for phase in ["source", "lines", "tokens", "data", "packages", "scripts", "rendered"]:
+            self.assertTrue(report.phases[phase] > 0, phase)
+
+        # The source text can't take up less room than its characters.
+        self.assertTrue(report.phases["source"] >= report.size)
+        self.assertTrue(report.peak >= report.phases["source"] + report.phases["lines"])
+
+        self.assertIn("data lists", str(report))
+        self.assertEqual(report.asDict()["phases"], report.phases)
+
+class Memory_Report_Include_TestCase(MemoryTest):
+    def runTest(self):
+        # The parser's own reading of the file and what it includes is what
+        # gets measured, so included files count too.
+        (handle, path) = tempfile.mkstemp(prefix="ks-memory-", text=True)
+        os.write(handle, ("%%include %s\n" % self._path).encode("utf-8"))
+        os.close(handle)
+
+        try:
+            with mock.patch("pykickstart.includes.load_to_str", wraps=load_to_str) as load:
+                included = memoryReport(path)
+            self.assertEqual(load.call_count, 2)
+        finally:
+            os.unlink(path)
+
+        direct = memoryReport(self._path)
+        self.assertEqual(included.lines, 1)
+        self.assertTrue(included.phases["source"] >= direct.size)
+        self.assertTrue(included.phases["tokens"] >= direct.phases["tokens"])
+
+class Memory_Report_Contents_TestCase(MemoryTest):
+    def runTest(self):
+        with open(self._path) as f:
+            contents = f.read()
+
+        checked = []
+        with mock.patch("pykickstart.includes.load_to_str", wraps=load_to_str) as load:
+            report = memoryReport(self._path, contents=contents + "text\n",
+                                  check=lambda handler: checked.append(handler.displaymode.seen))
+        self.assertEqual(load.call_count, 0)
+        self.assertEqual(report.size, len(contents) + 5)
+        self.assertEqual(checked, [True])
+
+class Memory_Report_Version_TestCase(MemoryTest):
+    def runTest(self):
+        report = memoryReport(self._path, version=F20)
+        self.assertTrue(report.phases["rendered"] > 0)
+
+class Memory_Regression_TestCase(unittest.TestCase):
+    """Parsing must keep the traced peak proportional to the input.  The bound
+       here is several times what is currently used, so only a real regression
+       in the parser or sections will trip it.
+    """
+    def _peak(self, lines):
+        (handle, path) = tempfile.mkstemp(prefix="ks-memory-", text=True)
+        os.write(handle, generateKickstart(lines).encode("utf-8"))
+        os.close(handle)
+
+        try:
+            report = memoryReport(path)
+        finally:
+            os.unlink(path)
+
+        return (report.size, report.peak - report.phases["handler"])
+
+    def runTest(self):
+        (smallSize, smallPeak) = self._peak(500)
+        (bigSize, bigPeak) = self._peak(5000)
+
+        perByte = float(bigPeak - smallPeak) / (bigSize - smallSize)
+        self.assertLess(perByte, 150)
+
+class RSS_Benchmark_TestCase(unittest.TestCase):
+    def runTest(self):
+        results = rssBenchmark([100, 2000])
+
+        self.assertEqual([r["lines"] for r in results], [100, 2000])
+        for r in results:
+            self.assertTrue(r["peakRSS"] >= r["baseRSS"])
+
+        # A few thousand lines must not cost more than a few megabytes.
+        growth = (results[1]["peakRSS"] - results[1]["baseRSS"]) - \
+                 (results[0]["peakRSS"] - results[0]["baseRSS"])
+        self.assertLess(growth, 64 * 1024 * 1024)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import warnings
+from argparse import ArgumentParser
+
+from pykickstart.errors import KickstartParseError
+from pykickstart.handlers.control import commandMap
+from pykickstart.options import KSOptionMatcher, KSOptionParser, _MatcherFallback
+from pykickstart.version import F20
+
+def _argumentLists(op):
+    """Return a variety of argument lists exercising every option of op."""
+    retval = [[], ["value"], ["value", "other"], ["--bogus"], ["--bogus=1", "value"],
+              ["-1"], ["-"], ["--"], ["--", "value"], ["has space"], ["-has space"]]
+
+    for action in op._actions:
+        for option in action.option_strings:
+            retval += [[option], [option, "1"], [option, "value", "other"],
+                       [option + "=1"], [option + "="], [option, "--bogus"],
+                       ["value", option, "1", "other"], [option, "1", option, "2"],
+                       [option, "-1"], [option, "--"], [option[:-1]], [option + "x"],
+                       [option, "on", "value"]]
+
+    return retval
+
+def _parse(func, args):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        try:
+            (ns, extra) = func(args)
+        except KickstartParseError as e:
+            return ("error", str(e))
+
+    return ("ok", vars(ns), extra)
+
+class Option_Matcher_Differential_TestCase(unittest.TestCase):
+    def runTest(self):
+        handled = 0
+
+        for (version, commands) in commandMap.items():
+            for (name, cmdClass) in commands.items():
+                cmd = cmdClass()
+                op = getattr(cmd, "op", None) or cmd._getParser()
+                matcher = KSOptionMatcher(op)
+
+                for args in _argumentLists(op):
+                    expected = _parse(lambda a: ArgumentParser.parse_known_args(op, a), list(args))
+
+                    try:
+                        got = _parse(matcher.parse_known_args, list(args))
+                    except _MatcherFallback:
+                        continue
+
+                    handled += 1
+                    self.assertEqual(got, expected, "%s (version %s) with %s" % (name, version, args))
+
+        # Make sure the matcher is really doing the work most of the time.
+        self.assertGreater(handled, 10000)
+
+class Option_Matcher_Used_TestCase(unittest.TestCase):
+    def runTest(self):
+        op = KSOptionParser(prog="cmd", description="", version=F20)
+        op.add_argument("--name", version=F20, help="")
+        op.add_argument("--enable", action="store_true", version=F20, help="")
+        op.add_argument("dev", version=F20, help="")
+
+        matcher = KSOptionMatcher(op)
+        (ns, extra) = matcher.parse_known_args(["--name", "n", "sda", "--enable", "more"])
+        self.assertEqual(ns.name, "n")
+        self.assertEqual(ns.dev, "sda")
+        self.assertTrue(ns.enable)
+        self.assertEqual(extra, ["more"])
+
+        # abbreviations are left to argparse
+        self.assertRaises(_MatcherFallback, matcher.parse_known_args, ["--nam", "n", "sda"])
+        (ns, extra) = op.parse_known_args(["--nam", "n", "sda"])
+        self.assertEqual(ns.name, "n")
+
+        # so is anything argparse reports as an error before taking actions
+        self.assertRaises(_MatcherFallback, matcher.parse_known_args, ["--name"])
+        self.assertRaises(KickstartParseError, op.parse_known_args, ["--name"])
+
+        # adding an argument throws the compiled matcher away
+        op.parse_known_args(["sda"])
+        self.assertIsNotNone(op._matcher)
+        op.add_argument("--other", version=F20, help="")
+        self.assertIsNone(op._matcher)
+        (ns, extra) = op.parse_known_args(["--other=x", "sda"])
+        self.assertEqual(ns.other, "x")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@ import warnings
 
 from tests.baseclass import ParserTest
 
-from pykickstart.constants import KS_MISSING_IGNORE
+from pykickstart.constants import GROUP_ALL, GROUP_REQUIRED, KS_MISSING_IGNORE
 from pykickstart.errors import KickstartParseError
 from pykickstart.parser import Group, Packages
 from pykickstart.version import DEVEL, F7, F21, RHEL6, returnClassForVersion
@@ -63,6 +63,31 @@ class AddGroups_TestCase(DevelPackagesBase):
 
         self.assertRaises(KickstartParseError, pkgs.add, ["@group-b --optional --nodefaults"])
 
+class AddDuplicateGroups_TestCase(DevelPackagesBase):
+    def runTest(self):
+        DevelPackagesBase.runTest(self)
+
+        pkgs = Packages()
+        pkgs.add(["@group-a --optional", "@group-b", "@group-a"])
+        self.assertEqual(["group-a", "group-b"], [g.name for g in pkgs.groupList])
+        self.assertEqual(pkgs.groupList[0].include, GROUP_ALL)
+
+        # Excluding a group replaces groupList, which must not leave the
+        # duplicate index behind.
+        pkgs.add(["-@group-a"])
+        pkgs.add(["@group-a --nodefaults"])
+        self.assertEqual(["group-b", "group-a"], [g.name for g in pkgs.groupList])
+        self.assertEqual(pkgs.groupList[1].include, GROUP_REQUIRED)
+
+        # The same goes for changing groupList directly.
+        pkgs.groupList = []
+        pkgs.add(["@group-b"])
+        self.assertEqual(["group-b"], [g.name for g in pkgs.groupList])
+
+        del pkgs.groupList[:]
+        pkgs.add(["@group-b"])
+        self.assertEqual(["group-b"], [g.name for g in pkgs.groupList])
+
 class AddGroupsAndEnvironment_TestCase(DevelPackagesBase):
     def runTest(self):
         DevelPackagesBase.runTest(self)
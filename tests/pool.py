@@ -0,0 +1,160 @@
+import threading
+import unittest
+from tests.baseclass import ParserTest
+
+from pykickstart.errors import KickstartParseError
+from pykickstart.parser import KickstartParser
+from pykickstart.pool import HandlerPool
+from pykickstart.version import F20, F27, makeVersion
+
+ks = """text
+rootpw --plaintext secret
+network --device=eth0 --bootproto=dhcp --hostname=base
+part / --size=1000
+part /home --size=100
+%packages
+vim
+@core
+%end
+%post
+echo post
+%end
+%addon bogus
+%end
+"""
+
+class Base_Pool(ParserTest):
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.version = F27
+
+    def expected(self, s):
+        handler = makeVersion(self.version)
+        KickstartParser(handler, unknownSectionIsFatal=False).readKickstartFromString(s)
+        return str(handler)
+
+class Reset_TestCase(Base_Pool):
+    def runTest(self):
+        fresh = str(makeVersion(self.version))
+
+        handler = makeVersion(self.version)
+        parser = KickstartParser(handler, unknownSectionIsFatal=False)
+
+        parser.readKickstartFromString(ks)
+        handler.reset()
+        self.assertEqual(str(handler), fresh)
+
+        # The first reset replaced everything, later ones only what was
+        # touched.
+        for _i in range(3):
+            parser.readKickstartFromString(ks)
+            self.assertEqual(str(handler), self.expected(ks))
+            self.assertEqual(handler.fingerprint(), handler.clone().fingerprint())
+
+            handler.reset()
+            self.assertEqual(str(handler), fresh)
+            self.assertFalse(handler.rootpw.seen)
+            self.assertEqual(handler.partition.partitions, [])
+            self.assertTrue(handler.commands["part"] is handler.partition)
+
+        parser.readKickstartFromString("graphical\n")
+        self.assertEqual(str(handler), self.expected("graphical\n"))
+
+class Reset_Clone_TestCase(Base_Pool):
+    def runTest(self):
+        base = makeVersion(self.version)
+        KickstartParser(base, unknownSectionIsFatal=False).readKickstartFromString(ks)
+
+        clone = base.clone()
+        clone.edit("rootpw").password = "other"
+        clone.edit("partition").partitions.pop()
+
+        # A clone goes back to how it was when it was cloned.
+        clone.reset()
+        self.assertEqual(str(clone), self.expected(ks))
+        self.assertEqual(str(base), self.expected(ks))
+
+class Pool_TestCase(Base_Pool):
+    def runTest(self):
+        pool = HandlerPool(size=2, parserArgs={"unknownSectionIsFatal": False})
+        pool.warm(self.version)
+        self.assertEqual(pool.free(self.version), 2)
+
+        with pool.parser(self.version) as parser:
+            self.assertEqual(pool.free(self.version), 1)
+            parser.readKickstartFromString(ks)
+            self.assertEqual(str(parser.handler), self.expected(ks))
+
+        self.assertEqual(pool.free(self.version), 2)
+
+        # A failed parse still hands the pair back, reset.
+        with self.assertRaises(KickstartParseError):
+            with pool.parser(self.version) as parser:
+                parser.readKickstartFromString("text\nbogus\n")
+
+        (handler, parser) = pool.acquire(self.version)
+        self.assertFalse(handler.displaymode.seen)
+        pool.release(handler, parser)
+
+        # Versions are kept apart, and no more than size are kept.
+        pairs = [pool.acquire("F20") for _i in range(3)]
+        self.assertEqual(pairs[0][0].version, F20)
+        for pair in pairs:
+            pool.release(*pair)
+        self.assertEqual(pool.free(F20), 2)
+        self.assertEqual(pool.free(self.version), 2)
+
+class Pool_Direct_Change_TestCase(Base_Pool):
+    def runTest(self):
+        pool = HandlerPool(size=1)
+
+        # Changes made without edit are not put back by reset, so the pair
+        # is dropped rather than handing them to the next caller.
+        (handler, parser) = pool.acquire(self.version)
+        handler.rootpw.password = "leak"
+        handler.packages.packageList.append("leaked")
+        pool.release(handler, parser)
+        self.assertEqual(pool.free(self.version), 0)
+
+        (handler, parser) = pool.acquire(self.version)
+        parser.readKickstartFromString("text\n")
+        self.assertNotIn("leak", str(handler))
+        self.assertEqual(str(handler), self.expected("text\n"))
+
+        # Changes made through edit are put back, so the pair is kept.
+        handler.edit("rootpw").password = "kept"
+        handler.edit("packages").packageList.append("kept")
+        pool.release(handler, parser)
+        self.assertEqual(pool.free(self.version), 1)
+
+        (handler, parser) = pool.acquire(self.version)
+        parser.readKickstartFromString("text\n")
+        self.assertEqual(str(handler), self.expected("text\n"))
+        pool.release(handler, parser)
+
+class Pool_Threads_TestCase(Base_Pool):
+    def runTest(self):
+        pool = HandlerPool(size=4, parserArgs={"unknownSectionIsFatal": False})
+        inputs = [ks.replace("base", "host%d" % i) for i in range(8)]
+        expected = [self.expected(s) for s in inputs]
+        failures = []
+
+        def work(n):
+            for i in range(10):
+                s = inputs[(n + i) % len(inputs)]
+                with pool.parser(self.version) as parser:
+                    parser.readKickstartFromString(s)
+                    if str(parser.handler) != expected[(n + i) % len(inputs)]:
+                        failures.append((n, i))
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(failures, [])
+        self.assertLessEqual(pool.free(self.version), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -136,5 +136,32 @@ class Multiple_Unterminated_Fails_TestCase(Multiple_Unterminated_TestCase):
     def runTest(self):
         self.assertRaises(KickstartParseError, self.parser.readKickstartFromString, self.ks)
 
+class Header_Parser_Cached_TestCase(ParserTest):
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.ks = """
+%post --log=/tmp/first
+ls /tmp
+%end
+
+%post
+ls /
+%end
+"""
+
+    def runTest(self):
+        self.parser.readKickstartFromString(self.ks)
+        self.assertEqual(len(self.handler.scripts), 2)
+
+        # Options from one header must not leak into the next one.
+        self.assertEqual(self.handler.scripts[0].logfile, "/tmp/first")
+        self.assertEqual(self.handler.scripts[1].logfile, None)
+
+        # Every instance of a section class shares the same header parser.
+        section = self.parser.getSection("%post")
+        other = section.__class__(self.handler, dataObj=section.dataObj)
+        self.assertIs(section._getCachedParser(), other._getCachedParser())
+        self.assertIsNot(section._getParser(), section._getCachedParser())
+
 if __name__ == "__main__":
     unittest.main()
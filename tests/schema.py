@@ -0,0 +1,91 @@
+import io
+import unittest
+
+from pykickstart.schema import buildSchema, checkSchema, getSchema, writeSchema
+from pykickstart.version import F16, F27, stringToVersion, versionToString
+from pykickstart.versionindex import DEPRECATED, VALID, getIndex
+
+class Consistency_TestCase(unittest.TestCase):
+    def runTest(self):
+        # If this fails, a command or option has changed without running
+        # "make schema" to regenerate pykickstart/schemadata.py.
+        self.assertEqual(checkSchema(), [])
+
+class Lookup_TestCase(unittest.TestCase):
+    def runTest(self):
+        schema = getSchema()
+
+        self.assertIn("autopart", schema.commandNames(F27))
+        self.assertEqual(schema.commandNames("F27"), schema.commandNames(F27))
+        self.assertEqual(schema.commandClass("F27", "autopart"), "F26_AutoPart")
+        self.assertIsNone(schema.commandClass("F27", "bogus"))
+        self.assertEqual(schema.aliases("F27", "part"), ["part", "partition"])
+        self.assertEqual(schema.aliases("F27", "bogus"), [])
+
+        self.assertTrue(schema.isDeprecated("F14", "interactive"))
+        self.assertFalse(schema.isDeprecated("F27", "autopart"))
+        self.assertFalse(schema.isDeprecated("F27", "bogus"))
+
+        # Options are only listed for the versions they can be used in.
+        self.assertIn("--type", schema.optionStrings("F27", "autopart"))
+        self.assertNotIn("--type", schema.optionStrings(F16, "autopart"))
+        self.assertEqual(schema.optionStrings("F27", "bogus"), [])
+
+        option = [o for o in schema.commandOptions("F27", "bootloader") if "--location" in o["names"]][0]
+        self.assertEqual(option["dest"], "location")
+        self.assertEqual(option["choices"], ("boot", "mbr", "none", "partition"))
+
+        option = [o for o in schema.classOptions("F12_Bootloader") if "--lba32" in o["names"]][0]
+        self.assertEqual(option["deprecated"], "F12")
+
+class Matches_Version_Index_TestCase(unittest.TestCase):
+    def runTest(self):
+        # The schema and pykickstart.versionindex are both worked out from
+        # the command classes, and must agree on what every version has.
+        schema = getSchema()
+        index = getIndex()
+
+        options = {}
+        for ((name, option), statuses) in index.options.items():
+            for (version, status) in statuses.items():
+                options.setdefault((version, name), {})[option] = status
+
+        for version in index.versions:
+            fromIndex = dict((name, statuses[version]) for (name, statuses) in index.names.items()
+                             if version in statuses and not index.isSection(name))
+            fromSchema = dict((name, DEPRECATED if schema.isDeprecated(version, name) else VALID)
+                              for name in schema.commandNames(version))
+            self.assertEqual(fromSchema, fromIndex, versionToString(version))
+
+            for name in fromSchema:
+                if schema.isDeprecated(version, name):
+                    self.assertEqual(schema.commandOptions(version, name), [])
+                    continue
+
+                # Like the parser, options go by the command class's version.
+                classVersion = stringToVersion(schema.classes[schema.commandClass(version, name)][1])
+
+                expected = {}
+                for option in schema.commandOptions(version, name):
+                    deprecated = option["deprecated"] is True or \
+                                 (option["deprecated"] and stringToVersion(option["deprecated"]) <= classVersion)
+                    for s in option["names"]:
+                        expected[s] = DEPRECATED if deprecated else VALID
+
+                self.assertEqual(expected, options.get((version, name), {}),
+                                 "%s %s" % (versionToString(version), name))
+
+class Write_TestCase(unittest.TestCase):
+    def runTest(self):
+        schema = buildSchema()
+        f = io.StringIO()
+        writeSchema(schema, f)
+
+        namespace = {}
+        exec(f.getvalue(), namespace)
+        self.assertEqual(namespace["COMMANDS"], schema.commands)
+        self.assertEqual(namespace["CLASSES"], schema.classes)
+        self.assertEqual(namespace["OPTIONS"], schema.options)
+
+if __name__ == "__main__":
+    unittest.main()
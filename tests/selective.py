@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from tests.baseclass import ParserTest
+
+from pykickstart.errors import KickstartParseError
+from pykickstart.parser import KickstartParser
+from pykickstart.version import F27, makeVersion
+
+ks = """text
+network --device=eth0 --hostname=host1
+url --url=http://example.com/os
+repo --name=updates --baseurl=http://example.com/updates
+part / --size=1000
+rootpw --plaintext "unbalanced
+%packages
+vim
+%end
+%pre
+echo pre
+%end
+%post
+echo post
+%end
+%addon com_example_unknown
+anything
+%end
+"""
+
+class Base_Selective(ParserTest):
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.version = F27
+
+    def parserFor(self, lst):
+        handler = makeVersion(self.version)
+        parser = KickstartParser(handler)
+        parser.maskAllExcept(lst)
+        return parser
+
+class Selective_Commands_TestCase(Base_Selective):
+    def runTest(self):
+        parser = self.parserFor(["network", "url", "repo"])
+
+        # The rootpw line can't be split, but it is never looked at, and
+        # neither is the unknown section.
+        parser.readKickstartFromString(ks)
+        handler = parser.handler
+
+        self.assertEqual(handler.network.network[0].hostname, "host1")
+        self.assertEqual(handler.url.url, "http://example.com/os")
+        self.assertEqual(handler.repo.repoList[0].name, "updates")
+        self.assertIsNone(handler.commands["part"])
+        self.assertIsNone(handler.commands["rootpw"])
+
+        self.assertEqual(handler.packages.packageList, [])
+        self.assertEqual(handler.scripts, [])
+
+        # Masking through the handler alone still splits every line.
+        handler = makeVersion(self.version)
+        handler.maskAllExcept(["network", "url", "repo"])
+        parser = KickstartParser(handler)
+        self.assertRaises(ValueError, parser.readKickstartFromString, 'rootpw --plaintext "unbalanced\n')
+
+class Selective_Sections_TestCase(Base_Selective):
+    def runTest(self):
+        parser = self.parserFor(["network", "%post"])
+        parser.readKickstartFromString(ks)
+        handler = parser.handler
+
+        self.assertEqual(handler.network.network[0].hostname, "host1")
+        self.assertEqual([s.script for s in handler.scripts], ["echo post\n"])
+        self.assertEqual(handler.packages.packageList, [])
+
+        # A skipped section must still end properly.
+        parser = self.parserFor(["network"])
+        with self.assertRaises(KickstartParseError) as cm:
+            parser.readKickstartFromString("%pre\necho pre\n")
+        self.assertIn("Section %pre does not end with %end.", str(cm.exception))
+        self.assertRaises(KickstartParseError, parser.readKickstartFromString, "%pre\necho pre\n%post\n%end\n")
+
+class Selective_Include_TestCase(Base_Selective):
+    def setUp(self):
+        Base_Selective.setUp(self)
+
+        (handle, self._path) = tempfile.mkstemp(prefix="include-", text=True)
+        os.write(handle, b"network --device=eth1 --hostname=host2\npart /home --size=10\n%pre\necho included\n%end\n")
+        os.close(handle)
+
+    def runTest(self):
+        parser = self.parserFor(["network"])
+        parser.readKickstartFromString("part / --size=1\n%%include %s\n%%post\necho post\n%%end\n" % self._path)
+
+        self.assertEqual([nd.hostname for nd in parser.handler.network.network], ["host2"])
+        self.assertEqual(parser.handler.scripts, [])
+
+    def tearDown(self):
+        Base_Selective.tearDown(self)
+        os.unlink(self._path)
+
+if __name__ == "__main__":
+    unittest.main()
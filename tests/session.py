@@ -0,0 +1,143 @@
+import unittest
+import unittest.mock as mock
+import warnings
+
+from pykickstart.parser import KickstartParser
+from pykickstart.session import KickstartSession
+from pykickstart.version import F27, makeVersion
+
+ks = """# A comment
+text
+rootpw --plaintext secret
+part / --size=1000
+partition swap --size=100
+
+%pre
+echo pre
+%end
+
+%packages
+vim
+%end
+
+%post --nochroot
+echo post
+%end
+"""
+
+class Base_Session(unittest.TestCase):
+    def setUp(self):
+        self.session = KickstartSession(makeVersion(F27))
+
+    def assertParsedAs(self, s):
+        """Is the session's handler the same as after a full parse of s?"""
+        handler = makeVersion(F27)
+        parser = KickstartParser(handler, errorsAreFatal=False)
+        parser.readKickstartFromString(s)
+
+        self.assertEqual(self.session.render(), str(handler))
+        self.assertEqual(str(self.session.handler), str(handler))
+
+class Load_TestCase(Base_Session):
+    def runTest(self):
+        self.session.load(ks)
+        self.assertEqual(str(self.session), ks)
+        self.assertEqual([e.name for e in self.session.entries],
+                         [None, "text", "rootpw", "part", "partition", None, "%pre", None, "%packages", None, "%post"])
+        self.assertEqual(self.session.lineno(6), 7)
+        self.assertEqual(self.session.lineno(10), 15)
+        self.assertParsedAs(ks)
+
+        self.session.load("")
+        self.assertEqual(self.session.entries, [])
+        self.assertParsedAs("")
+
+class Edit_TestCase(Base_Session):
+    def runTest(self):
+        self.session.load(ks)
+
+        # part and partition are the same command, so both lines are kept.
+        self.assertEqual(self.session.replace(3, "part /home --size=500"), [])
+        self.assertParsedAs(ks.replace("part / --size=1000", "part /home --size=500"))
+
+        self.session.delete(2)
+        self.assertParsedAs(str(self.session))
+        self.assertNotIn("rootpw", self.session.render())
+
+        self.session.insert(1, "rootpw --plaintext other\ntimezone America/New_York")
+        self.assertParsedAs(str(self.session))
+        self.assertEqual(self.session.lineno(3), 4)
+
+        # Only the edited script section is parsed again.
+        scripts = list(self.session.handler.scripts)
+        self.session.replace(self.session.entries.index([e for e in self.session.entries if e.name == "%post"][0]),
+                             "%post\necho changed\n%end")
+        self.assertIs(self.session.handler.scripts[0], scripts[0])
+        self.assertParsedAs(str(self.session))
+
+        self.session.append("%packages\nemacs\n%end")
+        self.assertParsedAs(str(self.session))
+        self.assertIn("emacs", self.session.handler.packages.packageList)
+
+class Errors_TestCase(Base_Session):
+    def runTest(self):
+        self.session.load(ks)
+
+        # Errors give the line in the whole file.
+        messages = self.session.insert(2, "bogus")
+        self.assertEqual(len(messages), 1)
+        self.assertIn("line 3", messages[0])
+
+        messages = self.session.append("part /var --bogus")
+        self.assertIn("line 19", messages[0])
+
+        messages = self.session.append("%post")
+        self.assertIn("%end", messages[0])
+
+        # Taking out the bad lines takes out their errors.
+        self.session.delete(len(self.session.entries) - 1)
+        self.session.delete(len(self.session.entries) - 1)
+        self.session.delete(2)
+        self.assertEqual([msg for e in self.session.entries for msg in e.messages], [])
+        self.assertParsedAs(ks)
+
+        # Warnings about the input are kept, but not other warnings.
+        messages = self.session.append("part / --size=200")
+        self.assertEqual(len(messages), 1)
+        self.assertIn("already been defined", messages[0])
+
+        with mock.patch.object(KickstartParser, "_markSource",
+                               side_effect=lambda lineno: warnings.warn("noise", DeprecationWarning)):
+            self.assertEqual(self.session.append("timezone UTC"), [])
+
+class Feed_TestCase(Base_Session):
+    def runTest(self):
+        for line in ks.splitlines():
+            if not line:
+                continue
+
+            messages = self.session.feed(line)
+            if self.session.pending:
+                self.assertIsNone(messages)
+            else:
+                self.assertEqual(messages, [])
+
+        self.assertFalse(self.session.pending)
+        self.assertParsedAs(ks)
+        self.assertEqual(len(self.session.handler.scripts), 2)
+
+class Complete_TestCase(Base_Session):
+    def runTest(self):
+        session = KickstartSession(makeVersion(F27), extraWords=[".show"])
+        self.assertEqual(session.complete("pa", 0, 2), ["part", "partition"])
+        self.assertEqual(session.complete(".s", 0, 2), [".show"])
+        self.assertIn("%packages", session.complete("%", 0, 1))
+        self.assertEqual(session.complete("part --si", 5, 9), ["--size"])
+        self.assertIn("--fstype", session.complete("part / ", 7, 7))
+        self.assertEqual(session.complete("bogus --", 6, 8), [])
+
+        session.feed("%post")
+        self.assertEqual(session.complete("pa", 0, 2), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock as mock
+from tests.baseclass import ParserTest
+
+from pykickstart.errors import KickstartParseError
+from pykickstart.parser import KickstartParser
+from pykickstart.sourcemap import SourceMap
+
+class SourceMap_TestCase(unittest.TestCase):
+    def runTest(self):
+        sm = SourceMap()
+        self.assertEqual(len(sm), 0)
+
+        top = sm.intern("top.ks")
+        frag = sm.intern("frag.ks")
+        self.assertEqual(sm.intern("top.ks"), top)
+        self.assertNotEqual(top, frag)
+        self.assertEqual(sm.fileName(frag), "frag.ks")
+
+        self.assertEqual(sm.add(top, 1), 0)
+        self.assertEqual(sm.add(frag, 12), 1)
+        self.assertEqual(sm.add(sm.intern(None), 3), 2)
+        self.assertEqual(len(sm), 3)
+
+        self.assertEqual(sm.lookup(1), ("frag.ks", 12))
+        self.assertEqual(sm.lookup(None), (None, None))
+        self.assertEqual(sm.describe(0), "line 1 of top.ks")
+        self.assertEqual(sm.describe(2), "line 3")
+
+        # Copies don't see what is added to the original afterwards.
+        new = sm.copy(2)
+        self.assertEqual(len(new), 2)
+        self.assertEqual(new.lookup(1), ("frag.ks", 12))
+        sm.add(sm.intern("other.ks"), 5)
+        self.assertEqual(len(new), 2)
+        self.assertEqual(new.intern("other.ks"), 2)
+
+        # Only the names the copied entries use are kept.
+        new = sm.copy(1)
+        self.assertEqual(new.lookup(0), ("top.ks", 1))
+        self.assertEqual(new.intern("frag.ks"), 1)
+
+        # There is room for more files than fit in two bytes.
+        sm = SourceMap()
+        for i in range(70000):
+            sm.add(sm.intern("file%d.ks" % i), i)
+        self.assertEqual(sm.lookup(69999), ("file69999.ks", 69999))
+
+class Base_SourceMap(ParserTest):
+    files = {"top.ks": "text\nrootpw --plaintext x\n\n%include frag.ks\n%post\necho\n%end\n",
+             "frag.ks": "# fragment\nnetwork --device=eth0\nnetwork --device=eth1\n\n%pre\necho\n%end\n",
+             "broken.ks": "text\n%include bad.ks\n",
+             "bad.ks": "\n\nbogus --option\n"}
+
+    def setUp(self):
+        ParserTest.setUp(self)
+        self._dir = tempfile.mkdtemp(prefix="sourcemap-")
+
+        for (name, contents) in self.files.items():
+            with open(self.path(name), "w") as f:
+                f.write(contents)
+
+    def tearDown(self):
+        ParserTest.tearDown(self)
+        shutil.rmtree(self._dir)
+
+    def path(self, name):
+        return os.path.join(self._dir, name)
+
+class Parser_SourceMap_TestCase(Base_SourceMap):
+    def runTest(self):
+        self.parser.readKickstart(self.path("top.ks"))
+        sm = self.handler.sourceMap
+
+        # Commands and data objects know which file they came from, and
+        # lineno is still the line in that file.
+        self.assertEqual(sm.lookup(self.handler.rootpw.source), (self.path("top.ks"), 2))
+        self.assertEqual([sm.lookup(nd.source) for nd in self.handler.network.network],
+                         [(self.path("frag.ks"), 2), (self.path("frag.ks"), 3)])
+        self.assertEqual(self.handler.network.network[1].lineno, 3)
+        self.assertEqual(sm.lookup(self.handler.network.source), (self.path("frag.ks"), 3))
+
+        # So do scripts.
+        self.assertEqual([sm.lookup(s.source) for s in self.handler.scripts],
+                         [(self.path("frag.ks"), 5), (self.path("top.ks"), 5)])
+
+        # A file read from a string has no name.
+        self.handler.reset()
+        self.parser.readKickstartFromString("text\n")
+        self.assertEqual(self.handler.sourceMap.lookup(self.handler.displaymode.source), (None, 1))
+
+class Error_SourceMap_TestCase(Base_SourceMap):
+    def runTest(self):
+        # Errors in an %include file say which file they are in.
+        with self.assertRaises(KickstartParseError) as cm:
+            self.parser.readKickstart(self.path("broken.ks"))
+
+        self.assertEqual(cm.exception.filename, self.path("bad.ks"))
+        self.assertEqual(cm.exception.lineno, 3)
+        self.assertTrue(str(cm.exception).startswith("In %%include file %s:\n" % self.path("bad.ks")))
+
+        # Those raised by the parser itself too.
+        with open(self.path("bad.ks"), "w") as f:
+            f.write("\n%bogus\n")
+
+        with self.assertRaises(KickstartParseError) as cm:
+            self.parser.readKickstart(self.path("broken.ks"))
+        self.assertEqual(cm.exception.filename, self.path("bad.ks"))
+        self.assertIn(self.path("bad.ks"), str(cm.exception))
+
+        # Errors in the top level file are left as they were.
+        with self.assertRaises(KickstartParseError) as cm:
+            self.parser.readKickstartFromString("text\nbogus\n")
+        self.assertIsNone(cm.exception.filename)
+        self.assertEqual(cm.exception.lineno, 2)
+        self.assertFalse(str(cm.exception).startswith("In %include"))
+
+        # Printed errors say which file they are in as well.
+        with open(self.path("bad.ks"), "w") as f:
+            f.write("bogus --option\n")
+
+        self.parser.errorsAreFatal = False
+        with mock.patch("pykickstart.parser.print") as _print:
+            self.parser.readKickstart(self.path("broken.ks"))
+        self.assertEqual(_print.call_count, 1)
+        self.assertIn(self.path("bad.ks"), str(_print.call_args[0][0]))
+
+class Handler_SourceMap_TestCase(Base_SourceMap):
+    def runTest(self):
+        self.parser.readKickstart(self.path("top.ks"))
+        self.assertEqual(len(self.handler.sourceMap), 6)
+
+        self.handler.reset()
+        self.assertEqual(len(self.handler.sourceMap), 0)
+
+        # A clone shares the entries its objects point at, and keeps them
+        # when either handler is reset.
+        self.parser.readKickstart(self.path("top.ks"))
+        clone = self.handler.clone()
+
+        self.parser.readKickstartFromString("rootpw --plaintext y\n")
+        self.assertEqual(len(self.handler.sourceMap), 7)
+        self.handler.reset()
+        self.assertEqual(len(self.handler.sourceMap), 0)
+        self.assertEqual(len(clone.sourceMap), 7)
+
+        clone.edit("rootpw")(password="z")
+        clone.reset()
+        self.assertEqual(clone.rootpw.password, "x")
+        self.assertEqual(clone.sourceMap.lookup(clone.rootpw.source), (self.path("top.ks"), 2))
+
+        # Names of files read since the clone was made don't pile up across
+        # resets.
+        for i in range(5):
+            name = self.path("other%d.ks" % i)
+            with open(name, "w") as f:
+                f.write("rootpw --plaintext y\n")
+
+            clone.reset()
+            parser = KickstartParser(clone)
+            parser.readKickstart(name)
+            self.assertEqual(clone.sourceMap.lookup(clone.rootpw.source), (name, 1))
+
+        clone.reset()
+        self.assertEqual(len(clone.sourceMap._names), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pykickstart.options import setOptionHook
+from pykickstart.stats import UsageStats, countFile, countFiles, findFiles
+from pykickstart.version import F12, F27
+
+ks = """#version=F27
+text
+rootpw --plaintext secret
+part / --size=1000
+part swap --size=100
+%packages
+@core
+vim
+%end
+%post --interpreter=/usr/bin/python
+print("hi")
+%end
+"""
+
+class Base_Stats(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp(prefix="ksstats-")
+
+    def write(self, name, contents):
+        path = os.path.join(self._tmpdir, name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        with open(path, "w") as f:
+            f.write(contents)
+
+        return path
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir)
+
+class CountFile_TestCase(Base_Stats):
+    def runTest(self):
+        stats = UsageStats()
+        countFile(stats, self.write("a.ks", ks), version=F12)
+
+        self.assertEqual(stats.files, {("F27",): 1})
+        self.assertEqual(stats.failed, {})
+        self.assertEqual(stats.commands, {("F27", "text"): 1, ("F27", "rootpw"): 1, ("F27", "part"): 1})
+
+        # Files are counted, not lines.
+        self.assertEqual(stats.options[("F27", "part", "--size")], 1)
+        self.assertEqual(stats.options[("F27", "%post", "--interpreter")], 1)
+        self.assertEqual(stats.groups, {("F27", "core"): 1})
+        self.assertEqual(stats.interpreters, {("F27", "/usr/bin/python"): 1})
+        self.assertEqual(stats.deprecated, {})
+
+        # Without a #version= line, the version given is used.
+        countFile(stats, self.write("b.ks", "bootloader --lba32\ninteractive\nbogus\n"), version=F12)
+        self.assertEqual(stats.files[("F12",)], 1)
+        self.assertEqual(stats.failed, {("F12",): 1})
+        self.assertEqual(stats.deprecated[("F12", "bootloader", "--lba32")], 1)
+
+        countFile(stats, self.write("c.ks", "#version=F27\nupgrade\n"), version=F12)
+        self.assertEqual(stats.deprecated[("F27", "upgrade", None)], 1)
+
+        countFile(stats, os.path.join(self._tmpdir, "nothere.ks"), version="F27")
+        self.assertEqual(stats.failed[("F27",)], 1)
+        self.assertEqual(stats.files[("F27",)], 3)
+
+        self.assertEqual(stats.versions(), ["F12", "F27"])
+        self.assertEqual(stats.total("files"), {(): 4})
+        self.assertEqual(stats.total("commands", "F12")[("bogus",)], 1)
+
+        # The hook is only set while parsing.
+        self.assertIsNone(setOptionHook(None))
+
+class CountFiles_TestCase(Base_Stats):
+    def runTest(self):
+        for i in range(20):
+            self.write("dir%d/%d.ks" % (i % 3, i), ks)
+        self.write("dir0/skipped.txt", ks)
+        self.write("other.cfg", "#version=F12\nbootloader --lba32\n")
+
+        paths = list(findFiles([self._tmpdir]))
+        self.assertEqual(len(paths), 21)
+        self.assertEqual(list(findFiles([self._tmpdir], patterns=["*.txt"])), [os.path.join(self._tmpdir, "dir0", "skipped.txt")])
+
+        seen = []
+        stats = countFiles(findFiles([self._tmpdir]), version=F27, processes=2, batchSize=4,
+                           callback=lambda s: seen.append(sum(s.files.values())))
+        self.assertEqual(stats.files, {("F27",): 20, ("F12",): 1})
+        self.assertEqual(stats.commands[("F27", "part")], 20)
+        self.assertEqual(stats.deprecated, {("F12", "bootloader", "--lba32"): 1})
+        self.assertEqual(len(seen), 6)
+        self.assertEqual(seen[-1], 21)
+
+        # Merging the counts made in each process gives the same answer as
+        # making them all in one.
+        single = countFiles(paths, version=F27, processes=1)
+        for field in UsageStats.fields:
+            self.assertEqual(getattr(single, field), getattr(stats, field))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import time
+import unittest
+from tests.baseclass import ParserTest
+
+from pykickstart.storage import StorageGraph, checkStorage
+from pykickstart.version import F27
+
+class Base_Storage(ParserTest):
+    ks = ""
+
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.version = F27
+
+    def errors(self, ks=None):
+        self.parser.readKickstartFromString(ks or self.ks)
+        return [str(err) for err in checkStorage(self.handler)]
+
+    def assertErrors(self, errors, expected):
+        self.assertEqual(len(errors), len(expected), errors)
+        for (err, (lineno, msg)) in zip(errors, expected):
+            self.assertIn("line %d of" % lineno, err)
+            self.assertIn(msg, err)
+
+class Storage_Valid_TestCase(Base_Storage):
+    ks = """
+part /boot --size=500
+part raid.01 --size=1000 --ondisk=sda
+part raid.02 --size=1000 --ondisk=sdb
+raid pv.01 --level=1 --device=root raid.01 raid.02
+part pv.02 --size=1000
+volgroup vg pv.01 pv.02
+logvol / --vgname=vg --name=root --size=1000
+logvol swap --vgname=vg --name=swap --size=100
+logvol swap --vgname=vg --name=swap2 --size=100
+logvol none --vgname=vg --name=pool --thinpool --size=1000
+logvol /srv --vgname=vg --name=srv --thin --poolname=pool --size=100
+logvol /old --vgname=oldvg --name=old --useexisting
+part btrfs.01 --size=1000
+part btrfs.02 --size=1000
+btrfs none --data=0 --label=f17 btrfs.01 btrfs.02
+btrfs /home --subvol --name=home LABEL=f17
+btrfs /var --subvol --name=var f17
+btrfs /data --subvol --name=data UUID=1234
+volgroup existing --useexisting
+raid /mnt --level=1 --device=data sdc1 sdd1
+"""
+
+    def runTest(self):
+        self.assertEqual(self.errors(), [])
+
+        graph = StorageGraph(self.handler)
+        self.assertEqual(sorted(graph.members.keys()),
+                         ["btrfs.01", "btrfs.02", "pv.01", "pv.02", "raid.01", "raid.02"])
+        self.assertEqual(graph.members["pv.01"].device, "root")
+        self.assertEqual(sorted(graph.volgroups.keys()), ["existing", "vg"])
+        self.assertEqual(list(graph.thinpools.keys()), [("vg", "pool")])
+        self.assertEqual(graph.btrfs["LABEL=f17"], graph.btrfs["f17"])
+
+        # Checking again gives the same answer.
+        self.assertEqual(graph.check(), [])
+
+class Storage_Undefined_TestCase(Base_Storage):
+    ks = """part raid.01 --size=1000
+raid / --level=1 --device=root raid.01 raid.02
+volgroup vg pv.01 raid.01
+logvol /home --vgname=nosuchvg --name=home --size=100
+logvol none --vgname=vg --name=pool --thinpool --size=100
+logvol /srv --vgname=vg --name=srv --thin --poolname=other --size=100
+btrfs none --label=vol btrfs.01
+btrfs /var --subvol --name=var LABEL=other
+"""
+
+    def runTest(self):
+        self.assertErrors(self.errors(),
+                          [(2, "RAID device root uses raid.02, which is not defined"),
+                           (3, "Volume group vg uses pv.01, which is not defined"),
+                           (3, "Volume group vg uses raid.01, which is not a physical volume"),
+                           (4, "Logical volume home uses volume group nosuchvg, which is not defined"),
+                           (6, "Logical volume srv uses thin pool other, which is not defined in volume group vg"),
+                           (7, "BTRFS volume vol uses btrfs.01, which is not defined"),
+                           (8, "BTRFS subvolume var uses volume LABEL=other, which is not defined")])
+
+class Storage_Duplicates_TestCase(Base_Storage):
+    ks = """part /boot --size=500
+part raid.01 --size=1000
+part raid.02 --size=1000
+raid /boot --level=1 --device=root raid.01 raid.02
+raid /data --level=1 --device=data raid.01 raid.02
+part pv.01 --size=1000
+volgroup vg pv.01
+volgroup vg2 pv.01
+logvol /data --vgname=vg --name=data --size=100
+reqpart --add-boot
+"""
+
+    def runTest(self):
+        self.assertErrors(self.errors(),
+                          [(1, "/boot is already created by reqpart --add-boot on line 10"),
+                           (4, "/boot is already defined on line 1"),
+                           (5, "RAID device data uses raid.01, which is already used on line 4"),
+                           (5, "RAID device data uses raid.02, which is already used on line 4"),
+                           (8, "Volume group vg2 uses pv.01, which is already used on line 7"),
+                           (9, "/data is already defined on line 5")])
+
+class Storage_Large_TestCase(Base_Storage):
+    def runTest(self):
+        count = 2000
+        lines = ["part pv.%d --size=100" % i for i in range(count)]
+        lines += ["volgroup vg %s" % " ".join("pv.%d" % i for i in range(count))]
+        lines += ["logvol /lv%d --vgname=vg --name=lv%d --size=10" % (i, i) for i in range(count)]
+        self.parser.readKickstartFromString("\n".join(lines) + "\n")
+
+        start = time.time()
+        self.assertEqual(checkStorage(self.handler), [])
+
+        # Checking every reference with a lookup keeps this well under a
+        # second, where comparing every pair would take minutes.
+        self.assertLess(time.time() - start, 5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import unittest.mock as mock
+from tests.baseclass import ParserTest
+
+from pykickstart.errors import KickstartError
+from pykickstart.parser import KickstartParser
+from pykickstart.template import KickstartTemplate
+from pykickstart.version import F27, makeVersion
+
+ks = """text
+rootpw --plaintext secret
+network --device=eth0 --bootproto=static --ip=10.0.0.1 --netmask=255.255.255.0 --hostname=base
+part / --size=1000
+partition /home --size=100 --grow
+part swap --recommended
+%packages
+vim
+%end
+%post
+echo 100%
+%end
+"""
+
+slots = {"hostname": ("network", "eth0", "hostname"),
+         "ip": ("network", "eth0", "ip"),
+         "password": ("rootpw", "password"),
+         "root": ("part", "/", "size"),
+         "home": ("partition", 1, "size")}
+
+class Base_Template(ParserTest):
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.version = F27
+
+    def setUp(self):
+        ParserTest.setUp(self)
+        self.ksHandler = makeVersion(self.version)
+        KickstartParser(self.ksHandler).readKickstartFromString(ks)
+
+    def expected(self, values):
+        # What str(handler) gives after setting each slot by hand.
+        template = KickstartTemplate(self.ksHandler, slots)
+        saved = dict((name, getattr(obj, attr)) for (name, (obj, attr)) in template.slots.items())
+
+        try:
+            for (name, value) in values.items():
+                (obj, attr) = template.slots[name]
+                setattr(obj, attr, value)
+
+            return str(self.ksHandler)
+        finally:
+            for (name, value) in saved.items():
+                (obj, attr) = template.slots[name]
+                setattr(obj, attr, value)
+
+class Template_Render_TestCase(Base_Template):
+    def runTest(self):
+        template = KickstartTemplate(self.ksHandler, slots)
+        self.assertEqual(template.render(), str(self.ksHandler))
+        self.assertEqual(template.values["root"], 1000)
+
+        variants = [{"hostname": "host1", "ip": "10.0.0.2", "root": 2000},
+                    {"password": "pass#word", "home": 0},
+                    {"hostname": "", "ip": None, "password": "with space"},
+                    {"root": "5000", "home": 1}]
+
+        for values in variants:
+            self.assertEqual(template.render(values), self.expected(values))
+
+        # Rendering did not change the handler, not even for a moment.
+        self.assertEqual(template.render(), str(self.ksHandler))
+        self.assertTrue("--hostname=base" in str(self.ksHandler))
+
+        rootpw = self.ksHandler.rootpw
+
+        def _setattr(obj, attr, value):
+            self.assertIsNot(obj, rootpw)
+            object.__setattr__(obj, attr, value)
+
+        with mock.patch.object(rootpw.__class__, "__setattr__", _setattr):
+            self.assertIn("rootpw --plaintext with space\n", template.render({"password": "with space"}))
+        self.assertEqual(rootpw.password, "secret")
+
+class Template_Many_TestCase(Base_Template):
+    def runTest(self):
+        template = KickstartTemplate(self.ksHandler, slots)
+
+        for i in range(200):
+            values = {"hostname": "host%d" % i, "ip": "10.0.%d.%d" % (i // 256, i % 256),
+                      "password": "secret%d" % i, "root": 1000 + i, "home": i % 3}
+            self.assertEqual(template.render(values), self.expected(values))
+
+class Template_Errors_TestCase(Base_Template):
+    def runTest(self):
+        self.assertRaises(KickstartError, KickstartTemplate, self.ksHandler, {"x": ("bogus", "attr")})
+        self.assertRaises(KickstartError, KickstartTemplate, self.ksHandler, {"x": ("part", "/var", "size")})
+        self.assertRaises(KickstartError, KickstartTemplate, self.ksHandler, {"x": ("part", 5, "size")})
+        self.assertRaises(KickstartError, KickstartTemplate, self.ksHandler, {"x": ("part", "/", "bogus")})
+        self.assertRaises(KickstartError, KickstartTemplate, self.ksHandler, {"x": ("rootpw", "/", "password")})
+        self.assertRaises(KickstartError, KickstartTemplate, self.ksHandler, {"x": ("rootpw",)})
+
+        template = KickstartTemplate(self.ksHandler, slots)
+        self.assertRaises(KickstartError, template.render, {"bogus": "value"})
+
+if __name__ == "__main__":
+    unittest.main()
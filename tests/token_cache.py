@@ -0,0 +1,64 @@
+import pickle
+import shlex
+import unittest
+from tests.baseclass import ParserTest
+
+from pykickstart.parser import KickstartParser, TokenCache
+from pykickstart.version import F20, makeVersion
+
+class TokenCache_TestCase(unittest.TestCase):
+    def runTest(self):
+        ks = """
+# comment
+network --bootproto=dhcp --hostname='my host' # trailing comment
+%post --log="/tmp/x y"
+echo "%not a section"
+%end
+"""
+        cache = TokenCache(ks)
+
+        for line in ks.splitlines(True):
+            if line.strip() and not line.startswith("#"):
+                self.assertEqual(cache.split(line, comments=True), shlex.split(line, comments=True))
+                self.assertEqual(cache.split(line), shlex.split(line))
+
+        # callers may change what they get back
+        args = cache.split("part / --size=1\n", comments=True)
+        args.append("--grow")
+        self.assertEqual(cache.split("part / --size=1\n", comments=True), ["part", "/", "--size=1"])
+
+        # lines that cannot be split raise the same error every time
+        self.assertRaises(ValueError, cache.split, "text'\n", comments=True)
+        self.assertRaises(ValueError, cache.split, "text'\n", comments=True)
+
+        cache = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(cache.split("%end\n"), ["%end"])
+
+class TokenCache_Shared_TestCase(ParserTest):
+    def __init__(self, *args, **kwargs):
+        ParserTest.__init__(self, *args, **kwargs)
+        self.ks = """
+autopart --type=lvm
+%post --nochroot
+ls /tmp
+%end
+"""
+
+    def runTest(self):
+        cache = TokenCache(self.ks)
+        rendered = []
+
+        # The same cache gives the same results as parsing without one, for
+        # more than one version.
+        for version in [F20, self.version]:
+            for tokenCache in [None, cache]:
+                handler = makeVersion(version)
+                parser = KickstartParser(handler, tokenCache=tokenCache)
+                parser.readKickstartFromString(self.ks)
+                rendered.append(str(handler))
+
+        self.assertEqual(rendered[0], rendered[1])
+        self.assertEqual(rendered[2], rendered[3])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+from unittest import TestCase
+from tools import ksdiff
+from tests.tools.utils import mktempfile
+
+class No_Parameters_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksdiff.main([])
+        self.assertEqual(retval, 2)
+        self.assertTrue("usage:" in " ".join(messages))
+
+class Help_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksdiff.main(["--help"])
+        self.assertEqual(retval, 0)
+        self.assertTrue(any("--followincludes" in line for line in messages))
+
+class KS_Diff_TestCase(TestCase):
+    def setUp(self):
+        super(KS_Diff_TestCase, self).setUp()
+        self._old_path = mktempfile("text\npart / --size=100\npart /home --size=10\n")
+        self._same_path = mktempfile("partition /home --size=10\ntext\npart / --size=100\n")
+        self._new_path = mktempfile("text\npart / --size=200\n")
+        self._bad_path = mktempfile("bogus\n")
+
+    def runTest(self):
+        retval, out = ksdiff.main([self._old_path, self._same_path])
+        self.assertEqual(retval, 0)
+        self.assertEqual(out, [])
+
+        retval, out = ksdiff.main([self._old_path, self._new_path])
+        self.assertEqual(retval, 1)
+        self.assertEqual(out, ["~ part /", "    ~ --size: 100 -> 200", "- part /home", "    - --size=10",
+                               "    - mountpoint=/home"])
+
+        retval, out = ksdiff.main([self._old_path, self._bad_path])
+        self.assertEqual(retval, 2)
+        self.assertTrue(self._bad_path in out[0])
+
+        retval, out = ksdiff.main(["-v", "RHEL99", self._old_path, self._new_path])
+        self.assertEqual(retval, 2)
+
+    def tearDown(self):
+        super(KS_Diff_TestCase, self).tearDown()
+        for path in [self._old_path, self._same_path, self._new_path, self._bad_path]:
+            os.unlink(path)
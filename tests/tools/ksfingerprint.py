@@ -0,0 +1,52 @@
+import os
+from unittest import TestCase
+from tools import ksfingerprint
+from tests.tools.utils import mktempfile
+
+class No_Parameters_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksfingerprint.main([])
+        self.assertEqual(retval, 1)
+        self.assertTrue("usage:" in " ".join(messages))
+
+class Help_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksfingerprint.main(["--help"])
+        self.assertEqual(retval, 0)
+        self.assertTrue(any("--files-from" in line for line in messages))
+
+class KS_Fingerprint_TestCase(TestCase):
+    def setUp(self):
+        super(KS_Fingerprint_TestCase, self).setUp()
+        self._paths = [mktempfile("text\nautopart\n%packages\nvim\n@core\n%end\n"),
+                       mktempfile("autopart\n\ntext\n%packages\n@core\nvim\n%end\n"),
+                       mktempfile("autopart\ntext\n%packages\n@core\nvim\n%end\n"),
+                       mktempfile("graphical\nautopart\n")]
+        self._bad_path = mktempfile("bogus\n")
+        self._list_path = mktempfile("\n".join(self._paths[2:]) + "\n")
+
+    def runTest(self):
+        (classes, errors) = ksfingerprint.groupFiles(self._paths + [self._bad_path], processes=2)
+        self.assertEqual(sorted(classes.values()), sorted([sorted(self._paths[:3]), self._paths[3:]]))
+        self.assertEqual(list(errors.keys()), [self._bad_path])
+
+        # The same answer without a pool.
+        self.assertEqual(ksfingerprint.groupFiles(self._paths, processes=1)[0], classes)
+
+        retval, out = ksfingerprint.main(self._paths[:2] + ["-f", self._list_path])
+        self.assertEqual(retval, 0)
+        self.assertTrue(out[0].endswith("(3 files)"))
+        self.assertEqual(out[1:4], ["    %s" % p for p in sorted(self._paths[:3])])
+        self.assertEqual(len(out), 6)
+
+        retval, out = ksfingerprint.main([self._bad_path])
+        self.assertEqual(retval, 1)
+        self.assertTrue(out[0].startswith(self._bad_path + ": "))
+
+        retval, out = ksfingerprint.main(["-v", "RHEL99", self._bad_path])
+        self.assertEqual(retval, 1)
+
+    def tearDown(self):
+        super(KS_Fingerprint_TestCase, self).tearDown()
+        for path in self._paths + [self._bad_path, self._list_path]:
+            os.unlink(path)
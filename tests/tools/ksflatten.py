@@ -0,0 +1,109 @@
+import io
+import os
+import shutil
+import stat
+import tempfile
+import unittest.mock as mock
+from unittest import TestCase
+from tools import ksflatten
+
+class No_Parameters_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksflatten.main([])
+        self.assertEqual(retval, 1)
+        self.assertEqual(messages, ["Need to specify a config to flatten"])
+
+class Help_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksflatten.main(["--help"])
+        self.assertEqual(retval, 0)
+        self.assertTrue(any("--output-dir" in line for line in messages))
+
+class Base_Flatten(TestCase):
+    def setUp(self):
+        super(Base_Flatten, self).setUp()
+        self._tmpdir = tempfile.mkdtemp(prefix="ksflatten-")
+        self._outdir = os.path.join(self._tmpdir, "out")
+        os.mkdir(self._outdir)
+
+        for (name, contents) in [("common.ks", "text\n"),
+                                 ("a.ks", "%%include %s\nrootpw --plaintext a\n" % self.path("common.ks")),
+                                 ("b.ks", "%%include %s\nrootpw --plaintext b\n" % self.path("common.ks")),
+                                 ("bad.ks", "bogus\n")]:
+            with open(self.path(name), "w") as f:
+                f.write(contents)
+
+    def path(self, name):
+        return os.path.join(self._tmpdir, name)
+
+    def output(self, name):
+        with open(os.path.join(self._outdir, name)) as f:
+            return f.read()
+
+    def tearDown(self):
+        super(Base_Flatten, self).tearDown()
+        shutil.rmtree(self._tmpdir)
+
+class Flatten_One_TestCase(Base_Flatten):
+    def runTest(self):
+        output = os.path.join(self._outdir, "a.ks")
+        retval, messages = ksflatten.main(["-c", self.path("a.ks"), "-o", output])
+        self.assertEqual(retval, 0)
+        self.assertEqual(messages, [])
+        self.assertIn("text", self.output("a.ks"))
+        self.assertIn("rootpw --plaintext a", self.output("a.ks"))
+        self.assertNotIn("%include", self.output("a.ks"))
+
+        # The file gets the usual permissions, and no temporary file is left.
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(output).st_mode), 0o666 & ~umask)
+        self.assertEqual(os.listdir(self._outdir), ["a.ks"])
+
+        with mock.patch("sys.stdout", new=io.StringIO()) as stdout:
+            retval, messages = ksflatten.main([self.path("b.ks")])
+        self.assertEqual(retval, 0)
+        self.assertIn("rootpw --plaintext b", stdout.getvalue())
+
+        retval, messages = ksflatten.main([self.path("bad.ks")])
+        self.assertEqual(retval, 1)
+        self.assertIn("Failed to parse kickstart file", messages[0])
+
+        retval, messages = ksflatten.main(["-v", "RHEL99", self.path("a.ks")])
+        self.assertEqual(retval, 1)
+
+class Flatten_Many_TestCase(Base_Flatten):
+    def runTest(self):
+        for jobs in ["1", "2"]:
+            retval, messages = ksflatten.main(["-j", jobs, "-d", self._outdir,
+                                               self.path("a.ks"), self.path("b.ks"), self.path("bad.ks")])
+            self.assertEqual(retval, 1)
+            self.assertEqual(len(messages), 1)
+            self.assertIn("bad.ks", messages[0])
+
+            self.assertEqual(sorted(os.listdir(self._outdir)), ["a.ks", "b.ks"])
+            self.assertIn("rootpw --plaintext a", self.output("a.ks"))
+            self.assertIn("rootpw --plaintext b", self.output("b.ks"))
+            self.assertIn("text", self.output("b.ks"))
+
+            for name in os.listdir(self._outdir):
+                os.unlink(os.path.join(self._outdir, name))
+
+        # fail - more than one file needs somewhere to put them
+        retval, messages = ksflatten.main([self.path("a.ks"), self.path("b.ks")])
+        self.assertEqual(retval, 1)
+
+        # fail - the files would be written over each other
+        os.mkdir(self.path("sub"))
+        shutil.copy(self.path("a.ks"), self.path("sub"))
+        retval, messages = ksflatten.main(["-d", self._outdir, self.path("a.ks"), os.path.join(self.path("sub"), "a.ks")])
+        self.assertEqual(retval, 1)
+        self.assertEqual(messages, ["More than one config is named a.ks"])
+
+        # fail - no such directory
+        retval, messages = ksflatten.main(["-d", self.path("nothere"), self.path("a.ks")])
+        self.assertEqual(retval, 1)
+
+        # fail - only one place to write to
+        retval, messages = ksflatten.main(["-d", self._outdir, "-o", self.path("out.ks"), self.path("a.ks")])
+        self.assertEqual(retval, 1)
@@ -0,0 +1,49 @@
+import os
+from unittest import TestCase
+from tools import ksinfer
+from tests.tools.utils import mktempfile
+
+class No_Parameters_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksinfer.main([])
+        self.assertEqual(retval, 1)
+        self.assertTrue("usage:" in " ".join(messages))
+
+class Help_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksinfer.main(["--help"])
+        self.assertEqual(retval, 0)
+        self.assertTrue(any("--verbose" in line for line in messages))
+
+class Nonexistent_KS_File_TestCase(TestCase):
+    def runTest(self):
+        retval, out = ksinfer.main(["/foo/bar/baz/ks.cfg"])
+        self.assertNotEqual(retval, 0)
+        self.assertTrue("No such file or directory" in " ".join(out))
+
+class KS_Infer_TestCase(TestCase):
+    def setUp(self):
+        super(KS_Infer_TestCase, self).setUp()
+        self._ks_path = mktempfile("autopart --type=lvm\n%packages --excludeWeakdeps\n%end\n")
+        self._bad_path = mktempfile("bogus --command\n")
+
+    def runTest(self):
+        retval, out = ksinfer.main([self._ks_path])
+        self.assertEqual(retval, 0)
+        self.assertEqual(out, ["Minimum version: F24", "Maximum version: F27",
+                               "Compatible versions: F24-F27"])
+
+        retval, out = ksinfer.main(["--verbose", self._ks_path])
+        self.assertEqual(retval, 0)
+        self.assertEqual(out[3:], ["line 1: autopart --type is valid in F17-F27, RHEL7",
+                                   "line 2: %packages --excludeWeakdeps is valid in F24-F27"])
+
+        retval, out = ksinfer.main(["-V", self._bad_path])
+        self.assertEqual(retval, 1)
+        self.assertEqual(out, ["No version of kickstart syntax supports this file.",
+                               "line 1: bogus is valid in no version"])
+
+    def tearDown(self):
+        super(KS_Infer_TestCase, self).tearDown()
+        os.unlink(self._ks_path)
+        os.unlink(self._bad_path)
@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from tools import ksstats
+from tests.tools.utils import mktempfile
+
+class No_Parameters_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksstats.main([])
+        self.assertEqual(retval, 1)
+        self.assertTrue("usage:" in " ".join(messages))
+
+class Help_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksstats.main(["--help"])
+        self.assertEqual(retval, 0)
+        self.assertTrue(any("--by-version" in line for line in messages))
+
+class KS_Stats_TestCase(TestCase):
+    def setUp(self):
+        super(KS_Stats_TestCase, self).setUp()
+        self._tmpdir = tempfile.mkdtemp(prefix="ksstats-")
+        for (name, contents) in [("a.ks", "#version=F27\ntext\npart / --size=1000\n"),
+                                 ("b.ks", "#version=F27\ntext\n"),
+                                 ("c.cfg", "#version=F12\nbootloader --lba32\n")]:
+            with open(os.path.join(self._tmpdir, name), "w") as f:
+                f.write(contents)
+
+        self._list_path = mktempfile(os.path.join(self._tmpdir, "a.ks") + "\n")
+
+    def runTest(self):
+        retval, out = ksstats.main(["-j", "1", self._tmpdir])
+        self.assertEqual(retval, 0)
+        self.assertEqual(out[0], "3 files, 0 with errors")
+        self.assertIn("    F27                                   2", out)
+        self.assertIn("    text                                  2   66.7%", out)
+        self.assertIn("Deprecated commands and options:", out)
+        self.assertIn("    bootloader --lba32                    1   33.3%", out)
+
+        retval, out = ksstats.main(["-j", "1", "-n", "1", "-b", "-p", "*.ks", self._tmpdir, "-f", self._list_path])
+        self.assertEqual(retval, 0)
+        self.assertEqual(out[0], "3 files, 0 with errors")
+        self.assertIn("F27: 3 files, 0 with errors", out)
+        self.assertNotIn("Deprecated commands and options:", out)
+        self.assertIn("    text                                  3  100.0%", out)
+        self.assertNotIn("    part                                  2   66.7%", out)
+
+        retval, out = ksstats.main(["-f", "/nothere"])
+        self.assertEqual(retval, 1)
+
+        retval, out = ksstats.main(["-v", "RHEL99", self._tmpdir])
+        self.assertEqual(retval, 1)
+
+    def tearDown(self):
+        super(KS_Stats_TestCase, self).tearDown()
+        shutil.rmtree(self._tmpdir)
+        os.unlink(self._list_path)
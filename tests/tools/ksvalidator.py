@@ -1,18 +1,15 @@
 import re
 import os
+import shutil
+import subprocess
+import sys
 import tempfile
 from unittest import TestCase
 import unittest.mock as mock
 from tools import ksvalidator
 from pykickstart import parser
 from tests.tools.utils import mktempfile
-from pykickstart.version import versionMap
-
-class Remove_Non_Existing_File_TestCase(TestCase):
-    def runTest(self):
-        destdir = tempfile.mkdtemp("", "ksvalidator-test-tmp-", "/tmp")
-        # no exception should be raised
-        ksvalidator.cleanup(destdir, "/non/existing/file")
+from pykickstart.version import F16, F17, RHEL3, RHEL7, makeVersion, versionMap, versionRanges, versionToString
 
 class No_Parameters_TestCase(TestCase):
     """
@@ -24,6 +21,16 @@ class No_Parameters_TestCase(TestCase):
         self.assertNotEqual(retval, 0)
         self.assertTrue("usage:" in " ".join(messages))
 
+class Light_Imports_TestCase(TestCase):
+    """
+        Nothing parsing needs is imported until ksvalidator knows it isn't
+        handing the file to ksvalidatord.
+    """
+    def runTest(self):
+        code = "import sys; import tools.ksvalidator; print(sorted(m for m in sys.modules if m.startswith('pykickstart')))"
+        out = subprocess.check_output([sys.executable, "-c", code]).decode("utf-8")
+        self.assertEqual(out.strip(), "['pykickstart', 'pykickstart.daemonclient', 'pykickstart.i18n']")
+
 class Show_Param_Help_TestCase(TestCase):
     """
     Help with specified command line options should be printed
@@ -32,10 +39,15 @@ class Show_Param_Help_TestCase(TestCase):
     def runTest(self):
         expected_pos_args = {"ksfile"}
         expected_opt_args = {("-h", "--help"),
+                             ("-a", "--all-versions"),
+                             ("-d", "--daemon"),
                              ("-e", "--firsterror"),
                              ("-i", "--followincludes"),
                              ("-l", "--listversions"),
-                             ("-v", "--version")}
+                             ("-m", "--memory"),
+                             ("-s", "--storage"),
+                             ("-v", "--version"),
+                             ("-w", "--watch")}
         retval, messages = ksvalidator.main(["--help"])
         pos_args = set()
         opt_args = set()
@@ -55,7 +67,7 @@ class Show_Param_Help_TestCase(TestCase):
                 if pos_arg:
                     pos_args.add(pos_arg.group(0))
             if opt:
-                opt_arg = tuple(re.findall("--?[a-zA-Z]+", line))
+                opt_arg = tuple(re.findall("--?[a-zA-Z]+(?:-[a-zA-Z]+)*", line))
                 if opt_arg:
                     opt_args.add(opt_arg)
 
@@ -138,6 +150,101 @@ class KS_With_Include_TestCase(TestCase):
         os.unlink(self._include_path)
 
 
+class KS_With_Relative_Include_TestCase(TestCase):
+    def setUp(self):
+        super(KS_With_Relative_Include_TestCase, self).setUp()
+        self._tmpdir = tempfile.mkdtemp(prefix="ksvalidator-include-")
+        with open(os.path.join(self._tmpdir, "part.ks"), "w") as f:
+            f.write("unknown_command --foo=bar\n")
+        self._ks_path = os.path.join(self._tmpdir, "ks.cfg")
+        with open(self._ks_path, "w") as f:
+            f.write("autopart --type=lvm\n%include part.ks\n")
+
+    @mock.patch.object(parser, 'print', create=True)
+    def runTest(self, _print):
+        # Nothing is copied anywhere, and the include is found next to the
+        # original file.
+        with mock.patch.object(tempfile, 'mkdtemp', side_effect=AssertionError), \
+             mock.patch.object(tempfile, 'mkstemp', side_effect=AssertionError):
+            retval, out = ksvalidator.main(["-i", self._ks_path])
+
+        self.assertEqual(_print.call_count, 1)
+        self.assertTrue("unknown_command" in str(_print.call_args[0][0]))
+        self.assertNotEqual(retval, 0)
+
+    def tearDown(self):
+        super(KS_With_Relative_Include_TestCase, self).tearDown()
+        shutil.rmtree(self._tmpdir)
+
+
+class KS_All_Versions_TestCase(TestCase):
+    def setUp(self):
+        super(KS_All_Versions_TestCase, self).setUp()
+        self._ks_path = mktempfile("autopart --type=lvm\n%packages\nvim\n%end\n")
+
+    def runTest(self):
+        retval, out = ksvalidator.main(["--all-versions", self._ks_path])
+        self.assertEqual(retval, 0)
+
+        # the result is the same as checking each version on its own
+        versions = sorted(set(versionMap.values()))
+        single = dict((v, ksvalidator.main(["-e", "-v", versionToString(v, skipDevel=True), self._ks_path]))
+                      for v in versions)
+        compatible = [v for v in versions if single[v][0] == 0]
+
+        self.assertEqual(out[0], "Compatible versions: %s" % ", ".join(versionRanges(compatible)))
+        self.assertIn(F17, compatible)
+        self.assertIn(RHEL7, compatible)
+        self.assertNotIn(F16, compatible)
+
+        # one first error for each incompatible version
+        self.assertEqual(len(out), 1 + len(versions) - len(compatible))
+        self.assertTrue(out[1].startswith("%s: " % versionToString(RHEL3)))
+        self.assertTrue(any(line.startswith("F16: ") and "--type=lvm" in line for line in out))
+
+        for (v, line) in zip([v for v in versions if v not in compatible], out[1:]):
+            self.assertEqual(line, "%s: %s" % (versionToString(v, skipDevel=True), single[v][1][0]))
+
+    def tearDown(self):
+        super(KS_All_Versions_TestCase, self).tearDown()
+        os.unlink(self._ks_path)
+
+
+class KS_Memory_Report_TestCase(TestCase):
+    def setUp(self):
+        super(KS_Memory_Report_TestCase, self).setUp()
+        self._ks_path = mktempfile("autopart\n%packages\nvim\n%end\n")
+
+    def runTest(self):
+        retval, out = ksvalidator.main([self._ks_path, "--memory"])
+        self.assertEqual(retval, 0)
+        self.assertTrue("Memory usage for %s:" % self._ks_path in out)
+        self.assertTrue(any("rendered output" in line for line in out))
+
+        # No report without the option.
+        retval, out = ksvalidator.main([self._ks_path])
+        self.assertEqual(out, [])
+
+        # The file is parsed once, with its %ksappend lines filled in.
+        appended = mktempfile("%%ksappend %s\nrootpw --plaintext secret\n" % self._ks_path)
+        try:
+            with mock.patch.object(parser.KickstartParser, "readKickstartFromString",
+                                   autospec=True, side_effect=parser.KickstartParser.readKickstartFromString) as read:
+                retval, out = ksvalidator.main([appended, "--memory"])
+            self.assertEqual(retval, 0)
+            self.assertEqual(read.call_count, 1)
+            self.assertIn("autopart", read.call_args[0][1])
+        finally:
+            os.unlink(appended)
+
+        retval, out = ksvalidator.main([self._ks_path, "--memory", "--storage"])
+        self.assertEqual(retval, 0)
+
+    def tearDown(self):
+        super(KS_Memory_Report_TestCase, self).tearDown()
+        os.unlink(self._ks_path)
+
+
 class Nonexistent_KS_File_TestCase(TestCase):
     def runTest(self):
         retval, out = ksvalidator.main(["/foo/bar/baz/ks.cfg"])
@@ -227,7 +334,7 @@ class Raise_DeprecationWarning_TestCase(TestCase):
         ks_content = "text"
         self._ks_path = mktempfile(ks_content)
 
-    @mock.patch.object(parser.KickstartParser, 'readKickstart')
+    @mock.patch.object(parser.KickstartParser, 'readKickstartFromString')
     def runTest(self, _mock):
         _mock.side_effect = DeprecationWarning('Raised by test')
         retval, out = ksvalidator.main([self._ks_path, "-v", "F10"])
@@ -237,3 +344,84 @@ class Raise_DeprecationWarning_TestCase(TestCase):
     def tearDown(self):
         super(self.__class__, self).tearDown()
         os.unlink(self._ks_path)
+
+class KS_Storage_TestCase(TestCase):
+    def setUp(self):
+        super(KS_Storage_TestCase, self).setUp()
+        self._ks_path = mktempfile("part pv.01 --size=1000\n"
+                                   "logvol / --vgname=vg --name=root --size=100\n"
+                                   "logvol /home --vgname=vg --name=home --size=100\n")
+
+    def runTest(self):
+        # Without the option, the file is fine.
+        retval, out = ksvalidator.main([self._ks_path])
+        self.assertEqual(retval, 0)
+
+        retval, out = ksvalidator.main(["--storage", self._ks_path])
+        self.assertEqual(retval, 2)
+        self.assertEqual(len(out), 2)
+        self.assertTrue("volume group vg, which is not defined" in out[0])
+
+        retval, out = ksvalidator.main(["-s", "-e", self._ks_path])
+        self.assertEqual(retval, 1)
+        self.assertEqual(len(out), 1)
+
+    def tearDown(self):
+        super(KS_Storage_TestCase, self).tearDown()
+        os.unlink(self._ks_path)
+
+class KS_Watch_TestCase(TestCase):
+    def setUp(self):
+        super(KS_Watch_TestCase, self).setUp()
+        self._tmpdir = tempfile.mkdtemp(prefix="ksvalidator-watch-")
+        with open(os.path.join(self._tmpdir, "good.ks"), "w") as f:
+            f.write("%include frag.ks\n")
+        with open(os.path.join(self._tmpdir, "frag.ks"), "w") as f:
+            f.write("autopart\n")
+        with open(os.path.join(self._tmpdir, "bad.ks"), "w") as f:
+            f.write("bogus\n")
+        with open(os.path.join(self._tmpdir, "script.ks"), "w") as f:
+            f.write("%post\necho script\n%include script-frag.ks\n%end\n")
+        with open(os.path.join(self._tmpdir, "script-frag.ks"), "w") as f:
+            f.write("echo frag\n")
+
+    def runTest(self):
+        calls = []
+        with mock.patch("pykickstart.pool.makeVersion", wraps=makeVersion) as _makeVersion:
+            watcher = ksvalidator.watch(self._tmpdir, "F27", interval=0, iterations=2, callback=calls.append)
+
+        # One handler did for every file.
+        self.assertEqual(_makeVersion.call_count, 1)
+        self.assertEqual(len(calls), 1)
+        results = calls[0]
+        self.assertEqual(sorted(results.keys()), [os.path.join(self._tmpdir, "bad.ks"),
+                                                  os.path.join(self._tmpdir, "good.ks"),
+                                                  os.path.join(self._tmpdir, "script.ks")])
+        self.assertIsNone(results[os.path.join(self._tmpdir, "good.ks")])
+        self.assertIsNone(results[os.path.join(self._tmpdir, "script.ks")])
+        self.assertIn("bogus", results[os.path.join(self._tmpdir, "bad.ks")])
+        self.assertEqual(watcher.results, results)
+
+        # The parser follows a %include in a script section, so a change to
+        # what it includes is found in the file including it.
+        frag = os.path.join(self._tmpdir, "script-frag.ks")
+        with open(frag, "w") as f:
+            f.write("%end\nbogus_command here\n%post\n")
+        st = os.stat(frag)
+        os.utime(frag, (st.st_atime, st.st_mtime + 10))
+
+        changed = watcher.poll()
+        self.assertEqual(list(changed.keys()), [os.path.join(self._tmpdir, "script.ks")])
+        self.assertIn("bogus_command", changed[os.path.join(self._tmpdir, "script.ks")])
+
+        with mock.patch("tools.ksvalidator.print") as _print:
+            ksvalidator.printResults(results)
+            self.assertIn("%s: OK" % os.path.join(self._tmpdir, "good.ks"),
+                          [args[0] for (args, _kwargs) in _print.call_args_list])
+
+        retval, out = ksvalidator.main(["--watch", self._tmpdir, "-v", "RHEL99"])
+        self.assertEqual(retval, 1)
+
+    def tearDown(self):
+        super(KS_Watch_TestCase, self).tearDown()
+        shutil.rmtree(self._tmpdir)
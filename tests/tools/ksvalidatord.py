@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import TestCase
+import unittest.mock as mock
+from tools import ksvalidator, ksvalidatord
+from tests.tools.utils import mktempfile
+
+class Help_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksvalidatord.main(["--help"])
+        self.assertEqual(retval, 0)
+        self.assertTrue(any("--pool-size" in line for line in messages))
+
+class Bad_Version_TestCase(TestCase):
+    def runTest(self):
+        retval, messages = ksvalidatord.main(["-v", "RHEL99"])
+        self.assertEqual(retval, 1)
+        self.assertIn("RHEL99", messages[0])
+
+class Daemon_TestCase(TestCase):
+    def setUp(self):
+        super(Daemon_TestCase, self).setUp()
+        self._tmpdir = tempfile.mkdtemp(prefix="ksvalidatord-")
+        self._socket = os.path.join(self._tmpdir, "sock")
+        self._ks_path = mktempfile("text\nbogus\n")
+
+    def runTest(self):
+        retval, messages = ksvalidatord.main(["-s", self._socket, "--stop"])
+        self.assertEqual(retval, 1)
+
+        # Without a server the file is checked here.
+        retval, messages = ksvalidator.main(["--daemon", self._socket, "-v", "F27", self._ks_path])
+        self.assertEqual(retval, 1)
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(ksvalidatord.main(["-s", self._socket, "-v", "F27"])))
+        thread.start()
+
+        for _i in range(100):
+            if os.path.exists(self._socket):
+                break
+            time.sleep(0.1)
+
+        with mock.patch("tools.ksvalidator.print") as _print:
+            with mock.patch("pykickstart.parser.KickstartParser") as _parser:
+                retval, messages = ksvalidator.main(["--daemon", self._socket, "-v", "F27", self._ks_path])
+                self.assertFalse(_parser.called)
+        self.assertEqual(retval, 1)
+        self.assertIn("bogus", str(_print.call_args))
+
+        retval, messages = ksvalidator.main(["--daemon", self._socket, "-e", "-v", "F27", self._ks_path])
+        self.assertEqual(retval, 1)
+        self.assertIn("bogus", messages[0])
+
+        retval, messages = ksvalidatord.main(["-s", self._socket, "--stop"])
+        self.assertEqual(retval, 0)
+        thread.join(30)
+        self.assertEqual(results, [(0, [])])
+
+    def tearDown(self):
+        super(Daemon_TestCase, self).tearDown()
+        shutil.rmtree(self._tmpdir)
+        os.unlink(self._ks_path)
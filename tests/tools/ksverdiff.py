@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from tools import ksverdiff
+
+class Base_Ksverdiff(TestCase):
+    def setUp(self):
+        super(Base_Ksverdiff, self).setUp()
+        self._tmpdir = tempfile.mkdtemp(prefix="ksverdiff-")
+        self._cache = os.path.join(self._tmpdir, "index.json")
+
+    def tearDown(self):
+        super(Base_Ksverdiff, self).tearDown()
+        shutil.rmtree(self._tmpdir)
+
+class Help_TestCase(Base_Ksverdiff):
+    def runTest(self):
+        retval, messages = ksverdiff.main(["--help"])
+        self.assertEqual(retval, 0)
+        self.assertTrue(any("--range" in line for line in messages))
+
+        retval, messages = ksverdiff.main(["--listversions"])
+        self.assertEqual(retval, 0)
+        self.assertIn("F27", messages)
+
+class Bad_Versions_TestCase(Base_Ksverdiff):
+    def runTest(self):
+        retval, messages = ksverdiff.main(["-f", "F26"])
+        self.assertEqual(retval, 1)
+        self.assertEqual(messages, ["You must specify two syntax versions."])
+
+        retval, messages = ksverdiff.main(["-f", "F26", "-t", "RHEL99", "-c", self._cache])
+        self.assertEqual(retval, 1)
+        self.assertEqual(messages, ["The version RHEL99 is not supported by pykickstart"])
+
+class Diff_TestCase(Base_Ksverdiff):
+    def runTest(self):
+        retval, messages = ksverdiff.main(["-f", "F26", "-t", "F27", "-c", self._cache])
+        self.assertEqual(retval, 0)
+        self.assertEqual(messages, ["The following commands were removed in F27:", "",
+                                    "The following commands were deprecated in F27:", "",
+                                    "The following commands were added in F27:", "",
+                                    "",
+                                    "The following options were added to the repo command in F27:", "--metalink",
+                                    "",
+                                    "The following options were added to the url command in F27:", "--metalink",
+                                    ""])
+        self.assertTrue(os.path.exists(self._cache))
+
+        retval, messages = ksverdiff.main(["-f", "F8", "-t", "F14", "-c", self._cache])
+        self.assertEqual(retval, 0)
+        self.assertIn("interactive", messages[3].split())
+
+class Range_TestCase(Base_Ksverdiff):
+    def runTest(self):
+        retval, messages = ksverdiff.main(["-f", "F24", "-t", "F27", "-r", "-c", self._cache])
+        self.assertEqual(retval, 0)
+        self.assertEqual([line for line in messages if line.startswith("Changes")],
+                         ["Changes from F24 to F25:", "Changes from F25 to F26:", "Changes from F26 to F27:"])
+
+        retval, reverse = ksverdiff.main(["-f", "F27", "-t", "F24", "-r", "-c", self._cache])
+        self.assertEqual(reverse[0], "Changes from F27 to F26:")
+        self.assertIn("The following options were removed from the url command in F26:", reverse)
+
+class Range_Families_TestCase(Base_Ksverdiff):
+    def runTest(self):
+        # RHEL7 is numbered between F21 and F22, but isn't part of a Fedora
+        # range.
+        retval, messages = ksverdiff.main(["-f", "F20", "-t", "F22", "-r", "-c", self._cache])
+        self.assertEqual(retval, 0)
+        self.assertEqual([line for line in messages if line.startswith("Changes")],
+                         ["Changes from F20 to F21:", "Changes from F21 to F22:"])
+
+        retval, messages = ksverdiff.main(["-f", "RHEL6", "-t", "RHEL7", "-r", "-c", self._cache])
+        self.assertEqual(retval, 0)
+        self.assertEqual([line for line in messages if line.startswith("Changes")],
+                         ["Changes from RHEL6 to RHEL7:"])
+
+        retval, messages = ksverdiff.main(["-f", "F20", "-t", "RHEL7", "-r", "-c", self._cache])
+        self.assertEqual(retval, 1)
+        self.assertEqual(messages, ["A range must be between two Fedora or two RHEL versions."])
@@ -164,6 +164,13 @@ class StringToVersion_TestCase(CommandTest):
             self.assertEqual(stringToVersion("Red Hat Enterprise Linux Server 7.%s" % MINOR), RHEL7)
         self.assertEqual(stringToVersion("RHEL7"), RHEL7)
 
+class VersionRanges_TestCase(CommandTest):
+    def runTest(self):
+        self.assertEqual(versionRanges([]), [])
+        self.assertEqual(versionRanges([F24, F25, RHEL7, F27]), ["F24-F25", "F27", "RHEL7"])
+        self.assertEqual(versionRanges([F21, F22]), ["F21-F22"])
+        self.assertEqual(versionRanges([RHEL6, RHEL7, FC3]), ["FC3", "RHEL6-RHEL7"])
+
 class VersionToString_TestCase(CommandTest):
     def runTest(self):
 
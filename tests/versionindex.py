@@ -0,0 +1,212 @@
+import os
+import shutil
+import tempfile
+import unittest
+import warnings
+
+import six
+
+from pykickstart.errors import KickstartError
+from pykickstart.parser import KickstartParser
+from pykickstart.version import FC3, F8, F14, F17, F24, F26, F27, RHEL6, RHEL7, makeVersion
+from pykickstart.base import DeprecatedCommand
+from pykickstart.versionindex import DEPRECATED, VALID, actionStatus, buildIndex, cachedIndex, diffVersions, dumpIndex, getIndex, inferVersions, loadIndex
+
+def _parses(ks, version):
+    handler = makeVersion(version)
+    parser = KickstartParser(handler)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        try:
+            parser.readKickstartFromString(ks)
+        except (KickstartError, DeprecationWarning):
+            return False
+
+    return True
+
+class VersionIndex_TestCase(unittest.TestCase):
+    def runTest(self):
+        index = getIndex()
+        self.assertIs(index, getIndex())
+
+        self.assertEqual(index.versionRange("autopart"), (min(index.versions), max(index.versions)))
+        self.assertEqual(index.versionRange("autopart", "--type"), (F17, F27))
+        self.assertTrue(RHEL7 in index.optionVersions("autopart", "--type"))
+        self.assertEqual(index.versionRange("%packages", "--excludeWeakdeps"), (F24, F27))
+        self.assertEqual(index.versionRange("nosuchcommand"), (None, None))
+
+        # aliases are indexed under both names
+        self.assertEqual(index.options[("part", "--size")], index.options[("partition", "--size")])
+
+        # deprecated commands are only valid when asked for
+        self.assertEqual(index.names["interactive"][F14], DEPRECATED)
+        self.assertEqual(index.names["interactive"][FC3], VALID)
+        self.assertFalse(F14 in index.nameVersions("interactive"))
+        self.assertTrue(F14 in index.nameVersions("interactive", allowDeprecated=True))
+        self.assertFalse(F17 in index.nameVersions("interactive", allowDeprecated=True))
+
+        self.assertEqual(index.findOption("network", "--hostname=foo"), "--hostname")
+        self.assertEqual(index.findOption("network", "--hostn"), "--hostname")
+        self.assertEqual(index.findOption("network", "--bogus"), None)
+
+class VersionIndex_Matches_Parser_TestCase(unittest.TestCase):
+    def runTest(self):
+        index = buildIndex()
+
+        for ks in ["autopart --type=lvm\n",
+                   "rootpw --plaintext secret\nauth --useshadow\n",
+                   "%packages --excludeWeakdeps\nvim\n%end\n",
+                   "%packages --multilib\n%end\n",
+                   "interactive\n",
+                   "network --device=eth0 --hostname=host --ipv6=auto\n",
+                   "bogus\n"]:
+            inference = inferVersions(ks, index=index)
+            expected = [v for v in index.versions if _parses(ks, v)]
+            self.assertEqual(inference.versions, expected, ks)
+
+class VersionInference_TestCase(unittest.TestCase):
+    def runTest(self):
+        inference = inferVersions("""
+# a comment
+autopart --type=lvm
+rootpw --plaintext secret
+%post --log=/tmp/post.log
+echo --type=not-an-option
+%end
+%packages --excludeWeakdeps
+vim
+%end
+""")
+        self.assertEqual(inference.minimum, F24)
+        self.assertEqual(inference.maximum, F27)
+        self.assertEqual(str(inference), "Minimum version: F24\nMaximum version: F27")
+        self.assertEqual([(lineno, what) for (lineno, what, _versions) in inference.limits],
+                         [(3, "autopart --type"), (4, "rootpw --plaintext"),
+                          (5, "%post --log"), (8, "%packages --excludeWeakdeps")])
+
+        inference = inferVersions("autopart --type=lvm\nnetwork --activate\n")
+        self.assertTrue(RHEL7 in inference.versions)
+        self.assertFalse(RHEL6 in inference.versions)
+
+        inference = inferVersions("%packages\n%end\nbogus\n")
+        self.assertEqual(inference.versions, [])
+        self.assertEqual(inference.minimum, None)
+        self.assertEqual(str(inference), "No version of kickstart syntax supports this file.")
+
+        inference = inferVersions("interactive\n", allowDeprecated=True)
+        self.assertEqual(inference.maximum, F14)
+        inference = inferVersions("interactive\n")
+        self.assertTrue(inference.maximum < F14)
+        self.assertTrue(F8 in inference.versions)
+
+class VersionIndex_Dump_TestCase(unittest.TestCase):
+    def runTest(self):
+        index = getIndex()
+
+        f = six.StringIO()
+        dumpIndex(index, f)
+        f.seek(0)
+        loaded = loadIndex(f)
+
+        self.assertEqual(loaded.versions, index.versions)
+        self.assertEqual(loaded.names, index.names)
+        self.assertEqual(loaded.options, index.options)
+
+        self.assertRaises(KickstartError, loadIndex, six.StringIO("not json"))
+        self.assertRaises(KickstartError, loadIndex, six.StringIO('{"format": 0}'))
+
+class VersionIndex_Cache_TestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp(prefix="versionindex-")
+
+    def runTest(self):
+        path = os.path.join(self._tmpdir, "sub", "index.json")
+
+        index = cachedIndex(path)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(index.options, getIndex().options)
+
+        # An up to date file is used as it is.
+        with open(path) as f:
+            contents = f.read()
+        with open(path, "w") as f:
+            f.write(contents.replace('"autopart"', '"autopartx"'))
+        self.assertIn("autopartx", cachedIndex(path).names)
+
+        # Anything else is replaced.
+        with open(path, "w") as f:
+            f.write(contents.replace('"source":"', '"source":"x'))
+        self.assertNotIn("autopartx", cachedIndex(path).names)
+        with open(path) as f:
+            self.assertEqual(f.read(), contents)
+
+        with open(path, "w") as f:
+            f.write("garbage")
+        self.assertEqual(cachedIndex(path).names, index.names)
+
+        # Not being able to save the index is no reason to fail.
+        self.assertEqual(cachedIndex("/proc/nonexistent/index.json").names, index.names)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir)
+
+class VersionDiff_TestCase(unittest.TestCase):
+    def runTest(self):
+        index = getIndex()
+
+        diff = diffVersions(F26, F27, index=index)
+        self.assertEqual((diff.added, diff.removed, diff.deprecated), ([], [], []))
+        self.assertEqual(diff.options, {"repo": (["--metalink"], [], []),
+                                        "url": (["--metalink"], [], [])})
+
+        diff = diffVersions(F27, F26, index=index)
+        self.assertEqual(diff.options["url"], ([], [], ["--metalink"]))
+
+        diff = diffVersions(F8, F14, index=index)
+        self.assertIn("interactive", diff.deprecated)
+
+class VersionDiff_Matches_Handlers_TestCase(unittest.TestCase):
+    def _syntax(self, version):
+        handler = makeVersion(version)
+        names = set(handler.commands.keys())
+        deprecated = set(n for (n, cmd) in handler.commands.items() if isinstance(cmd, DeprecatedCommand))
+
+        options = {}
+        for (name, cmd) in handler.commands.items():
+            # method hands its options to whichever of cdrom, url and so on
+            # was used last, so it has none of its own to compare.
+            if isinstance(cmd, DeprecatedCommand) or name == "method":
+                continue
+
+            op = getattr(cmd, "op", None) or cmd._getParser()
+            options[name] = set(o for (o, action) in op._option_string_actions.items()
+                                if actionStatus(action, op.version) is not None)
+
+        return (names, deprecated, options)
+
+    def runTest(self):
+        index = getIndex()
+
+        for (old, new) in [(FC3, F8), (F14, F17), (RHEL6, RHEL7), (F24, F27)]:
+            (oldNames, oldDeprecated, oldOptions) = self._syntax(old)
+            (newNames, newDeprecated, newOptions) = self._syntax(new)
+
+            diff = diffVersions(old, new, index=index)
+            commands = lambda lst: [n for n in lst if not n.startswith("%")]
+
+            self.assertEqual(commands(diff.added), sorted(newNames - oldNames))
+            self.assertEqual(commands(diff.removed), sorted(oldNames - newNames))
+            self.assertEqual(diff.deprecated, sorted((newDeprecated - oldDeprecated) & oldNames))
+
+            for name in oldNames & newNames:
+                if name not in oldOptions or name not in newOptions:
+                    continue
+
+                (added, _deprecated, removed) = diff.options.get(name, ([], [], []))
+                self.assertEqual(added, sorted(newOptions[name] - oldOptions[name]), name)
+                self.assertEqual(removed, sorted(oldOptions[name] - newOptions[name]), name)
+
+if __name__ == "__main__":
+    unittest.main()
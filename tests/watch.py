@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pykickstart.watch import KickstartWatcher
+
+class Base_Watch(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.mkdtemp(prefix="watch-")
+        self._outside = tempfile.mkdtemp(prefix="watch-outside-")
+        self.validated = []
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+        shutil.rmtree(self._outside)
+
+    def path(self, name):
+        return os.path.join(self._dir, name)
+
+    def write(self, path, contents):
+        with open(path, "w") as f:
+            f.write(contents)
+
+        # Make sure the change is seen even on file systems with coarse
+        # timestamps.
+        st = os.stat(path)
+        os.utime(path, (st.st_atime, st.st_mtime + len(self.validated) + 1))
+
+    def validate(self, location):
+        self.validated.append(location)
+        with open(location) as f:
+            return f.read().count("\n")
+
+class Watch_TestCase(Base_Watch):
+    def runTest(self):
+        shared = os.path.join(self._outside, "shared.ks")
+        self.write(shared, "text\n")
+        self.write(self.path("frag.ks"), "%%include %s\n" % shared)
+        self.write(self.path("a.ks"), "%include frag.ks\n")
+        self.write(self.path("b.ks"), "%include frag.ks\nautopart\n")
+        self.write(self.path("c.ks"), "text\n")
+        self.write(self.path("README"), "not a kickstart file\n")
+
+        watcher = KickstartWatcher(self._dir, self.validate)
+
+        # Every top level file is validated the first time.
+        results = watcher.poll()
+        self.assertEqual(sorted(results.keys()), [self.path("a.ks"), self.path("b.ks"), self.path("c.ks")])
+        self.assertEqual(watcher.topLevel(), [self.path("a.ks"), self.path("b.ks"), self.path("c.ks")])
+        self.assertEqual(results[self.path("b.ks")], 2)
+        self.assertEqual(sorted(watcher.graph.ancestors(shared)),
+                         [self.path("a.ks"), self.path("b.ks"), self.path("frag.ks")])
+
+        # Nothing changed, so nothing is validated.
+        del self.validated[:]
+        self.assertEqual(watcher.poll(), {})
+        self.assertEqual(self.validated, [])
+
+        # A change to a fragment outside the directory revalidates the top
+        # level files that include it, and only those.
+        self.write(shared, "text\nzerombr\n")
+        results = watcher.poll()
+        self.assertEqual(sorted(results.keys()), [self.path("a.ks"), self.path("b.ks")])
+        self.assertEqual(sorted(self.validated), [self.path("a.ks"), self.path("b.ks")])
+
+        # A top level file that stops including the fragment no longer
+        # depends on it.
+        self.write(self.path("b.ks"), "autopart\n")
+        self.assertEqual(list(watcher.poll().keys()), [self.path("b.ks")])
+        del self.validated[:]
+        self.write(shared, "text\n")
+        self.assertEqual(list(watcher.poll().keys()), [self.path("a.ks")])
+
+        # New files are picked up, and removed ones forgotten.
+        self.write(self.path("d.ks"), "text\n")
+        os.unlink(self.path("c.ks"))
+        self.assertEqual(list(watcher.poll().keys()), [self.path("d.ks")])
+        self.assertEqual(sorted(watcher.results.keys()), [self.path("a.ks"), self.path("b.ks"), self.path("d.ks")])
+
+        # A fragment nothing includes any more becomes a top level file.
+        self.write(self.path("a.ks"), "text\n")
+        self.assertEqual(sorted(watcher.poll().keys()), [self.path("a.ks"), self.path("frag.ks")])
+
+class Watch_Missing_Include_TestCase(Base_Watch):
+    def runTest(self):
+        self.write(self.path("a.ks"), "%include later.ks\n")
+
+        watcher = KickstartWatcher(self._dir, self.validate, patterns=["a.ks"])
+        self.assertEqual(list(watcher.poll().keys()), [self.path("a.ks")])
+
+        # The include showing up is a change to a.ks, even though only a.ks
+        # matches the patterns.
+        self.write(self.path("later.ks"), "text\n")
+        self.assertEqual(list(watcher.poll().keys()), [self.path("a.ks")])
+
+        calls = []
+        watcher.watch(calls.append, interval=0, iterations=2)
+        self.assertEqual(calls, [])
+
+class Watch_Script_Include_TestCase(Base_Watch):
+    def runTest(self):
+        self.write(self.path("frag.ks"), "echo frag\n")
+        self.write(self.path("a.ks"), "%post\necho a\n%include frag.ks\n%end\n")
+
+        # The parser reads a %include line in a script section, so frag.ks
+        # is part of a.ks and not a top level file of its own.
+        watcher = KickstartWatcher(self._dir, self.validate)
+        self.assertEqual(list(watcher.poll().keys()), [self.path("a.ks")])
+        self.assertEqual(watcher.graph.includedBy(self.path("frag.ks")), [self.path("a.ks")])
+
+        # Changing the fragment revalidates the file that includes it.
+        self.write(self.path("frag.ks"), "%end\nbogus_command here\n%post\n")
+        self.assertEqual(list(watcher.poll().keys()), [self.path("a.ks")])
+
+if __name__ == "__main__":
+    unittest.main()
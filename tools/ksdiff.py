@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+
+# pylint: disable=broad-except,found-_-in-module-class
+
+import argparse
+import sys
+import warnings
+from pykickstart.i18n import _
+from pykickstart.diff import diffHandlers
+from pykickstart.errors import KickstartError, KickstartVersionError
+from pykickstart.parser import KickstartParser
+from pykickstart.version import DEVEL, makeVersion
+
+def parseFile(path, version, followIncludes):
+    handler = makeVersion(version)
+    ksparser = KickstartParser(handler, followIncludes=followIncludes)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        ksparser.readKickstart(path)
+
+    return handler
+
+def main(argv=sys.argv[1:]):
+    op = argparse.ArgumentParser(usage="%(prog)s [options] oldfile newfile", add_help=False)
+    op.add_argument("oldfile", nargs="?",
+                    help=_("filename or URL to compare from"))
+    op.add_argument("newfile", nargs="?",
+                    help=_("filename or URL to compare to"))
+    op.add_argument("-i", "--followincludes", dest="followincludes",
+                    action="store_true", default=False,
+                    help=_("parse include files when %%include is seen"))
+    op.add_argument("-v", "--version", dest="version", default=DEVEL,
+                    help=_("version of kickstart syntax to parse both files with"))
+    op.add_argument("-h", "--help", dest="help", action="store_true", default=False,
+                    help=_("show this help message and exit"))
+
+    opts = op.parse_args(argv)
+
+    # parse --help manually b/c we don't want to sys.exit before the
+    # tests have finished
+    if opts.help:
+        return (0, op.format_help().split("\n"))
+
+    if not opts.oldfile or not opts.newfile:
+        return (2, op.format_usage().split("\n"))
+
+    try:
+        makeVersion(opts.version)
+    except KickstartVersionError:
+        return (2, [_("The version %s is not supported by pykickstart") % opts.version])
+
+    handlers = []
+    for path in [opts.oldfile, opts.newfile]:
+        try:
+            handlers.append(parseFile(path, opts.version, opts.followincludes))
+        except KickstartError as err:
+            return (2, [_("Error reading %(filename)s:\n%(version)s") % {"filename": path, "version": err}])
+        except Exception as e:
+            return (2, [_("General error in input file:  %s") % e])
+
+    differences = diffHandlers(handlers[0], handlers[1])
+
+    messages = []
+    for d in differences:
+        messages.extend(str(d).split("\n"))
+
+    return (1 if differences else 0, messages)
+
+if __name__ == "__main__":
+    retval, messages = main()
+    for msg in messages:
+        print(msg)
+    sys.exit(retval)
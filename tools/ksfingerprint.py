@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+
+# pylint: disable=broad-except,found-_-in-module-class
+
+import argparse
+import multiprocessing
+import sys
+import warnings
+from pykickstart.i18n import _
+from pykickstart.errors import KickstartError, KickstartVersionError
+from pykickstart.parser import KickstartParser
+from pykickstart.version import DEVEL, makeVersion
+
+def fingerprintFile(args):
+    """Parse a kickstart file and return its fingerprint.  args is a tuple of
+       (path, version, followIncludes), so this can be handed to a process
+       pool.  Returns a tuple of the path, the fingerprint and an error
+       message, one of which is None.
+    """
+    (path, version, followIncludes) = args
+
+    warnings.simplefilter("ignore")
+
+    handler = makeVersion(version)
+    ksparser = KickstartParser(handler, followIncludes=followIncludes)
+
+    try:
+        ksparser.readKickstart(path)
+    except KickstartError as err:
+        return (path, None, str(err).strip())
+    except Exception as e:
+        return (path, None, _("General error in input file:  %s") % e)
+
+    return (path, handler.fingerprint(), None)
+
+def groupFiles(paths, version=DEVEL, followIncludes=False, processes=None):
+    """Fingerprint every kickstart file in the list paths on a pool of
+       processes and group the files by fingerprint.  Returns a tuple of a
+       dict mapping each fingerprint to the sorted list of files that have it,
+       and a dict mapping the files that could not be parsed to the error.
+    """
+    classes = {}
+    errors = {}
+
+    work = [(path, version, followIncludes) for path in paths]
+
+    if processes == 1 or len(work) < 2:
+        results = map(fingerprintFile, work)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap_unordered(fingerprintFile, work, chunksize=max(1, min(64, len(work) // 64)))
+
+    try:
+        for (path, fingerprint, err) in results:
+            if err is not None:
+                errors[path] = err
+            else:
+                classes.setdefault(fingerprint, []).append(path)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    for lst in classes.values():
+        lst.sort()
+
+    return (classes, errors)
+
+def main(argv=sys.argv[1:]):
+    op = argparse.ArgumentParser(usage="%(prog)s [options] ksfile [ksfile ...]", add_help=False)
+    op.add_argument("ksfiles", nargs="*",
+                    help=_("filenames or URLs to read from"))
+    op.add_argument("-f", "--files-from", dest="filesfrom", metavar="FILE",
+                    help=_("also read the files to group from FILE, one per line"))
+    op.add_argument("-i", "--followincludes", dest="followincludes",
+                    action="store_true", default=False,
+                    help=_("parse include files when %%include is seen"))
+    op.add_argument("-j", "--jobs", dest="jobs", type=int, default=None,
+                    help=_("number of processes to use, defaulting to one per CPU"))
+    op.add_argument("-v", "--version", dest="version", default=DEVEL,
+                    help=_("version of kickstart syntax to parse with"))
+    op.add_argument("-h", "--help", dest="help", action="store_true", default=False,
+                    help=_("show this help message and exit"))
+
+    opts = op.parse_args(argv)
+
+    # parse --help manually b/c we don't want to sys.exit before the
+    # tests have finished
+    if opts.help:
+        return (0, op.format_help().split("\n"))
+
+    paths = list(opts.ksfiles)
+    if opts.filesfrom:
+        try:
+            with open(opts.filesfrom) as f:
+                paths.extend(line.strip() for line in f if line.strip())
+        except IOError as e:
+            return (1, [_("Error reading %(filename)s:\n%(version)s") % {"filename": opts.filesfrom, "version": e}])
+
+    if not paths:
+        return (1, op.format_usage().split("\n"))
+
+    try:
+        makeVersion(opts.version)
+    except KickstartVersionError:
+        return (1, [_("The version %s is not supported by pykickstart") % opts.version])
+
+    (classes, errors) = groupFiles(paths, version=opts.version, followIncludes=opts.followincludes,
+                                   processes=opts.jobs)
+
+    # Largest classes first, so the most common layouts are easy to find.
+    messages = []
+    for fingerprint in sorted(classes.keys(), key=lambda k: (-len(classes[k]), classes[k][0])):
+        messages.append(_("%(fingerprint)s (%(count)d files)") %
+                        {"fingerprint": fingerprint, "count": len(classes[fingerprint])})
+        messages.extend("    %s" % path for path in classes[fingerprint])
+
+    for path in sorted(errors.keys()):
+        messages.append("%s: %s" % (path, errors[path]))
+
+    return (1 if errors else 0, messages)
+
+if __name__ == "__main__":
+    retval, messages = main()
+    for msg in messages:
+        print(msg)
+    sys.exit(retval)
@@ -22,58 +22,172 @@
 
 from __future__ import print_function
 
-import sys
 import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
 import pykickstart
 import pykickstart.parser
 from pykickstart.i18n import _
+from pykickstart.includes import IncludeResolver
 from pykickstart.version import DEVEL, makeVersion
 from pykickstart.errors import KickstartVersionError
 
-def parse_args():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-c", "--config", dest="kscfg", required=True,
-                        help=_("Path to kickstart config file"))
-    parser.add_argument("-v", "--version", dest="version", default=DEVEL,
-                        help=_("Kickstart version to use for interpreting config"))
-    parser.add_argument("-o", "--output", dest="output",
-                        help=_("Write flattened config to OUTPUT"))
+def writeAtomically(handler, path):
+    """Write handler out to path through a temporary file in the same
+       directory, which is moved into place once it is complete.  Anyone
+       reading path sees either the old file or the whole new one.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    (handle, tmp) = tempfile.mkstemp(dir=directory, prefix=".ksflatten-")
+
+    try:
+        with os.fdopen(handle, "w") as f:
+            handler.write(f)
+
+        # mkstemp makes the file readable only by its owner, where open
+        # would have gone by the umask.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)
+
+        os.rename(tmp, path)
+    except (IOError, OSError):
+        os.unlink(tmp)
+        raise
 
-    return parser.parse_args()
+# The parser each process flattens with for each version.  Its include
+# resolver keeps every fragment it has read, so fragments shared by many
+# files are only read once.
+_parsers = {}
 
-def main():
-    opts = parse_args()
-    if not opts.kscfg:
-        print(_("Need to specify a config to flatten"), file=sys.stderr)
-        sys.exit(1)
+def flattenFile(args):
+    """Flatten the kickstart file at path into output.  args is a tuple of
+       (path, output, version), so this can be handed to a process pool.
+       Returns a tuple of the path and an error message, or None.
+    """
+    (path, output, version) = args
+
+    if version not in _parsers:
+        _parsers[version] = pykickstart.parser.KickstartParser(makeVersion(version),
+                                                               includeResolver=IncludeResolver())
+    else:
+        _parsers[version].handler.reset()
+
+    ksparser = _parsers[version]
+
+    try:
+        ksparser.readKickstart(path)
+    except IOError as msg:
+        return (path, _("Failed to read kickstart file '%(filename)s' : %(error_msg)s") % {"filename": path, "error_msg": msg})
+    except pykickstart.errors.KickstartError as e:
+        return (path, _("Failed to parse kickstart file '%(filename)s' : %(error_msg)s") % {"filename": path, "error_msg": e})
+
+    try:
+        writeAtomically(ksparser.handler, output)
+    except (IOError, OSError) as msg:
+        return (path, _("Failed to open output file '%(filename)s' : %(error_msg)s") % {"filename": output, "error_msg": msg})
+
+    return (path, None)
+
+def flattenFiles(paths, outputDir, version=DEVEL, processes=None):
+    """Flatten every kickstart file in the list paths into a file of the
+       same name in outputDir, on a pool of processes.  Returns a dict
+       mapping the files that could not be flattened to the error.
+    """
+    errors = {}
+    work = [(path, os.path.join(outputDir, os.path.basename(path)), version) for path in paths]
+
+    if processes == 1 or len(work) < 2:
+        results = map(flattenFile, work)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap_unordered(flattenFile, work, chunksize=max(1, min(64, len(work) // 64)))
+
+    try:
+        for (path, err) in results:
+            if err is not None:
+                errors[path] = err
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return errors
+
+def main(argv=sys.argv[1:]):
+    op = argparse.ArgumentParser(usage="%(prog)s [options] [ksfile ...]", add_help=False)
+    op.add_argument("ksfiles", nargs="*",
+                    help=_("kickstart files to flatten, which need --output-dir if there is more than one"))
+    op.add_argument("-c", "--config", dest="kscfg",
+                    help=_("Path to kickstart config file"))
+    op.add_argument("-d", "--output-dir", dest="outputdir",
+                    help=_("Write each flattened config to a file of the same name in OUTPUTDIR"))
+    op.add_argument("-j", "--jobs", dest="jobs", type=int, default=None,
+                    help=_("number of processes to use with --output-dir, defaulting to one per CPU"))
+    op.add_argument("-v", "--version", dest="version", default=DEVEL,
+                    help=_("Kickstart version to use for interpreting config"))
+    op.add_argument("-o", "--output", dest="output",
+                    help=_("Write flattened config to OUTPUT"))
+    op.add_argument("-h", "--help", dest="help", action="store_true", default=False,
+                    help=_("show this help message and exit"))
+
+    opts = op.parse_args(argv)
+
+    # parse --help manually b/c we don't want to sys.exit before the
+    # tests have finished
+    if opts.help:
+        return (0, op.format_help().split("\n"))
+
+    paths = ([opts.kscfg] if opts.kscfg else []) + opts.ksfiles
+    if not paths:
+        return (1, [_("Need to specify a config to flatten")])
+    elif len(paths) > 1 and not opts.outputdir:
+        return (1, [_("Need to specify an output directory to flatten more than one config")])
+    elif opts.outputdir and opts.output:
+        return (1, [_("Only one of --output and --output-dir can be given")])
 
     try:
         ksversion = makeVersion(opts.version)
     except KickstartVersionError:
-        print(_("The version %s is not supported by pykickstart") % opts.version)
-        sys.exit(1)
+        return (1, [_("The version %s is not supported by pykickstart") % opts.version])
+
+    if opts.outputdir:
+        # Two files with the same name would be written over each other.
+        names = [os.path.basename(path) for path in paths]
+        duplicates = sorted(set(name for name in names if names.count(name) > 1))
+        if duplicates:
+            return (1, [_("More than one config is named %s") % name for name in duplicates])
+
+        if not os.path.isdir(opts.outputdir):
+            return (1, [_("The output directory %s does not exist") % opts.outputdir])
+
+        errors = flattenFiles(paths, opts.outputdir, version=opts.version, processes=opts.jobs)
+        return (1 if errors else 0, [errors[path] for path in paths if path in errors])
 
     ksparser = pykickstart.parser.KickstartParser(ksversion)
     try:
-        ksparser.readKickstart(opts.kscfg)
+        ksparser.readKickstart(paths[0])
     except IOError as msg:
-        print(_("Failed to read kickstart file '%(filename)s' : %(error_msg)s") % {"filename": opts.kscfg, "error_msg": msg}, file=sys.stderr)
-        sys.exit(1)
+        return (1, [_("Failed to read kickstart file '%(filename)s' : %(error_msg)s") % {"filename": paths[0], "error_msg": msg}])
     except pykickstart.errors.KickstartError as e:
-        print(_("Failed to parse kickstart file '%(filename)s' : %(error_msg)s") % {"filename": opts.kscfg, "error_msg": e}, file=sys.stderr)
-        sys.exit(1)
+        return (1, [_("Failed to parse kickstart file '%(filename)s' : %(error_msg)s") % {"filename": paths[0], "error_msg": e}])
 
     if opts.output:
         try:
-            f = open(opts.output, 'w')
-        except IOError as msg:
-            print(_("Failed to open output file '%(filename)s' : %(error_msg)s") % {"filename": opts.output, "error_msg": msg}, file=sys.stderr)
-            sys.exit(1)
+            writeAtomically(ksparser.handler, opts.output)
+        except (IOError, OSError) as msg:
+            return (1, [_("Failed to open output file '%(filename)s' : %(error_msg)s") % {"filename": opts.output, "error_msg": msg}])
     else:
-        f = sys.stdout
+        ksparser.handler.write(sys.stdout)
 
-    f.write("%s" % ksparser.handler)
-    f.close()
+    return (0, [])
 
 if __name__ == "__main__":
-    main()
+    retval, messages = main()
+    # The flattened config may be going to stdout.
+    for msg in messages:
+        print(msg, file=sys.stderr)
+    sys.exit(retval)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+
+# pylint: disable=found-_-in-module-class
+
+import argparse
+import sys
+from pykickstart.i18n import _
+from pykickstart.errors import KickstartError
+from pykickstart.version import versionRanges
+from pykickstart.versionindex import inferFileVersions
+
+def main(argv=sys.argv[1:]):
+    op = argparse.ArgumentParser(usage="%(prog)s [options] ksfile", add_help=False)
+    op.add_argument("ksfile", nargs="?",
+                    help=_("filename or URL to read from"))
+    op.add_argument("-d", "--deprecated", dest="deprecated", action="store_true",
+                    default=False,
+                    help=_("count deprecated commands and options as valid"))
+    op.add_argument("-V", "--verbose", dest="verbose", action="store_true",
+                    default=False,
+                    help=_("list what limits the versions the file can declare"))
+    op.add_argument("-h", "--help", dest="help", action="store_true", default=False,
+                    help=_("show this help message and exit"))
+
+    opts = op.parse_args(argv)
+
+    # parse --help manually b/c we don't want to sys.exit before the
+    # tests have finished
+    if opts.help:
+        return (0, op.format_help().split("\n"))
+
+    if not opts.ksfile:
+        return (1, op.format_usage().split("\n"))
+
+    try:
+        inference = inferFileVersions(opts.ksfile, allowDeprecated=opts.deprecated)
+    except KickstartError as e:
+        return (1, [_("Error reading %(filename)s:\n%(version)s") % {"filename": opts.ksfile, "version": e}])
+
+    messages = str(inference).split("\n")
+    if inference.versions:
+        messages.append(_("Compatible versions: %s") % ", ".join(versionRanges(inference.versions)))
+
+    if opts.verbose:
+        for (lineno, description, versions) in inference.limits:
+            if versions:
+                allowed = ", ".join(versionRanges(versions))
+            else:
+                allowed = _("no version")
+
+            messages.append(_("line %(lineno)s: %(what)s is valid in %(versions)s") %
+                            {"lineno": lineno, "what": description, "versions": allowed})
+
+    return (0 if inference.versions else 1, messages)
+
+if __name__ == "__main__":
+    retval, messages = main()
+    for msg in messages:
+        print(msg)
+    sys.exit(retval)
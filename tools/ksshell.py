@@ -25,10 +25,7 @@
 # a designated output file when the program quits.
 
 # TODO:
-# - error reporting always says you are on line 1
-# - handle sections like %packages
 # - some meta-commands might be nice:
-#   - .delete (a previous line)
 #   - .help (requires moving help text into each optionparser object?)
 #   - .save
 
@@ -40,7 +37,8 @@ import os, six, sys
 
 from pykickstart.i18n import _
 from pykickstart.errors import KickstartError, KickstartVersionError
-from pykickstart.parser import KickstartParser, preprocessKickstart
+from pykickstart.parser import preprocessKickstart
+from pykickstart.session import KickstartSession
 from pykickstart.version import DEVEL, makeVersion
 
 ##
@@ -53,82 +51,74 @@ class InternalCommand(object):
     def __init__(self):
         self.op = argparse.ArgumentParser()
 
-    def execute(self, parser):
+    def execute(self, session, args):
         pass
 
+    def _index(self, session, arg):
+        """Return the position of the entry starting on line arg."""
+        try:
+            lineno = int(arg)
+        except ValueError:
+            return None
+
+        for i in range(len(session.entries)):
+            if session.lineno(i) == lineno:
+                return i
+
+        return None
+
 class ClearCommand(InternalCommand):
-    def execute(self, parser):
-        version = parser.version
-        parser.handler = makeVersion(version)
+    def execute(self, session, args):
+        session.load("")
+
+class DeleteCommand(InternalCommand):
+    def execute(self, session, args):
+        index = self._index(session, args[0]) if len(args) == 1 else None
+        if index is None:
+            print(_("Usage: .delete LINE, where LINE starts a command or section shown by .list"))
+            return
+
+        session.delete(index)
+
+class EditCommand(InternalCommand):
+    def execute(self, session, args):
+        index = self._index(session, args[0]) if len(args) > 1 else None
+        if index is None:
+            print(_("Usage: .edit LINE TEXT, where LINE starts a command shown by .list"))
+            return
+
+        for msg in session.replace(index, " ".join(args[1:])):
+            print(msg)
+
+class ListCommand(InternalCommand):
+    def execute(self, session, args):
+        for (i, entry) in enumerate(session.entries):
+            for (j, line) in enumerate(entry.lines):
+                print("%4d  %s" % (session.lineno(i) + j, line))
 
 class QuitCommand(InternalCommand):
-    def execute(self, parser):
+    def execute(self, session, args):
         raise EOFError
 
 class ShowCommand(InternalCommand):
-    def execute(self, parser):
-        print(parser.handler)
+    def execute(self, session, args):
+        print(session.render())
 
 ##
 ## COMMAND COMPLETION
 ##
 
 class KickstartCompleter(object):
-    def __init__(self, handler, internal):
-        # Build up a dict of kickstart commands and their valid options:
-        # { command_name: [options] }
-        self.commands = {}
-
-        for (cStr, cObj) in handler.commands.items():
-            self._add_command(cStr, cObj)
-
-        for (cStr, cObj) in internal.items():
-            self._add_command(cStr, cObj)
-
+    def __init__(self, session):
+        self.session = session
         self.currentCandidates = []
 
-    def _add_command(self, cStr, cObj):
-        self.commands[cStr] = []
-
-        # Internal and simple commands don't have any optparse crud.
-        if cStr.startswith(".") or not hasattr(cObj, "op"):
-            return
-
-        for opt in cObj.op.option_list:
-            self.commands[cStr] += opt._short_opts + opt._long_opts
-
     def complete(self, _text, state):
-        response = None
-
         # This is the first time Tab has been pressed, so build up a list of matches.
         if state == 0:
-            origline = readline.get_line_buffer()
-            begin = readline.get_begidx()
-            end = readline.get_endidx()
-
-            beingCompleted = origline[begin:end]
-            parts = origline.split()
-
-            if not parts:
-                # Everything's a match for an empty string.
-                self.currentCandidates = sorted(self.commands.keys())
-            else:
-                try:
-                    # Ignore leading whitespace when trying to figure out
-                    # completions for a kickstart command.
-                    if begin == 0 or origline[:begin].strip() == "":
-                        # first word
-                        candidates = self.commands.keys()
-                    else:
-                        # later word
-                        candidates = self.commands[parts[0]]
-
-                    if beingCompleted:
-                        self.currentCandidates = [w for w in candidates if w.startswith(beingCompleted)]
-                    else:
-                        self.currentCandidates = list(candidates)
-                except (KeyError, IndexError):
-                    self.currentCandidates = []
+            self.currentCandidates = self.session.complete(readline.get_line_buffer(),
+                                                           readline.get_begidx(),
+                                                           readline.get_endidx())
 
         try:
             response = self.currentCandidates[state]
@@ -161,27 +151,34 @@ except KickstartVersionError:
     print(_("The version %s is not supported by pykickstart") % opts.version)
     sys.exit(1)
 
-ksparser = KickstartParser(kshandler, followIncludes=True, errorsAreFatal=False)
+internalCommands = {".clear": ClearCommand(),
+                    ".delete": DeleteCommand(),
+                    ".edit": EditCommand(),
+                    ".list": ListCommand(),
+                    ".show": ShowCommand(),
+                    ".quit": QuitCommand()}
+
+kssession = KickstartSession(kshandler, extraWords=list(internalCommands.keys()))
 
 if opts.input:
     try:
         processedFile = preprocessKickstart(opts.input)
-        ksparser.readKickstart(processedFile)
+        with open(processedFile) as f:
+            kssession.load(f.read())
         os.remove(processedFile)
     except KickstartError as e:
         # Errors should just dump you to the prompt anyway.
         print(_("Warning:  The following error occurred when processing the input file:\n%s\n") % e)
 
-internalCommands = {".clear": ClearCommand(),
-                    ".show": ShowCommand(),
-                    ".quit": QuitCommand()}
+    for msg in (msg for entry in kssession.entries for msg in entry.messages):
+        print(msg)
 
 ##
 ## SETTING UP READLINE
 ##
 
 readline.parse_and_bind("tab: complete")
-readline.set_completer(KickstartCompleter(kshandler, internalCommands).complete)
+readline.set_completer(KickstartCompleter(kssession).complete)
 
 # Since everything in kickstart looks like a command line arg, we need to
 # remove '-' from the delimiter string.
@@ -196,7 +193,10 @@ print("Press ^D to exit.")
 
 while True:
     try:
-        line = six.moves.input("ks> ")  # pylint: disable=no-member
+        if kssession.pending:
+            line = six.moves.input("... ")  # pylint: disable=no-member
+        else:
+            line = six.moves.input("ks> ")  # pylint: disable=no-member
     except EOFError:
         # ^D was hit, time to quit.
         break
@@ -205,12 +205,13 @@ while True:
         break
 
     # All internal commands start with a ., so if that's the beginning of the
-    # line, we need to dispatch ourselves.
-    if line.startswith("."):
+    # line, we need to dispatch ourselves.  Inside a section, lines are
+    # always part of the section.
+    if line.startswith(".") and not kssession.pending:
         words = line.split()
         if words[0] in internalCommands:
             try:
-                internalCommands[words[0]].execute(ksparser)
+                internalCommands[words[0]].execute(kssession, words[1:])
             except EOFError:
                 # ".quit" was typed, time to quit.
                 break
@@ -219,16 +220,15 @@ while True:
 
         continue
 
-    # Now process the line of input as if it were a kickstart file - just an
-    # extremely short one.
-    try:
-        ksparser.readKickstartFromString(line)
-    except KickstartError as e:
-        print(e)
+    # Now add the line to the end of the file.  Only the command it is part
+    # of is parsed again.  The lines of a section are parsed once its %end
+    # has been typed.
+    for msg in kssession.feed(line) or []:
+        print(msg)
 
 # And finally, print the output kickstart file.
 if opts.output:
     with open(opts.output, "w") as fd:
-        fd.write(str(ksparser.handler))
+        fd.write(kssession.render())
 else:
-    print("\n" + str(ksparser.handler))
+    print("\n" + kssession.render())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+
+# pylint: disable=found-_-in-module-class
+
+import argparse
+import itertools
+import sys
+from pykickstart.i18n import _
+from pykickstart.errors import KickstartVersionError
+from pykickstart.stats import countFiles, findFiles
+from pykickstart.version import DEVEL, makeVersion
+
+def _describe(key):
+    # Commands have no option in the deprecated counts.
+    return " ".join(part for part in key if part is not None)
+
+def formatStats(stats, version=None, top=None):
+    """Return a list of lines reporting the counts in the UsageStats stats
+       for version, or for every version together if version is None.  Each
+       section lists at most top entries, most used first.
+    """
+    files = sum(stats.total("files", version).values())
+    failed = sum(stats.total("failed", version).values())
+
+    if version is None:
+        lines = [_("%(files)d files, %(failed)d with errors") % {"files": files, "failed": failed}]
+        lines.append(_("Versions:"))
+        lines.extend("    %-30s %8d" % (v, stats.files[(v,)]) for v in stats.versions())
+    else:
+        lines = [_("%(version)s: %(files)d files, %(failed)d with errors") % {"version": version, "files": files, "failed": failed}]
+
+    for (field, title) in [("commands", _("Commands:")),
+                           ("options", _("Options:")),
+                           ("deprecated", _("Deprecated commands and options:")),
+                           ("unsupported", _("Removed or unknown options:")),
+                           ("groups", _("Groups:")),
+                           ("interpreters", _("Script interpreters:"))]:
+        counts = stats.total(field, version)
+        if not counts:
+            continue
+
+        lines.append(title)
+
+        # Most used first, and in order of name when used as often.
+        ordered = sorted(counts.items(), key=lambda item: (-item[1], tuple(str(part) for part in item[0])))
+        for (key, count) in itertools.islice(ordered, top):
+            lines.append("    %-30s %8d %6.1f%%" % (_describe(key), count, 100.0 * count / files if files else 0))
+
+    return lines
+
+def main(argv=sys.argv[1:]):
+    op = argparse.ArgumentParser(usage="%(prog)s [options] PATH [PATH ...]", add_help=False)
+    op.add_argument("paths", nargs="*",
+                    help=_("kickstart files, and directories to search for them"))
+    op.add_argument("-b", "--by-version", dest="byversion", action="store_true", default=False,
+                    help=_("also report the counts for each version separately"))
+    op.add_argument("-f", "--files-from", dest="filesfrom", metavar="FILE",
+                    help=_("also read the files to count from FILE, one per line"))
+    op.add_argument("-i", "--followincludes", dest="followincludes",
+                    action="store_true", default=False,
+                    help=_("parse include files when %%include is seen"))
+    op.add_argument("-j", "--jobs", dest="jobs", type=int, default=None,
+                    help=_("number of processes to use, defaulting to one per CPU"))
+    op.add_argument("-n", "--top", dest="top", type=int, default=None,
+                    help=_("only list the TOP most used entries of each kind"))
+    op.add_argument("-p", "--pattern", dest="patterns", action="append", default=[],
+                    help=_("the names of files to count in directories, which may be given more than once, defaulting to *.ks and *.cfg"))
+    op.add_argument("-v", "--version", dest="version", default=DEVEL,
+                    help=_("version of kickstart syntax to parse files without a #version= line with"))
+    op.add_argument("-h", "--help", dest="help", action="store_true", default=False,
+                    help=_("show this help message and exit"))
+
+    opts = op.parse_args(argv)
+
+    # parse --help manually b/c we don't want to sys.exit before the
+    # tests have finished
+    if opts.help:
+        return (0, op.format_help().split("\n"))
+
+    if not opts.paths and not opts.filesfrom:
+        return (1, op.format_usage().split("\n"))
+
+    try:
+        makeVersion(opts.version)
+    except KickstartVersionError:
+        return (1, [_("The version %s is not supported by pykickstart") % opts.version])
+
+    paths = findFiles(opts.paths, patterns=opts.patterns)
+
+    if opts.filesfrom:
+        try:
+            f = open(opts.filesfrom)
+        except IOError as e:
+            return (1, [_("Error reading %(filename)s:\n%(version)s") % {"filename": opts.filesfrom, "version": e}])
+
+        # The list is read as files are needed, not all at once.
+        paths = itertools.chain(paths, (line.strip() for line in f if line.strip()))
+    else:
+        f = None
+
+    try:
+        stats = countFiles(paths, version=opts.version, followIncludes=opts.followincludes,
+                           processes=opts.jobs)
+    finally:
+        if f is not None:
+            f.close()
+
+    messages = formatStats(stats, top=opts.top)
+
+    if opts.byversion:
+        for version in stats.versions():
+            messages.append("")
+            messages.extend(formatStats(stats, version=version, top=opts.top))
+
+    return (0, messages)
+
+if __name__ == "__main__":
+    retval, messages = main()
+    for msg in messages:
+        print(msg)
+    sys.exit(retval)
@@ -21,34 +21,182 @@
 
 # pylint: disable=broad-except,found-_-in-module-class
 
+from __future__ import print_function
+
 import argparse
 import os
+import socket
 import sys
 import warnings
-import tempfile
-import shutil
+import six
 from pykickstart.i18n import _
-from pykickstart.errors import KickstartError, KickstartParseError, KickstartVersionError
-from pykickstart.load import load_to_file
-from pykickstart.parser import KickstartParser, preprocessKickstart
-from pykickstart.version import DEVEL, makeVersion, versionMap
+from pykickstart.daemonclient import defaultSocketPath, request
 
-def cleanup(dest, fn=None, exitval=1):
-    shutil.rmtree(dest)
+# Only what is needed to hand the file to a running ksvalidatord is imported
+# up front, so that ksvalidator --daemon starts quickly.  Everything parsing
+# needs is imported where it is used.
 
-    # Don't care if this file doesn't exist.
-    if fn is not None:
-        try:
-            os.remove(fn)
-        except Exception:
-            pass
+def preprocess(contents):
+    """Return contents with any %ksappend lines replaced by the files they
+       refer to.  Nothing is written to disk.
+    """
+    from pykickstart.parser import preprocessFromStringToString
+
+    if "%ksappend" not in contents:
+        return contents
+
+    processed = preprocessFromStringToString(contents)
+    if six.PY3:
+        processed = processed.decode(sys.getdefaultencoding())
+
+    return processed
+
+def checkVersion(args):
+    """Parse a kickstart file against a single version, stopping at the first
+       error.  args is a tuple of (version, contents, path, tokenCache,
+       followIncludes), so this can be handed to a process pool.  Returns a
+       tuple of the version and the error message, which is None if the file
+       is valid for that version.
+    """
+    from pykickstart.parser import KickstartParser
+    from pykickstart.version import makeVersion
+
+    (version, contents, path, tokenCache, followIncludes) = args
+
+    handler = makeVersion(version)
+    ksparser = KickstartParser(handler, followIncludes=followIncludes,
+                               tokenCache=tokenCache)
+
+    return (version, checkParser(ksparser, contents, path))
+
+def checkParser(ksparser, contents, path=None):
+    """Parse a kickstart file with ksparser, stopping at the first error.
+       Returns the error message, or None if the file is valid.
+    """
+    from pykickstart.errors import KickstartError, KickstartParseError
+
+    # turn DeprecationWarnings into errors
+    warnings.filterwarnings("error")
+
+    try:
+        ksparser.readKickstartFromString(contents, path=path)
+    except DeprecationWarning as err:
+        return _("File uses a deprecated option or command.\n%s") % err
+    except KickstartParseError as err:
+        return str(err)
+    except KickstartError:
+        return _("General kickstart error in input file")
+    except Exception as e:
+        return _("General error in input file:  %s") % e
+
+    return None
+
+def checkAllVersions(contents, path=None, followIncludes=False, processes=None):
+    """Check a kickstart file, provided as the string contents, against every
+       supported version.  The file is split into tokens once and then
+       parsed for each version in parallel.  Returns a tuple of the sorted
+       list of compatible versions and a dict mapping each incompatible
+       version to its first error message.
+    """
+    import multiprocessing
+    from pykickstart.parser import TokenCache
+    from pykickstart.version import versionMap
+
+    tokenCache = TokenCache(contents)
+    jobs = [(v, contents, path, tokenCache, followIncludes)
+            for v in sorted(set(versionMap.values()))]
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        results = pool.map(checkVersion, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+    compatible = [v for (v, err) in results if err is None]
+    errors = dict((v, err) for (v, err) in results if err is not None)
+    return (compatible, errors)
+
+def validateFile(location, version, pool=None):
+    """Validate the kickstart file at location against version, following
+       includes.  Returns None if it is valid, or the first error.  If pool
+       is given, the file is parsed with a handler and parser from that
+       HandlerPool, whose parsers must follow includes, rather than with new
+       ones.
+    """
+    from pykickstart.errors import KickstartError
+    from pykickstart.load import load_to_str
+
+    try:
+        contents = preprocess(load_to_str(location))
+    except KickstartError as e:
+        return _("Error reading %(filename)s:\n%(version)s") % {"filename": location, "version": e}
+
+    if pool is None:
+        return checkVersion((version, contents, location, None, True))[1]
+
+    with pool.parser(version) as ksparser:
+        return checkParser(ksparser, contents, location)
+
+def validateWithDaemon(path, location, version, followIncludes=False, firstError=False, storage=False):
+    """Have the ksvalidatord listening on the socket path validate the file
+       at location.  Returns a tuple of the return value and messages, as
+       main does, or None if there is no server to ask.  Errors that would be
+       printed while parsing are printed to stderr here.
+    """
+    message = {"op": "validate", "location": location, "cwd": os.getcwd(),
+               "followIncludes": followIncludes, "firstError": firstError,
+               "storage": storage}
 
-    return exitval
+    # The server checks against the latest version if none is given.
+    if version is not None:
+        message["version"] = version
+
+    try:
+        response = request(path, message)
+    except (socket.error, ValueError):
+        return None
+
+    for err in response.get("errors", []):
+        print(err, file=sys.stderr)
+
+    return (response["retval"], response["messages"])
+
+def printResults(results):
+    for location in sorted(results.keys()):
+        if results[location] is None:
+            print(_("%s: OK") % location)
+        else:
+            print("%s: %s" % (location, results[location]))
+
+def watch(directory, version, interval=1.0, iterations=None, callback=printResults):
+    """Validate every top level kickstart file in directory, and then keep
+       validating the ones affected by any change until interrupted.  One
+       handler and parser is made for the whole run and reset after each
+       file.
+    """
+    from pykickstart.pool import HandlerPool
+    from pykickstart.watch import KickstartWatcher
+
+    pool = HandlerPool(size=1, parserArgs={"followIncludes": True})
+    watcher = KickstartWatcher(directory, lambda location: validateFile(location, version, pool))
+
+    try:
+        watcher.watch(callback, interval=interval, iterations=iterations)
+    except KeyboardInterrupt:
+        pass
+
+    return watcher
 
 def main(argv=sys.argv[1:]):
     op = argparse.ArgumentParser(usage="%(prog)s [options] ksfile", add_help=False)
     op.add_argument("ksfile", nargs="?",
                     help=_("filename or URL to read from"))
+    op.add_argument("-a", "--all-versions", dest="allversions", action="store_true",
+                    default=False,
+                    help=_("check the file against every version of kickstart syntax"))
+    op.add_argument("-d", "--daemon", dest="daemon", metavar="SOCKET", nargs="?", const="",
+                    help=_("have the ksvalidatord listening on SOCKET do the checking, if it is running"))
     op.add_argument("-e", "--firsterror", dest="firsterror", action="store_true",
                     default=False, help=_("halt after the first error or warning"))
     op.add_argument("-i", "--followincludes", dest="followincludes",
@@ -57,8 +205,16 @@ def main(argv=sys.argv[1:]):
     op.add_argument("-l", "--listversions", dest="listversions", action="store_true",
                     default=False,
                     help=_("list the available versions of kickstart syntax"))
-    op.add_argument("-v", "--version", dest="version", default=DEVEL,
+    op.add_argument("-m", "--memory", dest="memory", action="store_true",
+                    default=False,
+                    help=_("report how much memory each phase of parsing uses, halting after the first error"))
+    op.add_argument("-s", "--storage", dest="storage", action="store_true",
+                    default=False,
+                    help=_("check that the storage commands refer to each other correctly"))
+    op.add_argument("-v", "--version", dest="version", default=None,
                     help=_("version of kickstart syntax to validate against"))
+    op.add_argument("-w", "--watch", dest="watch", metavar="DIR",
+                    help=_("validate the kickstart files in DIR again whenever they or the files they include change"))
     op.add_argument("-h", "--help", dest="help", action="store_true", default=False,
                     help=_("show this help message and exit"))
 
@@ -70,26 +226,73 @@ def main(argv=sys.argv[1:]):
         return (0, op.format_help().split("\n"))
 
     if opts.listversions:
+        from pykickstart.version import versionMap
+
         versions = []
         for key in sorted(versionMap.keys()):
             versions.append(key)
         return (0, versions)
 
+    if opts.ksfile and opts.daemon is not None and not opts.watch:
+        # The server can't compare versions or report memory use, so those
+        # are always done here.
+        if not opts.allversions and not opts.memory:
+            result = validateWithDaemon(opts.daemon or defaultSocketPath(), opts.ksfile, opts.version,
+                                        followIncludes=opts.followincludes, firstError=opts.firsterror,
+                                        storage=opts.storage)
+            if result is not None:
+                return result
+
+    from pykickstart.errors import KickstartError, KickstartParseError, KickstartVersionError
+    from pykickstart.load import load_to_str
+    from pykickstart.memory import memoryReport
+    from pykickstart.parser import KickstartParser
+    from pykickstart.storage import checkStorage
+    from pykickstart.version import DEVEL, makeVersion, versionRanges, versionToString
+
+    if opts.version is None:
+        opts.version = DEVEL
+
+    if opts.watch:
+        try:
+            makeVersion(opts.version)
+        except KickstartVersionError:
+            return (1, [_("The version %s is not supported by pykickstart") % opts.version])
+
+        watch(opts.watch, opts.version)
+        return (0, [])
+
     if not opts.ksfile:
         return (1, op.format_usage().split("\n"))
 
-    destdir = tempfile.mkdtemp("", "ksvalidator-tmp-", "/tmp")
     try:
-        f = load_to_file(opts.ksfile, "%s/ks.cfg" % destdir)
+        contents = load_to_str(opts.ksfile)
     except KickstartError as e:
-        return (cleanup(destdir),
-                [_("Error reading %(filename)s:\n%(version)s") % {"filename": opts.ksfile, "version": e}])
+        return (1, [_("Error reading %(filename)s:\n%(version)s") % {"filename": opts.ksfile, "version": e}])
+
+    if opts.allversions:
+        try:
+            contents = preprocess(contents)
+        except KickstartError:
+            return (1, [_("General kickstart error in input file")])
+
+        (compatible, errors) = checkAllVersions(contents, path=opts.ksfile,
+                                                followIncludes=opts.followincludes)
+
+        if compatible:
+            messages = [_("Compatible versions: %s") % ", ".join(versionRanges(compatible))]
+        else:
+            messages = [_("The file is not compatible with any version of kickstart syntax")]
+
+        for v in sorted(errors.keys()):
+            messages.append("%s: %s" % (versionToString(v, skipDevel=True), errors[v]))
+
+        return (0 if compatible else 1, messages)
 
     try:
         handler = makeVersion(opts.version)
     except KickstartVersionError:
-        return (cleanup(destdir),
-                [_("The version %s is not supported by pykickstart") % opts.version])
+        return (1, [_("The version %s is not supported by pykickstart") % opts.version])
 
     ksparser = KickstartParser(handler, followIncludes=opts.followincludes,
                                errorsAreFatal=opts.firsterror)
@@ -97,23 +300,43 @@ def main(argv=sys.argv[1:]):
     # turn DeprecationWarnings into errors
     warnings.filterwarnings("error")
 
-    processedFile = None
-
     try:
-        processedFile = preprocessKickstart(f)
-        ksparser.readKickstart(processedFile)
-        return (cleanup(destdir, processedFile, exitval=ksparser.errorsCount), [])
+        contents = preprocess(contents)
+        errors = []
+
+        if opts.memory:
+            def check(measured):
+                if opts.storage:
+                    errors.extend(checkStorage(measured))
+
+            # The file is checked by the same parse that is measured, which
+            # stops at the first error.
+            report = memoryReport(opts.ksfile, version=handler.version,
+                                  followIncludes=opts.followincludes, contents=contents,
+                                  check=check)
+            messages = str(report).split("\n")
+        else:
+            # Relative %include paths are looked up next to the original file.
+            ksparser.readKickstartFromString(contents, path=opts.ksfile)
+            messages = []
+
+            if opts.storage and ksparser.errorsCount == 0:
+                errors = checkStorage(handler)
+
+        if errors and opts.firsterror:
+            return (1, [str(errors[0])])
+        elif errors:
+            return (len(errors), [str(err) for err in errors])
+
+        return (ksparser.errorsCount, messages)
     except DeprecationWarning as err:
-        return (cleanup(destdir, processedFile),
-                [_("File uses a deprecated option or command.\n%s") % err])
+        return (1, [_("File uses a deprecated option or command.\n%s") % err])
     except KickstartParseError as err:
-        return (cleanup(destdir, processedFile), [str(err)])
+        return (1, [str(err)])
     except KickstartError:
-        return (cleanup(destdir, processedFile),
-                [_("General kickstart error in input file")])
+        return (1, [_("General kickstart error in input file")])
     except Exception as e:
-        return (cleanup(destdir, processedFile),
-                [_("General error in input file:  %s") % e])
+        return (1, [_("General error in input file:  %s") % e])
 
 if __name__ == "__main__":
     retval, messages = main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+
+# pylint: disable=found-_-in-module-class
+
+import argparse
+import socket
+import sys
+from pykickstart.i18n import _
+from pykickstart.daemon import ValidationServer, defaultSocketPath, request
+from pykickstart.errors import KickstartError, KickstartVersionError
+from pykickstart.version import DEVEL, makeVersion
+
+def main(argv=sys.argv[1:]):
+    op = argparse.ArgumentParser(usage="%(prog)s [options]", add_help=False)
+    op.add_argument("-s", "--socket", dest="socket", default=None,
+                    help=_("listen on the Unix socket SOCKET"))
+    op.add_argument("-p", "--pool-size", dest="poolsize", type=int, default=4,
+                    help=_("number of handlers to keep for each version"))
+    op.add_argument("-v", "--version", dest="versions", action="append", default=[],
+                    help=_("version of kickstart syntax to have handlers ready for, which may be given more than once"))
+    op.add_argument("-k", "--stop", dest="stop", action="store_true", default=False,
+                    help=_("stop the server listening on the socket"))
+    op.add_argument("-h", "--help", dest="help", action="store_true", default=False,
+                    help=_("show this help message and exit"))
+
+    opts = op.parse_args(argv)
+
+    # parse --help manually b/c we don't want to sys.exit before the
+    # tests have finished
+    if opts.help:
+        return (0, op.format_help().split("\n"))
+
+    path = opts.socket or defaultSocketPath()
+
+    if opts.stop:
+        try:
+            request(path, {"op": "shutdown"}, timeout=10)
+        except (socket.error, ValueError) as e:
+            return (1, [_("Unable to reach a server on %(path)s: %(error)s") % {"path": path, "error": e}])
+
+        return (0, [])
+
+    versions = opts.versions or [DEVEL]
+    for version in versions:
+        try:
+            makeVersion(version)
+        except KickstartVersionError:
+            return (1, [_("The version %s is not supported by pykickstart") % version])
+
+    try:
+        server = ValidationServer(path, versions=versions, poolSize=opts.poolsize)
+    except KickstartError as e:
+        return (1, [str(e)])
+
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+
+    return (0, [])
+
+if __name__ == "__main__":
+    retval, messages = main()
+    for msg in messages:
+        print(msg)
+    sys.exit(retval)
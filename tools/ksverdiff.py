@@ -24,99 +24,113 @@
 import argparse
 import sys
 from pykickstart.i18n import _
-from pykickstart.base import DeprecatedCommand
 from pykickstart.errors import KickstartVersionError
-from pykickstart.version import makeVersion, versionMap
-
-def getCommandSet(handler):
-    return set(handler.commands.keys())
-
-def getOptSet(lst):
-    return set(map(lambda o: o.get_opt_string(), lst))
-
-def printList(lst):
-    print(' '.join(lst))
-
-op = argparse.ArgumentParser()
-op.add_argument("-f", "--from", dest="f")
-op.add_argument("-t", "--to", dest="t")
-op.add_argument("-l", "--listversions", dest="listversions", action="store_true",
-                default=False,
-                help=_("list the available versions of kickstart syntax"))
-
-opts = op.parse_args(sys.argv[1:])
-
-if opts.listversions:
-    for key in sorted(versionMap.keys()):
-        print(key)
-
-    sys.exit(1)
-
-if not opts.f or not opts.t:
-    print(_("You must specify two syntax versions."))
-    sys.exit(1)
-
-try:
-    fromHandler = makeVersion(opts.f)
-except KickstartVersionError:
-    print(_("The version %s is not supported by pykickstart") % opts.f)
-    sys.exit(1)
-
-try:
-    toHandler = makeVersion(opts.t)
-except KickstartVersionError:
-    print(_("The version %s is not supported by pykickstart") % opts.t)
-    sys.exit(1)
-
-fromCmdSet = getCommandSet(fromHandler)
-toCmdSet = getCommandSet(toHandler)
-bothSet = fromCmdSet & toCmdSet
-
-print(_("The following commands were removed in %s:") % opts.t)
-printList(sorted(fromCmdSet - toCmdSet))
-
-print(_("The following commands were deprecated in %s:") % opts.t)
-printList(sorted([cmd for cmd in bothSet if isinstance(toHandler.commands[cmd], DeprecatedCommand)]))
-
-print(_("The following commands were added in %s:") % opts.t)
-printList(sorted(toCmdSet - fromCmdSet))
-
-print()
-
-for cmd in sorted(bothSet):
-    printed = False
-
-    newOptList = []
-    deprecatedOptList = []
-    removedOptList = []
-
-    fromCmd = fromHandler.commands[cmd]
-    toCmd = toHandler.commands[cmd]
-
-    if not hasattr(fromCmd, "op") or not hasattr(toCmd, "op"):
-        continue
-
-    fromOpt = fromCmd.op.option_list
-    toOpt = toCmd.op.option_list
-
-    newOptList = getOptSet(toOpt) - getOptSet(fromOpt)
-    removedOptList = getOptSet(fromOpt) - getOptSet(toOpt)
-    deprecatedOptList = getOptSet([cmd for cmd in toOpt if cmd.deprecated == 1])
-
-    if len(newOptList) > 0:
-        print(_("The following options were added to the %(command_name)s command in %(version)s:") % {"command_name": cmd, "version": opts.t})
-        printList(sorted(newOptList))
-        printed = True
-
-    if len(deprecatedOptList) > 0:
-        print(_("The following options were deprecated from the %(command_name)s command in %(version)s:") % {"command_name": cmd, "version": opts.t})
-        printList(sorted(deprecatedOptList))
-        printed = True
-
-    if len(removedOptList) > 0:
-        print(_("The following options were removed from the %(command_name)s command in %(version)s:") % {"command_name": cmd, "version": opts.t})
-        printList(sorted(removedOptList))
-        printed = True
-
-    if printed:
-        print()
+from pykickstart.version import stringToVersion, versionMap, versionToString
+from pykickstart.versionindex import cachedIndex, diffVersions
+
+def formatDiff(diff, toName):
+    """Return a list of lines describing the VersionDiff diff, calling the
+       version the changes are to toName.
+    """
+    lines = []
+
+    lines.append(_("The following commands were removed in %s:") % toName)
+    lines.append(" ".join(diff.removed))
+
+    lines.append(_("The following commands were deprecated in %s:") % toName)
+    lines.append(" ".join(diff.deprecated))
+
+    lines.append(_("The following commands were added in %s:") % toName)
+    lines.append(" ".join(diff.added))
+
+    lines.append("")
+
+    for cmd in sorted(diff.options.keys()):
+        (added, deprecated, removed) = diff.options[cmd]
+
+        if added:
+            lines.append(_("The following options were added to the %(command_name)s command in %(version)s:") % {"command_name": cmd, "version": toName})
+            lines.append(" ".join(added))
+
+        if deprecated:
+            lines.append(_("The following options were deprecated from the %(command_name)s command in %(version)s:") % {"command_name": cmd, "version": toName})
+            lines.append(" ".join(deprecated))
+
+        if removed:
+            lines.append(_("The following options were removed from the %(command_name)s command in %(version)s:") % {"command_name": cmd, "version": toName})
+            lines.append(" ".join(removed))
+
+        lines.append("")
+
+    return lines
+
+def _isRHEL(version):
+    return versionToString(version, skipDevel=True).startswith("RHEL")
+
+def main(argv=sys.argv[1:]):
+    op = argparse.ArgumentParser(add_help=False)
+    op.add_argument("-f", "--from", dest="f",
+                    help=_("version of kickstart syntax to start with"))
+    op.add_argument("-t", "--to", dest="t",
+                    help=_("version of kickstart syntax to end with"))
+    op.add_argument("-r", "--range", dest="range", action="store_true", default=False,
+                    help=_("list the changes made in each version from FROM to TO"))
+    op.add_argument("-c", "--cache", dest="cache", metavar="FILE", default=None,
+                    help=_("keep the index of kickstart syntax in FILE"))
+    op.add_argument("-l", "--listversions", dest="listversions", action="store_true",
+                    default=False,
+                    help=_("list the available versions of kickstart syntax"))
+    op.add_argument("-h", "--help", dest="help", action="store_true", default=False,
+                    help=_("show this help message and exit"))
+
+    opts = op.parse_args(argv)
+
+    # parse --help manually b/c we don't want to sys.exit before the
+    # tests have finished
+    if opts.help:
+        return (0, op.format_help().split("\n"))
+
+    if opts.listversions:
+        return (0, sorted(versionMap.keys()))
+
+    if not opts.f or not opts.t:
+        return (1, [_("You must specify two syntax versions.")])
+
+    versions = []
+    for name in (opts.f, opts.t):
+        try:
+            versions.append(stringToVersion(name))
+        except KickstartVersionError:
+            return (1, [_("The version %s is not supported by pykickstart") % name])
+
+    (fromVersion, toVersion) = versions
+    index = cachedIndex(opts.cache)
+
+    if not opts.range:
+        return (0, formatDiff(diffVersions(fromVersion, toVersion, index=index), opts.t))
+
+    # Fedora and RHEL releases are numbered among each other, but each
+    # only follows on from releases of its own kind.
+    if _isRHEL(fromVersion) != _isRHEL(toVersion):
+        return (1, [_("A range must be between two Fedora or two RHEL versions.")])
+
+    # Every version between the two, in the order the changes were made.
+    steps = [v for v in index.versions
+             if min(fromVersion, toVersion) <= v <= max(fromVersion, toVersion)
+             and _isRHEL(v) == _isRHEL(fromVersion)]
+    if fromVersion > toVersion:
+        steps.reverse()
+
+    messages = []
+    for (old, new) in zip(steps, steps[1:]):
+        (oldName, newName) = (versionToString(old, skipDevel=True), versionToString(new, skipDevel=True))
+        messages.append(_("Changes from %(from)s to %(to)s:") % {"from": oldName, "to": newName})
+        messages.extend(formatDiff(diffVersions(old, new, index=index), newName))
+
+    return (0, messages)
+
+if __name__ == "__main__":
+    retval, messages = main()
+    for msg in messages:
+        print(msg)
+    sys.exit(retval)